@@ -0,0 +1,36 @@
+Feature: Punto de entrada ASGI de la API
+
+  Como servidor de la API,
+  quiero atender las rutas del juego sobre un bucle de eventos asyncio,
+  para mantener muchas conexiones en espera sin ocupar un hilo por cada una.
+
+  Scenario: Las rutas Flask se sirven a través de ASGI
+    Given una aplicación ASGI de la API
+    When creo una partida de 6 jugadores a través de ASGI
+    Then la respuesta ASGI debe tener código 201
+    And la respuesta ASGI debe incluir el ID de la partida
+
+  Scenario: Una consulta en espera se despierta cuando la partida cambia
+    Given una aplicación ASGI de la API
+    And una partida de 6 jugadores creada a través de ASGI
+    When espero cambios en la partida mientras un jugador se une a través de ASGI
+    Then la consulta en espera debe indicar que la partida cambió
+    And el estado recibido debe tener 1 jugadores
+
+  Scenario: Una consulta en espera sin cambios termina al agotar el tiempo
+    Given una aplicación ASGI de la API
+    And una partida de 6 jugadores creada a través de ASGI
+    When espero cambios en la partida durante 0.1 segundos
+    Then la consulta en espera debe indicar que la partida no cambió
+
+  Scenario: Las consultas de versión no bloquean el bucle de eventos
+    Given una aplicación ASGI de la API
+    And una partida de 6 jugadores creada a través de ASGI
+    When espero cambios en la partida durante 1.5 segundos registrando las consultas de versión
+    Then la consulta en espera debe indicar que la partida no cambió
+    And las consultas de versión deben haberse ejecutado en el pool del motor
+
+  Scenario: Consultar una partida inexistente a través de ASGI
+    Given una aplicación ASGI de la API
+    When espero cambios en la partida "missing" durante 0.1 segundos
+    Then la respuesta ASGI debe tener código 404
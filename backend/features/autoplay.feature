@@ -0,0 +1,58 @@
+Feature: Juego automático en el servidor
+
+  Como espectador de una mesa de bots,
+  quiero que el servidor juegue la partida por sí mismo,
+  para no tener que enviar una petición por cada paso de los bots.
+
+  Scenario: Una mesa de solo bots se juega hasta el final
+    Given una partida iniciada con 0 humanos y 7 bots para juego automático
+    When pido el juego automático de la partida
+    And espero a que termine el juego automático
+    Then la respuesta del juego automático debe tener código 202
+    And el juego automático debe haber terminado por "game_over"
+    And la partida debe haber terminado
+
+  Scenario: El juego automático se detiene en la ronda indicada
+    Given una partida iniciada con 0 humanos y 7 bots para juego automático
+    When pido el juego automático de la partida hasta la ronda 2
+    And espero a que termine el juego automático
+    Then el juego automático debe haber terminado por "round_reached"
+    And la partida debe estar al menos en la ronda 2
+
+  Scenario: El juego automático se detiene cuando le toca a un humano
+    Given una partida iniciada con 1 humanos y 5 bots para juego automático
+    When pido el juego automático de la partida
+    And espero a que termine el juego automático
+    Then el juego automático debe haber terminado por "human_turn"
+
+  Scenario: No se puede jugar sola una partida que no ha empezado
+    Given una partida de 6 jugadores sin iniciar para juego automático
+    When pido el juego automático de la partida
+    Then la respuesta del juego automático debe tener código 409
+
+  Scenario: Juego automático de una partida inexistente
+    When pido el juego automático de la partida "missing"
+    Then la respuesta del juego automático debe tener código 404
+
+  Scenario: Una acción de bot con respuesta asíncrona se ejecuta en segundo plano
+    Given una partida iniciada con 0 humanos y 7 bots para juego automático
+    When envío la nominación del bot pidiendo respuesta asíncrona
+    And espero a que termine el juego automático
+    Then la respuesta del juego automático debe tener código 202
+    And la respuesta debe indicar la versión de la partida antes de la acción
+    And la partida debe haber terminado
+
+  Scenario: Una acción de bot sin respuesta asíncrona se ejecuta en el pool
+    Given una partida iniciada con 0 humanos y 7 bots para juego automático
+    When envío la nominación del bot sin pedir respuesta asíncrona
+    Then la respuesta del juego automático debe tener código 200
+    And la respuesta debe incluir la nominación del bot
+    And las estrategias de los bots deben haberse ejecutado en el pool
+
+  Scenario: Los bots de una partida mixta juegan en segundo plano hasta el turno humano
+    Given una partida iniciada con 1 humanos y 5 bots para juego automático
+    When pido que avancen los bots de la partida
+    And espero a que termine el juego automático
+    Then la respuesta del juego automático debe tener código 202
+    And el juego automático debe haber terminado por "human_turn"
+    And el siguiente paso de la partida debe corresponder a un humano
@@ -0,0 +1,47 @@
+Feature: Acciones en lote
+
+  Como cliente de la API,
+  quiero enviar varias acciones de juego en una sola petición,
+  para avanzar la partida sin una petición por acción y sin estados intermedios.
+
+  Background:
+    Given una partida iniciada con 5 jugadores humanos para acciones en lote
+
+  Scenario: Un lote de nominación y votos se aplica de una vez
+    When envío en lote la nominación y los votos "ja" de todos los jugadores
+    Then la respuesta del lote debe tener código 200
+    And todas las acciones del lote deben haberse aplicado
+    And la versión de la partida debe haber avanzado 1
+    And la partida debe estar en la fase "legislative"
+
+  Scenario: Un lote con una acción fallida no modifica la partida
+    When envío en lote la nominación, los votos "ja" y una promulgación sin robo previo
+    Then la respuesta del lote debe tener código 403
+    And el lote debe indicar que falló la acción 6
+    And la versión de la partida debe haber avanzado 0
+    And la partida debe estar en la fase "election"
+
+  Scenario: Un lote construido sobre una versión antigua se rechaza
+    When envío en lote la nominación sobre una versión anterior de la partida
+    Then la respuesta del lote debe tener código 409
+    And la versión de la partida debe haber avanzado 0
+
+  Scenario: Un lote con una acción desconocida se rechaza
+    When envío en lote la acción "dance"
+    Then la respuesta del lote debe tener código 400
+
+  Scenario: Un lote sobre una partida inexistente
+    When envío en lote la nominación a la partida "missing"
+    Then la respuesta del lote debe tener código 404
+
+  Scenario: Una acción despachada fuera de una petición se persiste
+    When despacho fuera de una petición la nominación del presidente
+    Then la acción despachada debe tener código 200
+    And la versión de la partida debe ser la siguiente a la inicial
+    And la partida debe estar en la fase "voting"
+
+  Scenario: Una acción fallida despachada fuera de una petición no se persiste
+    When despacho fuera de una petición la acción "enact"
+    Then la acción despachada debe tener código 403
+    And la versión de la partida debe seguir siendo la inicial
+    And la partida debe estar en la fase "election"
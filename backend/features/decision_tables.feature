@@ -0,0 +1,45 @@
+Feature: Tablas de decisión de las estrategias por reglas
+
+  Como bot de Secret Hitler XL,
+  quiero decidir las políticas consultando tablas precompiladas,
+  para no ordenar la mano ni reconstruir prioridades en cada decisión.
+
+  Scenario Outline: El orden compilado coincide con ordenar la mano por prioridad
+    Given la tabla de orden de políticas del rol "<role>"
+    Then cada mano de 3 cartas debe ordenarse como con sorted por prioridad
+
+    Examples:
+      | role      |
+      | liberal   |
+      | fascist   |
+      | communist |
+
+  Scenario: Las tablas están compiladas antes de la primera decisión
+    Given la tabla de orden de políticas del rol "liberal"
+    Then la tabla debe contener todas las manos de 2 y 3 cartas
+    And consultar la misma mano dos veces debe devolver el mismo objeto
+
+  Scenario: SmartStrategy conserva la pareja si vale al menos lo que la carta suelta
+    Given la tabla de filtrado de SmartStrategy del rol "liberal"
+    Then la mano "liberal, fascist, liberal" debe quedarse con "liberal, liberal"
+    And la mano "fascist, liberal, fascist" debe quedarse con "liberal, fascist"
+    And la mano "communist, liberal, fascist" debe quedarse con "liberal, communist"
+
+  Scenario: Las tablas de veto dependen solo de los tipos de la mano
+    Then el veto liberal debe aceptar "fascist, fascist" y rechazar "fascist, liberal"
+    And el veto fascista debe aceptar "liberal, communist" y rechazar "fascist, liberal"
+    And el veto comunista debe aceptar "fascist, liberal" y rechazar "communist, fascist"
+
+  Scenario Outline: SmartStrategy acepta el veto según la mano y el contador de elecciones
+    Then SmartStrategy "<role>" debe <normal> el veto de "<hand>" lejos del caos y <chaos> al borde del caos
+
+    Examples:
+      | role      | hand              | normal        | chaos     |
+      | liberal   | fascist, fascist  | aceptar       | aceptar   |
+      | liberal   | fascist, liberal  | dejar al azar | rechazar  |
+      | fascist   | liberal, liberal  | aceptar       | aceptar   |
+      | communist | liberal, liberal  | aceptar       | rechazar  |
+
+  Scenario: Las manos fuera de la tabla se calculan con la misma regla
+    Given la tabla de orden de políticas del rol "fascist"
+    Then la mano "liberal, liberal, communist, fascist" debe ordenarse como "fascist, communist, liberal, liberal"
@@ -0,0 +1,33 @@
+Feature: Probabilidades de robo del mazo de políticas
+
+  Como bot de Secret Hitler XL,
+  quiero conocer la probabilidad de cada mano según la composición del mazo,
+  para juzgar si una declaración es verosímil sin recalcular las tablas.
+
+  Scenario: La tabla de 3 cartas es una distribución hipergeométrica
+    Given un mazo con 5 cartas liberal y 10 cartas fascist
+    When calculo la tabla de robo de 3 cartas
+    Then las probabilidades de la tabla deben sumar 1
+    And la probabilidad de robar 3 cartas fascist debe ser 120/455
+    And la probabilidad de robar al menos 1 carta liberal debe ser 335/455
+
+  Scenario: Las tablas se calculan una sola vez por composición
+    Given un mazo con 6 cartas liberal y 9 cartas fascist
+    When calculo la tabla de robo de 2 cartas dos veces
+    Then ambas tablas deben ser el mismo objeto
+
+  Scenario: Una declaración imposible tiene probabilidad 0
+    Given un mazo con 1 cartas liberal y 10 cartas fascist
+    Then la declaración "liberal, liberal, fascist" debe tener probabilidad 0
+    And la declaración "fascist, fascist, fascist" debe tener probabilidad 120/165
+
+  Scenario: El tablero publica la composición de las cartas por promulgar
+    Given un tablero de 7 jugadores con el mazo inicial
+    When el presidente roba 3 políticas
+    And descarta 1 de ellas y se promulga otra
+    Then la composición pública debe contar el mazo y los descartes
+    And la composición pública no debe cambiar al barajar los descartes en el mazo
+
+  Scenario: El tablero calcula las probabilidades del próximo robo
+    Given un tablero de 7 jugadores con el mazo inicial
+    Then las probabilidades del próximo robo deben usar la composición pública
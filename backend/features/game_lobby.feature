@@ -0,0 +1,29 @@
+Feature: Listado de salas de juego
+
+  Como jugador que busca partida,
+  quiero ver las salas abiertas con su configuración y ocupación,
+  para elegir a cuál unirme sin consultar cada partida.
+
+  Background:
+    Given una aplicación de la API con 3 salas de 6 jugadores
+    And un jugador se ha unido a la primera sala
+    And la última sala se ha llenado de bots y ha empezado
+
+  Scenario: Listar solo las salas en espera
+    When pido el listado de salas en estado "waiting"
+    Then el listado debe tener código 200
+    And el listado debe tener 2 salas en total
+    And la primera sala del listado debe tener 1 jugadores de 6
+
+  Scenario: Paginar el listado de salas
+    When pido el listado de salas en estado "waiting" con 1 sala por página
+    Then el listado debe tener 1 salas en la página
+    And el listado debe indicar que la siguiente página empieza en 1
+
+  Scenario: Listar las partidas en curso
+    When pido el listado de salas en estado "in_progress"
+    Then el listado debe tener 1 salas en total
+
+  Scenario: Un estado desconocido se rechaza
+    When pido el listado de salas en estado "lost"
+    Then el listado debe tener código 400
@@ -0,0 +1,52 @@
+Feature: Expulsión de partidas inactivas
+
+  Como servidor de la API,
+  quiero expulsar las partidas que llevan demasiado tiempo sin actividad,
+  para que la memoria del servidor se mantenga acotada con la rotación de lobbies.
+
+  Scenario Outline: Las partidas se expulsan según el TTL de su estado
+    Given un almacén de partidas "<store>"
+    And un recolector con TTL de 60 segundos para partidas en espera
+    When guardo una partida de 8 jugadores con ID "lobby1" en el almacén
+    And el recolector barre el almacén tras <elapsed> segundos
+    Then el recolector debe haber expulsado <evicted> partidas en espera
+    And el almacén debe tener <live> partidas vivas
+
+    Examples:
+      | store   | elapsed | evicted | live |
+      | memoria | 30      | 0       | 1    |
+      | memoria | 90      | 1       | 0    |
+      | sqlite  | 30      | 0       | 1    |
+      | sqlite  | 90      | 1       | 0    |
+
+  Scenario: Las partidas terminadas se vuelcan a disco antes de expulsarse
+    Given un almacén de partidas "memoria"
+    And un recolector con volcado a disco y TTL de 60 segundos para partidas terminadas
+    When guardo una partida de 8 jugadores con ID "final1" en el almacén
+    And marco la partida "final1" como terminada en el almacén
+    And el recolector barre el almacén tras 90 segundos
+    Then la partida "final1" no debe existir en el almacén
+    And la partida "final1" debe poder recuperarse del disco
+
+  Scenario: Las partidas sin TTL no se expulsan
+    Given un almacén de partidas "memoria"
+    And un recolector sin TTL para partidas en espera
+    When guardo una partida de 8 jugadores con ID "lobby1" en el almacén
+    And el recolector barre el almacén tras 100000 segundos
+    Then el almacén debe tener 1 partidas vivas
+
+  Scenario: Una partida bloqueada por una petición no se vuelca ni se expulsa
+    Given un almacén de partidas "memoria"
+    And un recolector con volcado a disco y TTL de 60 segundos para partidas terminadas
+    When guardo una partida de 8 jugadores con ID "final1" en el almacén
+    And marco la partida "final1" como terminada en el almacén
+    And otra petición tiene bloqueada la partida "final1"
+    And el recolector barre el almacén tras 90 segundos
+    Then el almacén debe tener 1 partidas vivas
+    And la partida "final1" no debe haberse volcado a disco
+
+  Scenario: El recolector es opcional y no expulsa partidas en curso por defecto
+    Given un almacén de partidas "memoria"
+    When creo el recolector sin variables de entorno
+    Then el recolector no debe barrer en segundo plano
+    And el recolector no debe tener TTL para partidas en curso
@@ -0,0 +1,71 @@
+Feature: Almacenamiento persistente de partidas
+
+  Como servidor de la API,
+  quiero guardar las partidas en un almacén intercambiable y versionado,
+  para que varios workers compartan el estado y las partidas sobrevivan a reinicios.
+
+  Scenario Outline: Guardar y recuperar una partida incrementa su versión
+    Given un almacén de partidas "<store>"
+    When guardo una partida de 8 jugadores con ID "abc123" en el almacén
+    And guardo de nuevo la partida "abc123" en el almacén
+    Then la partida "abc123" debe existir en el almacén
+    And la versión de la partida "abc123" debe ser 2
+
+    Examples:
+      | store   |
+      | memoria |
+      | sqlite  |
+
+  Scenario Outline: Una escritura sobre una versión obsoleta es rechazada
+    Given un almacén de partidas "<store>"
+    When guardo una partida de 8 jugadores con ID "abc123" en el almacén
+    And guardo de nuevo la partida "abc123" en el almacén
+    Then guardar la partida "abc123" esperando la versión 1 debe fallar por conflicto
+
+    Examples:
+      | store   |
+      | memoria |
+      | sqlite  |
+
+  Scenario: Las partidas SQLite sobreviven a un reinicio del servidor
+    Given un almacén de partidas "sqlite"
+    When guardo una partida de 8 jugadores con ID "abc123" en el almacén
+    And reabro el almacén SQLite
+    Then la partida "abc123" recuperada debe tener 8 jugadores
+    And la versión de la partida "abc123" debe ser 1
+
+  Scenario: Un worker detecta los cambios escritos por otro worker
+    Given un almacén de partidas "sqlite"
+    And un segundo worker que comparte la base de datos
+    When guardo una partida de 8 jugadores con ID "abc123" en el almacén
+    And el segundo worker carga la partida "abc123"
+    And el segundo worker marca la partida "abc123" como terminada
+    Then la partida "abc123" del primer worker debe estar terminada
+
+  Scenario: Eliminar una partida del almacén
+    Given un almacén de partidas "sqlite"
+    When guardo una partida de 8 jugadores con ID "abc123" en el almacén
+    And elimino la partida "abc123" del almacén
+    Then la partida "abc123" no debe existir en el almacén
+
+  Scenario Outline: El índice de salas resume las partidas sin cargarlas
+    Given un almacén de partidas "<store>"
+    When guardo una partida de 8 jugadores con ID "abc123" en el almacén
+    And guardo una partida de 6 jugadores con ID "def456" en el almacén
+    Then el índice de salas en espera debe tener 2 partidas
+    And la primera página de 1 sala debe ser la partida "def456" con 6 jugadores
+
+    Examples:
+      | store   |
+      | memoria |
+      | sqlite  |
+
+  Scenario Outline: Crear una partida por la API la guarda una sola vez
+    Given un almacén de partidas "<store>"
+    When creo una partida de 7 jugadores por la API sobre el almacén
+    Then la versión de la partida creada debe ser 1
+
+    Examples:
+      | store   |
+      | memoria |
+      | sqlite  |
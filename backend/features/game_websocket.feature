@@ -0,0 +1,31 @@
+Feature: Canal WebSocket de una partida
+
+  Como jugador humano,
+  quiero enviar mis acciones por un WebSocket de la partida,
+  para que el servidor juegue los turnos de los bots y me transmita lo ocurrido.
+
+  Scenario: Una partida solo de bots se juega entera al conectarse
+    Given una aplicación ASGI de la API
+    And una partida iniciada con 0 humanos y 5 bots
+    When me conecto al WebSocket de la partida
+    Then debo recibir acciones de los bots
+    And el último estado recibido debe indicar que la partida terminó
+
+  Scenario: Un humano juega una partida con bots por WebSocket
+    Given una aplicación ASGI de la API
+    And una partida iniciada con 1 humanos y 4 bots
+    When juego la partida por WebSocket como el jugador 0
+    Then debo recibir acciones de los bots
+    And todas mis acciones deben haberse aceptado
+    And el último estado recibido debe indicar que la partida terminó
+
+  Scenario: Un mensaje inválido recibe un error
+    Given una aplicación ASGI de la API
+    And una partida iniciada con 1 humanos y 4 bots
+    When envío el mensaje "no es json" por el WebSocket de la partida
+    Then debo recibir un error por el WebSocket
+
+  Scenario: Conectarse a una partida inexistente
+    Given una aplicación ASGI de la API
+    When me conecto al WebSocket de la partida "missing"
+    Then la conexión debe cerrarse con código 4404
@@ -0,0 +1,36 @@
+Feature: Estrategia aprendida a partir de partidas simuladas
+
+  Como desarrollador de bots de Secret Hitler XL,
+  quiero registrar las decisiones de partidas simuladas en arrays de NumPy
+  y entrenar con ellas un modelo pequeño que juegue como estrategia,
+  para tener un bot rápido y ajustable entrenado sin salir de la CPU.
+
+  Scenario: Las decisiones de una partida se guardan en arrays compactos
+    When registro las decisiones de 2 partidas de 7 jugadores con la estrategia "role" y semilla 4
+    Then cada tipo de decisión debe tener arrays coherentes
+    And debe haber decisiones de "vote", "nominate", "filter" y "choose"
+
+  Scenario: Los conjuntos de decisiones se guardan y se cargan sin cambios
+    When registro las decisiones de 1 partidas de 7 jugadores con la estrategia "role" y semilla 9
+    And guardo y vuelvo a cargar las decisiones
+    Then las decisiones cargadas deben ser iguales a las registradas
+
+  Scenario: El modelo imita a una estrategia determinista
+    When registro las decisiones de 8 partidas de 7 jugadores con la estrategia "role" y semilla 1
+    And entreno un modelo con capa oculta con todas las decisiones
+    Then el modelo debe acertar al menos el 95% de las decisiones "choose"
+    And el modelo guardado y cargado debe puntuar igual
+
+  Scenario: Sin modelo la estrategia aprendida juega como la de su rol
+    Given una partida de torneo de 7 jugadores con semilla 5
+    When creo una estrategia aprendida sin modelo para un liberal
+    Then debe filtrar las políticas como LiberalStrategy
+
+  Scenario: Una partida con bots aprendidos termina
+    When registro las decisiones de 4 partidas de 7 jugadores con la estrategia "role" y semilla 2
+    And entreno un modelo con capa oculta con las decisiones ganadoras
+    And juego una partida de 7 jugadores con todos los bots aprendidos y semilla 6
+    Then la partida aprendida debe terminar con un ganador
+
+  Scenario: Las políticas del mismo tipo son intercambiables al registrar
+    Then descartar la segunda política "fascist" de "fascist, liberal, fascist" debe registrarse como la posición 0
@@ -0,0 +1,75 @@
+Feature: Estrategia de búsqueda Monte-Carlo
+
+  Como jugador de Secret Hitler XL,
+  quiero un bot que simule las consecuencias de sus decisiones,
+  para enfrentarme a un rival más fuerte con un coste acotado por decisión.
+
+  Scenario: La fábrica crea bots con la estrategia MCTS
+    Given una partida de 8 jugadores con bots "mcts" y semilla 3
+    Then todos los bots deben usar MCTSStrategy
+    And la estrategia MCTS debe heredar de PlayerStrategy
+
+  Scenario: La copia del estado es independiente de la partida original
+    Given una partida de 8 jugadores con bots "role" y semilla 5
+    When copio el estado de la partida y modifico la copia
+    Then la partida original no debe cambiar
+    And la copia debe compartir las políticas y los roles del original
+
+  Scenario: Los roles muestreados respetan lo que sabe un fascista
+    Given una partida de 8 jugadores con bots "role" y semilla 7
+    And un bot MCTS en el asiento de un fascista
+    When el bot MCTS muestrea 20 asignaciones de roles
+    Then cada asignación debe conservar los roles que conoce el bot
+    And cada asignación debe tener el mismo reparto de roles que la partida
+
+  Scenario: La nominación respeta el presupuesto de simulaciones
+    Given una partida de 8 jugadores con bots "role" y semilla 11
+    And un bot MCTS con 12 simulaciones en el asiento del presidente
+    When el bot MCTS nomina un canciller
+    Then el canciller nominado debe ser elegible
+    And la búsqueda debe haber jugado como mucho 12 simulaciones
+    And la partida original no debe haber cambiado tras la búsqueda
+
+  Scenario: Un presupuesto de tiempo agotado no impide decidir
+    Given una partida de 8 jugadores con bots "role" y semilla 13
+    And un bot MCTS sin tiempo de búsqueda en el asiento del presidente
+    When el bot MCTS nomina un canciller
+    Then el canciller nominado debe ser elegible
+    And la búsqueda debe haber jugado como mucho 0 simulaciones
+
+  Scenario: Búsquedas simultáneas con la misma semilla no se interfieren
+    Given una partida de 8 jugadores con bots "role" y semilla 23
+    And un bot MCTS con 6 simulaciones en el asiento del presidente
+    When el bot MCTS nomina un canciller
+    And dos bots MCTS con la misma semilla nominan a la vez en hilos distintos
+    Then las búsquedas simultáneas deben dar los mismos valores que la primera
+    And la partida original no debe haber cambiado tras la búsqueda
+
+  Scenario Outline: Si ninguna simulación termina decide la estrategia de respaldo
+    Given una partida de 8 jugadores con bots "role" y semilla 29
+    And un bot MCTS con 4 simulaciones en el asiento del presidente
+    And las simulaciones del bot MCTS fallan con <error>
+    When el bot MCTS nomina un canciller
+    Then el canciller nominado debe ser elegible
+    And la búsqueda debe haber fallado 4 simulaciones
+    And la nominación debe venir de la estrategia de respaldo
+    And el bot MCTS debe haber registrado <logged> errores inesperados
+
+    Examples:
+      | error        | logged |
+      | ValueError   | 0      |
+      | IndexError   | 0      |
+      | RuntimeError | 4      |
+
+  Scenario: El bot MCTS simula partidas con jugadores humanos
+    Given una partida de 8 jugadores con bots "role" y semilla 17
+    And el jugador del asiento 1 es humano
+    And un bot MCTS con 8 simulaciones en el asiento del presidente
+    When el bot MCTS vota el gobierno del presidente con el primer canciller elegible
+    Then la búsqueda debe haber jugado 8 simulaciones sin errores
+
+  Scenario: Una partida con un bot MCTS termina
+    Given una partida de 8 jugadores con bots "role" y semilla 19
+    And un bot MCTS con 4 simulaciones en el asiento del presidente
+    When juego la partida hasta el final
+    Then la partida debe tener un ganador
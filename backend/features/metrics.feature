@@ -0,0 +1,37 @@
+Feature: Métricas de la API
+
+  Como operador del servidor,
+  quiero consultar la latencia de cada ruta y la carga de partidas en /metrics,
+  para ver qué rutas se degradan bajo carga y dimensionar la capacidad.
+
+  Background:
+    Given una aplicación de la API con métricas
+
+  Scenario: Las peticiones se cuentan por plantilla de ruta y código de estado
+    When creo una partida de 6 jugadores para las métricas
+    And consulto el estado de la partida "missing" para las métricas
+    And consulto las métricas
+    Then las métricas deben publicarse en formato de texto de Prometheus
+    And la métrica 'shxl_http_requests_total{route="/newgame",method="POST",status="201"}' debe valer 1
+    And la métrica 'shxl_http_requests_total{route="/games/<game_id>/state",method="GET",status="404"}' debe valer 1
+    And la métrica 'shxl_http_request_duration_seconds_count{route="/newgame",method="POST"}' debe valer 1
+
+  Scenario: Se mide la serialización de cada estado enviado
+    When creo una partida de 6 jugadores para las métricas
+    And consulto el estado de la partida creada para las métricas
+    And consulto las métricas
+    Then la métrica "shxl_state_serialization_duration_seconds_count" debe valer 1
+
+  Scenario: Se mide el tiempo del motor por acción y las partidas vivas
+    When una partida de 7 bots se juega sola hasta el final
+    And consulto las métricas
+    Then la métrica 'shxl_game_action_duration_seconds_count{action="nominate"}' debe ser mayor que 0
+    And la métrica 'shxl_game_action_duration_seconds_count{action="enact"}' debe ser mayor que 0
+    And la métrica 'shxl_live_games{state="game_over"}' debe valer 1
+    And la métrica 'shxl_live_games_by_phase{phase="game_over"}' debe valer 1
+    And la métrica 'shxl_live_games_by_bots{bots="7"}' debe valer 1
+
+  Scenario: Los histogramas son acumulativos
+    When creo una partida de 6 jugadores para las métricas
+    And consulto las métricas
+    Then la cubeta '+Inf' de "shxl_http_request_duration_seconds" para la ruta "/newgame" debe coincidir con su número de observaciones
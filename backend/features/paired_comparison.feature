@@ -0,0 +1,34 @@
+Feature: Comparación emparejada de estrategias
+
+  Como desarrollador de bots de Secret Hitler XL,
+  quiero comparar estrategias jugando las mismas semillas con todas ellas,
+  para detectar diferencias pequeñas de victorias con muchas menos partidas.
+
+  Scenario: La diferencia emparejada se calcula partida a partida
+    Given los resultados de referencia "1, 0, 1, 1" y los de la candidata "1, 1, 1, 0"
+    When calculo la diferencia emparejada
+    Then la diferencia media debe ser 0
+    And la varianza de las diferencias debe ser 2/3
+
+  Scenario: Dos estrategias idénticas no tienen incertidumbre emparejada
+    Given los resultados de referencia "1, 0, 0, 1, 1" y los de la candidata "1, 0, 0, 1, 1"
+    When calculo la diferencia emparejada
+    Then el error estándar emparejado debe ser 0
+    And el error estándar sin emparejar debe ser mayor que 0
+
+  Scenario: Los resultados correlacionados reducen la varianza
+    Given los resultados de referencia "1, 1, 0, 0, 1, 0, 1, 0" y los de la candidata "1, 1, 0, 0, 1, 1, 1, 0"
+    When calculo la diferencia emparejada
+    Then el error estándar emparejado debe ser menor que el sin emparejar
+    And el intervalo de confianza debe contener la diferencia media
+
+  Scenario: Las series deben tener la misma longitud
+    Given los resultados de referencia "1, 0, 1" y los de la candidata "1, 0"
+    When calculo la diferencia emparejada
+    Then la comparación debe lanzar un ValueError
+
+  Scenario: La misma semilla fija la partida inicial con cualquier estrategia
+    When preparo una partida de 8 jugadores con semilla 21 para cada estrategia "role, smart, random"
+    Then todas las partidas deben tener los mismos roles
+    And todas las partidas deben tener el mismo mazo
+    And todas las partidas deben tener el mismo primer presidente
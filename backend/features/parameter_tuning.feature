@@ -0,0 +1,40 @@
+Feature: Ajuste de parámetros de las estrategias
+
+  Como desarrollador de bots de Secret Hitler XL,
+  quiero estrategias con parámetros configurables y un buscador que los ajuste,
+  para optimizar el comportamiento de los bots con simulaciones en vez de a mano.
+
+  Scenario: Las estrategias usan sus parámetros por defecto
+    Given una estrategia "LiberalStrategy" para un jugador sin creencias
+    Then sus parámetros deben ser los valores por defecto de la clase
+    And el parámetro "vote_early" debe valer 0.7
+
+  Scenario: Un parámetro sustituye a su valor por defecto
+    Given una estrategia "LiberalStrategy" para un jugador sin creencias con "vote_early" a 0.0
+    Then el jugador debe votar "Nein" a un gobierno desconocido
+    And el parámetro "vote_late" debe valer 0.5
+
+  Scenario: Un parámetro desconocido lanza un error
+    When creo una estrategia "FascistStrategy" con el parámetro "no_existe"
+    Then la estrategia debe lanzar un ValueError
+
+  Scenario: Los parámetros se aplican solo a la facción indicada
+    Given una partida de torneo de 7 jugadores con semilla 3
+    When siento a todas las facciones con "role" y a los fascistas con "vote_default" a 0.1
+    Then los fascistas deben tener "vote_default" a 0.1
+    And los liberales deben tener sus parámetros por defecto
+
+  Scenario: Los candidatos de un lote juegan las mismas partidas
+    Given un ajuste de los liberales con 6 partidas por candidato y semilla 5
+    When evalúo dos veces los parámetros por defecto sin paralelismo
+    Then ambos candidatos deben tener el mismo porcentaje de victorias
+
+  Scenario: La búsqueda evolutiva respeta los intervalos de los parámetros
+    Given un ajuste de los liberales con 3 partidas por candidato y semilla 2
+    When ejecuto 2 generaciones de 3 candidatos sin paralelismo
+    Then se deben haber evaluado 6 candidatos
+    And los mejores parámetros deben estar dentro de sus intervalos
+
+  Scenario: Solo se ajustan estrategias con parámetros
+    When creo un ajuste de los liberales con la estrategia "random"
+    Then el ajuste debe lanzar un ValueError
@@ -0,0 +1,47 @@
+Feature: Máquina de estados de fases
+
+  Como motor del juego,
+  quiero una fase y sub-fase autoritativas con una tabla de transiciones,
+  para que las rutas comprueben la fase sin inferirla del resto del estado.
+
+  Scenario: Un estado nuevo empieza en la fase de configuración
+    Given un estado de juego nuevo
+    Then la fase del estado debe ser "setup" sin sub-fase
+
+  Scenario Outline: Transiciones permitidas por la tabla
+    Given un estado de juego en la fase "<origen>" con sub-fase "<sub_origen>"
+    When cambio la fase a "<destino>" con sub-fase "<sub_destino>"
+    Then la fase del estado debe ser "<destino>" con sub-fase "<sub_destino>"
+
+    Examples:
+      | origen      | sub_origen        | destino         | sub_destino       |
+      | election    | nomination        | voting          | voting            |
+      | voting      | voting            | legislative     | draw_policies     |
+      | voting      | voting            | election        | nomination        |
+      | legislative | draw_policies     | legislative     | president_discard |
+      | legislative | president_discard | legislative     | chancellor_enact  |
+      | legislative | chancellor_enact  | executive_power | execute_power     |
+      | legislative | chancellor_enact  | election        | nomination        |
+
+  Scenario Outline: Transiciones rechazadas por la tabla
+    Given un estado de juego en la fase "<origen>" con sub-fase "<sub_origen>"
+    When intento cambiar la fase a "<destino>" con sub-fase "<sub_destino>"
+    Then el cambio de fase debe rechazarse
+    And la fase del estado debe ser "<origen>" con sub-fase "<sub_origen>"
+
+    Examples:
+      | origen      | sub_origen        | destino     | sub_destino      |
+      | election    | nomination        | legislative | chancellor_enact |
+      | legislative | draw_policies     | voting      | voting           |
+      | legislative | president_discard | election    | nomination       |
+
+  Scenario: Terminar la partida lleva a la fase de fin de juego
+    Given un estado de juego en la fase "legislative" con sub-fase "chancellor_enact"
+    When marco la partida como terminada
+    Then la fase del estado debe ser "game_over" sin sub-fase
+    And intentar volver a la fase "election" debe rechazarse
+
+  Scenario: Una instantánea anterior a la máquina de fases se migra al cargarla
+    Given una instantánea antigua de un estado en la fase "voting"
+    When restauro el estado desde la instantánea
+    Then la fase del estado debe ser "voting" con sub-fase "voting"
@@ -0,0 +1,57 @@
+Feature: Creencias de los bots sobre los roles
+
+  Como jugador de Secret Hitler XL,
+  quiero que los bots razonen sobre los roles ocultos a partir de lo que ven,
+  para enfrentarme a rivales que deducen quién es quién durante la partida.
+
+  Scenario: La partida crea el motor de creencias al repartir los roles
+    Given una partida con creencias de 8 jugadores y semilla 3
+    Then el estado debe tener un motor de creencias sobre roles
+
+  Scenario: Las partidas simuladas no mantienen creencias por defecto
+    Given una partida sin creencias de 8 jugadores y semilla 3
+    Then el estado no debe tener un motor de creencias
+
+  Scenario: Las partidas de la API mantienen creencias
+    Given una partida de 6 bots iniciada a través de la API
+    Then la partida de la API debe tener un motor de creencias
+
+  Scenario: Las probabilidades de un observador son coherentes
+    Given una partida con creencias de 8 jugadores y semilla 5
+    And un observador liberal
+    Then las probabilidades de cada jugador deben sumar 1
+    And el observador debe estar seguro de su propio rol
+
+  Scenario: Un fascista conoce a sus compañeros
+    Given una partida con creencias de 8 jugadores y semilla 7
+    And un observador fascista
+    Then el observador debe estar seguro del rol de sus compañeros
+
+  Scenario: Una investigación fija el partido del investigado
+    Given una partida con creencias de 8 jugadores y semilla 11
+    And un observador liberal
+    When el observador investiga a otro jugador
+    Then el observador debe estar seguro del partido del investigado
+
+  Scenario: Un jugador muerto no es Hitler
+    Given una partida con creencias de 8 jugadores y semilla 13
+    And un observador liberal
+    When muere un jugador que no es Hitler
+    Then el observador debe descartar que el muerto sea Hitler
+
+  Scenario: Las políticas fascistas aumentan la sospecha sobre el gobierno
+    Given una partida con creencias de 8 jugadores y semilla 17
+    And un observador liberal
+    When dos jugadores desconocidos promulgan 3 políticas fascistas juntos
+    Then el observador debe sospechar más de ambos que antes
+
+  Scenario: Las copias y las instantáneas no conservan las partículas
+    Given una partida con creencias de 8 jugadores y semilla 19
+    And un observador liberal
+    When copio el estado y lo serializo
+    Then la copia del estado no debe tener motor de creencias
+    And la instantánea no debe conservar las partículas
+
+  Scenario: Una estrategia sin motor de creencias usa su lógica anterior
+    Given una estrategia liberal con un estado simulado
+    Then la estrategia no debe tener creencias
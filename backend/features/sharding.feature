@@ -0,0 +1,41 @@
+Feature: Despliegue particionado de la API
+
+  Como operador del servidor,
+  quiero repartir las partidas entre varios procesos,
+  para que el rendimiento de la API crezca con el número de núcleos.
+
+  Background:
+    Given un enrutador de la API con 2 procesos trabajadores
+
+  Scenario: Las partidas nuevas se reparten entre los procesos
+    When creo 4 partidas a través del enrutador
+    Then cada proceso trabajador debe ser dueño de alguna partida
+
+  Scenario: Las peticiones de una partida llegan al proceso que la guarda
+    When creo 4 partidas a través del enrutador
+    And un jugador se une a cada partida a través del enrutador
+    Then todas las uniones deben haberse aceptado
+
+  Scenario: Una partida inexistente responde 404 a través del enrutador
+    When consulto el estado de la partida "missing" a través del enrutador
+    Then la respuesta del enrutador debe tener código 404
+
+  Scenario: Las rutas sin partida se atienden a través del enrutador
+    When consulto la salud del servidor a través del enrutador
+    Then la respuesta del enrutador debe tener código 200
+
+  Scenario: El listado de salas reúne las partidas de todos los procesos
+    When creo 4 partidas a través del enrutador
+    And pido el listado de salas en espera a través del enrutador
+    Then el listado del enrutador debe incluir las 4 partidas
+
+  Scenario: La salud de las partidas suma todos los procesos
+    When creo 4 partidas a través del enrutador
+    And consulto la salud de las partidas a través del enrutador
+    Then la salud del enrutador debe contar 4 partidas en 2 procesos
+
+  Scenario: Las métricas del enrutador etiquetan cada proceso
+    When creo 4 partidas a través del enrutador
+    And consulto las métricas a través del enrutador
+    Then las métricas deben incluir las partidas de cada proceso
+    And cada métrica debe tener una sola cabecera
@@ -0,0 +1,44 @@
+Feature: Diario de instantáneas de las partidas
+
+  Como operador del servidor,
+  quiero que la imagen de cada partida tras una acción aceptada quede en disco,
+  para recuperar las partidas en curso si el proceso se reinicia.
+
+  Background:
+    Given un almacén en memoria con diario de instantáneas
+
+  Scenario: Las partidas se recuperan tras un reinicio
+    When creo una partida con 3 jugadores unidos a través de la API
+    And el proceso se reinicia sin cerrar el almacén
+    Then se debe haber recuperado 1 partida
+    And la partida recuperada debe tener 3 jugadores
+
+  Scenario: Cada entrada anota la ruta de la acción que la provocó
+    When creo una partida con 3 jugadores unidos a través de la API
+    Then el diario de la partida debe incluir la acción "POST" a "/join"
+
+  Scenario: El diario se compacta en una instantánea
+    Given el diario se compacta cada 2 escrituras
+    When creo una partida con 3 jugadores unidos a través de la API
+    Then la partida debe tener una instantánea compacta
+    And el diario de la partida debe tener menos de 2 entradas
+
+  Scenario: El diario se compacta al superar su tamaño máximo
+    Given el diario se compacta al superar 1 bytes
+    When creo una partida con 3 jugadores unidos a través de la API
+    Then la partida debe tener una instantánea compacta
+    And el diario de la partida debe tener menos de 1 entradas
+    When el proceso se reinicia sin cerrar el almacén
+    Then la partida recuperada debe tener 3 jugadores
+
+  Scenario: Una escritura interrumpida se descarta al recuperar
+    When creo una partida con 3 jugadores unidos a través de la API
+    And el diario de la partida termina con una escritura interrumpida
+    And el proceso se reinicia sin cerrar el almacén
+    Then la partida recuperada debe tener 3 jugadores
+
+  Scenario: Las partidas eliminadas no se recuperan
+    When creo una partida con 3 jugadores unidos a través de la API
+    And elimino la partida del almacén con diario
+    And el proceso se reinicia sin cerrar el almacén
+    Then se debe haber recuperado 0 partida
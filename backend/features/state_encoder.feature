@@ -0,0 +1,40 @@
+Feature: Vista numérica del estado de la partida
+
+  Como desarrollador de bots y análisis de Secret Hitler XL,
+  quiero un vector de tamaño fijo con lo que cada jugador ve de la partida
+  que se actualice de forma incremental con cada evento,
+  para extraer características sin recorrer el estado en cada decisión.
+
+  Scenario: El vector tiene el mismo tamaño con cualquier número de jugadores
+    Given una partida codificada de 6 jugadores con semilla 3
+    And otra partida codificada de 16 jugadores con semilla 3
+    Then los vectores de ambas partidas deben tener FEATURE_SIZE valores
+
+  Scenario: El observador ocupa el primer asiento
+    Given una partida codificada de 8 jugadores con semilla 5
+    When codifico la partida desde el tercer jugador
+    Then el primer asiento debe ser el del observador
+    And el asiento del presidente debe estar marcado como presidente
+
+  Scenario: Un fascista conoce a Hitler y un liberal no
+    Given una partida codificada de 8 jugadores con semilla 7
+    Then el vector de un fascista debe marcar a Hitler como conocido
+    And el vector de un liberal solo debe conocer su propio rol
+
+  Scenario: Una votación actualiza solo el resumen de votos
+    Given una partida codificada de 8 jugadores con semilla 11
+    When codifico la partida desde el tercer jugador
+    And se registra una votación en la que todos votan a favor
+    Then el porcentaje de votos a favor de cada asiento debe ser 1
+    And los tableros del vector no deben cambiar
+
+  Scenario: El vector se reutiliza mientras la partida no cambia
+    Given una partida codificada de 8 jugadores con semilla 13
+    When codifico la partida desde el tercer jugador
+    Then codificarla de nuevo debe devolver el mismo vector
+    And tras subir el contador de elecciones el vector debe reflejarlo
+
+  Scenario: La cabecera coincide con el estado durante una partida completa
+    Given una partida codificada de 8 jugadores con semilla 17
+    When juego la partida codificada comprobando cada decisión
+    Then la cabecera del vector debe coincidir siempre con el estado
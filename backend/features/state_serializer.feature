@@ -0,0 +1,23 @@
+Feature: Serialización rápida del estado de la partida
+
+  Como servidor de la API,
+  quiero serializar el estado de la partida en un único recorrido,
+  para responder a las consultas de estado con menos CPU sin cambiar el formato.
+
+  Scenario Outline: El serializador produce el mismo estado que las funciones auxiliares
+    Given una partida de API con <player_count> jugadores en curso
+    And la partida de API tiene <liberal> políticas liberales y <fascist> fascistas
+    And la partida de API tiene un gobierno anterior
+    When serializo el estado de la partida de API
+    Then el estado serializado debe coincidir con el de las funciones auxiliares
+
+    Examples:
+      | player_count | liberal | fascist |
+      | 6            | 0       | 0       |
+      | 11           | 2       | 1       |
+      | 16           | 3       | 4       |
+
+  Scenario: La codificación JSON funciona sin orjson
+    Given una partida de API con 16 jugadores en curso
+    When serializo el estado de la partida de API sin orjson
+    Then el documento JSON debe contener 16 jugadores
@@ -0,0 +1,162 @@
+import asyncio
+import json
+import threading
+from unittest.mock import patch
+
+# mypy: disable-error-code=import
+from behave import given, then, when
+from src.api.app import create_app
+from src.api.asgi import GameASGIApp
+from src.api.storage import games
+
+
+async def _asgi_request(app, method, path, body=None, query=""):
+    """Send one HTTP request through an ASGI app and collect the response."""
+    content = json.dumps(body).encode() if body is not None else b""
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query.encode(),
+        "headers": [(b"content-type", b"application/json")],
+    }
+    messages = [{"type": "http.request", "body": content, "more_body": False}]
+    sent = []
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        await asyncio.sleep(3600)
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    status = sent[0]["status"]
+    payload = b"".join(m.get("body", b"") for m in sent[1:])
+    return status, json.loads(payload) if payload else None
+
+
+def _request(context, method, path, body=None, query=""):
+    """Run a single ASGI request and store its response."""
+    context.asgi_status, context.asgi_payload = asyncio.run(
+        _asgi_request(context.asgi_app, method, path, body, query)
+    )
+
+
+@given("una aplicación ASGI de la API")
+def step_given_asgi_app(context):
+    """Wrap a fresh Flask app in the ASGI front-end."""
+    context.asgi_app = GameASGIApp(create_app(), max_workers=4)
+    context.add_cleanup(context.asgi_app.executor.shutdown)
+
+
+@when("creo una partida de {player_count:d} jugadores a través de ASGI")
+@given("una partida de {player_count:d} jugadores creada a través de ASGI")
+def step_create_game_asgi(context, player_count):
+    """Create a game through the ASGI app."""
+    _request(context, "POST", "/newgame", {"playerCount": player_count})
+    if context.asgi_status == 201:
+        context.asgi_game_id = context.asgi_payload["gameID"]
+
+
+@when("espero cambios en la partida mientras un jugador se une a través de ASGI")
+def step_when_long_poll_with_join(context):
+    """Start a long-poll, then join a player and collect the long-poll result."""
+    app = context.asgi_app
+    game_id = context.asgi_game_id
+
+    async def scenario():
+        since = games.version(game_id)
+        poll = asyncio.ensure_future(
+            _asgi_request(
+                app, "GET", f"/games/{game_id}/events", query=f"since={since}&timeout=5"
+            )
+        )
+        await asyncio.sleep(0.05)
+        await _asgi_request(
+            app, "POST", f"/games/{game_id}/join", {"playerName": "Alice"}
+        )
+        return await poll
+
+    context.asgi_status, context.asgi_payload = asyncio.run(scenario())
+
+
+@when("espero cambios en la partida durante {timeout:f} segundos")
+def step_when_long_poll_timeout(context, timeout):
+    """Long-poll the current version of the game until the timeout."""
+    since = games.version(context.asgi_game_id)
+    _request(
+        context,
+        "GET",
+        f"/games/{context.asgi_game_id}/events",
+        query=f"since={since}&timeout={timeout}",
+    )
+
+
+@when('espero cambios en la partida "{game_id}" durante {timeout:f} segundos')
+def step_when_long_poll_missing(context, game_id, timeout):
+    """Long-poll a game that does not exist."""
+    _request(context, "GET", f"/games/{game_id}/events", query=f"timeout={timeout}")
+
+
+@then("la respuesta ASGI debe tener código {status:d}")
+def step_then_asgi_status(context, status):
+    """Check the HTTP status of the last ASGI response."""
+    assert context.asgi_status == status, context.asgi_payload
+
+
+@then("la respuesta ASGI debe incluir el ID de la partida")
+def step_then_asgi_game_id(context):
+    """Check that the game creation response includes the game ID."""
+    assert context.asgi_payload["gameID"]
+
+
+@then("la consulta en espera debe indicar que la partida cambió")
+def step_then_long_poll_changed(context):
+    """Check that the long-poll returned a new version."""
+    assert context.asgi_status == 200
+    assert context.asgi_payload["changed"] is True
+
+
+@then("la consulta en espera debe indicar que la partida no cambió")
+def step_then_long_poll_unchanged(context):
+    """Check that the long-poll timed out without changes."""
+    assert context.asgi_status == 200
+    assert context.asgi_payload["changed"] is False
+
+
+@then("el estado recibido debe tener {count:d} jugadores")
+def step_then_long_poll_players(context, count):
+    """Check the player count of the state returned by the long-poll."""
+    assert len(context.asgi_payload["state"]["players"]) == count
+
+
+@when(
+    "espero cambios en la partida durante {timeout:f} segundos registrando las "
+    "consultas de versión"
+)
+def step_when_long_poll_recording_versions(context, timeout):
+    """Long-poll while recording the thread of every version query."""
+    context.version_threads = []
+    version = games.version
+
+    def recorded(game_id):
+        context.version_threads.append(threading.current_thread().name)
+        return version(game_id)
+
+    with patch.object(games, "version", recorded):
+        _request(
+            context,
+            "GET",
+            f"/games/{context.asgi_game_id}/events",
+            query=f"since={version(context.asgi_game_id)}&timeout={timeout}",
+        )
+
+
+@then("las consultas de versión deben haberse ejecutado en el pool del motor")
+def step_then_versions_in_pool(context):
+    """Every version query, including the rechecks, ran off the event loop."""
+    threads = context.version_threads
+    assert len(threads) >= 2, threads
+    assert all(name.startswith("shxl-engine") for name in threads), threads
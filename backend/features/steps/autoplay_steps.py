@@ -0,0 +1,198 @@
+import random
+import threading
+
+# mypy: disable-error-code=import
+from behave import given, then, when
+from src.api.app import create_app
+from src.api.autoplay import get_autoplay
+from src.api.game_actions import next_step
+from src.api.storage import games
+
+
+def _autoplay_client(context):
+    """Create a Flask app and test client for the scenario."""
+    context.autoplay_app = create_app()
+    context.autoplay_client = context.autoplay_app.test_client()
+    return context.autoplay_client
+
+
+def _status(context):
+    """Fetch the autoplay job status through the API."""
+    response = context.autoplay_client.get(
+        f"/games/{context.autoplay_game_id}/autoplay"
+    )
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()
+
+
+@given(
+    "una partida iniciada con {humans:d} humanos y {bots:d} bots para juego automático"
+)
+def step_given_autoplay_game(context, humans, bots):
+    """Create, fill and start a game through the Flask routes."""
+    random.seed(1)
+    client = _autoplay_client(context)
+    response = client.post("/newgame", json={"playerCount": humans + bots})
+    context.autoplay_game_id = response.get_json()["gameID"]
+    for i in range(humans):
+        client.post(
+            f"/games/{context.autoplay_game_id}/join", json={"playerName": f"H{i}"}
+        )
+    if bots:
+        client.post(f"/games/{context.autoplay_game_id}/add-bots", json={"count": bots})
+    response = client.post(
+        f"/games/{context.autoplay_game_id}/start", json={"hostPlayerID": 0}
+    )
+    assert response.status_code == 200, response.get_json()
+
+
+@given("una partida de {players:d} jugadores sin iniciar para juego automático")
+def step_given_waiting_game(context, players):
+    """Create a game without starting it."""
+    client = _autoplay_client(context)
+    response = client.post("/newgame", json={"playerCount": players})
+    context.autoplay_game_id = response.get_json()["gameID"]
+
+
+@when("pido el juego automático de la partida")
+def step_when_start_autoplay(context):
+    """Start autoplay until the game is over."""
+    response = context.autoplay_client.post(
+        f"/games/{context.autoplay_game_id}/autoplay", json={}
+    )
+    context.autoplay_status = response.status_code
+    context.autoplay_payload = response.get_json()
+
+
+@when("pido el juego automático de la partida hasta la ronda {round_number:d}")
+def step_when_start_autoplay_until_round(context, round_number):
+    """Start autoplay until a given round."""
+    response = context.autoplay_client.post(
+        f"/games/{context.autoplay_game_id}/autoplay",
+        json={"untilRound": round_number},
+    )
+    context.autoplay_status = response.status_code
+    context.autoplay_payload = response.get_json()
+
+
+@when('pido el juego automático de la partida "{game_id}"')
+def step_when_start_autoplay_missing(context, game_id):
+    """Start autoplay on a game id that does not exist."""
+    client = _autoplay_client(context)
+    response = client.post(f"/games/{game_id}/autoplay", json={})
+    context.autoplay_status = response.status_code
+    context.autoplay_payload = response.get_json()
+
+
+@when("envío la nominación del bot pidiendo respuesta asíncrona")
+def step_when_nominate_async(context):
+    """Ask for the bot president's nomination with Prefer: respond-async."""
+    context.autoplay_version = games.version(context.autoplay_game_id)
+    response = context.autoplay_client.post(
+        f"/games/{context.autoplay_game_id}/nominate",
+        json={},
+        headers={"Prefer": "respond-async"},
+    )
+    context.autoplay_status = response.status_code
+    context.autoplay_payload = response.get_json()
+
+
+def _record_threads(player, method, threads):
+    """Record the thread that runs each call to a bot decision method."""
+    decide = getattr(player, method)
+
+    def recorded(*args, **kwargs):
+        threads.append(threading.current_thread().name)
+        return decide(*args, **kwargs)
+
+    setattr(player, method, recorded)
+
+
+@when("envío la nominación del bot sin pedir respuesta asíncrona")
+def step_when_nominate_sync(context):
+    """Ask for the bot president's nomination without the async preference."""
+    context.autoplay_threads = []
+    for player in games.store.get(context.autoplay_game_id).state.players:
+        for method in ("nominate_chancellor", "vote"):
+            _record_threads(player, method, context.autoplay_threads)
+    response = context.autoplay_client.post(
+        f"/games/{context.autoplay_game_id}/nominate", json={}
+    )
+    context.autoplay_status = response.status_code
+    context.autoplay_payload = response.get_json()
+
+
+@when("pido que avancen los bots de la partida")
+def step_when_advance_bots(context):
+    """Queue the pending bot steps of the game."""
+    response = context.autoplay_client.post(
+        f"/games/{context.autoplay_game_id}/bots/advance"
+    )
+    context.autoplay_status = response.status_code
+    context.autoplay_payload = response.get_json()
+
+
+@when("espero a que termine el juego automático")
+def step_when_wait_autoplay(context):
+    """Block until the background job finishes."""
+    assert context.autoplay_status == 202, context.autoplay_payload
+    with context.autoplay_app.app_context():
+        job = get_autoplay().get(context.autoplay_game_id)
+    job.future.result(timeout=30)
+
+
+@then("la respuesta del juego automático debe tener código {status:d}")
+def step_then_autoplay_status(context, status):
+    """Check the HTTP status of the autoplay request."""
+    assert context.autoplay_status == status, context.autoplay_payload
+
+
+@then('el juego automático debe haber terminado por "{reason}"')
+def step_then_autoplay_reason(context, reason):
+    """Check why the autoplay job stopped."""
+    status = _status(context)
+    assert status["status"] == "finished", status
+    assert status["stoppedReason"] == reason, status
+
+
+@then("la partida debe haber terminado")
+def step_then_autoplay_game_over(context):
+    """The game reached game over."""
+    assert _status(context)["gameState"] == "game_over"
+
+
+@then("la partida debe estar al menos en la ronda {round_number:d}")
+def step_then_autoplay_round(context, round_number):
+    """The game reached the requested round and is still running."""
+    status = _status(context)
+    assert status["roundNumber"] >= round_number, status
+    assert status["gameState"] == "in_progress", status
+
+
+@then("la respuesta debe indicar la versión de la partida antes de la acción")
+def step_then_async_version(context):
+    """The 202 response carries the version to poll from."""
+    assert context.autoplay_payload["version"] == context.autoplay_version
+    assert context.autoplay_payload["eventsUrl"].endswith("/events")
+
+
+@then("el siguiente paso de la partida debe corresponder a un humano")
+def step_then_next_step_human(context):
+    """The bots stopped at a human step."""
+    step = next_step(games.get(context.autoplay_game_id))
+    assert step is not None and step["actor"] == "human", step
+
+
+@then("la respuesta debe incluir la nominación del bot")
+def step_then_sync_nomination(context):
+    """The response carries the result of the action, not a queued job."""
+    assert "fullElectionResult" in context.autoplay_payload, context.autoplay_payload
+    assert "autoplay" not in context.autoplay_payload
+
+
+@then("las estrategias de los bots deben haberse ejecutado en el pool")
+def step_then_strategies_in_pool(context):
+    """Every recorded bot decision ran on an autoplay worker thread."""
+    threads = context.autoplay_threads
+    assert threads, "no bot decision was recorded"
+    assert all(name.startswith("shxl-autoplay") for name in threads), threads
@@ -0,0 +1,156 @@
+# mypy: disable-error-code=import
+from behave import given, then, when
+from src.api.app import create_app
+from src.api.game_actions import dispatch_action
+from src.api.storage import games
+
+
+def _nomination(context):
+    """Nominate the first eligible chancellor on behalf of the president."""
+    state = context.batch_client.get(f"/games/{context.batch_game_id}/state")
+    state = state.get_json()
+    nominee = state["nomination"]["eligibleChancellors"][0]["id"]
+    return {"action": "nominate", "nomineeId": nominee}
+
+
+def _votes(vote):
+    """One vote per player."""
+    return [{"action": "vote", "playerId": i, "vote": vote} for i in range(5)]
+
+
+def _post_batch(context, actions, game_id=None, **extra):
+    """Send a batch of actions and store the response."""
+    game_id = game_id or context.batch_game_id
+    response = context.batch_client.post(
+        f"/games/{game_id}/actions", json={"actions": actions, **extra}
+    )
+    context.batch_status = response.status_code
+    context.batch_payload = response.get_json()
+
+
+@given("una partida iniciada con 5 jugadores humanos para acciones en lote")
+def step_given_batch_game(context):
+    """Create and start a game with five human players."""
+    context.batch_client = create_app().test_client()
+    response = context.batch_client.post("/newgame", json={"playerCount": 5})
+    context.batch_game_id = response.get_json()["gameID"]
+    for i in range(5):
+        context.batch_client.post(
+            f"/games/{context.batch_game_id}/join", json={"playerName": f"P{i}"}
+        )
+    response = context.batch_client.post(
+        f"/games/{context.batch_game_id}/start", json={"hostPlayerID": 0}
+    )
+    assert response.status_code == 200, response.get_json()
+    context.batch_version = games.version(context.batch_game_id)
+
+
+@when('envío en lote la nominación y los votos "{vote}" de todos los jugadores')
+def step_when_batch_election(context, vote):
+    """Nominate and vote in a single batch."""
+    _post_batch(context, [_nomination(context)] + _votes(vote))
+
+
+@when(
+    'envío en lote la nominación, los votos "{vote}" y una promulgación sin robo previo'
+)
+def step_when_batch_failing(context, vote):
+    """Append an enact action that the legislative routes must reject."""
+    enact = {"action": "enact", "enactIndex": 0}
+    _post_batch(context, [_nomination(context)] + _votes(vote) + [enact])
+
+
+@when("envío en lote la nominación sobre una versión anterior de la partida")
+def step_when_batch_stale(context):
+    """Send a batch that expects an older version of the game."""
+    _post_batch(
+        context, [_nomination(context)], expectedVersion=context.batch_version - 1
+    )
+
+
+@when('envío en lote la acción "{action}"')
+def step_when_batch_unknown(context, action):
+    """Send a batch with a single arbitrary action."""
+    _post_batch(context, [{"action": action}])
+
+
+@when('envío en lote la nominación a la partida "{game_id}"')
+def step_when_batch_missing(context, game_id):
+    """Send a batch to a game id that does not exist."""
+    _post_batch(context, [{"action": "nominate", "nomineeId": 1}], game_id=game_id)
+
+
+def _dispatch(context, action, body):
+    """Run an action through the shared core, outside any request."""
+    app = context.batch_client.application
+    context.dispatch_status, context.dispatch_payload = dispatch_action(
+        app, context.batch_game_id, action, body
+    )
+
+
+@when("despacho fuera de una petición la nominación del presidente")
+def step_when_dispatch_nomination(context):
+    """Nominate the first eligible chancellor without an HTTP request."""
+    nomination = _nomination(context)
+    _dispatch(context, "nominate", {"nomineeId": nomination["nomineeId"]})
+
+
+@when('despacho fuera de una petición la acción "{action}"')
+def step_when_dispatch_action(context, action):
+    """Dispatch an arbitrary action without an HTTP request."""
+    _dispatch(context, action, {})
+
+
+@then("la acción despachada debe tener código {status:d}")
+def step_then_dispatch_status(context, status):
+    """Check the status returned by dispatch_action."""
+    assert context.dispatch_status == status, context.dispatch_payload
+
+
+@then("la versión de la partida debe ser la siguiente a la inicial")
+def step_then_dispatch_persisted(context):
+    """The dispatched action was saved as a new version."""
+    assert games.version(context.batch_game_id) == context.batch_version + 1
+
+
+@then("la versión de la partida debe seguir siendo la inicial")
+def step_then_dispatch_discarded(context):
+    """The failed action left the stored game untouched."""
+    assert games.version(context.batch_game_id) == context.batch_version
+
+
+@then("la respuesta del lote debe tener código {status:d}")
+def step_then_batch_status(context, status):
+    """Check the HTTP status of the batch response."""
+    assert context.batch_status == status, context.batch_payload
+
+
+@then("todas las acciones del lote deben haberse aplicado")
+def step_then_batch_applied(context):
+    """Every action in the batch succeeded."""
+    results = context.batch_payload["results"]
+    assert context.batch_payload["applied"] == len(results) == 6
+    assert all(result["status"] == 200 for result in results), results
+
+
+@then("el lote debe indicar que falló la acción {index:d}")
+def step_then_batch_failed_index(context, index):
+    """Check which action made the batch fail."""
+    assert context.batch_payload["failedIndex"] == index
+    assert context.batch_payload["results"][-1]["index"] == index
+
+
+@then("la versión de la partida debe haber avanzado {delta:d}")
+def step_then_batch_version(context, delta):
+    """Compare the stored version with the one before the batch."""
+    version = games.version(context.batch_game_id)
+    assert version == context.batch_version + delta, version
+    if context.batch_status == 200:
+        assert context.batch_payload["version"] == version
+
+
+@then('la partida debe estar en la fase "{phase}"')
+def step_then_batch_phase(context, phase):
+    """Check the phase reported by the state route."""
+    response = context.batch_client.get(f"/games/{context.batch_game_id}/state")
+    assert response.get_json()["currentPhase"]["name"] == phase
@@ -0,0 +1,110 @@
+from itertools import product
+from types import SimpleNamespace
+
+# mypy: disable-error-code=import
+from behave import given, then
+from src.players.strategies.decision_tables import (
+    COMMUNIST_VETO,
+    FASCIST_VETO,
+    LIBERAL_VETO,
+    POLICY_ORDER,
+    ROLE_PRIORITIES,
+    SMART_ACCEPT_VETO,
+    SMART_FILTER_ORDER,
+)
+from src.policies.deck_odds import POLICY_TYPES
+
+VETO_TABLES = {
+    "liberal": LIBERAL_VETO,
+    "fascista": FASCIST_VETO,
+    "comunista": COMMUNIST_VETO,
+}
+
+ACCEPT_VETO_ANSWERS = {"aceptar": True, "rechazar": False, "dejar al azar": None}
+
+
+def _hand(text):
+    """Build policies from a comma separated list of types."""
+    return [SimpleNamespace(type=name.strip()) for name in text.split(",")]
+
+
+def _types(policies):
+    """Policy types of a list of policies."""
+    return [policy.type for policy in policies]
+
+
+@given('la tabla de orden de políticas del rol "{role}"')
+def step_given_policy_order(context, role):
+    """Select the compiled policy order of a role strategy."""
+    context.role = role
+    context.decision_table = POLICY_ORDER[role]
+
+
+@given('la tabla de filtrado de SmartStrategy del rol "{role}"')
+def step_given_smart_filter(context, role):
+    """Select the compiled presidential filter of SmartStrategy."""
+    context.decision_table = SMART_FILTER_ORDER[role]
+
+
+@then("cada mano de 3 cartas debe ordenarse como con sorted por prioridad")
+def step_then_matches_sorted(context):
+    """The table reproduces the sort the role strategies used to run."""
+    priority = ROLE_PRIORITIES[context.role]
+    for types in product(POLICY_TYPES, repeat=3):
+        policies = _hand(", ".join(types))
+        expected = sorted(policies, key=lambda p: priority.get(p.type, 0), reverse=True)
+        order = context.decision_table.lookup(policies)
+        assert [policies[i] for i in order] == expected, types
+
+
+@then("la tabla debe contener todas las manos de 2 y 3 cartas")
+def step_then_precompiled(context):
+    """Every 2 and 3 card hand is compiled at import."""
+    count = len(POLICY_TYPES)
+    assert len(context.decision_table) >= count**2 + count**3
+    for types in product(POLICY_TYPES, repeat=2):
+        assert types in context.decision_table
+
+
+@then("consultar la misma mano dos veces debe devolver el mismo objeto")
+def step_then_same_decision(context):
+    """Lookups return the compiled entry instead of recomputing it."""
+    table = context.decision_table
+    first = table.lookup(_hand("fascist, liberal, communist"))
+    assert table.lookup(_hand("fascist, liberal, communist")) is first
+
+
+@then('la mano "{hand}" debe quedarse con "{kept}"')
+def step_then_smart_keeps(context, hand, kept):
+    """The president keeps the first two cards of the compiled order."""
+    policies = _hand(hand)
+    order = context.decision_table.lookup(policies)
+    assert _types(policies[i] for i in order[:2]) == _types(_hand(kept)), order
+
+
+@then('el veto {faction} debe aceptar "{accepted}" y rechazar "{rejected}"')
+def step_then_veto(context, faction, accepted, rejected):
+    """Veto tables only look at the policy types in hand."""
+    table = VETO_TABLES[faction]
+    assert table.lookup(_hand(accepted)) is True
+    assert table.lookup(_hand(rejected)) is False
+
+
+@then('la mano "{hand}" debe ordenarse como "{expected}"')
+def step_then_uncompiled_hand(context, hand, expected):
+    """Hands of other sizes are computed on first use and cached."""
+    policies = _hand(hand)
+    order = context.decision_table.lookup(policies)
+    assert _types(policies[i] for i in order) == _types(_hand(expected))
+    assert tuple(p.type for p in policies) in context.decision_table
+
+
+@then(
+    'SmartStrategy "{role}" debe {normal} el veto de "{hand}" lejos del caos '
+    "y {chaos} al borde del caos"
+)
+def step_then_smart_accept_veto(context, role, normal, hand, chaos):
+    """The accept-veto table is keyed on the tracker as well as the hand."""
+    table = SMART_ACCEPT_VETO[role]
+    assert table[False].lookup(_hand(hand)) is ACCEPT_VETO_ANSWERS[normal]
+    assert table[True].lookup(_hand(hand)) is ACCEPT_VETO_ANSWERS[chaos]
@@ -0,0 +1,126 @@
+from fractions import Fraction
+from unittest.mock import Mock
+
+# mypy: disable-error-code=import
+from behave import given, then, when
+from src.game.board import GameBoard
+from src.policies.deck_odds import (
+    claim_probability,
+    composition_key,
+    draw_table,
+    hand_probability,
+)
+from src.policies.policy_factory import PolicyFactory
+
+
+def _close(value, expected):
+    """Compare a probability with an exact fraction written as text."""
+    return abs(value - float(Fraction(expected))) < 1e-12
+
+
+@given("un mazo con {liberals:d} cartas liberal y {fascists:d} cartas fascist")
+def step_given_deck(context, liberals, fascists):
+    """Build a composition key from policy type counts."""
+    context.composition = composition_key(
+        ["liberal"] * liberals + ["fascist"] * fascists
+    )
+
+
+@given("un tablero de {count:d} jugadores con el mazo inicial")
+def step_given_board_with_deck(context, count):
+    """Create a board on a mocked state and deal the initial policy deck."""
+    state = Mock()
+    state.enacted_policies = 0
+    state.round_number = 1
+    context.odds_board = GameBoard(state, count, True)
+    state.board = context.odds_board
+    context.odds_board.initialize_policy_deck(PolicyFactory)
+
+
+@when("calculo la tabla de robo de {count:d} cartas")
+def step_when_draw_table(context, count):
+    """Compute the draw table for the composition."""
+    context.odds_table = draw_table(context.composition, count)
+
+
+@when("calculo la tabla de robo de {count:d} cartas dos veces")
+def step_when_draw_table_twice(context, count):
+    """Compute the same draw table twice."""
+    context.tables = [draw_table(context.composition, count) for _ in range(2)]
+
+
+@when("el presidente roba {count:d} políticas")
+def step_when_president_draws(context, count):
+    """Draw the presidential hand from the board."""
+    context.hand = context.odds_board.draw_policy(count)
+
+
+@when("descarta 1 de ellas y se promulga otra")
+def step_when_discard_and_enact(context):
+    """Discard one card, enact another and leave the last in the hand."""
+    context.odds_board.discard(context.hand[0])
+    context.odds_board.enact_policy(context.hand[1])
+
+
+@then("las probabilidades de la tabla deben sumar 1")
+def step_then_table_sums(context):
+    """Every draw table is a probability distribution."""
+    assert abs(sum(context.odds_table.values()) - 1.0) < 1e-12
+
+
+@then("la probabilidad de robar {count:d} cartas {policy_type} debe ser {expected}")
+def step_then_exact_hand(context, count, policy_type, expected):
+    """Check the probability of an all-same-type hand."""
+    hand = composition_key([policy_type] * count)
+    assert _close(context.odds_table[hand], expected), context.odds_table[hand]
+
+
+@then(
+    "la probabilidad de robar al menos {at_least:d} carta {policy_type} "
+    "debe ser {expected}"
+)
+def step_then_at_least(context, at_least, policy_type, expected):
+    """Check the probability of drawing at least some cards of a type."""
+    value = hand_probability(context.composition, policy_type, 3, at_least)
+    assert _close(value, expected), value
+
+
+@then("ambas tablas deben ser el mismo objeto")
+def step_then_same_table(context):
+    """Tables are memoized per composition and hand size."""
+    assert context.tables[0] is context.tables[1]
+
+
+@then('la declaración "{claim}" debe tener probabilidad {expected}')
+def step_then_claim(context, claim, expected):
+    """Check the probability of a claimed hand."""
+    value = claim_probability(context.composition, claim.split(", "))
+    assert _close(value, expected), value
+
+
+@then("la composición pública debe contar el mazo y los descartes")
+def step_then_public_composition(context):
+    """Cards in the hand and on the tracks are not counted."""
+    board = context.odds_board
+    expected = composition_key(board.policies + board.discards)
+    assert board.public_deck_composition() == expected
+    dealt = composition_key(PolicyFactory.create_policy_deck(board.player_count))
+    assert sum(expected) == sum(dealt) - 2
+
+
+@then("la composición pública no debe cambiar al barajar los descartes en el mazo")
+def step_then_composition_after_reshuffle(context):
+    """Reshuffling moves cards between piles without changing the composition."""
+    board = context.odds_board
+    before = board.public_deck_composition()
+    board.policies.extend(board.discards)
+    board.discards = []
+    assert board.public_deck_composition() == before
+
+
+@then("las probabilidades del próximo robo deben usar la composición pública")
+def step_then_board_odds(context):
+    """The board exposes the memoized table of its public composition."""
+    board = context.odds_board
+    assert board.draw_odds() is draw_table(board.public_deck_composition(), 3)
+    assert board.draw_odds(2) is draw_table(board.public_deck_composition(), 2)
@@ -0,0 +1,86 @@
+# mypy: disable-error-code=import
+from behave import given, then, when
+from src.api.app import create_app
+
+
+@given("una aplicación de la API con {count:d} salas de {players:d} jugadores")
+def step_given_lobbies(context, count, players):
+    """Create several empty game rooms."""
+    context.lobby_client = create_app().test_client()
+    context.lobby_games = [
+        context.lobby_client.post("/newgame", json={"playerCount": players}).get_json()[
+            "gameID"
+        ]
+        for _ in range(count)
+    ]
+
+
+@given("un jugador se ha unido a la primera sala")
+def step_given_join_first(context):
+    """Join one human to the first room."""
+    response = context.lobby_client.post(
+        f"/games/{context.lobby_games[0]}/join", json={"playerName": "Alice"}
+    )
+    assert response.status_code == 200
+
+
+@given("la última sala se ha llenado de bots y ha empezado")
+def step_given_start_last(context):
+    """Fill the last room with bots and start it."""
+    game_id = context.lobby_games[-1]
+    context.lobby_client.post(f"/games/{game_id}/add-bots", json={"count": 6})
+    response = context.lobby_client.post(
+        f"/games/{game_id}/start", json={"hostPlayerID": 0}
+    )
+    assert response.status_code == 200, response.get_json()
+
+
+@when('pido el listado de salas en estado "{state}"')
+def step_when_list(context, state):
+    """List the rooms in one state."""
+    response = context.lobby_client.get("/games", query_string={"state": state})
+    context.lobby_status = response.status_code
+    context.lobby_payload = response.get_json()
+
+
+@when('pido el listado de salas en estado "{state}" con {limit:d} sala por página')
+def step_when_list_page(context, state, limit):
+    """List one page of rooms."""
+    response = context.lobby_client.get(
+        "/games", query_string={"state": state, "limit": limit}
+    )
+    context.lobby_status = response.status_code
+    context.lobby_payload = response.get_json()
+
+
+@then("el listado debe tener código {status:d}")
+def step_then_status(context, status):
+    """Check the HTTP status of the listing."""
+    assert context.lobby_status == status, context.lobby_payload
+
+
+@then("el listado debe tener {count:d} salas en total")
+def step_then_total(context, count):
+    """Check the number of matching rooms."""
+    assert context.lobby_payload["total"] == count, context.lobby_payload
+
+
+@then("el listado debe tener {count:d} salas en la página")
+def step_then_page(context, count):
+    """Check the size of the returned page."""
+    assert len(context.lobby_payload["games"]) == count, context.lobby_payload
+
+
+@then("la primera sala del listado debe tener {current:d} jugadores de {maximum:d}")
+def step_then_first_room(context, current, maximum):
+    """The most recently active room comes first with its occupancy."""
+    room = context.lobby_payload["games"][0]
+    assert room["gameId"] == context.lobby_games[0], room
+    assert room["currentPlayers"] == current, room
+    assert room["maxPlayers"] == maximum, room
+
+
+@then("el listado debe indicar que la siguiente página empieza en {offset:d}")
+def step_then_next_offset(context, offset):
+    """Check the offset of the next page."""
+    assert context.lobby_payload["nextOffset"] == offset, context.lobby_payload
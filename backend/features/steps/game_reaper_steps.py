@@ -0,0 +1,117 @@
+import tempfile
+import threading
+import time
+
+# mypy: disable-error-code=import
+from behave import given, then, when
+from src.api.game_reaper import GameArchive, GameReaper, create_reaper_from_env
+from src.api.storage import game_lock
+
+
+@given("un recolector con TTL de {ttl:d} segundos para partidas en espera")
+def step_given_reaper_waiting_ttl(context, ttl):
+    """Create a reaper with a TTL for waiting games."""
+    context.reaper = GameReaper(
+        context.store, ttls={"waiting_for_players": ttl}, interval=0
+    )
+
+
+@given(
+    "un recolector con volcado a disco y TTL de {ttl:d} segundos para partidas terminadas"
+)
+def step_given_reaper_with_archive(context, ttl):
+    """Create a reaper that spills finished games to a temporary directory."""
+    directory = tempfile.TemporaryDirectory()
+    context.add_cleanup(directory.cleanup)
+    context.archive = GameArchive(directory.name)
+    context.reaper = GameReaper(
+        context.store,
+        ttls={"game_over": ttl},
+        interval=0,
+        archive=context.archive,
+    )
+
+
+@given("un recolector sin TTL para partidas en espera")
+def step_given_reaper_without_ttl(context):
+    """Create a reaper that never evicts waiting games."""
+    context.reaper = GameReaper(
+        context.store, ttls={"waiting_for_players": None}, interval=0
+    )
+
+
+@when('marco la partida "{game_id}" como terminada en el almacén')
+def step_when_mark_game_over(context, game_id):
+    """Finish a stored game and save it."""
+    game = context.store.get(game_id)
+    game.state.game_over = True
+    context.store.put(game_id, game)
+
+
+@when('otra petición tiene bloqueada la partida "{game_id}"')
+def step_when_game_locked_elsewhere(context, game_id):
+    """Hold the game lock from another thread until the scenario ends."""
+    locked = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with game_lock(game_id):
+            locked.set()
+            release.wait()
+
+    holder = threading.Thread(target=hold, daemon=True)
+    holder.start()
+    context.add_cleanup(holder.join)
+    context.add_cleanup(release.set)
+    assert locked.wait(5)
+
+
+@when("creo el recolector sin variables de entorno")
+def step_when_reaper_from_empty_env(context):
+    """Create the reaper the app would build with no configuration."""
+    context.reaper = create_reaper_from_env(context.store, environ={})
+
+
+@when("el recolector barre el almacén tras {elapsed:d} segundos")
+def step_when_reaper_sweeps(context, elapsed):
+    """Run a sweep as if the given time had passed."""
+    context.evicted = context.reaper.sweep(now=time.time() + elapsed)
+
+
+@then("el recolector debe haber expulsado {count:d} partidas en espera")
+def step_then_evicted_waiting(context, count):
+    """Check the number of waiting games evicted by the last sweep."""
+    assert context.evicted["waiting_for_players"] == count
+
+
+@then("el almacén debe tener {count:d} partidas vivas")
+def step_then_live_games(context, count):
+    """Check the live game count reported by the reaper metrics."""
+    assert context.reaper.metrics()["liveGames"] == count
+
+
+@then('la partida "{game_id}" debe poder recuperarse del disco')
+def step_then_game_spilled(context, game_id):
+    """Check that the finished game was archived."""
+    game = context.archive.load(game_id)
+    assert game is not None
+    assert game.state.game_over is True
+
+
+@then('la partida "{game_id}" no debe haberse volcado a disco')
+def step_then_game_not_spilled(context, game_id):
+    """Check that the game was not archived."""
+    assert context.archive.load(game_id) is None
+    assert context.reaper.spilled == 0
+
+
+@then("el recolector no debe barrer en segundo plano")
+def step_then_reaper_not_started(context):
+    """Check that the reaper is configured without a background thread."""
+    assert context.reaper.interval == 0
+
+
+@then("el recolector no debe tener TTL para partidas en curso")
+def step_then_no_in_progress_ttl(context):
+    """Check that in-progress games are never evicted by default."""
+    assert context.reaper.ttls["in_progress"] is None
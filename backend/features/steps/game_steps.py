@@ -230,7 +230,7 @@ def step_when_configuro_juego(context):
         human_player_indices=context.humans,
         ai_strategy=context.strategy,
     )
-    context.patch_pf_class.stop()
+    context.patcher_pf_class.stop()
     SHXLGame.initialize_board = context.orig_init_board
     SHXLGame.assign_players = context.orig_assign
     SHXLGame.inform_players = context.orig_inform
@@ -0,0 +1,168 @@
+import os
+import tempfile
+
+# mypy: disable-error-code=import
+from behave import given, then, when
+from src.api.app import create_app
+from src.api.game_store import InMemoryGameStore, SQLiteGameStore, StaleGameError
+from src.game.game import SHXLGame
+from src.players.player_factory import PlayerFactory
+
+
+def _open_sqlite_store(context):
+    """Open a SQLite store on the scenario database and register its cleanup."""
+    store = SQLiteGameStore(context.db_path)
+    context.add_cleanup(store.close)
+    return store
+
+
+@given('un almacén de partidas "{store}"')
+def step_given_game_store(context, store):
+    """Create an in-memory or SQLite game store."""
+    if store == "sqlite":
+        directory = tempfile.TemporaryDirectory()
+        context.add_cleanup(directory.cleanup)
+        context.db_path = os.path.join(directory.name, "games.db")
+        context.store = _open_sqlite_store(context)
+    else:
+        context.store = InMemoryGameStore()
+
+
+@given("un segundo worker que comparte la base de datos")
+def step_given_second_worker(context):
+    """Open a second store on the same database file."""
+    context.other_store = _open_sqlite_store(context)
+
+
+@when(
+    'guardo una partida de {player_count:d} jugadores con ID "{game_id}" en el almacén'
+)
+def step_when_save_game(context, player_count, game_id):
+    """Create a lobby game the way the API does and save it in the store."""
+    game = SHXLGame()
+    game.player_count = player_count
+    game.state.player_factory = PlayerFactory()
+    game.state.players = [
+        game.state.player_factory.create_player(
+            id=i,
+            name=f"Player {i}",
+            role=None,
+            state=game.state,
+            strategy_type="smart",
+            player_type="ai",
+        )
+        for i in range(player_count)
+    ]
+    context.store.put(game_id, game)
+
+
+@when("creo una partida de {player_count:d} jugadores por la API sobre el almacén")
+def step_when_create_through_api(context, player_count):
+    """Create a game through POST /newgame on an app backed by the store."""
+    client = create_app(context.store).test_client()
+    response = client.post("/newgame", json={"playerCount": player_count})
+    assert response.status_code == 201, response.get_json()
+    context.created_game_id = response.get_json()["gameID"]
+
+
+@when('guardo de nuevo la partida "{game_id}" en el almacén')
+def step_when_save_again(context, game_id):
+    """Save the current copy of a game again."""
+    context.store.put(game_id, context.store.get(game_id))
+
+
+@when("reabro el almacén SQLite")
+def step_when_reopen_store(context):
+    """Close the store and open a new one on the same file."""
+    context.store.close()
+    context.store = _open_sqlite_store(context)
+
+
+@when('el segundo worker carga la partida "{game_id}"')
+def step_when_other_loads(context, game_id):
+    """Load a game from the second store."""
+    context.other_game, context.other_version = context.other_store.load(game_id)
+
+
+@when('el segundo worker marca la partida "{game_id}" como terminada')
+def step_when_other_finishes(context, game_id):
+    """Finish the game from the second store and save it."""
+    context.other_game.state.game_over = True
+    context.other_store.put(
+        game_id, context.other_game, expected_version=context.other_version
+    )
+
+
+@when('elimino la partida "{game_id}" del almacén')
+def step_when_delete_game(context, game_id):
+    """Delete a game from the store."""
+    context.store.delete(game_id)
+
+
+@then('la partida "{game_id}" debe existir en el almacén')
+def step_then_game_exists(context, game_id):
+    """Check that the game can be loaded."""
+    assert context.store.get(game_id) is not None
+    assert game_id in context.store.ids()
+
+
+@then('la partida "{game_id}" no debe existir en el almacén')
+def step_then_game_missing(context, game_id):
+    """Check that the game is gone."""
+    assert context.store.get(game_id) is None
+    assert context.store.version(game_id) is None
+
+
+@then('la versión de la partida "{game_id}" debe ser {version:d}')
+def step_then_game_version(context, game_id, version):
+    """Check the stored version of a game."""
+    assert context.store.version(game_id) == version
+
+
+@then("la versión de la partida creada debe ser {version:d}")
+def step_then_created_version(context, version):
+    """The game created through the API was written exactly once."""
+    assert context.store.version(context.created_game_id) == version
+
+
+@then(
+    'guardar la partida "{game_id}" esperando la versión {version:d} debe fallar por conflicto'
+)
+def step_then_stale_write(context, game_id, version):
+    """Check that writing over an old version raises StaleGameError."""
+    try:
+        context.store.put(game_id, context.store.get(game_id), expected_version=version)
+    except StaleGameError:
+        return
+    raise AssertionError("Expected StaleGameError")
+
+
+@then('la partida "{game_id}" recuperada debe tener {player_count:d} jugadores')
+def step_then_reloaded_players(context, game_id, player_count):
+    """Check the player count of a game loaded from disk."""
+    game = context.store.get(game_id)
+    assert len(game.state.players) == player_count
+
+
+@then('la partida "{game_id}" del primer worker debe estar terminada')
+def step_then_first_sees_change(context, game_id):
+    """Check that the first store reloads the newer version."""
+    assert context.store.get(game_id).state.game_over is True
+
+
+@then("el índice de salas en espera debe tener {count:d} partidas")
+def step_then_lobby_total(context, count):
+    """Count the waiting games in the lobby index."""
+    total, page = context.store.lobby(status="waiting_for_players")
+    assert total == len(page) == count, (total, page)
+
+
+@then(
+    'la primera página de 1 sala debe ser la partida "{game_id}" con {players:d} jugadores'
+)
+def step_then_lobby_first_page(context, game_id, players):
+    """The most recently written game comes first."""
+    total, page = context.store.lobby(offset=0, limit=1)
+    assert len(page) == 1, page
+    assert page[0]["gameId"] == game_id, page
+    assert page[0]["currentPlayers"] == players, page
@@ -0,0 +1,194 @@
+import asyncio
+import json
+import random
+
+# mypy: disable-error-code=import
+from behave import given, then, when
+
+
+async def _websocket_session(app, path, query="", outgoing=None, reply=None):
+    """Drive a WebSocket connection until the game ends or the server goes idle.
+
+    Args:
+        app: ASGI application.
+        path (str): WebSocket path.
+        query (str): Query string.
+        outgoing (list): Raw texts to send right after connecting.
+        reply: Callable mapping a received state message to a message to send.
+
+    Returns:
+        list: ASGI messages sent by the server.
+    """
+    incoming = asyncio.Queue()
+    received = asyncio.Queue()
+    sent = []
+
+    async def receive():
+        return await incoming.get()
+
+    async def send(message):
+        await received.put(message)
+
+    scope = {"type": "websocket", "path": path, "query_string": query.encode()}
+    await incoming.put({"type": "websocket.connect"})
+    for text in outgoing or []:
+        await incoming.put({"type": "websocket.receive", "text": text})
+    connection = asyncio.ensure_future(app(scope, receive, send))
+
+    while True:
+        try:
+            message = await asyncio.wait_for(received.get(), 2)
+        except asyncio.TimeoutError:
+            break
+        sent.append(message)
+        if message["type"] != "websocket.send":
+            continue
+
+        payload = json.loads(message["text"])
+        if payload["type"] != "state":
+            continue
+        if payload["state"]["gameState"] == "game_over":
+            break
+        answer = reply(payload) if reply else None
+        if answer is not None:
+            await incoming.put(
+                {"type": "websocket.receive", "text": json.dumps(answer)}
+            )
+
+    await incoming.put({"type": "websocket.disconnect"})
+    await asyncio.wait_for(connection, 5)
+    return sent
+
+
+def _payloads(context, message_type):
+    """Decoded server messages of one type."""
+    payloads = [
+        json.loads(m["text"])
+        for m in context.ws_messages
+        if m["type"] == "websocket.send"
+    ]
+    return [p for p in payloads if p["type"] == message_type]
+
+
+def _human_reply(client, game_id, player_id):
+    """Build a reply function that plays the human's pending steps."""
+
+    def reply(payload):
+        step = payload["nextStep"]
+        if step is None or step["actor"] != "human" or step["playerId"] != player_id:
+            return None
+
+        state = payload["state"]
+        message = {"action": step["action"]}
+        if step["action"] == "nominate":
+            eligible = state["nomination"]["eligibleChancellors"]
+            message["nomineeId"] = eligible[0]["id"]
+        elif step["action"] == "vote":
+            message["vote"] = "ja"
+        elif step["action"] == "discard":
+            message["discardIndex"] = 0
+        elif step["action"] == "enact":
+            message["enactIndex"] = 0
+        elif step["action"] == "execute_power":
+            options = client.get(f"/games/{game_id}/executive/options").get_json()
+            message["powerType"] = options["powerType"]
+            if options["availableTargets"]:
+                message["targetPlayerId"] = options["availableTargets"][0]["id"]
+        return message
+
+    return reply
+
+
+@given("una partida iniciada con {humans:d} humanos y {bots:d} bots")
+def step_given_started_game(context, humans, bots):
+    """Create, fill and start a game through the Flask routes."""
+    random.seed(7)
+    client = context.asgi_app.flask_app.test_client()
+    response = client.post("/newgame", json={"playerCount": humans + bots})
+    context.asgi_game_id = response.get_json()["gameID"]
+    for i in range(humans):
+        client.post(
+            f"/games/{context.asgi_game_id}/join", json={"playerName": f"Human {i}"}
+        )
+    client.post(f"/games/{context.asgi_game_id}/add-bots", json={"count": bots})
+    response = client.post(
+        f"/games/{context.asgi_game_id}/start", json={"hostPlayerID": 0}
+    )
+    assert response.status_code == 200, response.get_json()
+    context.ws_client = client
+
+
+@when("me conecto al WebSocket de la partida")
+def step_when_connect(context):
+    """Connect to the game channel without sending anything."""
+    path = f"/games/{context.asgi_game_id}/ws"
+    context.ws_messages = asyncio.run(_websocket_session(context.asgi_app, path))
+
+
+@when('me conecto al WebSocket de la partida "{game_id}"')
+def step_when_connect_to(context, game_id):
+    """Connect to the channel of a given game id."""
+    path = f"/games/{game_id}/ws"
+    context.ws_messages = asyncio.run(_websocket_session(context.asgi_app, path))
+
+
+@when("juego la partida por WebSocket como el jugador {player_id:d}")
+def step_when_play(context, player_id):
+    """Answer every pending human step until the game ends."""
+    game_id = context.asgi_game_id
+    context.ws_messages = asyncio.run(
+        _websocket_session(
+            context.asgi_app,
+            f"/games/{game_id}/ws",
+            query=f"playerId={player_id}",
+            reply=_human_reply(context.ws_client, game_id, player_id),
+        )
+    )
+
+
+@when('envío el mensaje "{text}" por el WebSocket de la partida')
+def step_when_send_raw(context, text):
+    """Send a raw text frame right after connecting."""
+    path = f"/games/{context.asgi_game_id}/ws"
+    context.ws_messages = asyncio.run(
+        _websocket_session(context.asgi_app, path, outgoing=[text])
+    )
+
+
+@then("debo recibir acciones de los bots")
+def step_then_bot_actions(context):
+    """The server streamed at least one successful bot step."""
+    actions = [a for a in _payloads(context, "action") if a["actor"] == "bot"]
+    assert actions, "No bot actions were streamed"
+    assert all(a["status"] < 400 for a in actions), actions
+
+
+@then("todas mis acciones deben haberse aceptado")
+def step_then_results_ok(context):
+    """Every human action got a successful result."""
+    results = _payloads(context, "result")
+    assert results, "No actions were sent"
+    failed = [r for r in results if r["status"] >= 400]
+    assert not failed, failed
+
+
+@then("el último estado recibido debe indicar que la partida terminó")
+def step_then_game_over(context):
+    """The last streamed state is a finished game."""
+    states = _payloads(context, "state")
+    assert states, "No state was streamed"
+    assert states[-1]["state"]["gameState"] == "game_over", states[-1]["nextStep"]
+    assert states[-1]["nextStep"] is None
+
+
+@then("debo recibir un error por el WebSocket")
+def step_then_error(context):
+    """The server answered with an error message."""
+    assert _payloads(context, "error"), context.ws_messages
+
+
+@then("la conexión debe cerrarse con código {code:d}")
+def step_then_closed(context, code):
+    """The connection was refused with the given close code."""
+    assert context.ws_messages[0]["type"] == "websocket.close", context.ws_messages
+    assert context.ws_messages[0]["code"] == code
@@ -0,0 +1,169 @@
+import os
+import random
+import tempfile
+from types import SimpleNamespace
+
+import numpy as np
+
+# mypy: disable-error-code=import
+from behave import then, when
+from src.game.game import SHXLGame
+from src.game.game_logger import GameLogger, LogLevel
+from src.players.strategies import LearnedStrategy, LiberalStrategy
+from src.players.strategies.learned_strategy import (
+    ACTION_SIZES,
+    STATE_SIZE,
+    DecisionModel,
+    chosen_index,
+)
+from src.policies.policy_factory import PolicyFactory
+from src.simulation.decision_data import (
+    FIELDS,
+    collect_decisions,
+    decision_accuracy,
+    load_dataset,
+    save_dataset,
+    train_model,
+)
+
+
+@when(
+    "registro las decisiones de {games:d} partidas de {count:d} jugadores "
+    'con la estrategia "{strategy}" y semilla {seed:d}'
+)
+def step_when_collect(context, games, count, strategy, seed):
+    """Record the decisions of a few sequential games."""
+    context.dataset = collect_decisions(
+        games,
+        strategy,
+        player_count=count,
+        with_communists=False,
+        seed=seed,
+        parallel=False,
+    )
+
+
+@when("guardo y vuelvo a cargar las decisiones")
+def step_when_save_load(context):
+    """Round-trip the dataset through a compressed .npz file."""
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "decisions.npz")
+        save_dataset(path, context.dataset)
+        context.loaded = load_dataset(path)
+
+
+@when("entreno un modelo con capa oculta con todas las decisiones")
+def step_when_train_imitation(context):
+    """Train a small MLP that imitates every recorded decision.
+
+    A linear scorer cannot imitate policy choices: the state features are
+    the same for every legal action, so its ranking ignores the faction.
+    """
+    context.model = train_model(
+        context.dataset, hidden=8, epochs=200, winners_only=False, seed=0
+    )
+
+
+@when("entreno un modelo con capa oculta con las decisiones ganadoras")
+def step_when_train_mlp(context):
+    """Train a small MLP on the winners' decisions."""
+    context.model = train_model(context.dataset, hidden=8, epochs=50, seed=0)
+
+
+@when("creo una estrategia aprendida sin modelo para un liberal")
+def step_when_learned_without_model(context):
+    """Create a learned strategy with no model for a liberal player."""
+    context.player = next(
+        p for p in context.tournament_game.state.players if p.is_liberal
+    )
+    context.strategy = LearnedStrategy(context.player, model=DecisionModel({}))
+
+
+@when(
+    "juego una partida de {count:d} jugadores con todos los bots aprendidos "
+    "y semilla {seed:d}"
+)
+def step_when_play_learned(context, count, seed):
+    """Play a full game where every bot uses the trained model."""
+    random.seed(seed)
+    game = SHXLGame(GameLogger(LogLevel.NONE))
+    game.setup_game(count, with_communists=False)
+    for player in game.state.players:
+        player.strategy = LearnedStrategy(player, model=context.model)
+    context.winner = game.start_game() or game.state.winner
+
+
+@then("cada tipo de decisión debe tener arrays coherentes")
+def step_then_consistent(context):
+    """Offsets, widths and chosen rows agree for every decision kind."""
+    for kind, arrays in context.dataset.items():
+        decisions = len(arrays["chosen"])
+        counts = np.diff(arrays["offsets"])
+        assert arrays["states"].shape == (decisions, STATE_SIZE), kind
+        assert arrays["actions"].shape == (arrays["offsets"][-1], ACTION_SIZES[kind])
+        assert arrays["offsets"][0] == 0 and (counts >= 2).all(), kind
+        assert ((arrays["chosen"] >= 0) & (arrays["chosen"] < counts)).all(), kind
+        assert len(arrays["won"]) == len(arrays["faction"]) == decisions
+
+
+@then('debe haber decisiones de "{a}", "{b}", "{c}" y "{d}"')
+def step_then_kinds(context, a, b, c, d):
+    """The main decision kinds are recorded."""
+    assert {a, b, c, d} <= set(context.dataset), set(context.dataset)
+
+
+@then("las decisiones cargadas deben ser iguales a las registradas")
+def step_then_same_dataset(context):
+    """Saving a dataset does not change it."""
+    assert set(context.loaded) == set(context.dataset)
+    for kind, arrays in context.dataset.items():
+        for field in FIELDS:
+            assert np.array_equal(context.loaded[kind][field], arrays[field])
+
+
+@then('el modelo debe acertar al menos el {percent:d}% de las decisiones "{kind}"')
+def step_then_accuracy(context, percent, kind):
+    """The model reproduces a deterministic teacher."""
+    accuracy = decision_accuracy(context.model, context.dataset)[kind]
+    assert accuracy >= percent / 100, accuracy
+
+
+@then("el modelo guardado y cargado debe puntuar igual")
+def step_then_model_round_trip(context):
+    """Saved weights score decisions exactly as before."""
+    arrays = context.dataset["vote"]
+    state, actions = arrays["states"][0], arrays["actions"][:2]
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "model.npz")
+        context.model.save(path)
+        loaded = DecisionModel.load(path)
+    assert np.array_equal(
+        loaded.scores("vote", state, actions),
+        context.model.scores("vote", state, actions),
+    )
+
+
+@then("debe filtrar las políticas como LiberalStrategy")
+def step_then_like_role(context):
+    """Decisions without a model go to the role strategy."""
+    policies = PolicyFactory.create_policy_deck(7)[:3]
+    expected = LiberalStrategy(context.player).filter_policies(policies)
+    assert context.strategy.filter_policies(policies) == expected
+
+
+@then("la partida aprendida debe terminar con un ganador")
+def step_then_winner(context):
+    """A learned game finishes."""
+    assert context.winner in ("liberal", "fascist"), context.winner
+
+
+@then(
+    'descartar la segunda política "{policy_type}" de "{hand}" '
+    "debe registrarse como la posición {index:d}"
+)
+def step_then_interchangeable(context, policy_type, hand, index):
+    """Same-type policies map to their first position."""
+    policies = [SimpleNamespace(type=name) for name in hand.split(", ")]
+    second = [p for p in policies if p.type == policy_type][1]
+    kept = [p for p in policies if p is not second]
+    assert chosen_index("filter", policies, (kept, second)) == index
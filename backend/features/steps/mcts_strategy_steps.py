@@ -0,0 +1,282 @@
+import builtins
+import random
+import threading
+from collections import Counter
+from unittest.mock import Mock, patch
+
+# mypy: disable-error-code=import
+from behave import given, then, when
+from src.game.game import SHXLGame
+from src.game.game_logger import GameLogger, LogLevel
+from src.players.human_player import HumanPlayer
+from src.players.strategies import mcts_strategy
+from src.players.strategies.base_strategy import PlayerStrategy
+from src.players.strategies.mcts_strategy import MCTSStrategy
+
+
+def _snapshot(game):
+    """Summarize the parts of the game a search must not touch."""
+    state = game.state
+    return (
+        [policy for policy in state.board.policies],
+        [policy for policy in state.board.discards],
+        (
+            state.board.liberal_track,
+            state.board.fascist_track,
+            state.board.communist_track,
+        ),
+        [
+            (p.id, p.role.role, p.is_dead, dict(p.inspected_players))
+            for p in state.players
+        ],
+        state.election_tracker,
+        getattr(state.president, "id", None),
+        random.getstate(),
+    )
+
+
+def _seat_mcts(context, player, rollouts=8, time_budget=None):
+    """Give a player an MCTS strategy with a fixed budget."""
+    player.strategy = MCTSStrategy(
+        player, rollouts=rollouts, time_budget=time_budget, seed=1
+    )
+    context.mcts_player = player
+
+
+@given('una partida de {count:d} jugadores con bots "{strategy}" y semilla {seed:d}')
+def step_given_mcts_game(context, count, strategy, seed):
+    """Set up a seeded game without starting it."""
+    random.seed(seed)
+    context.mcts_game = SHXLGame(GameLogger(LogLevel.NONE))
+    context.mcts_game.setup_game(count, with_communists=True, ai_strategy=strategy)
+    context.mcts_game.state.president_candidate = context.mcts_game.state.president
+
+
+@given("un bot MCTS en el asiento de un fascista")
+def step_given_mcts_fascist(context):
+    """Seat the MCTS strategy on a non-Hitler fascist."""
+    fascist = next(
+        p for p in context.mcts_game.state.players if p.is_fascist and not p.is_hitler
+    )
+    _seat_mcts(context, fascist)
+
+
+@given("un bot MCTS con {rollouts:d} simulaciones en el asiento del presidente")
+def step_given_mcts_president(context, rollouts):
+    """Seat the MCTS strategy on the first president."""
+    _seat_mcts(context, context.mcts_game.state.president, rollouts=rollouts)
+
+
+@given("un bot MCTS sin tiempo de búsqueda en el asiento del presidente")
+def step_given_mcts_no_time(context):
+    """Seat an MCTS strategy whose time budget is already spent."""
+    _seat_mcts(context, context.mcts_game.state.president, time_budget=0)
+
+
+@given("las simulaciones del bot MCTS fallan con {error}")
+def step_given_mcts_rollouts_fail(context, error):
+    """Make every rollout raise the given built-in exception."""
+    strategy = context.mcts_player.strategy
+
+    def fail(*args):
+        raise getattr(builtins, error)("rollout")
+
+    strategy._replay_election = fail
+    strategy.fallback = Mock(wraps=strategy.fallback)
+    context.mcts_log = patch.object(mcts_strategy.logger, "exception").start()
+    context.add_cleanup(patch.stopall)
+
+
+@given("el jugador del asiento {seat:d} es humano")
+def step_given_human_seat(context, seat):
+    """Replace a bot with a human player holding the same role."""
+    state = context.mcts_game.state
+    bot = state.players[seat]
+    human = HumanPlayer(bot.id, bot.name, bot.role, state)
+    human.player_type = "human"
+    for players in (state.players, state.active_players):
+        players[players.index(bot)] = human
+    if state.president is bot:
+        state.president = state.president_candidate = human
+
+
+@when("copio el estado de la partida y modifico la copia")
+def step_when_fork_state(context):
+    """Fork the state and change the fork."""
+    context.mcts_before = _snapshot(context.mcts_game)
+    context.mcts_fork = context.mcts_game.state.fork()
+    fork = context.mcts_fork
+    fork.board.draw_policy(3)
+    fork.board.fascist_track += 1
+    fork.players[0].is_dead = True
+    fork.players[1].inspected_players[2] = "fascist"
+    fork.election_tracker += 1
+
+
+@when("el bot MCTS muestrea {count:d} asignaciones de roles")
+def step_when_sample_roles(context, count):
+    """Sample several determinizations."""
+    strategy = context.mcts_player.strategy
+    context.mcts_samples = [
+        strategy.sample_roles(context.mcts_game.state) for _ in range(count)
+    ]
+
+
+@when("el bot MCTS nomina un canciller")
+def step_when_mcts_nominates(context):
+    """Ask the MCTS president for a nomination."""
+    context.mcts_before = _snapshot(context.mcts_game)
+    context.mcts_eligible = context.mcts_game.state.get_eligible_chancellors()
+    context.mcts_choice = context.mcts_player.strategy.nominate_chancellor(
+        context.mcts_eligible
+    )
+
+
+@when("dos bots MCTS con la misma semilla nominan a la vez en hilos distintos")
+def step_when_concurrent_searches(context):
+    """Run two identically seeded searches at the same time."""
+    player = context.mcts_player
+    rollouts = player.strategy.rollouts
+    strategies = [MCTSStrategy(player, rollouts=rollouts, seed=1) for _ in range(2)]
+    barrier = threading.Barrier(len(strategies))
+
+    def search(strategy):
+        barrier.wait()
+        strategy.nominate_chancellor(context.mcts_eligible)
+
+    threads = [threading.Thread(target=search, args=(s,)) for s in strategies]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    context.mcts_concurrent = [s.last_search for s in strategies]
+
+
+@when("el bot MCTS vota el gobierno del presidente con el primer canciller elegible")
+def step_when_mcts_votes(context):
+    """Ask the MCTS bot to vote on a proposed government."""
+    state = context.mcts_game.state
+    state.chancellor_candidate = state.get_eligible_chancellors()[0]
+    context.mcts_choice = context.mcts_player.strategy.vote(
+        state.president_candidate, state.chancellor_candidate
+    )
+
+
+@when("juego la partida hasta el final")
+def step_when_play_mcts_game(context):
+    """Play the whole game."""
+    context.mcts_winner = context.mcts_game.start_game()
+
+
+@then("todos los bots deben usar MCTSStrategy")
+def step_then_all_mcts(context):
+    """Every AI player got an MCTS strategy."""
+    for player in context.mcts_game.state.players:
+        assert isinstance(player.strategy, MCTSStrategy), player.strategy
+
+
+@then("la estrategia MCTS debe heredar de PlayerStrategy")
+def step_then_mcts_is_strategy(context):
+    """MCTSStrategy implements the strategy interface."""
+    assert issubclass(MCTSStrategy, PlayerStrategy)
+
+
+@then("la partida original no debe cambiar")
+def step_then_original_unchanged(context):
+    """Changes to the fork did not reach the original game."""
+    assert _snapshot(context.mcts_game)[:-1] == context.mcts_before[:-1]
+
+
+@then("la copia debe compartir las políticas y los roles del original")
+def step_then_fork_shares_immutables(context):
+    """Policies and roles are shared instead of copied."""
+    state = context.mcts_game.state
+    fork = context.mcts_fork
+    assert all(a is b for a, b in zip(fork.board.policies, state.board.policies[3:]))
+    assert all(a.role is b.role for a, b in zip(fork.players, state.players))
+    assert all(a is not b for a, b in zip(fork.players, state.players))
+    assert fork.board.state is fork
+
+
+@then("cada asignación debe conservar los roles que conoce el bot")
+def step_then_samples_keep_known_roles(context):
+    """The bot's own role and its known teammates are fixed."""
+    player = context.mcts_player
+    known = {player.id: player.role.role, player.hitler.id: "hitler"}
+    known.update({p.id: p.role.role for p in player.fascists})
+    for sample in context.mcts_samples:
+        for player_id, role in known.items():
+            assert sample[player_id].role == role, (player_id, sample[player_id])
+
+
+@then("cada asignación debe tener el mismo reparto de roles que la partida")
+def step_then_samples_keep_role_counts(context):
+    """Samples are permutations of the game's roles."""
+    expected = Counter(p.role.role for p in context.mcts_game.state.players)
+    for sample in context.mcts_samples:
+        assert Counter(role.role for role in sample.values()) == expected
+
+
+@then("el canciller nominado debe ser elegible")
+def step_then_nominee_eligible(context):
+    """The nomination is one of the eligible players."""
+    assert context.mcts_choice in context.mcts_eligible
+
+
+@then("la búsqueda debe haber jugado como mucho {count:d} simulaciones")
+def step_then_search_budget(context, count):
+    """The search stayed within its rollout budget."""
+    search = context.mcts_player.strategy.last_search
+    assert search is not None
+    assert search["rollouts"] + search["failed"] <= count, search
+
+
+@then("las búsquedas simultáneas deben dar los mismos valores que la primera")
+def step_then_concurrent_searches_match(context):
+    """Concurrent searches reproduce the values of the sequential one."""
+    expected = context.mcts_player.strategy.last_search
+    for search in context.mcts_concurrent:
+        assert search["values"] == expected["values"], (search, expected)
+        assert search["choice"] == expected["choice"]
+
+
+@then("la búsqueda debe haber fallado {count:d} simulaciones")
+def step_then_search_failed(context, count):
+    """Every rollout failed and none was scored."""
+    search = context.mcts_player.strategy.last_search
+    assert search["failed"] == count and search["rollouts"] == 0, search
+    assert search["choice"] is None
+
+
+@then("la nominación debe venir de la estrategia de respaldo")
+def step_then_nomination_fell_back(context):
+    """The fallback strategy made the nomination."""
+    fallback = context.mcts_player.strategy.fallback
+    fallback.nominate_chancellor.assert_called_once_with(context.mcts_eligible)
+
+
+@then("el bot MCTS debe haber registrado {count:d} errores inesperados")
+def step_then_unexpected_errors_logged(context, count):
+    """Only unexpected rollout errors are logged."""
+    assert context.mcts_log.call_count == count
+
+
+@then("la búsqueda debe haber jugado {count:d} simulaciones sin errores")
+def step_then_search_complete(context, count):
+    """Every rollout of the search finished."""
+    search = context.mcts_player.strategy.last_search
+    assert search["rollouts"] == count and search["failed"] == 0, search
+    assert context.mcts_choice in (True, False)
+
+
+@then("la partida original no debe haber cambiado tras la búsqueda")
+def step_then_search_left_game_alone(context):
+    """Searching forks the game and restores the global random state."""
+    assert _snapshot(context.mcts_game) == context.mcts_before
+
+
+@then("la partida debe tener un ganador")
+def step_then_mcts_winner(context):
+    """The game ended with a winner."""
+    assert context.mcts_game.state.game_over
+    assert context.mcts_winner
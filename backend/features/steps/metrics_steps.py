@@ -0,0 +1,104 @@
+import random
+
+# mypy: disable-error-code=import
+from behave import given, then, when
+from src.api.app import create_app
+from src.api.autoplay import get_autoplay
+from src.api.game_store import InMemoryGameStore
+
+
+def _metric_values(text):
+    """Parse Prometheus text exposition into a series -> value mapping."""
+    values = {}
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        series, value = line.rsplit(" ", 1)
+        values[series] = float(value)
+    return values
+
+
+@given("una aplicación de la API con métricas")
+def step_given_metrics_app(context):
+    """Create a Flask app with an empty store and its test client."""
+    context.metrics_app = create_app(InMemoryGameStore())
+    context.metrics_client = context.metrics_app.test_client()
+
+
+@when("creo una partida de {players:d} jugadores para las métricas")
+def step_when_create_game(context, players):
+    """Create a waiting game through the API."""
+    response = context.metrics_client.post("/newgame", json={"playerCount": players})
+    assert response.status_code == 201, response.get_json()
+    context.metrics_game_id = response.get_json()["gameID"]
+
+
+@when('consulto el estado de la partida "{game_id}" para las métricas')
+def step_when_get_state(context, game_id):
+    """Request the state of a given game."""
+    context.metrics_client.get(f"/games/{game_id}/state")
+
+
+@when("consulto el estado de la partida creada para las métricas")
+def step_when_get_created_state(context):
+    """Request the state of the created game."""
+    response = context.metrics_client.get(f"/games/{context.metrics_game_id}/state")
+    assert response.status_code == 200, response.get_json()
+
+
+@when("una partida de {bots:d} bots se juega sola hasta el final")
+def step_when_autoplay(context, bots):
+    """Start an all-bot game and wait for server-side autoplay to finish."""
+    random.seed(7)
+    client = context.metrics_client
+    game_id = client.post("/newgame", json={"playerCount": bots}).get_json()["gameID"]
+    client.post(f"/games/{game_id}/add-bots", json={"count": bots})
+    client.post(f"/games/{game_id}/start", json={"hostPlayerID": 0})
+    response = client.post(f"/games/{game_id}/autoplay", json={})
+    assert response.status_code == 202, response.get_json()
+    with context.metrics_app.app_context():
+        job = get_autoplay().get(game_id)
+    job.future.result(timeout=30)
+    assert job.stopped_reason == "game_over", job.to_dict()
+
+
+@when("consulto las métricas")
+def step_when_get_metrics(context):
+    """Scrape the /metrics endpoint."""
+    context.metrics_response = context.metrics_client.get("/metrics")
+    assert context.metrics_response.status_code == 200
+    context.metrics = _metric_values(context.metrics_response.get_data(as_text=True))
+
+
+@then("las métricas deben publicarse en formato de texto de Prometheus")
+def step_then_prometheus_format(context):
+    """Check the exposition content type and metadata lines."""
+    assert context.metrics_response.content_type.startswith("text/plain")
+    assert "version=0.0.4" in context.metrics_response.content_type
+    text = context.metrics_response.get_data(as_text=True)
+    assert "# TYPE shxl_http_request_duration_seconds histogram" in text
+
+
+@then("la métrica '{series}' debe valer {value:d}")
+@then('la métrica "{series}" debe valer {value:d}')
+def step_then_metric_value(context, series, value):
+    """Check the exact value of a series."""
+    assert context.metrics.get(series) == value, context.metrics.get(series)
+
+
+@then("la métrica '{series}' debe ser mayor que {value:d}")
+def step_then_metric_greater(context, series, value):
+    """Check that a series exceeds a value."""
+    assert context.metrics.get(series, 0) > value, context.metrics.get(series)
+
+
+@then(
+    'la cubeta \'{bound}\' de "{name}" para la ruta "{route}" '
+    "debe coincidir con su número de observaciones"
+)
+def step_then_bucket_matches_count(context, bound, name, route):
+    """The last cumulative bucket equals the observation count."""
+    labels = f'route="{route}",method="POST"'
+    bucket = context.metrics[f'{name}_bucket{{{labels},le="{bound}"}}']
+    count = context.metrics[f"{name}_count{{{labels}}}"]
+    assert bucket == count == 1, (bucket, count)
@@ -0,0 +1,116 @@
+import random
+from fractions import Fraction
+
+# mypy: disable-error-code=import
+from behave import given, then, when
+from src.game.game import SHXLGame
+from src.game.game_logger import GameLogger, LogLevel
+from src.simulation.comparison import paired_difference
+
+
+def _series(text):
+    """Parse a comma separated list of per-game results."""
+    return [int(value) for value in text.split(",")]
+
+
+@given('los resultados de referencia "{baseline}" y los de la candidata "{candidate}"')
+def step_given_series(context, baseline, candidate):
+    """Keep two per-game result series played with the same seeds."""
+    context.series = (_series(baseline), _series(candidate))
+
+
+@when("calculo la diferencia emparejada")
+def step_when_paired_difference(context):
+    """Compute the paired difference, keeping any raised error."""
+    context.error = None
+    try:
+        context.paired = paired_difference(*context.series)
+    except ValueError as error:
+        context.error = error
+
+
+@when(
+    "preparo una partida de {count:d} jugadores con semilla {seed:d} "
+    'para cada estrategia "{strategies}"'
+)
+def step_when_seeded_games(context, count, seed, strategies):
+    """Set up one game per strategy from the same seed."""
+    context.seeded_games = []
+    for strategy in strategies.split(", "):
+        random.seed(seed)
+        game = SHXLGame(GameLogger(LogLevel.NONE))
+        game.setup_game(count, with_communists=True, ai_strategy=strategy)
+        context.seeded_games.append(game)
+
+
+@then("la diferencia media debe ser {expected}")
+def step_then_mean(context, expected):
+    """Check the mean per-game difference."""
+    assert abs(context.paired["difference"] - float(Fraction(expected))) < 1e-12
+
+
+@then("la varianza de las diferencias debe ser {expected}")
+def step_then_variance(context, expected):
+    """Check the sample variance of the differences."""
+    assert abs(context.paired["variance"] - float(Fraction(expected))) < 1e-12
+
+
+@then("el error estándar emparejado debe ser 0")
+def step_then_zero_error(context):
+    """Identical series have no paired uncertainty."""
+    assert context.paired["std_error"] == 0
+    assert context.paired["low"] == context.paired["high"] == 0
+
+
+@then("el error estándar sin emparejar debe ser mayor que 0")
+def step_then_unpaired_error(context):
+    """Independent samples would still be uncertain."""
+    assert context.paired["unpaired_std_error"] > 0
+
+
+@then("el error estándar emparejado debe ser menor que el sin emparejar")
+def step_then_reduced_error(context):
+    """Correlated outcomes make the paired estimate more precise."""
+    paired = context.paired
+    assert paired["std_error"] < paired["unpaired_std_error"], paired
+    assert paired["variance_reduction"] > 1
+
+
+@then("el intervalo de confianza debe contener la diferencia media")
+def step_then_interval(context):
+    """The 95% interval is centred on the mean difference."""
+    paired = context.paired
+    assert paired["low"] < paired["difference"] < paired["high"]
+
+
+@then("la comparación debe lanzar un ValueError")
+def step_then_error(context):
+    """Series of different lengths cannot be paired."""
+    assert isinstance(context.error, ValueError)
+
+
+@then("todas las partidas deben tener los mismos roles")
+def step_then_same_roles(context):
+    """Role assignment does not depend on the strategy."""
+    roles = [
+        [type(player.role).__name__ for player in game.state.players]
+        for game in context.seeded_games
+    ]
+    assert all(r == roles[0] for r in roles), roles
+
+
+@then("todas las partidas deben tener el mismo mazo")
+def step_then_same_deck(context):
+    """The deck shuffle does not depend on the strategy."""
+    decks = [
+        [policy.type for policy in game.state.board.policies]
+        for game in context.seeded_games
+    ]
+    assert all(deck == decks[0] for deck in decks)
+
+
+@then("todas las partidas deben tener el mismo primer presidente")
+def step_then_same_president(context):
+    """The first president does not depend on the strategy."""
+    presidents = [game.state.president_candidate.id for game in context.seeded_games]
+    assert len(set(presidents)) == 1, presidents
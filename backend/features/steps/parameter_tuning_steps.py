@@ -0,0 +1,184 @@
+from unittest.mock import Mock
+
+# mypy: disable-error-code=import
+from behave import given, then, when
+from src.players import strategies
+from src.simulation.tournament import seat_lineup
+from src.simulation.tuning import ParameterTuner
+
+PARTIES = {"liberales": "liberal", "fascistas": "fascist", "comunistas": "communist"}
+
+
+def _player_without_beliefs():
+    """Mock an early-game player whose game keeps no role beliefs."""
+    player = Mock()
+    player.id = 0
+    player.inspected_players = {}
+    player.state.beliefs = None
+    player.state.fascist_track = 0
+    return player
+
+
+def _tuner(games, seed, strategy="role"):
+    """Create a small 7-player tuner for the liberal faction."""
+    return ParameterTuner(
+        "liberal",
+        strategy,
+        player_count=7,
+        with_communists=False,
+        games=games,
+        seed=seed,
+    )
+
+
+def _faction_players(context, faction):
+    """Players of the tournament game that belong to a faction."""
+    return [
+        p
+        for p in context.tournament_game.state.players
+        if p.role.party_membership == PARTIES[faction]
+    ]
+
+
+@given('una estrategia "{strategy_class}" para un jugador sin creencias')
+def step_given_strategy(context, strategy_class):
+    """Create a strategy with its default parameters."""
+    context.strategy = getattr(strategies, strategy_class)(_player_without_beliefs())
+
+
+@given(
+    'una estrategia "{strategy_class}" para un jugador sin creencias '
+    'con "{name}" a {value:f}'
+)
+def step_given_strategy_with_parameter(context, strategy_class, name, value):
+    """Create a strategy overriding one parameter."""
+    context.strategy = getattr(strategies, strategy_class)(
+        _player_without_beliefs(), {name: value}
+    )
+
+
+@given(
+    "un ajuste de los liberales con {games:d} partidas por candidato "
+    "y semilla {seed:d}"
+)
+def step_given_tuner(context, games, seed):
+    """Create a parameter tuner for the liberal role strategy."""
+    context.tuner = _tuner(games, seed)
+
+
+@when('creo una estrategia "{strategy_class}" con el parámetro "{name}"')
+def step_when_strategy_unknown_parameter(context, strategy_class, name):
+    """Try to create a strategy with an unknown parameter."""
+    context.error = None
+    try:
+        getattr(strategies, strategy_class)(_player_without_beliefs(), {name: 0.5})
+    except ValueError as error:
+        context.error = error
+
+
+@when(
+    'siento a todas las facciones con "{strategy}" y a los fascistas '
+    'con "{name}" a {value:f}'
+)
+def step_when_seat_with_parameters(context, strategy, name, value):
+    """Seat a lineup where only the fascists get a tuned parameter."""
+    lineup = {faction: strategy for faction in PARTIES.values()}
+    seat_lineup(context.tournament_game, lineup, {"fascist": {name: value}})
+
+
+@when("evalúo dos veces los parámetros por defecto sin paralelismo")
+def step_when_evaluate_twins(context):
+    """Evaluate two identical candidates in the same batch."""
+    defaults = context.tuner.defaults
+    context.rates = context.tuner.evaluate([defaults, dict(defaults)], parallel=False)
+
+
+@when(
+    "ejecuto {generations:d} generaciones de {population:d} candidatos sin paralelismo"
+)
+def step_when_evolve(context, generations, population):
+    """Run a short sequential evolution strategy."""
+    context.best = context.tuner.evolve(
+        generations, population=population, parallel=False
+    )
+
+
+@when('creo un ajuste de los liberales con la estrategia "{strategy}"')
+def step_when_tuner_invalid(context, strategy):
+    """Try to tune a strategy without parameters."""
+    context.error = None
+    try:
+        _tuner(1, 0, strategy)
+    except ValueError as error:
+        context.error = error
+
+
+@then("sus parámetros deben ser los valores por defecto de la clase")
+def step_then_default_parameters(context):
+    """Without overrides the strategy uses its class defaults."""
+    assert context.strategy.parameters == type(context.strategy).PARAMETERS
+    assert context.strategy.parameters is not type(context.strategy).PARAMETERS
+
+
+@then('el parámetro "{name}" debe valer {value:f}')
+def step_then_parameter_value(context, name, value):
+    """Check the value of one parameter."""
+    assert context.strategy.parameters[name] == value
+
+
+@then('el jugador debe votar "Nein" a un gobierno desconocido')
+def step_then_votes_no(context):
+    """A zero vote probability always rejects unknown governments."""
+    president, chancellor = Mock(id=1), Mock(id=2)
+    assert all(not context.strategy.vote(president, chancellor) for _ in range(20))
+
+
+@then("la estrategia debe lanzar un ValueError")
+def step_then_strategy_error(context):
+    """Unknown parameters are rejected."""
+    assert isinstance(context.error, ValueError)
+
+
+@then('los fascistas deben tener "{name}" a {value:f}')
+def step_then_fascist_parameter(context, name, value):
+    """The tuned parameter reaches every fascist strategy."""
+    players = _faction_players(context, "fascistas")
+    assert players
+    for player in players:
+        assert player.strategy.parameters[name] == value
+
+
+@then("los liberales deben tener sus parámetros por defecto")
+def step_then_liberal_defaults(context):
+    """Other factions keep the class defaults."""
+    for player in _faction_players(context, "liberales"):
+        assert player.strategy.parameters == type(player.strategy).PARAMETERS
+
+
+@then("ambos candidatos deben tener el mismo porcentaje de victorias")
+def step_then_same_rates(context):
+    """Common random numbers make identical candidates score the same."""
+    assert context.rates[0] == context.rates[1], context.rates
+
+
+@then("se deben haber evaluado {count:d} candidatos")
+def step_then_history(context, count):
+    """Every generation evaluates its whole population."""
+    assert len(context.tuner.history) == count
+
+
+@then("los mejores parámetros deben estar dentro de sus intervalos")
+def step_then_best_in_bounds(context):
+    """The search never leaves the parameter bounds."""
+    parameters, win_rate = context.best
+    assert 0.0 <= win_rate <= 1.0
+    assert set(parameters) == set(context.tuner.defaults)
+    for name, value in parameters.items():
+        low, high = context.tuner.bounds[name]
+        assert low <= value <= high, (name, value)
+
+
+@then("el ajuste debe lanzar un ValueError")
+def step_then_tuner_error(context):
+    """Strategies without parameters cannot be tuned."""
+    assert isinstance(context.error, ValueError)
@@ -0,0 +1,81 @@
+import pickle
+
+# mypy: disable-error-code=import
+from behave import given, then, when
+from src.game.game_state import EnhancedGameState
+from src.game.phases.phase_machine import InvalidPhaseTransition, Phase, SubPhase
+
+
+@given('un estado de juego en la fase "{phase}" con sub-fase "{sub_phase}"')
+def step_given_state_in_phase(context, phase, sub_phase):
+    """Place a fresh state directly in the given phase."""
+    context.game_state = EnhancedGameState()
+    context.game_state.phase = Phase(phase)
+    context.game_state.sub_phase = SubPhase(sub_phase)
+
+
+@when('cambio la fase a "{phase}" con sub-fase "{sub_phase}"')
+def step_when_set_phase(context, phase, sub_phase):
+    context.game_state.set_phase(phase, sub_phase)
+
+
+@when('intento cambiar la fase a "{phase}" con sub-fase "{sub_phase}"')
+def step_when_try_set_phase(context, phase, sub_phase):
+    context.phase_error = None
+    try:
+        context.game_state.set_phase(phase, sub_phase)
+    except InvalidPhaseTransition as e:
+        context.phase_error = e
+
+
+@when("marco la partida como terminada")
+def step_when_game_over(context):
+    context.game_state.game_over = True
+
+
+@given('una instantánea antigua de un estado en la fase "{phase}"')
+def step_given_legacy_snapshot(context, phase):
+    """Pickle a state the way it looked before phase/sub_phase existed."""
+    attributes = dict(vars(EnhancedGameState()))
+    for name in ("phase", "sub_phase", "_game_over"):
+        attributes.pop(name)
+    attributes["current_phase_name"] = phase
+    attributes["game_over"] = False
+
+    legacy = EnhancedGameState.__new__(EnhancedGameState)
+    legacy.__dict__.update(attributes)
+    context.snapshot = pickle.dumps(legacy)
+
+
+@when("restauro el estado desde la instantánea")
+def step_when_restore(context):
+    context.game_state = pickle.loads(context.snapshot)
+
+
+@then('la fase del estado debe ser "{phase}" sin sub-fase')
+def step_then_phase_without_sub(context, phase):
+    assert context.game_state.phase == Phase(phase), context.game_state.phase
+    assert context.game_state.sub_phase is None, context.game_state.sub_phase
+    assert context.game_state.current_phase_name == phase
+
+
+@then('la fase del estado debe ser "{phase}" con sub-fase "{sub_phase}"')
+def step_then_phase_with_sub(context, phase, sub_phase):
+    assert context.game_state.phase == Phase(phase), context.game_state.phase
+    assert context.game_state.sub_phase == SubPhase(
+        sub_phase
+    ), context.game_state.sub_phase
+
+
+@then("el cambio de fase debe rechazarse")
+def step_then_rejected(context):
+    assert isinstance(context.phase_error, InvalidPhaseTransition)
+
+
+@then('intentar volver a la fase "{phase}" debe rechazarse')
+def step_then_cannot_leave(context, phase):
+    try:
+        context.game_state.set_phase(phase)
+    except InvalidPhaseTransition:
+        return
+    raise AssertionError(f"Transition to {phase} was allowed")
@@ -0,0 +1,219 @@
+import pickle
+import random
+from unittest.mock import Mock
+
+# mypy: disable-error-code=import
+from behave import given, then, when
+from src.api.app import create_app
+from src.api.game_store import InMemoryGameStore
+from src.game.game import SHXLGame
+from src.game.game_logger import GameLogger, LogLevel
+from src.game.role_beliefs import RoleBeliefs
+from src.players.strategies.base_strategy import player_beliefs
+from src.players.strategies.liberal_strategy import LiberalStrategy
+
+
+def _view(context):
+    """Return the current belief view of the observer."""
+    return context.beliefs_game.state.beliefs.view(context.observer)
+
+
+def _strangers(context):
+    """Players whose role the observer cannot know, excluding the observer."""
+    return [
+        p
+        for p in context.beliefs_game.state.players
+        if p is not context.observer
+        and p.id not in context.observer.inspected_players
+        and not p.is_hitler
+    ]
+
+
+@given("una partida con creencias de {count:d} jugadores y semilla {seed:d}")
+def step_given_beliefs_game(context, count, seed):
+    """Set up a seeded game whose bots use role strategies."""
+    random.seed(seed)
+    context.beliefs_game = SHXLGame(GameLogger(LogLevel.NONE))
+    context.beliefs_game.setup_game(
+        count, with_communists=True, ai_strategy="role", role_beliefs=True
+    )
+
+
+@given("una partida sin creencias de {count:d} jugadores y semilla {seed:d}")
+def step_given_game_without_beliefs(context, count, seed):
+    """Set up a seeded game with the default settings of the simulators."""
+    random.seed(seed)
+    context.beliefs_game = SHXLGame(GameLogger(LogLevel.NONE))
+    context.beliefs_game.setup_game(count, with_communists=True, ai_strategy="role")
+
+
+@given("una partida de {count:d} bots iniciada a través de la API")
+def step_given_api_bots_game(context, count):
+    """Create, fill and start a bot game through the Flask routes."""
+    store = InMemoryGameStore()
+    client = create_app(store).test_client()
+    response = client.post("/newgame", json={"playerCount": count})
+    game_id = response.get_json()["gameID"]
+    client.post(f"/games/{game_id}/add-bots", json={"count": count})
+    response = client.post(f"/games/{game_id}/start", json={"hostPlayerID": 0})
+    assert response.status_code == 200, response.get_json()
+    context.api_beliefs_game = store.get(game_id)
+
+
+@given("un observador liberal")
+def step_given_liberal_observer(context):
+    """Pick the first liberal as the observer."""
+    context.observer = next(
+        p for p in context.beliefs_game.state.players if p.is_liberal
+    )
+
+
+@given("un observador fascista")
+def step_given_fascist_observer(context):
+    """Pick the first non-Hitler fascist as the observer."""
+    context.observer = next(
+        p
+        for p in context.beliefs_game.state.players
+        if p.is_fascist and not p.is_hitler
+    )
+
+
+@given("una estrategia liberal con un estado simulado")
+def step_given_mocked_strategy(context):
+    """Create a liberal strategy whose player and state are mocks."""
+    player = Mock()
+    player.state = Mock()
+    context.mocked_strategy = LiberalStrategy(player)
+
+
+@when("el observador investiga a otro jugador")
+def step_when_observer_inspects(context):
+    """Record an inspection result in the observer's knowledge."""
+    context.inspected = next(
+        p for p in context.beliefs_game.state.players if p is not context.observer
+    )
+    context.observer.inspected_players[context.inspected.id] = (
+        context.inspected.role.party_membership
+    )
+
+
+@when("muere un jugador que no es Hitler")
+def step_when_player_dies(context):
+    """Kill the first player other than the observer and Hitler."""
+    context.dead = _strangers(context)[0]
+    context.dead.is_dead = True
+
+
+@when("dos jugadores desconocidos promulgan {count:d} políticas fascistas juntos")
+def step_when_fascist_government(context, count):
+    """Append fascist policies enacted by the same government to the history."""
+    president, chancellor = _strangers(context)[:2]
+    context.government = (president, chancellor)
+    view = _view(context)
+    context.suspicion_before = [view.party(p, "fascist") for p in context.government]
+    state = context.beliefs_game.state
+    for _ in range(count):
+        state.policy_history.append(
+            {"policy": "fascist", "president": president, "chancellor": chancellor}
+        )
+
+
+@when("copio el estado y lo serializo")
+def step_when_fork_and_pickle(context):
+    """Fork the state and pickle the belief engine after a view."""
+    _view(context)
+    context.forked_state = context.beliefs_game.state.fork()
+    context.pickled_beliefs = pickle.loads(
+        pickle.dumps(context.beliefs_game.state.beliefs)
+    )
+
+
+@then("el estado debe tener un motor de creencias sobre roles")
+def step_then_has_engine(context):
+    """The setup must attach a RoleBeliefs engine to the state."""
+    assert isinstance(context.beliefs_game.state.beliefs, RoleBeliefs)
+
+
+@then("el estado no debe tener un motor de creencias")
+def step_then_has_no_engine(context):
+    """Without the flag the state keeps no engine and strategies see None."""
+    state = context.beliefs_game.state
+    assert state.beliefs is None
+    assert all(player_beliefs(player) is None for player in state.players)
+
+
+@then("la partida de la API debe tener un motor de creencias")
+def step_then_api_engine(context):
+    """Games started through the API keep beliefs for their bots."""
+    assert isinstance(context.api_beliefs_game.state.beliefs, RoleBeliefs)
+
+
+@then("las probabilidades de cada jugador deben sumar 1")
+def step_then_marginals_sum(context):
+    """Role marginals of every player must form a distribution."""
+    view = _view(context)
+    for player in context.beliefs_game.state.players:
+        roles = ("liberal", "fascist", "hitler", "communist")
+        total = sum(view.role(player, role) for role in roles)
+        assert abs(total - 1.0) < 1e-9, f"{player.name}: {total}"
+
+
+@then("el observador debe estar seguro de su propio rol")
+def step_then_own_role_certain(context):
+    """The observer's own role must have probability 1."""
+    view = _view(context)
+    assert view.role(context.observer, context.observer.role.role) == 1.0
+
+
+@then("el observador debe estar seguro del rol de sus compañeros")
+def step_then_teammates_certain(context):
+    """A fascist must know the roles of the other fascists and Hitler."""
+    view = _view(context)
+    for player in context.beliefs_game.state.players:
+        if player.is_fascist:
+            assert view.role(player, player.role.role) == 1.0, player.name
+
+
+@then("el observador debe estar seguro del partido del investigado")
+def step_then_inspected_certain(context):
+    """An inspected player's party must have probability 1."""
+    view = _view(context)
+    party = context.inspected.role.party_membership
+    assert view.party(context.inspected, party) == 1.0
+    assert view.uncertainty(context.inspected) == 0.0
+
+
+@then("el observador debe descartar que el muerto sea Hitler")
+def step_then_dead_not_hitler(context):
+    """A dead player cannot be Hitler while the game goes on."""
+    assert _view(context).role(context.dead, "hitler") == 0.0
+
+
+@then("el observador debe sospechar más de ambos que antes")
+def step_then_more_suspicion(context):
+    """Fascist policies must raise the fascist probability of the government."""
+    view = _view(context)
+    for player, before in zip(context.government, context.suspicion_before):
+        after = view.party(player, "fascist")
+        assert after > before, f"{player.name}: {before} -> {after}"
+
+
+@then("la copia del estado no debe tener motor de creencias")
+def step_then_fork_without_engine(context):
+    """Forked states must not carry the belief engine."""
+    assert context.forked_state.beliefs is None
+    assert context.beliefs_game.state.beliefs is not None
+
+
+@then("la instantánea no debe conservar las partículas")
+def step_then_pickle_without_particles(context):
+    """Pickled engines drop particles and rebuild them on the next view."""
+    assert context.pickled_beliefs._filters == {}
+    view = context.pickled_beliefs.view(context.observer)
+    assert view.role(context.observer, context.observer.role.role) == 1.0
+
+
+@then("la estrategia no debe tener creencias")
+def step_then_no_beliefs(context):
+    """Strategies on mocked states fall back to their rule-based logic."""
+    assert player_beliefs(context.mocked_strategy.player) is None
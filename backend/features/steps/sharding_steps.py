@@ -0,0 +1,137 @@
+# mypy: disable-error-code=import
+from behave import given, then, when
+from src.api.sharding import ShardRouter
+from src.api.storage import shard_for
+from werkzeug.test import Client
+
+
+@given("un enrutador de la API con {count:d} procesos trabajadores")
+def step_given_router(context, count):
+    """Start a shard router and stop it after the scenario."""
+    context.router = ShardRouter(count)
+    context.router.start()
+    context.add_cleanup(context.router.stop)
+    context.router_client = Client(context.router)
+
+
+@when("creo {count:d} partidas a través del enrutador")
+def step_when_create_games(context, count):
+    """Create games through the router."""
+    context.router_games = []
+    for _ in range(count):
+        response = context.router_client.post("/newgame", json={"playerCount": 6})
+        assert response.status_code == 201, response.get_data()
+        context.router_games.append(response.get_json()["gameID"])
+
+
+@when("un jugador se une a cada partida a través del enrutador")
+def step_when_join_games(context):
+    """Join one player to every created game."""
+    context.router_statuses = [
+        context.router_client.post(
+            f"/games/{game_id}/join", json={"playerName": "Alice"}
+        ).status_code
+        for game_id in context.router_games
+    ]
+
+
+@when('consulto el estado de la partida "{game_id}" a través del enrutador')
+def step_when_missing_game(context, game_id):
+    """Request the state of a game through the router."""
+    context.router_status = context.router_client.get(
+        f"/games/{game_id}/state"
+    ).status_code
+
+
+@when("consulto la salud del servidor a través del enrutador")
+def step_when_health(context):
+    """Request the health route through the router."""
+    context.router_status = context.router_client.get("/health").status_code
+
+
+@then("cada proceso trabajador debe ser dueño de alguna partida")
+def step_then_games_spread(context):
+    """Every shard owns at least one of the created games."""
+    owners = {
+        shard_for(game_id, context.router.shard_count)
+        for game_id in context.router_games
+    }
+    assert owners == set(range(context.router.shard_count)), owners
+
+
+@then("todas las uniones deben haberse aceptado")
+def step_then_joins_accepted(context):
+    """Every join reached the shard that holds the game."""
+    assert context.router_statuses == [200] * len(context.router_games)
+
+
+@then("la respuesta del enrutador debe tener código {status:d}")
+def step_then_router_status(context, status):
+    """Check the status of the last routed request."""
+    assert context.router_status == status
+
+
+@when("pido el listado de salas en espera a través del enrutador")
+def step_when_router_lobby(context):
+    """List waiting rooms through the router."""
+    response = context.router_client.get("/games?state=waiting")
+    assert response.status_code == 200, response.get_data()
+    context.router_lobby = response.get_json()
+
+
+@then("el listado del enrutador debe incluir las {count:d} partidas")
+def step_then_router_lobby(context, count):
+    """The merged listing contains every game, newest first."""
+    listed = [room["gameId"] for room in context.router_lobby["games"]]
+    assert context.router_lobby["total"] == count, context.router_lobby
+    assert listed == context.router_games[::-1], listed
+
+
+@when("consulto la salud de las partidas a través del enrutador")
+def step_when_router_games_health(context):
+    """Request the games health route through the router."""
+    response = context.router_client.get("/health/games")
+    assert response.status_code == 200, response.get_data()
+    context.router_health = response.get_json()
+
+
+@then("la salud del enrutador debe contar {count:d} partidas en {shards:d} procesos")
+def step_then_router_games_health(context, count, shards):
+    """The merged health adds up the games of every shard."""
+    health = context.router_health
+    assert health["liveGames"] == count, health
+    assert health["liveGamesByState"]["waiting_for_players"] == count, health
+    assert [shard["shard"] for shard in health["shards"]] == list(range(shards))
+    assert sum(shard["liveGames"] for shard in health["shards"]) == count
+
+
+@when("consulto las métricas a través del enrutador")
+def step_when_router_metrics(context):
+    """Request the Prometheus metrics through the router."""
+    response = context.router_client.get("/metrics")
+    assert response.status_code == 200, response.get_data()
+    context.router_metrics = response.get_data(as_text=True).splitlines()
+
+
+@then("las métricas deben incluir las partidas de cada proceso")
+def step_then_router_metrics_games(context):
+    """Every shard reports its own waiting games under the shard label."""
+    waiting = {}
+    for line in context.router_metrics:
+        if line.startswith("shxl_live_games{"):
+            labels, value = line.split(" ")
+            waiting[labels] = int(value)
+    owners = [
+        shard_for(game_id, context.router.shard_count)
+        for game_id in context.router_games
+    ]
+    for index in range(context.router.shard_count):
+        labels = f'shxl_live_games{{shard="{index}",state="waiting_for_players"}}'
+        assert waiting.get(labels) == owners.count(index), waiting
+
+
+@then("cada métrica debe tener una sola cabecera")
+def step_then_router_metrics_headers(context):
+    """HELP and TYPE lines are not repeated per shard."""
+    headers = [line for line in context.router_metrics if line.startswith("# ")]
+    assert len(headers) == len(set(headers)), headers
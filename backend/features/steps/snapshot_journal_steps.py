@@ -0,0 +1,121 @@
+import tempfile
+
+# mypy: disable-error-code=import
+from behave import given, then, when
+from src.api.app import create_app
+from src.api.game_store import InMemoryGameStore
+from src.api.snapshot_journal import (
+    JournaledGameStore,
+    SnapshotJournal,
+    _read_records,
+)
+
+
+def _open_journaled_store(context):
+    """Open a journaled in-memory store on the scenario directory."""
+    journal = SnapshotJournal(
+        context.journal_dir,
+        sync_interval=0,
+        compact_every=context.compact_every,
+        max_bytes=context.max_bytes,
+    )
+    context.add_cleanup(journal.close)
+    return JournaledGameStore(InMemoryGameStore(), journal)
+
+
+@given("un almacén en memoria con diario de instantáneas")
+def step_given_journaled_store(context):
+    """Create a journaled store in a temporary directory."""
+    directory = tempfile.TemporaryDirectory()
+    context.add_cleanup(directory.cleanup)
+    context.journal_dir = directory.name
+    context.compact_every = 100
+    context.max_bytes = 1 << 30
+    context.journaled_store = _open_journaled_store(context)
+
+
+@given("el diario se compacta cada {count:d} escrituras")
+def step_given_compact_every(context, count):
+    """Reopen the store with a small compaction threshold."""
+    context.compact_every = count
+    context.journaled_store = _open_journaled_store(context)
+
+
+@given("el diario se compacta al superar {size:d} bytes")
+def step_given_max_bytes(context, size):
+    """Reopen the store with a small size threshold."""
+    context.max_bytes = size
+    context.journaled_store = _open_journaled_store(context)
+
+
+@when("creo una partida con {players:d} jugadores unidos a través de la API")
+def step_when_create_and_join(context, players):
+    """Create a game and join players through the Flask routes."""
+    client = create_app(context.journaled_store).test_client()
+    response = client.post("/newgame", json={"playerCount": 6})
+    context.journaled_game_id = response.get_json()["gameID"]
+    for i in range(players):
+        response = client.post(
+            f"/games/{context.journaled_game_id}/join", json={"playerName": f"P{i}"}
+        )
+        assert response.status_code == 200
+
+
+@when("el proceso se reinicia sin cerrar el almacén")
+def step_when_restart(context):
+    """Open a new store on the same journal, as a restarted process would."""
+    context.journaled_store = _open_journaled_store(context)
+
+
+@when("el diario de la partida termina con una escritura interrumpida")
+def step_when_torn_write(context):
+    """Append the beginning of a record that never finished."""
+    path = context.journaled_store.journal.path(context.journaled_game_id)
+    with open(path, "ab") as f:
+        f.write(b"\x00\x10\x00\x00\x12\x34")
+
+
+@when("elimino la partida del almacén con diario")
+def step_when_delete_journaled(context):
+    """Delete the game from the journaled store."""
+    assert context.journaled_store.delete(context.journaled_game_id)
+
+
+@then("se debe haber recuperado {count:d} partida")
+def step_then_recovered(context, count):
+    """Check how many games the new store recovered."""
+    assert context.journaled_store.recovered == count
+
+
+@then("la partida recuperada debe tener {players:d} jugadores")
+def step_then_recovered_players(context, players):
+    """The recovered game keeps every joined player."""
+    game = context.journaled_store.get(context.journaled_game_id)
+    assert game is not None
+    assert len(game.state.players) == players
+
+
+@then('el diario de la partida debe incluir la acción "{method}" a "{suffix}"')
+def step_then_journaled_action(context, method, suffix):
+    """The journal notes the request behind each write."""
+    path = context.journaled_store.journal.path(context.journaled_game_id)
+    actions = [header["action"] for header, _ in _read_records(path)[0]]
+    assert any(
+        action and action["method"] == method and action["path"].endswith(suffix)
+        for action in actions
+    ), actions
+
+
+@then("la partida debe tener una instantánea compacta")
+def step_then_snapshot(context):
+    """The compacted snapshot holds the latest version."""
+    journal = context.journaled_store.journal
+    records = _read_records(journal.path(context.journaled_game_id, ".snap"))[0]
+    assert len(records) == 1
+
+
+@then("el diario de la partida debe tener menos de {count:d} entradas")
+def step_then_journal_short(context, count):
+    """The journal was emptied by the compaction."""
+    path = context.journaled_store.journal.path(context.journaled_game_id)
+    assert len(_read_records(path)[0]) < count
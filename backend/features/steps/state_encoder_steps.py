@@ -0,0 +1,202 @@
+import random
+
+import numpy as np
+
+# mypy: disable-error-code=import
+from behave import given, then, when
+from src.game.game import SHXLGame
+from src.game.game_logger import GameLogger, LogLevel
+from src.game.state_encoder import (
+    FEATURE_SIZE,
+    HEADER,
+    HEADER_SIZE,
+    KNOWN,
+    MAX_PLAYERS,
+    SEAT,
+    SEAT_SIZE,
+)
+from src.players.strategies.learned_strategy import STATE_SIZE, state_features
+
+
+def _encoded_game(count, seed):
+    """Set up a seeded game whose bots use smart strategies."""
+    random.seed(seed)
+    game = SHXLGame(GameLogger(LogLevel.NONE))
+    game.setup_game(count, with_communists=True, ai_strategy="smart")
+    return game
+
+
+def _seats(vector):
+    """Seat rows of a feature vector."""
+    return vector[HEADER_SIZE:].reshape(MAX_PLAYERS, SEAT_SIZE)
+
+
+def _traversed(player):
+    """Header computed by traversing the state, without the encoder."""
+    state = player.state
+    encoder, state.encoder = state.encoder, None
+    try:
+        return state_features(player)
+    finally:
+        state.encoder = encoder
+
+
+class _CheckingStrategy:
+    """Strategy proxy that compares the encoder with a traversal on each call."""
+
+    def __init__(self, player, strategy, mismatches):
+        self.player = player
+        self.strategy = strategy
+        self.mismatches = mismatches
+
+    def __getattr__(self, name):
+        attribute = getattr(self.strategy, name)
+        if not callable(attribute):
+            return attribute
+
+        def check(*args, **kwargs):
+            encoded = self.player.state.encoder.features(self.player)
+            if not np.allclose(encoded[:STATE_SIZE], _traversed(self.player)):
+                self.mismatches.append(name)
+            return attribute(*args, **kwargs)
+
+        return check
+
+
+@given("una partida codificada de {count:d} jugadores con semilla {seed:d}")
+def step_given_encoded_game(context, count, seed):
+    """Set up the main encoded game."""
+    context.encoded_game = _encoded_game(count, seed)
+
+
+@given("otra partida codificada de {count:d} jugadores con semilla {seed:d}")
+def step_given_other_encoded_game(context, count, seed):
+    """Set up a second encoded game."""
+    context.other_encoded_game = _encoded_game(count, seed)
+
+
+@then("los vectores de ambas partidas deben tener FEATURE_SIZE valores")
+def step_then_fixed_size(context):
+    """Both games produce vectors of the same fixed size."""
+    for game in (context.encoded_game, context.other_encoded_game):
+        player = game.state.players[0]
+        vector = game.state.encoder.features(player)
+        assert vector.shape == (FEATURE_SIZE,), vector.shape
+        assert vector.min() >= 0 and vector.max() <= 1
+
+
+@when("codifico la partida desde el tercer jugador")
+def step_when_encode_third(context):
+    """Encode the game from the third seat's point of view."""
+    state = context.encoded_game.state
+    context.observer = state.players[2]
+    context.vector = state.encoder.features(context.observer)
+
+
+@then("el primer asiento debe ser el del observador")
+def step_then_observer_first(context):
+    """The observer's own role is known in the first seat."""
+    seats = _seats(context.vector)
+    known = seats[0, KNOWN]
+    party = context.observer.role.party_membership
+    assert known[("liberal", "fascist", "communist").index(party)] == 1
+    count = len(context.encoded_game.state.players)
+    assert seats[:count, SEAT["alive"]].all()
+    assert not seats[count:].any()
+
+
+@then("el asiento del presidente debe estar marcado como presidente")
+def step_then_president_seat(context):
+    """The president's row, counted from the observer, is flagged."""
+    state = context.encoded_game.state
+    players = state.players
+    offset = (players.index(state.president) - 2) % len(players)
+    flags = _seats(context.vector)[:, SEAT["president"]]
+    assert flags[offset] == 1
+    assert flags.sum() == 1
+
+
+@then("el vector de un fascista debe marcar a Hitler como conocido")
+def step_then_fascist_knows_hitler(context):
+    """A plain fascist knows which seat is Hitler's."""
+    state = context.encoded_game.state
+    fascist = next(p for p in state.players if p.is_fascist and not p.is_hitler)
+    hitler = next(p for p in state.players if p.is_hitler)
+    seats = _seats(state.encoder.features(fascist))
+    offset = (state.players.index(hitler) - state.players.index(fascist)) % len(
+        state.players
+    )
+    assert seats[offset, SEAT["known_hitler"]] == 1
+    assert seats[offset, SEAT["known_fascist"]] == 1
+
+
+@then("el vector de un liberal solo debe conocer su propio rol")
+def step_then_liberal_knows_self(context):
+    """A liberal only knows their own party at the start."""
+    state = context.encoded_game.state
+    liberal = next(p for p in state.players if p.is_liberal)
+    known = _seats(state.encoder.features(liberal))[:, KNOWN]
+    assert known[0, 0] == 1
+    assert known.sum() == 1
+
+
+@when("se registra una votación en la que todos votan a favor")
+def step_when_record_election(context):
+    """Record a unanimous election in the state history."""
+    state = context.encoded_game.state
+    state.president_candidate = state.players[0]
+    state.chancellor_candidate = state.players[1]
+    state.record_election({p.id: True for p in state.players}, True)
+
+
+@then("el porcentaje de votos a favor de cada asiento debe ser 1")
+def step_then_ja_rate(context):
+    """Every seat that voted has a full ja rate."""
+    state = context.encoded_game.state
+    vector = state.encoder.features(context.observer)
+    count = len(state.players)
+    assert (_seats(vector)[:count, SEAT["ja_rate"]] == 1).all()
+    context.updated_vector = vector
+
+
+@then("los tableros del vector no deben cambiar")
+def step_then_header_unchanged(context):
+    """The election did not touch the header."""
+    assert np.array_equal(
+        context.vector[:HEADER_SIZE], context.updated_vector[:HEADER_SIZE]
+    )
+
+
+@then("codificarla de nuevo debe devolver el mismo vector")
+def step_then_cached(context):
+    """Without changes the cached vector is returned."""
+    state = context.encoded_game.state
+    assert state.encoder.features(context.observer) is context.vector
+    assert not context.vector.flags.writeable
+
+
+@then("tras subir el contador de elecciones el vector debe reflejarlo")
+def step_then_tracker_updated(context):
+    """Changing the election tracker produces a new vector."""
+    state = context.encoded_game.state
+    state.election_tracker = 2
+    vector = state.encoder.features(context.observer)
+    assert vector is not context.vector
+    assert np.isclose(vector[HEADER["election_tracker"]], 2 / 3)
+    assert np.array_equal(vector[HEADER_SIZE:], context.vector[HEADER_SIZE:])
+
+
+@when("juego la partida codificada comprobando cada decisión")
+def step_when_play_checking(context):
+    """Play the game comparing the encoder with a traversal at each call."""
+    context.mismatches = []
+    for player in context.encoded_game.state.players:
+        player.strategy = _CheckingStrategy(player, player.strategy, context.mismatches)
+    context.encoded_game.start_game()
+
+
+@then("la cabecera del vector debe coincidir siempre con el estado")
+def step_then_header_matches(context):
+    """The encoder agreed with the traversal on every decision."""
+    assert context.encoded_game.state.game_over
+    assert not context.mismatches, context.mismatches
@@ -0,0 +1,107 @@
+import json
+from unittest.mock import patch
+
+# mypy: disable-error-code=import
+from behave import given, then, when
+from src.api.utils import game_state_helpers as helpers
+from src.api.utils import state_serializer
+from src.game.board import GameBoard
+from src.game.game import SHXLGame
+from src.players.player_factory import PlayerFactory
+from src.roles.role import Fascist, Hitler, Liberal
+
+
+def _without_timestamps(state):
+    """Drop the timestamps, which differ between two serializations."""
+    state = json.loads(json.dumps(state))
+    state.pop("timestamp")
+    state["lastAction"].pop("timestamp")
+    return state
+
+
+@given("una partida de API con {player_count:d} jugadores en curso")
+def step_given_api_game(context, player_count):
+    """Build an in-progress game without going through setup_game."""
+    game = SHXLGame()
+    game.player_count = player_count
+    game.include_communists = True
+    state = game.state
+    state.player_factory = PlayerFactory()
+    roles = [Hitler(), Fascist()] + [Liberal() for _ in range(player_count - 2)]
+    state.players = [
+        state.player_factory.create_player(
+            id=i,
+            name=f"Player {i}",
+            role=roles[i],
+            state=state,
+            strategy_type="smart",
+            player_type="human" if i == 0 else "ai",
+        )
+        for i in range(player_count)
+    ]
+    state.active_players = list(state.players)
+    state.board = GameBoard(state, player_count, with_communists=True)
+    state.president = state.players[0]
+    state.current_phase_name = "election"
+    state.chancellor_candidate = state.players[1]
+    state.term_limited_players = [state.players[2]]
+    context.api_game = game
+
+
+@given(
+    "la partida de API tiene {liberal:d} políticas liberales y {fascist:d} fascistas"
+)
+def step_given_api_game_tracks(context, liberal, fascist):
+    """Set the policy tracks of the game."""
+    context.api_game.state.board.liberal_track = liberal
+    context.api_game.state.board.fascist_track = fascist
+
+
+@given("la partida de API tiene un gobierno anterior")
+def step_given_api_previous_government(context):
+    """Record a previous government."""
+    context.api_game.state.previous_government = {"president": 3, "chancellor": 4}
+
+
+@when("serializo el estado de la partida de API")
+def step_when_serialize(context):
+    """Serialize the game state with the fast serializer."""
+    context.serialized = state_serializer.serialize_game_state(
+        context.api_game, "game1"
+    )
+
+
+@when("serializo el estado de la partida de API sin orjson")
+def step_when_serialize_without_orjson(context):
+    """Serialize and encode the game state with the stdlib JSON fallback."""
+    with patch.object(state_serializer, "orjson", None):
+        context.document = state_serializer.dumps_json(
+            state_serializer.serialize_game_state(context.api_game, "game1")
+        )
+
+
+@then("el estado serializado debe coincidir con el de las funciones auxiliares")
+def step_then_matches_helpers(context):
+    """Compare against the original helper-based game state."""
+    game = context.api_game
+    expected = {
+        "gameState": helpers._get_game_state_status(game),
+        "currentPhase": helpers._get_current_phase_info(game),
+        "players": helpers._get_players_info(game, None),
+        "government": helpers._get_government_info(game),
+        "nomination": helpers._get_nomination_info(game),
+        "trackers": helpers._get_trackers_info(game),
+        "board": helpers._get_board_info(game),
+        "lastAction": helpers._get_last_action_info(game),
+        "gameConfig": helpers._get_game_config_info(game),
+        "gameId": "game1",
+        "timestamp": helpers._get_current_timestamp(),
+    }
+    assert _without_timestamps(context.serialized) == _without_timestamps(expected)
+
+
+@then("el documento JSON debe contener {player_count:d} jugadores")
+def step_then_document_players(context, player_count):
+    """Decode the JSON document and count the players."""
+    document = json.loads(context.document)
+    assert len(document["players"]) == player_count
@@ -0,0 +1,282 @@
+import os
+import pickle
+import random
+import time
+from unittest.mock import patch
+
+# mypy: disable-error-code=import
+from behave import given, then, when
+from src.api.app import create_app
+from src.api.game_store import InMemoryGameStore
+from src.game.game import SHXLGame
+from src.game.game_logger import GameLogger, LogLevel
+from src.players.ai_player import ANYTIME_SHARE
+from src.policies.policy import Communist, Fascist, Liberal
+
+POLICIES = {"liberal": Liberal, "fascist": Fascist, "communist": Communist}
+
+
+class _SlowStrategy:
+    """Strategy stub that keeps the first policies after a fixed delay."""
+
+    def __init__(self, delay):
+        self.delay = delay
+
+    def filter_policies(self, policies):
+        time.sleep(self.delay)
+        return policies[1:], policies[0]
+
+
+class _AnytimeStrategy:
+    """Strategy stub that records the time budget it is given."""
+
+    def __init__(self, time_budget, delay=0):
+        self.time_budget = time_budget
+        self.delay = delay
+        self.seen = None
+
+    def filter_policies(self, policies):
+        self.seen = self.time_budget
+        time.sleep(self.delay)
+        return policies[1:], policies[0]
+
+
+class _OvershootingAnytimeStrategy(_AnytimeStrategy):
+    """Anytime stub that searches its whole limit and then overshoots it."""
+
+    def filter_policies(self, policies):
+        self.seen = self.time_budget
+        time.sleep(self.time_budget + self.delay)
+        return policies[1:], policies[0]
+
+
+@given("una partida con presupuesto de {count:d} jugadores y semilla {seed:d}")
+def step_given_budget_game(context, count, seed):
+    """Set up a seeded game whose bots use role strategies."""
+    random.seed(seed)
+    context.budget_game = SHXLGame(GameLogger(LogLevel.NONE))
+    context.budget_game.setup_game(count, with_communists=True, ai_strategy="role")
+
+
+@given("un bot liberal con una estrategia que tarda {delay:d} milisegundos")
+def step_given_slow_bot(context, delay):
+    """Give the first liberal bot a strategy that takes the given time."""
+    context.bot = next(p for p in context.budget_game.state.players if p.is_liberal)
+    context.bot.strategy = _SlowStrategy(delay / 1000)
+
+
+@given("un bot liberal con una estrategia anytime")
+def step_given_anytime_bot(context):
+    """Give the first liberal bot an anytime strategy with a 1 s limit."""
+    context.bot = next(p for p in context.budget_game.state.players if p.is_liberal)
+    context.bot.strategy = _AnytimeStrategy(1.0)
+
+
+@given("un bot liberal con una estrategia anytime que tarda {delay:d} milisegundos")
+def step_given_slow_anytime_bot(context, delay):
+    """Give the first liberal bot an anytime strategy that overshoots."""
+    context.bot = next(p for p in context.budget_game.state.players if p.is_liberal)
+    context.bot.strategy = _AnytimeStrategy(1.0, delay / 1000)
+
+
+@given(
+    "un bot liberal con una estrategia anytime que agota su límite y se pasa "
+    "{delay:d} milisegundos"
+)
+def step_given_overshooting_anytime_bot(context, delay):
+    """Give the first liberal bot an anytime strategy that runs past its limit."""
+    context.bot = next(p for p in context.budget_game.state.players if p.is_liberal)
+    context.bot.strategy = _OvershootingAnytimeStrategy(1.0, delay / 1000)
+
+
+@given("un bot liberal guardado sin presupuesto de tiempo")
+def step_given_pickled_bot(context):
+    """Pickle the first liberal bot as it was before time budgets existed."""
+    bot = next(p for p in context.budget_game.state.players if p.is_liberal)
+    for name in ("time_budget", "budget_stats", "_fallback"):
+        delattr(bot, name)
+    context.pickled_bot = pickle.dumps(bot)
+
+
+@when("restauro el bot guardado")
+def step_when_unpickle_bot(context):
+    """Load the pickled bot back."""
+    context.bot = pickle.loads(context.pickled_bot)
+
+
+@given("un presupuesto de {budget:d} milisegundos por decisión")
+def step_given_budget(context, budget):
+    """Set the bot's time budget."""
+    context.budget = budget / 1000
+    context.bot.time_budget = context.budget
+
+
+@when('el bot filtra las políticas "{types}"')
+def step_when_filter(context, types):
+    """Ask the bot to filter a hand of the given policy types."""
+    context.hand = [POLICIES[t.strip()]() for t in types.split(",")]
+    start = time.perf_counter()
+    context.kept, context.discarded = context.bot.filter_policies(context.hand)
+    context.decision_elapsed = time.perf_counter() - start
+
+
+@then("el bot debe haber cronometrado {calls:d} decisiones")
+def step_then_timed_calls(context, calls):
+    """Check how many decisions were timed."""
+    assert context.bot.budget_stats["calls"] == calls, context.bot.budget_stats
+
+
+@then('el bot debe descartar la política "{policy_type}" como LiberalStrategy')
+def step_then_role_answer(context, policy_type):
+    """The discarded policy is the one the liberal strategy drops."""
+    assert context.discarded.type == policy_type, context.discarded.type
+
+
+@then('el bot debe descartar la política "{policy_type}"')
+def step_then_strategy_answer(context, policy_type):
+    """The discarded policy is the strategy's own answer."""
+    assert context.discarded.type == policy_type, context.discarded.type
+
+
+@then("el bot debe contar {overruns:d} exceso y {fallbacks:d} respuesta sustituida")
+@then("el bot debe contar {overruns:d} excesos y {fallbacks:d} respuestas sustituidas")
+@then("el bot debe contar {overruns:d} exceso y {fallbacks:d} respuestas sustituidas")
+def step_then_overruns(context, overruns, fallbacks):
+    """Check the overrun and fallback counters."""
+    stats = context.bot.budget_stats
+    assert stats["calls"] == 1, stats
+    assert stats["overruns"] == overruns, stats
+    assert stats["fallbacks"] == fallbacks, stats
+
+
+@then("la decisión debe tardar menos de {limit:d} milisegundos en total")
+def step_then_total_elapsed(context, limit):
+    """The whole decision, fallback included, stays under the limit."""
+    assert context.decision_elapsed < limit / 1000, context.decision_elapsed
+
+
+@then("la estrategia debe haber buscado con ANYTIME_SHARE del presupuesto")
+def step_then_anytime_budget(context):
+    """The anytime strategy searched with a share of the budget."""
+    seen = context.bot.strategy.seen
+    assert abs(seen - ANYTIME_SHARE * context.budget) < 1e-9, seen
+
+
+@then("la estrategia debe recuperar su propio límite de tiempo")
+def step_then_budget_restored(context):
+    """The strategy's own time limit is restored after the call."""
+    assert context.bot.strategy.time_budget == 1.0
+
+
+@when(
+    "juego una partida de {count:d} bots MCTS con {budget:d} milisegundos "
+    "por decisión y semilla {seed:d}"
+)
+def step_when_play_mcts_budget(context, count, budget, seed):
+    """Play a whole game of budgeted MCTS bots."""
+    random.seed(seed)
+    context.budget_game = SHXLGame(GameLogger(LogLevel.NONE))
+    context.budget_game.setup_game(
+        count,
+        with_communists=False,
+        ai_strategy="mcts",
+        bot_time_budget=budget / 1000,
+    )
+    context.budget_game.start_game()
+
+
+@then("la partida con presupuesto debe terminar")
+def step_then_budget_game_over(context):
+    """The budgeted game reached an end."""
+    assert context.budget_game.state.game_over
+    assert context.budget_game.state.winner is not None
+
+
+@then("cada bot debe haber cronometrado sus decisiones")
+def step_then_bots_timed(context):
+    """Every bot timed at least one decision."""
+    for player in context.budget_game.state.players:
+        assert player.budget_stats["calls"] > 0, player.budget_stats
+
+
+@then("cada exceso debe haberse respondido con la estrategia del rol")
+def step_then_overruns_fell_back(context):
+    """MCTS overruns were answered by the role strategy."""
+    for player in context.budget_game.state.players:
+        stats = player.budget_stats
+        assert stats["overruns"] == stats["fallbacks"], stats
+
+
+def _new_api_game(context, data):
+    """Create a game through the Flask routes and keep its response."""
+    context.api_store = InMemoryGameStore()
+    context.api_client = create_app(context.api_store).test_client()
+    context.api_response = context.api_client.post("/newgame", json=data)
+
+
+def _start_api_game(context, data):
+    """Fill the API game with bots and start it."""
+    game_id = context.api_response.get_json()["gameID"]
+    response = context.api_client.post(f"/games/{game_id}/add-bots", json=data)
+    assert response.status_code == 200, response.get_json()
+    response = context.api_client.post(
+        f"/games/{game_id}/start", json={"hostPlayerID": 0}
+    )
+    assert response.status_code == 200, response.get_json()
+    context.api_budget_game = context.api_store.get(game_id)
+
+
+@given('una partida de la API de {count:d} jugadores con "botTimeBudget" {budget:g}')
+def step_given_api_budget_game(context, count, budget):
+    """Create an API game with a bot time budget."""
+    _new_api_game(context, {"playerCount": count, "botTimeBudget": budget})
+    assert context.api_response.status_code == 201
+
+
+@given("una partida de la API de {count:d} jugadores sin presupuesto")
+def step_given_api_game(context, count):
+    """Create an API game without a bot time budget."""
+    _new_api_game(context, {"playerCount": count})
+    assert context.api_response.status_code == 201
+
+
+@given('la variable de entorno SHXL_BOT_TIME_BUDGET vale "{value}"')
+def step_given_budget_env(context, value):
+    """Set the default bot time budget for the scenario."""
+    environ = patch.dict(os.environ, {"SHXL_BOT_TIME_BUDGET": value})
+    environ.start()
+    context.add_cleanup(environ.stop)
+
+
+@when('creo una partida de la API con "botTimeBudget" {budget:g}')
+def step_when_create_api_budget_game(context, budget):
+    """Try to create an API game with the given bot time budget."""
+    _new_api_game(context, {"playerCount": 6, "botTimeBudget": budget})
+
+
+@when("añado {count:d} bots a la partida de la API con presupuesto e inicio la partida")
+def step_when_start_api_game(context, count):
+    """Add bots without a budget of their own and start the game."""
+    _start_api_game(context, {"count": count})
+
+
+@when('añado {count:d} bots con "botTimeBudget" {budget:g} e inicio la partida')
+def step_when_start_api_game_with_budget(context, count, budget):
+    """Add bots with their own budget and start the game."""
+    _start_api_game(context, {"count": count, "botTimeBudget": budget})
+
+
+@then(
+    "cada bot de la partida de la API debe tener un presupuesto de "
+    "{budget:d} milisegundos"
+)
+def step_then_api_bots_budget(context, budget):
+    """Every bot of the started API game has the expected budget."""
+    for player in context.api_budget_game.state.players:
+        assert player.time_budget == budget / 1000, player.time_budget
+
+
+@then("la API debe responder con código {status:d} al presupuesto")
+def step_then_api_budget_status(context, status):
+    """Check the status code of the game creation."""
+    assert context.api_response.status_code == status, context.api_response.status_code
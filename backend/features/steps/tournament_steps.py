@@ -0,0 +1,177 @@
+import random
+
+# mypy: disable-error-code=import
+from behave import given, then, when
+from src.game.game import SHXLGame
+from src.game.game_logger import GameLogger, LogLevel
+from src.simulation.tournament import (
+    INITIAL_MU,
+    INITIAL_SIGMA,
+    Tournament,
+    seat_lineup,
+    winning_factions,
+)
+
+
+def _strategies(text):
+    """Split a comma separated list of strategy names."""
+    return [name.strip() for name in text.split(",")]
+
+
+def _tournament(liberals, fascists, seed):
+    """Create an 8-player tournament with the given faction lineups."""
+    return Tournament(
+        {"liberal": _strategies(liberals), "fascist": _strategies(fascists)},
+        player_count=8,
+        seed=seed,
+    )
+
+
+@given("una partida de torneo de {count:d} jugadores con semilla {seed:d}")
+def step_given_tournament_game(context, count, seed):
+    """Set up a seeded game with roles dealt."""
+    random.seed(seed)
+    context.tournament_game = SHXLGame(GameLogger(LogLevel.NONE))
+    context.tournament_game.setup_game(count, with_communists=True)
+
+
+@given(
+    'un torneo con liberales "{liberals}" y fascistas "{fascists}" '
+    "con semilla {seed:d}"
+)
+def step_given_tournament(context, liberals, fascists, seed):
+    """Create a tournament and keep its settings to build a twin."""
+    context.tournament = _tournament(liberals, fascists, seed)
+    context.tournament_args = (liberals, fascists, seed)
+
+
+@when(
+    'siento a los liberales con "{liberal}", a los fascistas con "{fascist}" '
+    'y a los comunistas con "{communist}"'
+)
+def step_when_seat_lineup(context, liberal, fascist, communist):
+    """Give each faction its own strategy."""
+    seat_lineup(
+        context.tournament_game,
+        {"liberal": liberal, "fascist": fascist, "communist": communist},
+    )
+
+
+@when("programo {count:d} partidas")
+def step_when_schedule(context, count):
+    """Schedule matches without playing them."""
+    context.schedule = context.tournament.schedule(count)
+
+
+@when(
+    'registro una victoria "{winner}" con liberales "{liberal}" '
+    'y fascistas "{fascist}"'
+)
+def step_when_record(context, winner, liberal, fascist):
+    """Record the result of one match."""
+    context.tournament.record(
+        {"liberal": liberal, "fascist": fascist, "communist": "role"}, winner
+    )
+
+
+@when("juego {count:d} partidas del torneo sin paralelismo")
+def step_when_run_tournament(context, count):
+    """Play a short sequential tournament."""
+    context.leaderboard = context.tournament.run(count, parallel=False)
+
+
+@when('creo un torneo con liberales "{liberals}"')
+def step_when_create_invalid(context, liberals):
+    """Try to create a tournament, keeping the raised error."""
+    context.error = None
+    try:
+        Tournament({"liberal": _strategies(liberals)})
+    except ValueError as error:
+        context.error = error
+
+
+@then("los {faction} deben usar {strategy_class}")
+def step_then_faction_strategy(context, faction, strategy_class):
+    """Every player of a faction uses the expected strategy class."""
+    party = {"liberales": "liberal", "fascistas": "fascist", "comunistas": "communist"}
+    players = [
+        p
+        for p in context.tournament_game.state.players
+        if p.role.party_membership == party[faction]
+    ]
+    assert players
+    for player in players:
+        assert type(player.strategy).__name__ == strategy_class, player.strategy
+
+
+@then("cada alineación debe usar estrategias de la lista de su facción")
+def step_then_schedule_lineups(context):
+    """Scheduled lineups only use each faction's candidate strategies."""
+    for lineup, _ in context.schedule:
+        for faction, strategy in lineup.items():
+            assert strategy in context.tournament.lineups[faction], lineup
+    used = {lineup["liberal"] for lineup, _ in context.schedule}
+    assert used == {"smart", "role"}, used
+
+
+@then("otro torneo con la misma semilla debe programar las mismas partidas")
+def step_then_same_schedule(context):
+    """Schedules are reproducible from the tournament seed."""
+    twin = _tournament(*context.tournament_args)
+    assert twin.schedule(len(context.schedule)) == context.schedule
+
+
+@then('la valoración de {faction} "{strategy}" debe haber subido')
+def step_then_rating_up(context, faction, strategy):
+    """The winner's rating increases."""
+    assert context.tournament.ratings[faction, strategy].mu > INITIAL_MU
+
+
+@then('la valoración de {faction} "{strategy}" debe haber bajado')
+def step_then_rating_down(context, faction, strategy):
+    """The loser's rating decreases."""
+    assert context.tournament.ratings[faction, strategy].mu < INITIAL_MU
+
+
+@then("la incertidumbre de ambas valoraciones debe haber bajado")
+def step_then_sigma_down(context):
+    """Both rated entries become more certain."""
+    ratings = context.tournament.ratings
+    assert ratings["liberal", "smart"].sigma < INITIAL_SIGMA
+    assert ratings["fascist", "role"].sigma < INITIAL_SIGMA
+
+
+@then('la valoración de {faction} "{strategy}" no debe haber cambiado')
+def step_then_rating_unchanged(context, faction, strategy):
+    """Strategies that did not play keep their prior rating."""
+    rating = context.tournament.ratings[faction, strategy]
+    assert (rating.mu, rating.sigma, rating.games) == (INITIAL_MU, INITIAL_SIGMA, 0)
+
+
+@then('el ganador "{winner}" debe dar la victoria a "{factions}"')
+def step_then_winning_factions(context, winner, factions):
+    """Map state.winner values to the factions that win."""
+    assert winning_factions(winner) == set(_strategies(factions))
+
+
+@then("cada facción debe haber jugado {count:d} partidas en la clasificación")
+def step_then_games_per_faction(context, count):
+    """Each game rates exactly one strategy of every faction."""
+    games = {}
+    for row in context.leaderboard:
+        games[row["faction"]] = games.get(row["faction"], 0) + row["games"]
+    assert games == {"liberal": count, "fascist": count, "communist": count}, games
+
+
+@then("cada fila debe tener un intervalo de confianza alrededor de su valoración")
+def step_then_intervals(context):
+    """Rows carry confidence bounds around the rating."""
+    for row in context.leaderboard:
+        assert row["low"] < row["mu"] < row["high"], row
+        assert 0.0 <= row["win_rate"] <= 1.0
+
+
+@then("el torneo debe lanzar un ValueError")
+def step_then_value_error(context):
+    """Unknown strategies are rejected."""
+    assert isinstance(context.error, ValueError)
@@ -0,0 +1,161 @@
+import random
+
+# mypy: disable-error-code=import
+from behave import given, then, when
+from src.api.app import create_app
+from src.api.game_store import InMemoryGameStore
+from src.game.game import SHXLGame
+from src.game.game_logger import GameLogger, LogLevel
+from src.game.phases.election import ElectionPhase
+from src.game.phases.election_utils import resolve_election
+from src.game.phases.legislative import LegislativePhase
+from src.game.phases.legislative_utils import handle_chancellor_choice
+from src.game.phases.phase_machine import Phase, SubPhase
+
+
+def _track_total(board):
+    """Policies on every track of the board."""
+    return board.liberal_track + board.fascist_track + board.communist_track
+
+
+@given("una partida de {count:d} jugadores con el veto disponible y semilla {seed:d}")
+def step_given_veto_game(context, count, seed):
+    """Set up a seeded game whose board already unlocked the veto."""
+    random.seed(seed)
+    context.veto_game = SHXLGame(GameLogger(LogLevel.NONE))
+    context.veto_game.setup_game(count, with_communists=False)
+    context.veto_game.state.board.veto_available = True
+
+
+@given("un gobierno elegido que acordará vetar su agenda")
+def step_given_vetoing_government(context):
+    """Elect a government whose chancellor vetoes and president accepts."""
+    state = context.veto_game.state
+    president = state.president_candidate
+    chancellor = next(p for p in state.active_players if p is not president)
+    state.chancellor_candidate = chancellor
+    state.president = president
+    state.chancellor = chancellor
+    state.term_limited_players = [chancellor]
+    chancellor.veto = lambda: True
+    president.veto = lambda: True
+    president.accept_veto = lambda: True
+    context.veto_president = president
+    context.veto_round = state.round_number
+    context.veto_enacted = _track_total(state.board)
+
+
+@given("el contador de elecciones fallidas está en {count:d}")
+def step_given_tracker(context, count):
+    """Set the election tracker."""
+    context.veto_game.state.election_tracker = count
+
+
+@when("se juega la sesión legislativa")
+def step_when_legislative(context):
+    """Run the legislative phase of the elected government."""
+    context.veto_next_phase = LegislativePhase(context.veto_game).execute()
+
+
+@when("el gobierno es elegido en la fase de elección")
+def step_when_elected(context):
+    """Run an election in which the government passes."""
+    game = context.veto_game
+    game.nominate_chancellor = lambda: game.state.chancellor_candidate
+    game.vote_on_government = lambda: True
+    context.veto_next_phase = ElectionPhase(game).execute()
+
+
+@then("el contador de elecciones fallidas debe estar en {count:d}")
+def step_then_tracker(context, count):
+    """Check the election tracker."""
+    assert context.veto_game.state.election_tracker == count
+
+
+@then("la presidencia debe pasar al siguiente jugador")
+def step_then_next_president(context):
+    """The vetoing president does not stay in office."""
+    state = context.veto_game.state
+    assert state.president_candidate is not context.veto_president
+    assert state.round_number == context.veto_round + 1
+
+
+@then("no se debe haber promulgado ninguna política")
+def step_then_nothing_enacted(context):
+    """The vetoed agenda is discarded."""
+    assert _track_total(context.veto_game.state.board) == context.veto_enacted
+
+
+@then("la partida debe volver a la fase de elección")
+def step_then_back_to_election(context):
+    """An accepted veto leads to a new election."""
+    assert isinstance(context.veto_next_phase, ElectionPhase)
+
+
+@then("se debe haber promulgado {count:d} política de caos")
+def step_then_chaos(context, count):
+    """The third failed government enacts the top policy."""
+    board = context.veto_game.state.board
+    assert _track_total(board) == context.veto_enacted + count
+
+
+@then("no debe haber jugadores con límite de mandato")
+def step_then_no_term_limits(context):
+    """Chaos clears the term limits."""
+    assert context.veto_game.state.term_limited_players == []
+
+
+def _api_legislative_session(context):
+    """Put the elected government in the chancellor's turn of an API game."""
+    state = context.veto_game.state
+    state.set_phase(Phase.ELECTION)
+    state.set_phase(Phase.LEGISLATIVE)
+    state.set_sub_phase(SubPhase.CHANCELLOR_ENACT)
+    state.chancellor_policies = state.board.draw_policy(2)
+
+
+@when("el gobierno de bots veta su agenda a través de la API")
+def step_when_api_veto(context):
+    """Ask the bot chancellor to enact through the Flask routes."""
+    _api_legislative_session(context)
+    store = InMemoryGameStore()
+    store.put("veto", context.veto_game)
+    client = create_app(store).test_client()
+    context.veto_response = client.post("/games/veto/chancellor/enact", json={})
+    context.veto_game = store.get("veto")
+
+
+@when("el gobierno es elegido a través de la API")
+def step_when_api_elected(context):
+    """Resolve a unanimous election with the API election utilities."""
+    state = context.veto_game.state
+    state.set_phase(Phase.ELECTION)
+    resolve_election(context.veto_game, {p.id: True for p in state.active_players})
+
+
+@when("el canciller promulga a través de la API sin vetar")
+def step_when_api_enact(context):
+    """Enact the first policy with the API legislative utilities."""
+    _api_legislative_session(context)
+    result = handle_chancellor_choice(context.veto_game, 0)
+    assert result["success"], result
+
+
+@then("la API debe responder que el gobierno vetó su agenda")
+def step_then_api_vetoed(context):
+    """The enact route reports the veto instead of an enacted policy."""
+    response = context.veto_response
+    assert response.status_code == 200, response.get_json()
+    payload = response.get_json()
+    assert "veto" in payload, payload
+    assert payload["newPhase"] == "election", payload
+
+
+@then("la presidencia de la API debe pasar al siguiente jugador")
+def step_then_api_next_president(context):
+    """The vetoing president is replaced and a new election starts."""
+    state = context.veto_game.state
+    assert state.president is not None
+    assert state.president.id != context.veto_president.id
+    assert state.chancellor is None
+    assert state.phase == Phase.ELECTION
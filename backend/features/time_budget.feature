@@ -0,0 +1,87 @@
+Feature: Presupuesto de tiempo por decisión de los bots
+
+  Como operador del servidor y de las simulaciones,
+  quiero limitar el tiempo de cada decisión de un bot y recurrir a la
+  estrategia de su rol cuando una búsqueda anytime lo supera,
+  para que un bot lento no bloquee una partida ni un lote de simulaciones.
+
+  Scenario: Sin presupuesto las decisiones no se cronometran
+    Given una partida con presupuesto de 7 jugadores y semilla 3
+    And un bot liberal con una estrategia que tarda 0 milisegundos
+    When el bot filtra las políticas "liberal, fascist, communist"
+    Then el bot debe haber cronometrado 0 decisiones
+
+  Scenario: Una decisión lenta que no es anytime se cuenta y se respeta
+    Given una partida con presupuesto de 7 jugadores y semilla 5
+    And un bot liberal con una estrategia que tarda 30 milisegundos
+    And un presupuesto de 10 milisegundos por decisión
+    When el bot filtra las políticas "liberal, fascist, communist"
+    Then el bot debe descartar la política "liberal"
+    And el bot debe contar 1 exceso y 0 respuestas sustituidas
+    And la decisión debe tardar menos de 60 milisegundos en total
+
+  Scenario: Una búsqueda anytime que se excede se sustituye por la del rol
+    Given una partida con presupuesto de 7 jugadores y semilla 5
+    And un bot liberal con una estrategia anytime que tarda 30 milisegundos
+    And un presupuesto de 10 milisegundos por decisión
+    When el bot filtra las políticas "liberal, fascist, communist"
+    Then el bot debe descartar la política "fascist" como LiberalStrategy
+    And el bot debe contar 1 exceso y 1 respuesta sustituida
+
+  Scenario: La latencia de una búsqueda anytime queda acotada por el presupuesto
+    Given una partida con presupuesto de 7 jugadores y semilla 5
+    And un bot liberal con una estrategia anytime que agota su límite y se pasa 30 milisegundos
+    And un presupuesto de 100 milisegundos por decisión
+    When el bot filtra las políticas "liberal, fascist, communist"
+    Then el bot debe descartar la política "fascist" como LiberalStrategy
+    And el bot debe contar 1 exceso y 1 respuesta sustituida
+    And la decisión debe tardar menos de 160 milisegundos en total
+
+  Scenario: Una decisión a tiempo se respeta
+    Given una partida con presupuesto de 7 jugadores y semilla 7
+    And un bot liberal con una estrategia que tarda 0 milisegundos
+    And un presupuesto de 200 milisegundos por decisión
+    When el bot filtra las políticas "liberal, fascist, communist"
+    Then el bot debe descartar la política "liberal"
+    And el bot debe contar 0 excesos y 0 respuestas sustituidas
+
+  Scenario: Una estrategia anytime busca solo hasta el límite
+    Given una partida con presupuesto de 7 jugadores y semilla 11
+    And un bot liberal con una estrategia anytime
+    And un presupuesto de 100 milisegundos por decisión
+    When el bot filtra las políticas "liberal, fascist, communist"
+    Then la estrategia debe haber buscado con ANYTIME_SHARE del presupuesto
+    And la estrategia debe recuperar su propio límite de tiempo
+
+  Scenario: Una partida de bots MCTS con presupuesto termina
+    When juego una partida de 7 bots MCTS con 20 milisegundos por decisión y semilla 13
+    Then la partida con presupuesto debe terminar
+    And cada bot debe haber cronometrado sus decisiones
+    And cada exceso debe haberse respondido con la estrategia del rol
+
+  Scenario: Un bot guardado antes del presupuesto se restaura sin límite
+    Given una partida con presupuesto de 7 jugadores y semilla 17
+    And un bot liberal guardado sin presupuesto de tiempo
+    When restauro el bot guardado
+    And el bot filtra las políticas "liberal, fascist, communist"
+    Then el bot debe haber cronometrado 0 decisiones
+
+  Scenario: Una partida de la API aplica el presupuesto a sus bots
+    Given una partida de la API de 6 jugadores con "botTimeBudget" 0.5
+    When añado 6 bots a la partida de la API con presupuesto e inicio la partida
+    Then cada bot de la partida de la API debe tener un presupuesto de 500 milisegundos
+
+  Scenario: Los bots añadidos cambian el presupuesto de la partida de la API
+    Given una partida de la API de 6 jugadores con "botTimeBudget" 0.5
+    When añado 6 bots con "botTimeBudget" 0.25 e inicio la partida
+    Then cada bot de la partida de la API debe tener un presupuesto de 250 milisegundos
+
+  Scenario: El presupuesto por defecto de la API se lee del entorno
+    Given la variable de entorno SHXL_BOT_TIME_BUDGET vale "0.1"
+    And una partida de la API de 6 jugadores sin presupuesto
+    When añado 6 bots a la partida de la API con presupuesto e inicio la partida
+    Then cada bot de la partida de la API debe tener un presupuesto de 100 milisegundos
+
+  Scenario: La API rechaza un presupuesto que no es un número positivo
+    When creo una partida de la API con "botTimeBudget" -1
+    Then la API debe responder con código 400 al presupuesto
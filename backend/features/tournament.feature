@@ -0,0 +1,40 @@
+Feature: Torneos entre estrategias de bots
+
+  Como desarrollador de Secret Hitler XL,
+  quiero enfrentar estrategias distintas en cada facción y valorarlas,
+  para medir diferencias reales de fuerza sin jugar todas las combinaciones.
+
+  Scenario: Cada facción juega con la estrategia de su alineación
+    Given una partida de torneo de 8 jugadores con semilla 3
+    When siento a los liberales con "smart", a los fascistas con "role" y a los comunistas con "random"
+    Then los liberales deben usar SmartStrategy
+    And los fascistas deben usar FascistStrategy
+    And los comunistas deben usar RandomStrategy
+
+  Scenario: El calendario elige estrategias de la lista de cada facción
+    Given un torneo con liberales "smart, role" y fascistas "role" con semilla 5
+    When programo 50 partidas
+    Then cada alineación debe usar estrategias de la lista de su facción
+    And otro torneo con la misma semilla debe programar las mismas partidas
+
+  Scenario: Una victoria sube la valoración del ganador y baja la del perdedor
+    Given un torneo con liberales "smart, role" y fascistas "role" con semilla 7
+    When registro una victoria "liberal" con liberales "smart" y fascistas "role"
+    Then la valoración de liberal "smart" debe haber subido
+    And la valoración de fascist "role" debe haber bajado
+    And la incertidumbre de ambas valoraciones debe haber bajado
+    And la valoración de liberal "role" no debe haber cambiado
+
+  Scenario: Liberales y comunistas pueden ganar juntos
+    Then el ganador "liberal_and_communist" debe dar la victoria a "liberal, communist"
+    And el ganador "fascist" debe dar la victoria a "fascist"
+
+  Scenario: Un torneo corto actualiza la clasificación
+    Given un torneo con liberales "smart, role" y fascistas "role, smart" con semilla 11
+    When juego 6 partidas del torneo sin paralelismo
+    Then cada facción debe haber jugado 6 partidas en la clasificación
+    And cada fila debe tener un intervalo de confianza alrededor de su valoración
+
+  Scenario: Una estrategia desconocida se rechaza
+    When creo un torneo con liberales "genius"
+    Then el torneo debe lanzar un ValueError
@@ -0,0 +1,55 @@
+Feature: Veto aceptado en la fase legislativa
+
+  Como jugador de Secret Hitler XL,
+  quiero que un veto aceptado cuente como un gobierno fallido,
+  tanto en las partidas del motor como en las de la API,
+  para que la partida avance y no se repita siempre el mismo gobierno.
+
+  Background:
+    Given una partida de 8 jugadores con el veto disponible y semilla 3
+    And un gobierno elegido que acordará vetar su agenda
+
+  Scenario: Un veto aceptado avanza el contador y la presidencia
+    Given el contador de elecciones fallidas está en 0
+    When se juega la sesión legislativa
+    Then el contador de elecciones fallidas debe estar en 1
+    And la presidencia debe pasar al siguiente jugador
+    And no se debe haber promulgado ninguna política
+    And la partida debe volver a la fase de elección
+
+  Scenario: El tercer gobierno fallido por veto promulga una política de caos
+    Given el contador de elecciones fallidas está en 2
+    When se juega la sesión legislativa
+    Then el contador de elecciones fallidas debe estar en 0
+    And se debe haber promulgado 1 política de caos
+    And no debe haber jugadores con límite de mandato
+
+  Scenario: Un gobierno elegido no reinicia el contador antes de legislar
+    Given el contador de elecciones fallidas está en 2
+    When el gobierno es elegido en la fase de elección
+    Then el contador de elecciones fallidas debe estar en 2
+
+  Scenario: Un veto aceptado a través de la API avanza el contador y la presidencia
+    Given el contador de elecciones fallidas está en 0
+    When el gobierno de bots veta su agenda a través de la API
+    Then la API debe responder que el gobierno vetó su agenda
+    And el contador de elecciones fallidas debe estar en 1
+    And la presidencia de la API debe pasar al siguiente jugador
+    And no se debe haber promulgado ninguna política
+
+  Scenario: El tercer gobierno fallido por veto en la API promulga una política de caos
+    Given el contador de elecciones fallidas está en 2
+    When el gobierno de bots veta su agenda a través de la API
+    Then el contador de elecciones fallidas debe estar en 0
+    And se debe haber promulgado 1 política de caos
+    And no debe haber jugadores con límite de mandato
+
+  Scenario: Un gobierno elegido a través de la API no reinicia el contador
+    Given el contador de elecciones fallidas está en 2
+    When el gobierno es elegido a través de la API
+    Then el contador de elecciones fallidas debe estar en 2
+
+  Scenario: Promulgar a través de la API reinicia el contador
+    Given el contador de elecciones fallidas está en 2
+    When el canciller promulga a través de la API sin vetar
+    Then el contador de elecciones fallidas debe estar en 0
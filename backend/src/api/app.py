@@ -7,20 +7,48 @@ que sirve como API para el juego Secret Hitler XL.
 from flask import Flask
 from flask_cors import CORS
 
+from .autoplay import EXTENSION_KEY, create_autoplay_from_env, defer_bot_actions
+from .game_reaper import create_reaper_from_env, start_reaper
+from .game_store import create_store_from_env
+from .metrics import EXTENSION_KEY as METRICS_KEY
+from .metrics import (
+    ApiMetrics,
+    record_request,
+    record_request_games,
+    start_request_timer,
+)
+from .routes.action_routes import action_bp
+from .routes.autoplay_routes import autoplay_bp
 from .routes.election_routes import election_bp
 from .routes.game_routes import game_bp
 from .routes.health_routes import health_bp
 from .routes.legislative_routes import legislative_bp
 from .routes.power_routes import power_bp
+from .storage import (
+    acquire_request_game_lock,
+    configure_store,
+    persist_request_games,
+    release_request_game_lock,
+)
 
 
-def create_app():
+def create_app(game_store=None):
     """Crea y configura la aplicación Flask.
 
     Inicializa una aplicación Flask con configuración CORS habilitada y
     registra todos los blueprints necesarios para las rutas de la API
     del juego Secret Hitler XL.
 
+    Args:
+        game_store (GameStore, optional): Almacén de partidas a utilizar. Si
+            no se indica, se crea a partir de las variables de entorno
+            SHXL_GAME_STORE, SHXL_SQLITE_PATH y SHXL_GAME_CACHE_SIZE.
+            El recolector de partidas inactivas solo arranca si se define
+            SHXL_REAPER_INTERVAL y se configura con SHXL_TTL_* y
+            SHXL_SPILL_DIR, y el pool de partidas automáticas con
+            SHXL_AUTOPLAY_WORKERS. Las métricas de la aplicación se
+            publican en GET /metrics.
+
     Returns:
         Flask: La aplicación Flask configurada con todos los blueprints
             registrados y CORS habilitado.
@@ -28,11 +56,27 @@ def create_app():
     app = Flask(__name__)
     CORS(app)
 
+    store = game_store or create_store_from_env()
+    reaper = create_reaper_from_env(store)
+    configure_store(store, archive=reaper.archive)
+    start_reaper(reaper)
+    app.extensions[METRICS_KEY] = ApiMetrics()
+    app.before_request(start_request_timer)
+    app.before_request(defer_bot_actions)
+    app.before_request(acquire_request_game_lock)
+    app.after_request(record_request)
+    app.after_request(persist_request_games)
+    app.after_request(record_request_games)
+    app.teardown_request(release_request_game_lock)
+    app.extensions[EXTENSION_KEY] = create_autoplay_from_env(app)
+
     app.register_blueprint(game_bp)
     app.register_blueprint(election_bp)
     app.register_blueprint(legislative_bp)
     app.register_blueprint(power_bp)
     app.register_blueprint(health_bp)
+    app.register_blueprint(action_bp)
+    app.register_blueprint(autoplay_bp)
 
     return app
 
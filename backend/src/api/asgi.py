@@ -0,0 +1,735 @@
+"""Punto de entrada ASGI de la API del juego Secret Hitler XL.
+
+Este módulo expone las mismas rutas que la aplicación Flask (game, election,
+legislative, power y health) sobre un bucle de eventos asyncio. Las llamadas
+al motor del juego siguen siendo síncronas: cada petición se ejecuta en un
+pool de hilos acotado, serializada por un cerrojo asyncio por partida, de
+modo que las conexiones en espera no ocupan ningún hilo. Las consultas al
+almacén, incluida la versión de una partida, también se ejecutan en el pool
+y nunca bloquean el bucle de eventos.
+
+Además ofrece una consulta de larga espera (long-poll) nativa:
+
+    GET /games/<game_id>/events?since=<versión>&timeout=<segundos>
+
+que responde en cuanto la versión de la partida supera ``since`` o al
+agotarse el tiempo de espera, y un canal WebSocket por partida:
+
+    /games/<game_id>/ws?playerId=<id>
+
+por el que los humanos envían acciones (``{"action": "vote", "vote": "ja"}``)
+y reciben los eventos resultantes. Tras cada acción humana el servidor
+ejecuta por sí mismo los pasos consecutivos de los bots y los transmite a
+todos los clientes conectados a la partida, seguidos del nuevo estado.
+
+Ejemplo de ejecución con uvicorn, que construye la aplicación al arrancar::
+
+    uvicorn src.api.asgi:create_asgi_app --factory --host 0.0.0.0 --port 5000
+"""
+
+import asyncio
+import io
+import json
+import os
+import re
+import sys
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs
+
+from .game_actions import MAX_BOT_STEPS, dispatch_action, next_step, run_bot_step
+from .metrics import get_metrics
+from .storage import game_lock, games
+from .utils.state_serializer import dumps_json, serialize_game_state
+
+DEFAULT_MAX_WORKERS = 32
+DEFAULT_LONG_POLL_TIMEOUT = 30.0
+MAX_LONG_POLL_TIMEOUT = 120.0
+# Las partidas pueden cambiar desde otros procesos que comparten el almacén
+VERSION_RECHECK_INTERVAL = 1.0
+
+GAME_PATH = re.compile(r"^/games/(?P<game_id>[^/]+)(?P<rest>/.*)?$")
+WEBSOCKET_PATH = re.compile(r"^/games/(?P<game_id>[^/]+)/ws$")
+
+# Códigos de cierre WebSocket de la aplicación (rango 4000-4999)
+WS_CLOSE_BAD_REQUEST = 4400
+WS_CLOSE_NOT_FOUND = 4404
+
+
+class VersionWatchers:
+    """Notifica a las consultas en espera cuando cambia una partida."""
+
+    def __init__(self):
+        """Inicializa el registro de esperas vacío."""
+        self._events = {}
+
+    def subscribe(self, game_id):
+        """Registra una espera sobre una partida.
+
+        Args:
+            game_id: Identificador único de la partida.
+
+        Returns:
+            asyncio.Event: Evento que se activa al cambiar la partida.
+        """
+        event = asyncio.Event()
+        self._events.setdefault(game_id, set()).add(event)
+        return event
+
+    def unsubscribe(self, game_id, event):
+        """Elimina una espera registrada.
+
+        Args:
+            game_id: Identificador único de la partida.
+            event (asyncio.Event): Evento devuelto por subscribe.
+        """
+        events = self._events.get(game_id)
+        if events is not None:
+            events.discard(event)
+            if not events:
+                del self._events[game_id]
+
+    def notify(self, game_id):
+        """Despierta a todas las esperas de una partida.
+
+        Args:
+            game_id: Identificador único de la partida.
+        """
+        for event in self._events.get(game_id, ()):
+            event.set()
+
+
+class GameASGIApp:
+    """Aplicación ASGI que sirve la API del juego.
+
+    Attributes:
+        flask_app (Flask): Aplicación Flask con las rutas del juego.
+        executor (ThreadPoolExecutor): Pool donde se ejecuta el motor del juego.
+        watchers (VersionWatchers): Esperas activas por partida.
+        channels (dict): Colas de salida de los WebSocket abiertos por partida.
+    """
+
+    def __init__(self, flask_app, max_workers=DEFAULT_MAX_WORKERS):
+        """Inicializa la aplicación ASGI.
+
+        Args:
+            flask_app (Flask): Aplicación Flask a servir.
+            max_workers (int): Número máximo de hilos para el motor del juego.
+        """
+        self.flask_app = flask_app
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="shxl-engine"
+        )
+        self.watchers = VersionWatchers()
+        self.channels = {}
+        self._locks = weakref.WeakValueDictionary()
+
+    def game_lock(self, game_id):
+        """Obtiene el cerrojo asyncio de una partida.
+
+        Args:
+            game_id: Identificador único de la partida.
+
+        Returns:
+            asyncio.Lock: Cerrojo de la partida.
+        """
+        lock = self._locks.get(game_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[game_id] = lock
+        return lock
+
+    async def run_sync(self, func, *args):
+        """Ejecuta una función síncrona en el pool de hilos del motor.
+
+        Args:
+            func: Función a ejecutar.
+            *args: Argumentos de la función.
+
+        Returns:
+            Any: Resultado de la función.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def game_version(self, game_id):
+        """Obtiene la versión de una partida sin bloquear el bucle de eventos.
+
+        Args:
+            game_id: Identificador único de la partida.
+
+        Returns:
+            int: Versión de la partida, o None si no existe.
+        """
+        return await self.run_sync(games.version, game_id)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            await self.handle_http(scope, receive, send)
+        elif scope["type"] == "websocket":
+            await self.handle_websocket(scope, receive, send)
+        elif scope["type"] == "lifespan":
+            await self.handle_lifespan(receive, send)
+        else:
+            raise ValueError(f"Unsupported ASGI scope type: {scope['type']}")
+
+    async def handle_lifespan(self, receive, send):
+        """Atiende los eventos de arranque y parada del servidor.
+
+        Args:
+            receive: Canal de recepción ASGI.
+            send: Canal de envío ASGI.
+        """
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def handle_http(self, scope, receive, send):
+        """Atiende una petición HTTP.
+
+        Args:
+            scope (dict): Ámbito ASGI de la petición.
+            receive: Canal de recepción ASGI.
+            send: Canal de envío ASGI.
+        """
+        body = await _read_body(receive)
+        match = GAME_PATH.match(scope["path"])
+        game_id = match.group("game_id") if match else None
+
+        if game_id is None:
+            status, headers, content = await self.run_sync(self.call_flask, scope, body)
+        elif scope["method"] == "GET" and match.group("rest") == "/events":
+            status, headers, content = await self.long_poll(scope, game_id)
+        else:
+            async with self.game_lock(game_id):
+                version, (status, headers, content), new_version = await self.run_sync(
+                    self.call_flask_versioned, game_id, scope, body
+                )
+            if new_version is not None:
+                headers.append((b"x-game-version", str(new_version).encode()))
+            if new_version != version:
+                self.watchers.notify(game_id)
+
+        await send(
+            {"type": "http.response.start", "status": status, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": content})
+
+    def call_flask(self, scope, body):
+        """Ejecuta la aplicación Flask (WSGI) para una petición ASGI.
+
+        Args:
+            scope (dict): Ámbito ASGI de la petición.
+            body (bytes): Cuerpo completo de la petición.
+
+        Returns:
+            tuple: Código de estado, cabeceras y cuerpo de la respuesta.
+        """
+        response = {}
+
+        def start_response(status, headers, exc_info=None):
+            response["status"] = int(status.split(" ", 1)[0])
+            response["headers"] = [
+                (name.lower().encode("latin-1"), value.encode("latin-1"))
+                for name, value in headers
+            ]
+
+        result = self.flask_app.wsgi_app(_wsgi_environ(scope, body), start_response)
+        try:
+            content = b"".join(result)
+        finally:
+            if hasattr(result, "close"):
+                result.close()
+
+        return response["status"], response["headers"], content
+
+    def call_flask_versioned(self, game_id, scope, body):
+        """Ejecuta call_flask y lee la versión de la partida antes y después.
+
+        Args:
+            game_id: Identificador único de la partida.
+            scope (dict): Ámbito ASGI de la petición.
+            body (bytes): Cuerpo completo de la petición.
+
+        Returns:
+            tuple: Versión previa, respuesta de call_flask y versión final.
+        """
+        version = games.version(game_id)
+        response = self.call_flask(scope, body)
+        return version, response, games.version(game_id)
+
+    def read_game_events(self, game_id, player_id):
+        """Obtiene la versión y el estado serializado de una partida.
+
+        Args:
+            game_id: Identificador único de la partida.
+            player_id (int): Jugador que consulta, o None.
+
+        Returns:
+            tuple: Versión y estado de la partida, o (None, None) si no existe.
+        """
+        with game_lock(game_id):
+            game, version = games.store.load(game_id)
+            if game is None:
+                return None, None
+            with get_metrics(self.flask_app).serialization_seconds.time():
+                return version, serialize_game_state(game, game_id, player_id)
+
+    async def long_poll(self, scope, game_id):
+        """Espera a que una partida cambie de versión.
+
+        Args:
+            scope (dict): Ámbito ASGI de la petición.
+            game_id: Identificador único de la partida.
+
+        Returns:
+            tuple: Código de estado, cabeceras y cuerpo de la respuesta.
+        """
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        try:
+            since = int(query.get("since", ["0"])[0])
+            timeout = float(query.get("timeout", [DEFAULT_LONG_POLL_TIMEOUT])[0])
+            player_id = int(query["playerId"][0]) if "playerId" in query else None
+        except ValueError:
+            return _json(400, {"error": "since, timeout and playerId must be numbers"})
+
+        timeout = max(0.0, min(timeout, MAX_LONG_POLL_TIMEOUT))
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        event = self.watchers.subscribe(game_id)
+        try:
+            while True:
+                version = await self.game_version(game_id)
+                if version is None:
+                    return _json(404, {"error": "Game not found"})
+                if version > since:
+                    break
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return _json(
+                        200, {"gameId": game_id, "version": version, "changed": False}
+                    )
+
+                event.clear()
+                try:
+                    await asyncio.wait_for(
+                        event.wait(), min(remaining, VERSION_RECHECK_INTERVAL)
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.watchers.unsubscribe(game_id, event)
+
+        version, state = await self.run_sync(self.read_game_events, game_id, player_id)
+        if version is None:
+            return _json(404, {"error": "Game not found"})
+        return _json(
+            200,
+            {"gameId": game_id, "version": version, "changed": True, "state": state},
+        )
+
+    def read_game_snapshot(self, game_id, player_id):
+        """Obtiene el estado de una partida y el siguiente paso pendiente.
+
+        Args:
+            game_id: Identificador único de la partida.
+            player_id (int): Jugador que consulta, o None.
+
+        Returns:
+            dict: Mensaje de estado para el canal WebSocket, o None si la
+                partida no existe.
+        """
+        with game_lock(game_id):
+            game, version = games.store.load(game_id)
+            if game is None:
+                return None
+            with get_metrics(self.flask_app).serialization_seconds.time():
+                state = serialize_game_state(game, game_id, player_id)
+            return {
+                "type": "state",
+                "gameId": game_id,
+                "version": version,
+                "state": state,
+                "nextStep": next_step(game),
+            }
+
+    def broadcast(self, game_id, message):
+        """Envía un mensaje a todos los WebSocket abiertos de una partida.
+
+        Args:
+            game_id: Identificador único de la partida.
+            message (dict): Mensaje a enviar.
+        """
+        for queue in self.channels.get(game_id, ()):
+            queue.put_nowait(message)
+
+    async def run_action(self, game_id, action, body):
+        """Ejecuta una acción de juego bajo el cerrojo de la partida.
+
+        Args:
+            game_id: Identificador único de la partida.
+            action (str): Nombre de la acción.
+            body (dict): Cuerpo JSON de la acción.
+
+        Returns:
+            tuple: Código de estado y cuerpo JSON del resultado.
+        """
+        async with self.game_lock(game_id):
+            version = await self.game_version(game_id)
+            status, result = await self.run_sync(
+                dispatch_action, self.flask_app, game_id, action, body
+            )
+            changed = await self.game_version(game_id) != version
+        if changed:
+            self.watchers.notify(game_id)
+        return status, result
+
+    async def advance_bots(self, game_id):
+        """Ejecuta los pasos consecutivos de los bots de una partida.
+
+        Cada paso se transmite a los WebSocket de la partida en cuanto
+        termina. El avance se detiene al llegar a un paso humano, al terminar
+        la partida o ante la primera acción fallida.
+
+        Args:
+            game_id: Identificador único de la partida.
+
+        Returns:
+            int: Número de pasos ejecutados.
+        """
+        steps = 0
+        async with self.game_lock(game_id):
+            version = await self.game_version(game_id)
+            while steps < MAX_BOT_STEPS:
+                event = await self.run_sync(run_bot_step, self.flask_app, game_id)
+                if event is None:
+                    break
+                steps += 1
+                self.broadcast(
+                    game_id,
+                    {"type": "action", "actor": "bot", "gameId": game_id, **event},
+                )
+                if event["status"] >= 400:
+                    break
+            changed = await self.game_version(game_id) != version
+        if changed:
+            self.watchers.notify(game_id)
+        return steps
+
+    async def handle_websocket(self, scope, receive, send):
+        """Atiende el canal WebSocket de una partida.
+
+        Mensajes del cliente (JSON):
+            {"action": <acción>, "requestId": <opcional>, ...cuerpo}: Ejecuta
+                una acción (nominate, vote, draw, discard, enact o
+                execute_power) con los campos restantes como cuerpo. Si la
+                conexión indicó playerId, se usa como playerId por defecto.
+            {"action": "sync"}: Solicita de nuevo el estado completo.
+
+        Mensajes del servidor (JSON):
+            {"type": "state", ...}: Estado serializado, versión y siguiente
+                paso pendiente; se envía al conectar y tras cada cambio.
+            {"type": "result", ...}: Resultado de una acción de este cliente.
+            {"type": "action", ...}: Acción ejecutada por un bot o por otro
+                humano conectado a la partida.
+            {"type": "error", ...}: Mensaje inválido.
+
+        Args:
+            scope (dict): Ámbito ASGI de la conexión.
+            receive: Canal de recepción ASGI.
+            send: Canal de envío ASGI.
+        """
+        message = await receive()
+        if message["type"] != "websocket.connect":
+            return
+
+        match = WEBSOCKET_PATH.match(scope["path"])
+        if match is None:
+            await send({"type": "websocket.close", "code": WS_CLOSE_NOT_FOUND})
+            return
+        game_id = match.group("game_id")
+
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        try:
+            player_id = int(query["playerId"][0]) if "playerId" in query else None
+        except ValueError:
+            await send({"type": "websocket.close", "code": WS_CLOSE_BAD_REQUEST})
+            return
+
+        if await self.game_version(game_id) is None:
+            await send({"type": "websocket.close", "code": WS_CLOSE_NOT_FOUND})
+            return
+
+        await send({"type": "websocket.accept"})
+
+        queue = asyncio.Queue()
+        writer = asyncio.ensure_future(_drain_websocket(queue, send))
+        self.channels.setdefault(game_id, set()).add(queue)
+        changed = self.watchers.subscribe(game_id)
+        receiving = None
+        sent_version = None
+        close_code = None
+
+        try:
+            await self.advance_bots(game_id)
+
+            while True:
+                changed.clear()
+                version = await self.game_version(game_id)
+                if version is None:
+                    queue.put_nowait({"type": "error", "error": "Game not found"})
+                    close_code = WS_CLOSE_NOT_FOUND
+                    break
+                if version != sent_version:
+                    snapshot = await self.run_sync(
+                        self.read_game_snapshot, game_id, player_id
+                    )
+                    if snapshot is not None:
+                        sent_version = snapshot["version"]
+                        queue.put_nowait(snapshot)
+
+                if receiving is None:
+                    receiving = asyncio.ensure_future(receive())
+                waiting = asyncio.ensure_future(changed.wait())
+                done, _ = await asyncio.wait(
+                    {receiving, waiting},
+                    timeout=VERSION_RECHECK_INTERVAL,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                waiting.cancel()
+
+                if waiting in done:
+                    # La partida cambió desde otra conexión: puede tocar a un bot
+                    await self.advance_bots(game_id)
+
+                if receiving not in done:
+                    continue
+                message = receiving.result()
+                receiving = None
+
+                if message["type"] == "websocket.disconnect":
+                    break
+
+                request, error = _parse_ws_message(message)
+                if error is not None:
+                    queue.put_nowait({"type": "error", "error": error})
+                    continue
+
+                if request["action"] == "sync":
+                    sent_version = None
+                    continue
+
+                action = request.pop("action")
+                request_id = request.pop("requestId", None)
+                if player_id is not None:
+                    request.setdefault("playerId", player_id)
+
+                status, result = await self.run_action(game_id, action, request)
+                queue.put_nowait(
+                    {
+                        "type": "result",
+                        "requestId": request_id,
+                        "action": action,
+                        "status": status,
+                        "result": result,
+                    }
+                )
+                if status < 400:
+                    for other in self.channels.get(game_id, ()):
+                        if other is not queue:
+                            other.put_nowait(
+                                {
+                                    "type": "action",
+                                    "actor": "human",
+                                    "gameId": game_id,
+                                    "action": action,
+                                    "playerId": request.get("playerId"),
+                                    "status": status,
+                                    "result": result,
+                                }
+                            )
+                    await self.advance_bots(game_id)
+        finally:
+            if receiving is not None:
+                receiving.cancel()
+            self.watchers.unsubscribe(game_id, changed)
+            queues = self.channels.get(game_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self.channels[game_id]
+            if close_code is not None:
+                queue.put_nowait({"type": "websocket.close", "code": close_code})
+            queue.put_nowait(None)
+            await writer
+
+
+async def _read_body(receive):
+    """Lee el cuerpo completo de una petición HTTP ASGI.
+
+    Args:
+        receive: Canal de recepción ASGI.
+
+    Returns:
+        bytes: Cuerpo de la petición.
+    """
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+async def _drain_websocket(queue, send):
+    """Envía por un WebSocket los mensajes encolados para él.
+
+    Termina al recibir None o si el cliente ya se desconectó.
+
+    Args:
+        queue (asyncio.Queue): Cola de mensajes de la conexión.
+        send: Canal de envío ASGI.
+    """
+    while True:
+        message = await queue.get()
+        if message is None:
+            return
+        try:
+            if message.get("type") == "websocket.close":
+                await send(message)
+            else:
+                await send(
+                    {"type": "websocket.send", "text": dumps_json(message).decode()}
+                )
+        except Exception:
+            # El cliente cerró la conexión; se descartan los mensajes restantes
+            return
+
+
+def _parse_ws_message(message):
+    """Decodifica un mensaje recibido por el canal WebSocket.
+
+    Args:
+        message (dict): Mensaje ASGI websocket.receive.
+
+    Returns:
+        tuple: Petición decodificada y mensaje de error (uno de los dos es None).
+    """
+    text = message.get("text")
+    if text is None:
+        text = (message.get("bytes") or b"").decode("utf-8", errors="replace")
+
+    try:
+        request = json.loads(text)
+    except ValueError:
+        return None, "Message must be valid JSON"
+
+    if not isinstance(request, dict) or not isinstance(request.get("action"), str):
+        return None, "Message must be a JSON object with an action"
+
+    return request, None
+
+
+def _wsgi_environ(scope, body):
+    """Construye el entorno WSGI (PEP 3333) de una petición ASGI.
+
+    Args:
+        scope (dict): Ámbito ASGI de la petición.
+        body (bytes): Cuerpo completo de la petición.
+
+    Returns:
+        dict: Entorno WSGI.
+    """
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", "").encode("utf-8").decode("latin-1"),
+        "PATH_INFO": scope["path"].encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": server[0],
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "REMOTE_ADDR": client[0],
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
+
+    for name, value in scope.get("headers", []):
+        name = name.decode("latin-1").upper().replace("-", "_")
+        value = value.decode("latin-1")
+        if name == "CONTENT_TYPE":
+            environ["CONTENT_TYPE"] = value
+        elif name != "CONTENT_LENGTH":
+            key = f"HTTP_{name}"
+            environ[key] = f"{environ[key]},{value}" if key in environ else value
+
+    return environ
+
+
+def _json(status, payload):
+    """Construye una respuesta JSON para el canal ASGI.
+
+    Args:
+        status (int): Código de estado HTTP.
+        payload: Objeto serializable a JSON.
+
+    Returns:
+        tuple: Código de estado, cabeceras y cuerpo.
+    """
+    content = dumps_json(payload)
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(content)).encode()),
+    ]
+    return status, headers, content
+
+
+def create_asgi_app(flask_app=None, max_workers=None):
+    """Crea la aplicación ASGI de la API.
+
+    Es la factoría que usa uvicorn con --factory: el módulo no construye
+    ninguna aplicación al importarse.
+
+    Args:
+        flask_app (Flask, optional): Aplicación Flask a servir. Por defecto la
+            aplicación global de src.api.app.
+        max_workers (int, optional): Hilos del motor del juego. Por defecto la
+            variable SHXL_ASGI_WORKERS o DEFAULT_MAX_WORKERS.
+
+    Returns:
+        GameASGIApp: Aplicación ASGI.
+    """
+    if flask_app is None:
+        from .app import app as flask_app
+
+    if max_workers is None:
+        max_workers = int(os.environ.get("SHXL_ASGI_WORKERS", DEFAULT_MAX_WORKERS))
+
+    return GameASGIApp(flask_app, max_workers=max_workers)
+
+
+if __name__ == "__main__":
+    try:
+        import uvicorn  # type: ignore[import-not-found]
+    except ImportError:
+        sys.exit("uvicorn is required to run the ASGI server: pip install uvicorn")
+
+    uvicorn.run(create_asgi_app(), host="0.0.0.0", port=5000)
@@ -0,0 +1,398 @@
+"""Partidas automáticas ejecutadas en el servidor.
+
+Este módulo permite que el servidor juegue por sí mismo las mesas de bots:
+una petición pone en marcha la partida en un pool de hilos acotado y los
+clientes siguen el progreso a través de la versión de la partida (consulta
+en espera /games/<id>/events o canal WebSocket) o del estado del trabajo.
+
+Cada paso se despacha a través de las rutas Flask (ver game_actions), de modo
+que se persiste y se versiona igual que una acción enviada por un cliente.
+En una mesa de solo bots cada nominación ejecuta el ciclo completo de la
+ronda, por lo que una partida entera necesita unas pocas decenas de pasos.
+
+El mismo pool ejecuta las acciones de las partidas con bots, de modo que las
+estrategias nunca se ejecutan en el hilo de la petición: por defecto la
+petición espera el resultado de la acción y responde con él. Una acción de
+bot enviada con la cabecera ``Prefer: respond-async`` se responde al instante
+con 202 y la versión actual, y la estrategia del bot se ejecuta en segundo
+plano junto con los pasos de bot consecutivos. Cada partida tiene como mucho
+un trabajo activo, de modo que sus pasos se ejecutan en orden.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import current_app, jsonify, request
+
+from .game_actions import (
+    ACTION_ROUTES,
+    dispatch_action,
+    has_bots,
+    next_step,
+    run_bot_step,
+)
+from .game_store import describe_game_status
+from .storage import game_lock, games
+from .utils.state_serializer import json_response
+
+DEFAULT_AUTOPLAY_WORKERS = 4
+MAX_AUTOPLAY_STEPS = 5000
+EXTENSION_KEY = "shxl_autoplay"
+RESPOND_ASYNC = "respond-async"
+
+_ACTIONS_BY_ROUTE = {route: action for action, route in ACTION_ROUTES.items()}
+
+
+class AutoplayJob:
+    """Trabajo de juego automático de una partida.
+
+    Attributes:
+        game_id (str): Identificador único de la partida.
+        until_round (int): Ronda en la que detenerse, o None.
+        until_game_over (bool): Si se juega hasta el final de la partida.
+        status (str): queued, running, finished, failed o cancelled.
+        stopped_reason (str): Motivo de la parada (game_over, round_reached,
+            human_turn, step_limit, action_failed o cancelled).
+        steps (int): Pasos ejecutados.
+        last_event (dict): Último paso ejecutado.
+        error (str): Descripción del error si el trabajo falló.
+    """
+
+    def __init__(self, game_id, until_round=None, until_game_over=True):
+        """Inicializa el trabajo.
+
+        Args:
+            game_id (str): Identificador único de la partida.
+            until_round (int, optional): Ronda en la que detenerse.
+            until_game_over (bool): Si se juega hasta el final de la partida.
+        """
+        self.game_id = game_id
+        self.until_round = until_round
+        self.until_game_over = until_game_over
+        self.status = "queued"
+        self.stopped_reason = None
+        self.steps = 0
+        self.last_event = None
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+        self.future = None
+        self._cancel = threading.Event()
+        self._pending = False
+
+    @property
+    def active(self):
+        """bool: True mientras el trabajo está en cola o en ejecución."""
+        return self.status in ("queued", "running")
+
+    def cancel(self):
+        """Pide que el trabajo se detenga tras el paso en curso."""
+        self._cancel.set()
+
+    def _finish(self, status, reason, error=None):
+        """Marca el trabajo como terminado.
+
+        Args:
+            status (str): Estado final del trabajo.
+            reason (str): Motivo de la parada.
+            error (str, optional): Descripción del error.
+        """
+        self.status = status
+        self.stopped_reason = reason
+        self.error = error
+        self.finished_at = time.time()
+
+    def to_dict(self):
+        """Representa el trabajo como diccionario JSON.
+
+        Returns:
+            dict: Estado y progreso del trabajo.
+        """
+        game = games.store.get(self.game_id)
+        state = getattr(game, "state", None)
+        return {
+            "gameId": self.game_id,
+            "status": self.status,
+            "stoppedReason": self.stopped_reason,
+            "untilRound": self.until_round,
+            "untilGameOver": self.until_game_over,
+            "steps": self.steps,
+            "lastEvent": self.last_event,
+            "error": self.error,
+            "version": games.version(self.game_id),
+            "gameState": describe_game_status(game) if game is not None else None,
+            "roundNumber": getattr(state, "round_number", None),
+            "createdAt": self.created_at,
+            "finishedAt": self.finished_at,
+        }
+
+
+class AutoplayRunner:
+    """Ejecuta trabajos de juego automático en un pool de hilos acotado.
+
+    Attributes:
+        flask_app (Flask): Aplicación Flask con las rutas del juego.
+        executor (ThreadPoolExecutor): Pool donde se juegan las partidas.
+        jobs (dict): Último trabajo de cada partida.
+    """
+
+    def __init__(self, flask_app, max_workers=DEFAULT_AUTOPLAY_WORKERS):
+        """Inicializa el ejecutor.
+
+        Args:
+            flask_app (Flask): Aplicación Flask con las rutas del juego.
+            max_workers (int): Número máximo de partidas jugándose a la vez.
+        """
+        self.flask_app = flask_app
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="shxl-autoplay"
+        )
+        self.jobs = {}
+        self._lock = threading.Lock()
+
+    def get(self, game_id):
+        """Obtiene el último trabajo de una partida.
+
+        Args:
+            game_id (str): Identificador único de la partida.
+
+        Returns:
+            AutoplayJob: Trabajo de la partida o None si no hay ninguno.
+        """
+        with self._lock:
+            return self.jobs.get(game_id)
+
+    def start(self, game_id, until_round=None, until_game_over=True):
+        """Encola el juego automático de una partida.
+
+        Args:
+            game_id (str): Identificador único de la partida.
+            until_round (int, optional): Ronda en la que detenerse.
+            until_game_over (bool): Si se juega hasta el final de la partida.
+
+        Returns:
+            tuple: Trabajo de la partida y True si se creó, o el trabajo
+                activo existente y False.
+        """
+        with self._lock:
+            current = self.jobs.get(game_id)
+            if current is not None and current.active:
+                return current, False
+            job = AutoplayJob(game_id, until_round, until_game_over)
+            self.jobs[game_id] = job
+            job.future = self.executor.submit(self._run, job)
+            return job, True
+
+    def advance(self, game_id):
+        """Encola los pasos de bot pendientes de una partida.
+
+        Si la partida ya tiene un trabajo activo, se le pide que vuelva a
+        comprobar si hay pasos de bot antes de terminar en lugar de crear
+        otro, de modo que los pasos de una partida nunca se ejecutan en
+        paralelo.
+
+        Args:
+            game_id (str): Identificador único de la partida.
+
+        Returns:
+            AutoplayJob: Trabajo que ejecutará los pasos de bot.
+        """
+        with self._lock:
+            current = self.jobs.get(game_id)
+            if current is not None and current.active:
+                current._pending = True
+                return current
+            job = AutoplayJob(game_id)
+            self.jobs[game_id] = job
+            job.future = self.executor.submit(self._run, job)
+            return job
+
+    def run_action(self, game_id, action, body=None):
+        """Ejecuta una acción de juego en el pool y espera su resultado.
+
+        Args:
+            game_id (str): Identificador único de la partida.
+            action (str): Nombre de la acción (clave de ACTION_ROUTES).
+            body (dict, optional): Cuerpo de la acción.
+
+        Returns:
+            tuple: Código de estado y cuerpo de la respuesta (ver
+                dispatch_action).
+        """
+        future = self.executor.submit(
+            dispatch_action, self.flask_app, game_id, action, body
+        )
+        return future.result()
+
+    def cancel(self, game_id):
+        """Pide que se detenga el trabajo activo de una partida.
+
+        Args:
+            game_id (str): Identificador único de la partida.
+
+        Returns:
+            AutoplayJob: Trabajo cancelado o None si no había ninguno activo.
+        """
+        job = self.get(game_id)
+        if job is None or not job.active:
+            return None
+        job.cancel()
+        return job
+
+    def shutdown(self):
+        """Cancela los trabajos activos y detiene el pool."""
+        with self._lock:
+            jobs = list(self.jobs.values())
+        for job in jobs:
+            job.cancel()
+        self.executor.shutdown(wait=True)
+
+    def _round_reached(self, job):
+        """Indica si la partida alcanzó la ronda objetivo del trabajo.
+
+        Args:
+            job (AutoplayJob): Trabajo en curso.
+
+        Returns:
+            bool: True si hay ronda objetivo y la partida ya llegó a ella.
+        """
+        if job.until_round is None:
+            return False
+        game = games.store.get(job.game_id)
+        round_number = getattr(getattr(game, "state", None), "round_number", 0)
+        return round_number >= job.until_round
+
+    def _run(self, job):
+        """Juega la partida de un trabajo paso a paso.
+
+        Args:
+            job (AutoplayJob): Trabajo a ejecutar.
+        """
+        job.status = "running"
+        try:
+            for _ in range(MAX_AUTOPLAY_STEPS):
+                if job._cancel.is_set():
+                    job._finish("cancelled", "cancelled")
+                    return
+                if self._round_reached(job):
+                    job._finish("finished", "round_reached")
+                    return
+
+                event = run_bot_step(self.flask_app, job.game_id)
+                if event is None:
+                    with self._lock:
+                        if job._pending:
+                            job._pending = False
+                            continue
+                        game = games.store.get(job.game_id)
+                        if (
+                            game is not None
+                            and describe_game_status(game) == "in_progress"
+                        ):
+                            job._finish("finished", "human_turn")
+                        else:
+                            job._finish("finished", "game_over")
+                    return
+
+                job.steps += 1
+                job.last_event = event
+                if event["status"] >= 400:
+                    job._finish("failed", "action_failed", str(event["result"]))
+                    return
+
+            job._finish("finished", "step_limit")
+        except Exception as e:
+            import traceback
+
+            traceback.print_exc()
+            job._finish("failed", "error", str(e))
+
+
+def create_autoplay_from_env(flask_app, environ=None):
+    """Crea el ejecutor de partidas automáticas de una aplicación.
+
+    Variables reconocidas:
+        SHXL_AUTOPLAY_WORKERS: Número máximo de partidas jugándose a la vez.
+
+    Args:
+        flask_app (Flask): Aplicación Flask con las rutas del juego.
+        environ (dict, optional): Entorno a utilizar. Por defecto os.environ.
+
+    Returns:
+        AutoplayRunner: Ejecutor configurado.
+    """
+    environ = os.environ if environ is None else environ
+    max_workers = int(environ.get("SHXL_AUTOPLAY_WORKERS", DEFAULT_AUTOPLAY_WORKERS))
+    return AutoplayRunner(flask_app, max_workers=max_workers)
+
+
+def get_autoplay():
+    """Obtiene el ejecutor de partidas automáticas de la aplicación actual.
+
+    Returns:
+        AutoplayRunner: Ejecutor registrado en la aplicación Flask activa.
+    """
+    return current_app.extensions[EXTENSION_KEY]
+
+
+def defer_bot_actions():
+    """Ejecuta en el pool las acciones de juego de las partidas con bots.
+
+    Se registra como manejador before_request, antes de que la petición tome
+    el cerrojo de la partida. En una partida con bots la acción puede
+    ejecutar estrategias (la jugada de un bot, los votos de los bots o el
+    poder de un presidente bot tras la promulgación de un humano), así que
+    se despacha en el pool y la petición solo espera su resultado.
+
+    Si la acción llega con la cabecera ``Prefer: respond-async`` y el
+    siguiente paso de la partida corresponde a un bot que realiza esa
+    acción, la petición no espera: encola los pasos de bot en el pool y
+    responde al instante con 202.
+
+    Returns:
+        Response: Resultado de la acción, respuesta 202 si la acción se
+            difiere, o None para que la ruta atienda la petición.
+    """
+    if request.method != "POST":
+        return None
+
+    game_id = (request.view_args or {}).get("game_id")
+    if game_id is None:
+        return None
+    action = _ACTIONS_BY_ROUTE.get(request.path[len(f"/games/{game_id}") :])
+    if action is None:
+        return None
+
+    with game_lock(game_id):
+        game = games.store.get(game_id)
+        if game is None or not has_bots(game):
+            return None
+        step = next_step(game)
+
+    if (
+        RESPOND_ASYNC not in request.headers.get("Prefer", "")
+        or step is None
+        or step["actor"] != "bot"
+        or step["action"] != action
+    ):
+        status, payload = get_autoplay().run_action(
+            game_id, action, request.get_json(silent=True)
+        )
+        return json_response(payload, status)
+
+    job = get_autoplay().advance(game_id)
+    response = jsonify(
+        {
+            "message": "Bot action queued",
+            "action": action,
+            "playerId": step["playerId"],
+            "version": games.version(game_id),
+            "eventsUrl": f"/games/{game_id}/events",
+            "autoplay": job.to_dict(),
+        }
+    )
+    response.status_code = 202
+    response.headers["Preference-Applied"] = RESPOND_ASYNC
+    return response
@@ -0,0 +1,266 @@
+"""Acciones de juego y turnos automáticos de los bots.
+
+Este módulo permite despachar acciones de juego sin pasar por HTTP y hacer
+avanzar la partida mientras el siguiente paso corresponda a un bot. Cada
+acción se ejecuta con el mismo manejador que usa su ruta REST (ver
+handlers), de modo que las validaciones, el cerrojo por partida y la
+persistencia en el almacén son idénticos en todas las vías de entrada.
+"""
+
+from contextlib import nullcontext
+
+from flask import g
+from src.game.phases.phase_machine import Phase, SubPhase
+
+from .handlers.election_handlers import cast_vote_handler, nominate_chancellor_handler
+from .handlers.legislative_handlers import (
+    discard_policy_handler,
+    draw_policies_handler,
+    enact_policy_handler,
+    execute_power_handler,
+)
+from .metrics import get_metrics, observe_games
+from .storage import game_lock, games, persist_games
+from .utils.game_state_helpers import _get_current_phase_name, _get_game_state_status
+
+ACTION_ROUTES = {
+    "nominate": "/nominate",
+    "vote": "/vote",
+    "draw": "/president/draw",
+    "discard": "/president/discard",
+    "enact": "/chancellor/enact",
+    "execute_power": "/executive/execute",
+}
+ACTION_HANDLERS = {
+    "nominate": nominate_chancellor_handler,
+    "vote": cast_vote_handler,
+    "draw": draw_policies_handler,
+    "discard": discard_policy_handler,
+    "enact": enact_policy_handler,
+    "execute_power": execute_power_handler,
+}
+
+MAX_BOT_STEPS = 500
+
+
+def _is_bot(player):
+    """Indica si un jugador está controlado por la IA.
+
+    Args:
+        player: Jugador a comprobar.
+
+    Returns:
+        bool: True si el jugador es un bot.
+    """
+    return getattr(player, "player_type", "human") == "ai"
+
+
+def has_bots(game):
+    """Indica si una partida tiene algún jugador controlado por la IA.
+
+    Args:
+        game: Instancia de la partida.
+
+    Returns:
+        bool: True si algún jugador de la partida es un bot.
+    """
+    return any(_is_bot(player) for player in getattr(game.state, "players", []))
+
+
+def _step(actor, action, player, body=None):
+    """Construye la descripción de un paso pendiente.
+
+    Args:
+        actor (str): "bot" o "human".
+        action (str): Nombre de la acción (clave de ACTION_ROUTES).
+        player: Jugador que debe actuar.
+        body (dict, optional): Cuerpo de la acción para los bots.
+
+    Returns:
+        dict: Paso pendiente.
+    """
+    return {
+        "actor": actor,
+        "action": action,
+        "playerId": player.id,
+        "body": body if body is not None else {},
+    }
+
+
+def next_step(game):
+    """Determina el siguiente paso de la partida y quién debe darlo.
+
+    Se decide a partir de la fase y sub-fase del estado: nominación,
+    votación, robo y descarte del presidente, promulgación del canciller y
+    poder ejecutivo del presidente humano. Los bots votan antes que los
+    humanos.
+
+    Args:
+        game: Instancia de la partida.
+
+    Returns:
+        dict: Paso pendiente con actor, action, playerId y body, o None si la
+            partida no está en curso o no hay ningún paso reconocible.
+    """
+    if _get_game_state_status(game) != "in_progress":
+        return None
+
+    state = game.state
+    president = getattr(state, "president", None)
+    if president is None:
+        return None
+
+    phase = _get_current_phase_name(game)
+    sub_phase = getattr(state, "sub_phase", None)
+
+    if phase == Phase.EXECUTIVE_POWER:
+        if _is_bot(president):
+            return None
+        return _step("human", "execute_power", president)
+
+    if phase == Phase.VOTING:
+        votes = getattr(state, "api_votes", None) or {}
+        pending = [
+            p
+            for p in state.players
+            if getattr(p, "is_alive", True) and p.id not in votes
+        ]
+        for player in pending:
+            if _is_bot(player):
+                return _step("bot", "vote", player, {"playerId": player.id})
+        if pending:
+            return _step("human", "vote", pending[0])
+        return None
+
+    if phase == Phase.LEGISLATIVE:
+        if sub_phase == SubPhase.CHANCELLOR_ENACT:
+            chancellor = state.chancellor
+            return _step("bot" if _is_bot(chancellor) else "human", "enact", chancellor)
+        if sub_phase == SubPhase.PRESIDENT_DISCARD:
+            return _step("human", "discard", president)
+        return _step("bot" if _is_bot(president) else "human", "draw", president)
+
+    if phase == Phase.ELECTION:
+        return _step("bot" if _is_bot(president) else "human", "nominate", president)
+
+    return None
+
+
+def apply_action(game_id, action, body=None):
+    """Ejecuta una acción de juego en el contexto de aplicación actual.
+
+    Es el núcleo común de todas las vías de entrada: las rutas REST, el lote
+    de POST /games/<game_id>/actions, los bots en segundo plano y el canal
+    WebSocket llaman al mismo manejador, sin construir una petición interna
+    ni serializar el cuerpo a JSON. Las partidas usadas quedan anotadas en g
+    y las persiste quien posee el contexto (ver persist_request_games y
+    dispatch_action).
+
+    Args:
+        game_id (str): Identificador único de la partida.
+        action (str): Nombre de la acción (clave de ACTION_HANDLERS).
+        body (dict, optional): Cuerpo de la acción.
+
+    Returns:
+        tuple: Código de estado y cuerpo de la respuesta.
+    """
+    handler = ACTION_HANDLERS.get(action)
+    if handler is None:
+        return 400, {
+            "error": f"Unknown action: {action}",
+            "availableActions": sorted(ACTION_HANDLERS),
+        }
+
+    metrics = get_metrics()
+    timer = metrics.action_seconds.time(action) if metrics else nullcontext()
+    try:
+        with timer:
+            payload, status = handler(game_id, body or {})
+    except Exception as e:
+        import traceback
+
+        traceback.print_exc()
+        return 500, {"error": f"Failed to run action {action}: {str(e)}"}
+    return status, payload
+
+
+def dispatch_action(flask_app, game_id, action, body=None):
+    """Ejecuta una acción de juego fuera de cualquier petición.
+
+    Toma el cerrojo de la partida, ejecuta la acción con apply_action en un
+    contexto de aplicación propio y persiste las partidas usadas, como haría
+    una petición REST de la misma acción.
+
+    Args:
+        flask_app (Flask): Aplicación Flask con las rutas del juego.
+        game_id (str): Identificador único de la partida.
+        action (str): Nombre de la acción (clave de ACTION_HANDLERS).
+        body (dict, optional): Cuerpo de la acción.
+
+    Returns:
+        tuple: Código de estado y cuerpo de la respuesta.
+    """
+    with flask_app.app_context(), game_lock(game_id):
+        status, payload = apply_action(game_id, action, body)
+        loaded = g.pop("loaded_games", None) or {}
+        if status < 400:
+            observe_games(loaded)
+        conflict = persist_games(loaded, failed=status >= 400)
+    if conflict is not None:
+        return 409, {"error": "Game was modified concurrently", "gameId": conflict}
+    return status, payload
+
+
+def run_bot_step(flask_app, game_id):
+    """Ejecuta el siguiente paso de la partida si corresponde a un bot.
+
+    Args:
+        flask_app (Flask): Aplicación Flask con las rutas del juego.
+        game_id (str): Identificador único de la partida.
+
+    Returns:
+        dict: Evento con action, playerId, status y result del paso
+            ejecutado, o None si la partida espera a un humano o terminó.
+    """
+    with game_lock(game_id):
+        game = games.get(game_id)
+        if game is None:
+            return None
+
+        step = next_step(game)
+        if step is None or step["actor"] != "bot":
+            return None
+
+        status, result = dispatch_action(
+            flask_app, game_id, step["action"], step["body"]
+        )
+
+    return {
+        "action": step["action"],
+        "playerId": step["playerId"],
+        "status": status,
+        "result": result,
+    }
+
+
+def run_bot_steps(flask_app, game_id, max_steps=MAX_BOT_STEPS):
+    """Avanza la partida mientras el siguiente paso corresponda a un bot.
+
+    Se detiene al llegar a un paso humano, al terminar la partida, ante la
+    primera acción fallida o tras max_steps pasos.
+
+    Args:
+        flask_app (Flask): Aplicación Flask con las rutas del juego.
+        game_id (str): Identificador único de la partida.
+        max_steps (int): Número máximo de pasos a ejecutar.
+
+    Yields:
+        dict: Evento de cada paso ejecutado (ver run_bot_step).
+    """
+    for _ in range(max_steps):
+        event = run_bot_step(flask_app, game_id)
+        if event is None:
+            return
+        yield event
+        if event["status"] >= 400:
+            return
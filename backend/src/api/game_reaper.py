@@ -0,0 +1,342 @@
+"""Recolector de partidas inactivas para la API de SHXL.
+
+Este módulo elimina del almacén las partidas que llevan demasiado tiempo sin
+modificarse, con un tiempo de vida (TTL) configurable para cada estado de la
+partida. Las partidas terminadas pueden volcarse a disco antes de eliminarse
+para poder consultarlas más tarde. También expone métricas sobre el número de
+partidas vivas y el uso de memoria del proceso.
+
+El barrido en segundo plano es opcional: la aplicación solo lo arranca si se
+define SHXL_REAPER_INTERVAL. Las partidas en curso no se expulsan salvo que se
+configure su TTL con SHXL_TTL_IN_PROGRESS.
+"""
+
+import os
+import re
+import threading
+import time
+from typing import Dict, Optional
+
+from .game_store import deserialize_game, serialize_game
+from .storage import game_lock
+
+# Las partidas en curso no caducan por defecto: una partida lenta o en pausa
+# sigue siendo válida. Su TTL se configura con SHXL_TTL_IN_PROGRESS.
+DEFAULT_TTLS: Dict[str, Optional[float]] = {
+    "waiting_for_players": 30 * 60.0,
+    "in_progress": None,
+    "game_over": 10 * 60.0,
+}
+DEFAULT_INTERVAL = 60.0
+
+_SAFE_ID = re.compile(r"[^A-Za-z0-9_-]")
+
+
+def process_rss_bytes():
+    """Obtiene la memoria residente (RSS) actual del proceso.
+
+    Returns:
+        int: Bytes residentes, o None si no se puede determinar.
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    # ru_maxrss es el pico de memoria, en KiB en Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class GameArchive:
+    """Archivo en disco de partidas terminadas.
+
+    Attributes:
+        directory (str): Directorio donde se guardan las instantáneas.
+    """
+
+    def __init__(self, directory):
+        """Inicializa el archivo y crea el directorio si no existe.
+
+        Args:
+            directory (str): Directorio de destino.
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, game_id):
+        """Obtiene la ruta del fichero de una partida.
+
+        Args:
+            game_id: Identificador único de la partida.
+
+        Returns:
+            str: Ruta del fichero de la instantánea.
+        """
+        return os.path.join(self.directory, _SAFE_ID.sub("_", str(game_id)) + ".shxl")
+
+    def save(self, game_id, game):
+        """Vuelca una partida a disco de forma atómica.
+
+        Args:
+            game_id: Identificador único de la partida.
+            game: Instancia de la partida.
+        """
+        path = self.path(game_id)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(serialize_game(game))
+        os.replace(tmp_path, path)
+
+    def load(self, game_id):
+        """Recupera una partida volcada a disco.
+
+        Args:
+            game_id: Identificador único de la partida.
+
+        Returns:
+            Any: Instancia de la partida o None si no está archivada.
+        """
+        try:
+            with open(self.path(game_id), "rb") as f:
+                return deserialize_game(f.read())
+        except FileNotFoundError:
+            return None
+
+
+class GameReaper:
+    """Elimina periódicamente las partidas inactivas de un almacén.
+
+    La inactividad se mide desde la última escritura de la partida. Un TTL
+    None o no positivo desactiva la expulsión para ese estado.
+
+    Attributes:
+        store (GameStore): Almacén de partidas vigilado.
+        ttls (Dict[str, float]): TTL en segundos por estado de partida.
+        interval (float): Segundos entre barridos del hilo de fondo.
+        archive (GameArchive): Destino opcional de las partidas terminadas.
+    """
+
+    def __init__(self, store, ttls=None, interval=DEFAULT_INTERVAL, archive=None):
+        """Inicializa el recolector.
+
+        Args:
+            store (GameStore): Almacén de partidas a vigilar.
+            ttls (dict, optional): TTL por estado; se combinan con DEFAULT_TTLS.
+            interval (float): Segundos entre barridos.
+            archive (GameArchive, optional): Archivo para partidas terminadas.
+        """
+        self.store = store
+        self.ttls = dict(DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+        self.interval = interval
+        self.archive = archive
+
+        self.evicted = {status: 0 for status in self.ttls}
+        self.spilled = 0
+        self.last_sweep_at = None
+        self.last_sweep_seconds = 0.0
+
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _expired(self, status, updated_at, now):
+        """Indica si una partida ha superado el TTL de su estado.
+
+        Args:
+            status (str): Estado de la partida.
+            updated_at (float): Marca de tiempo de la última escritura.
+            now (float): Marca de tiempo actual.
+
+        Returns:
+            bool: True si la partida debe expulsarse.
+        """
+        ttl = self.ttls.get(status)
+        return ttl is not None and ttl > 0 and now - updated_at >= ttl
+
+    def sweep(self, now=None):
+        """Expulsa las partidas cuyo TTL ha vencido.
+
+        Args:
+            now (float, optional): Marca de tiempo de referencia.
+
+        Returns:
+            Dict[str, int]: Número de partidas expulsadas por estado.
+        """
+        started = time.perf_counter()
+        now = time.time() if now is None else now
+        evicted = {status: 0 for status in self.ttls}
+
+        with self._lock:
+            for game_id, version, status, updated_at in self.store.entries():
+                if not self._expired(status, updated_at, now):
+                    continue
+                if self._evict(game_id, version, status):
+                    evicted[status] = evicted.get(status, 0) + 1
+                    self.evicted[status] = self.evicted.get(status, 0) + 1
+
+            self.last_sweep_at = now
+            self.last_sweep_seconds = time.perf_counter() - started
+
+        return evicted
+
+    def _evict(self, game_id, version, status):
+        """Expulsa una partida bajo su cerrojo, volcándola si ha terminado.
+
+        Una partida cuyo cerrojo está ocupado la está usando una petición, así
+        que se omite en este barrido en lugar de bloquear el recolector.
+
+        Args:
+            game_id: Identificador único de la partida.
+            version (int): Versión leída al enumerar el almacén.
+            status (str): Estado de la partida.
+
+        Returns:
+            bool: True si la partida se ha eliminado del almacén.
+        """
+        lock = game_lock(game_id)
+        if not lock.acquire(blocking=False):
+            return False
+        try:
+            if status == "game_over" and self.archive is not None:
+                game = self.store.get(game_id)
+                if game is None:
+                    return False
+                self.archive.save(game_id, game)
+                self.spilled += 1
+
+            return self.store.delete(game_id, expected_version=version)
+        finally:
+            lock.release()
+
+    def _run(self):
+        """Bucle del hilo de fondo."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.sweep()
+            except Exception:
+                import traceback
+
+                traceback.print_exc()
+
+    def start(self):
+        """Arranca el hilo de barrido en segundo plano."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="shxl-game-reaper", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Detiene el hilo de barrido."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    def metrics(self):
+        """Obtiene métricas de partidas vivas, expulsiones y memoria.
+
+        Returns:
+            dict: Métricas del almacén y del recolector.
+        """
+        live = {status: 0 for status in self.ttls}
+        for _, _, status, _ in self.store.entries():
+            live[status] = live.get(status, 0) + 1
+
+        metrics = {
+            "liveGames": sum(live.values()),
+            "liveGamesByState": live,
+            "evictedGames": dict(self.evicted),
+            "spilledGames": self.spilled,
+            "ttlSeconds": dict(self.ttls),
+            "lastSweepAt": self.last_sweep_at,
+            "lastSweepSeconds": self.last_sweep_seconds,
+            "processRssBytes": process_rss_bytes(),
+        }
+
+        if hasattr(self.store, "cached_games"):
+            metrics["cachedGames"] = self.store.cached_games()
+        if hasattr(self.store, "snapshot_bytes"):
+            metrics["snapshotBytes"] = self.store.snapshot_bytes()
+
+        return metrics
+
+
+def create_reaper_from_env(store, environ=None):
+    """Crea el recolector configurado por variables de entorno.
+
+    El barrido en segundo plano solo se activa si se define
+    SHXL_REAPER_INTERVAL; sin ella el recolector se registra para publicar
+    métricas pero no expulsa partidas.
+
+    Variables reconocidas:
+        SHXL_REAPER_INTERVAL: Segundos entre barridos (sin definir o 0
+            desactiva el hilo).
+        SHXL_TTL_WAITING: TTL de partidas esperando jugadores.
+        SHXL_TTL_IN_PROGRESS: TTL de partidas en curso (sin definir o 0 no
+            se expulsan).
+        SHXL_TTL_GAME_OVER: TTL de partidas terminadas.
+        SHXL_SPILL_DIR: Directorio donde volcar las partidas terminadas.
+
+    Args:
+        store (GameStore): Almacén de partidas a vigilar.
+        environ (dict, optional): Entorno a utilizar. Por defecto os.environ.
+
+    Returns:
+        GameReaper: Recolector configurado (sin arrancar).
+    """
+    environ = os.environ if environ is None else environ
+
+    ttls = {}
+    for status, variable in (
+        ("waiting_for_players", "SHXL_TTL_WAITING"),
+        ("in_progress", "SHXL_TTL_IN_PROGRESS"),
+        ("game_over", "SHXL_TTL_GAME_OVER"),
+    ):
+        if variable in environ:
+            ttls[status] = float(environ[variable])
+
+    spill_dir = environ.get("SHXL_SPILL_DIR")
+
+    return GameReaper(
+        store,
+        ttls=ttls,
+        interval=float(environ.get("SHXL_REAPER_INTERVAL", 0)),
+        archive=GameArchive(spill_dir) if spill_dir else None,
+    )
+
+
+_active_reaper: Optional[GameReaper] = None
+
+
+def start_reaper(reaper):
+    """Sustituye y arranca el recolector activo del proceso.
+
+    Args:
+        reaper (GameReaper): Recolector a activar. Un intervalo no positivo
+            lo registra sin arrancar el hilo de fondo.
+    """
+    global _active_reaper
+    if _active_reaper is not None and _active_reaper is not reaper:
+        _active_reaper.stop()
+    _active_reaper = reaper
+    if reaper.interval > 0:
+        reaper.start()
+
+
+def get_reaper():
+    """Obtiene el recolector activo del proceso.
+
+    Returns:
+        GameReaper: Recolector activo o None si no hay ninguno.
+    """
+    return _active_reaper
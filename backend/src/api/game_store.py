@@ -0,0 +1,663 @@
+"""Almacenes persistentes de partidas para la API de SHXL.
+
+Este módulo define la interfaz de almacenamiento de partidas y sus
+implementaciones: un almacén en memoria (comportamiento histórico de la API)
+y un almacén SQLite en modo WAL que guarda una instantánea compacta de cada
+partida tras cada mutación. El almacén SQLite mantiene además una caché LRU
+de partidas calientes en el proceso, validada por número de versión, de modo
+que varios workers de la API pueden compartir el mismo fichero de base de
+datos y las partidas sobreviven a reinicios del servidor.
+"""
+
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+DEFAULT_CACHE_SIZE = 128
+DEFAULT_SQLITE_PATH = "shxl_games.db"
+
+
+class StaleGameError(Exception):
+    """La partida fue modificada por otro proceso desde que se cargó."""
+
+
+def serialize_game(game):
+    """Serializa una partida en una instantánea binaria compacta.
+
+    Args:
+        game: Instancia de la partida.
+
+    Returns:
+        bytes: Instantánea comprimida de la partida.
+    """
+    return zlib.compress(pickle.dumps(game, protocol=pickle.HIGHEST_PROTOCOL), 1)
+
+
+def deserialize_game(snapshot):
+    """Reconstruye una partida a partir de su instantánea.
+
+    Args:
+        snapshot (bytes): Instantánea generada por serialize_game.
+
+    Returns:
+        Any: Instancia de la partida.
+    """
+    return pickle.loads(zlib.decompress(snapshot))
+
+
+def describe_game_status(game):
+    """Obtiene el estado de ciclo de vida de una partida.
+
+    Args:
+        game: Instancia de la partida.
+
+    Returns:
+        str: "game_over", "in_progress" o "waiting_for_players".
+    """
+    state = getattr(game, "state", None)
+    if getattr(state, "game_over", False):
+        return "game_over"
+    if getattr(state, "president", None) is not None:
+        return "in_progress"
+    return "waiting_for_players"
+
+
+def describe_lobby(game):
+    """Obtiene el resumen de una partida que se muestra en el listado de salas.
+
+    Args:
+        game: Instancia de la partida.
+
+    Returns:
+        dict: Configuración y ocupación de la partida.
+    """
+    players = getattr(getattr(game, "state", None), "players", None) or []
+    return {
+        "maxPlayers": getattr(game, "player_count", None),
+        "currentPlayers": len(players),
+        "withCommunists": getattr(game, "include_communists", False),
+        "withAntiPolicies": getattr(game, "with_anti_policies", False),
+        "withEmergencyPowers": getattr(game, "with_emergency_powers", False),
+        "strategy": getattr(game, "ai_strategy", None),
+    }
+
+
+def _lobby_entry(game_id, version, status, updated_at, summary):
+    """Construye una entrada del índice de salas.
+
+    Args:
+        game_id: Identificador único de la partida.
+        version (int): Versión de la partida.
+        status (str): Estado de la partida.
+        updated_at (float): Marca de tiempo de la última escritura.
+        summary (dict): Resumen generado por describe_lobby, o None.
+
+    Returns:
+        dict: Entrada del índice de salas.
+    """
+    entry = {
+        "gameId": game_id,
+        "state": status,
+        "version": version,
+        "lastActivity": updated_at,
+    }
+    entry.update(summary or {})
+    return entry
+
+
+class GameStore(ABC):
+    """Interfaz común de los almacenes de partidas.
+
+    Cada escritura incrementa la versión de la partida, lo que permite a los
+    clientes y a las cachés detectar cambios sin cargar la partida completa.
+    """
+
+    @abstractmethod
+    def get(self, game_id):
+        """Obtiene una partida por su ID.
+
+        Args:
+            game_id: Identificador único de la partida.
+
+        Returns:
+            Any: Instancia de la partida o None si no existe.
+        """
+
+    def load(self, game_id):
+        """Obtiene una partida junto con la versión sobre la que se cargó.
+
+        Args:
+            game_id: Identificador único de la partida.
+
+        Returns:
+            Tuple[Any, int]: Instancia y versión, o (None, None) si no existe.
+        """
+        current = self.version(game_id)
+        if current is None:
+            return None, None
+        return self.get(game_id), current
+
+    @abstractmethod
+    def put(self, game_id, game, expected_version=None):
+        """Guarda una partida e incrementa su versión.
+
+        Args:
+            game_id: Identificador único de la partida.
+            game: Instancia de la partida.
+            expected_version (int, optional): Versión sobre la que se aplicó la
+                mutación. Si no coincide con la almacenada se lanza
+                StaleGameError.
+
+        Returns:
+            int: Nueva versión de la partida.
+        """
+
+    @abstractmethod
+    def delete(self, game_id, expected_version=None):
+        """Elimina una partida.
+
+        Args:
+            game_id: Identificador único de la partida.
+            expected_version (int, optional): Si se indica, solo se elimina la
+                partida si su versión no ha cambiado.
+
+        Returns:
+            bool: True si la partida se eliminó.
+        """
+
+    @abstractmethod
+    def version(self, game_id):
+        """Obtiene la versión actual de una partida.
+
+        Args:
+            game_id: Identificador único de la partida.
+
+        Returns:
+            int: Versión de la partida o None si no existe.
+        """
+
+    @abstractmethod
+    def ids(self):
+        """Obtiene los IDs de todas las partidas almacenadas.
+
+        Returns:
+            List[str]: Lista de identificadores.
+        """
+
+    @abstractmethod
+    def entries(self):
+        """Obtiene los metadatos de todas las partidas sin cargarlas.
+
+        Returns:
+            List[Tuple[str, int, str, float]]: Tuplas (game_id, versión,
+                estado, marca de tiempo de la última escritura).
+        """
+
+    @abstractmethod
+    def lobby(self, status=None, offset=0, limit=None):
+        """Lista el índice de salas sin cargar las partidas.
+
+        El índice se actualiza en cada escritura de una partida, por lo que
+        refleja su creación, la unión de jugadores, su inicio y su final.
+
+        Args:
+            status (str, optional): Estado por el que filtrar.
+            offset (int): Número de entradas a saltar.
+            limit (int, optional): Número máximo de entradas a devolver.
+
+        Returns:
+            Tuple[int, List[dict]]: Total de entradas que cumplen el filtro y
+                la página pedida, de la actividad más reciente a la más
+                antigua.
+        """
+
+    @abstractmethod
+    def clear(self):
+        """Elimina todas las partidas del almacén."""
+
+    def invalidate(self, game_id):
+        """Descarta cualquier copia local de una partida.
+
+        La siguiente lectura obtendrá la última versión guardada.
+
+        Args:
+            game_id: Identificador único de la partida.
+        """
+
+    def close(self):
+        """Libera los recursos asociados al almacén."""
+
+
+class InMemoryGameStore(GameStore):
+    """Almacén de partidas en memoria del proceso.
+
+    Las partidas se pierden al reiniciar el servidor y no se comparten entre
+    workers. Es el almacén por defecto.
+    """
+
+    def __init__(self):
+        """Inicializa el almacén vacío."""
+        self._games: Dict[str, Any] = {}
+        self._versions: Dict[str, int] = {}
+        self._meta: Dict[str, Tuple[str, float]] = {}
+        self._summaries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, game_id):
+        return self._games.get(game_id)
+
+    def put(self, game_id, game, expected_version=None):
+        with self._lock:
+            current = self._versions.get(game_id, 0)
+            if expected_version is not None and expected_version != current:
+                raise StaleGameError(game_id)
+            self._games[game_id] = game
+            self._versions[game_id] = current + 1
+            self._meta[game_id] = (describe_game_status(game), time.time())
+            self._summaries[game_id] = describe_lobby(game)
+            return current + 1
+
+    def delete(self, game_id, expected_version=None):
+        with self._lock:
+            current = self._versions.get(game_id)
+            if current is None or (
+                expected_version is not None and expected_version != current
+            ):
+                return False
+            del self._games[game_id]
+            del self._versions[game_id]
+            self._meta.pop(game_id, None)
+            self._summaries.pop(game_id, None)
+            return True
+
+    def version(self, game_id):
+        return self._versions.get(game_id)
+
+    def ids(self):
+        return list(self._games)
+
+    def entries(self):
+        with self._lock:
+            return [
+                (game_id, version) + self._meta[game_id]
+                for game_id, version in self._versions.items()
+            ]
+
+    def lobby(self, status=None, offset=0, limit=None):
+        with self._lock:
+            entries = [
+                _lobby_entry(
+                    game_id,
+                    self._versions[game_id],
+                    meta[0],
+                    meta[1],
+                    self._summaries.get(game_id),
+                )
+                for game_id, meta in self._meta.items()
+                if status is None or meta[0] == status
+            ]
+        entries.sort(key=lambda entry: entry["lastActivity"], reverse=True)
+        end = None if limit is None else offset + limit
+        return len(entries), entries[offset:end]
+
+    def clear(self):
+        with self._lock:
+            self._games.clear()
+            self._versions.clear()
+            self._meta.clear()
+            self._summaries.clear()
+
+
+class SQLiteGameStore(GameStore):
+    """Almacén de partidas respaldado por SQLite en modo WAL.
+
+    Cada escritura guarda una instantánea comprimida de la partida junto con
+    su versión. Las lecturas consultan primero la versión en la base de datos
+    (búsqueda por clave primaria) y solo deserializan la instantánea si la
+    copia en la caché LRU local está desactualizada.
+
+    Attributes:
+        path (str): Ruta del fichero de base de datos.
+        cache_size (int): Número máximo de partidas calientes en memoria.
+    """
+
+    def __init__(self, path=DEFAULT_SQLITE_PATH, cache_size=DEFAULT_CACHE_SIZE):
+        """Abre (o crea) la base de datos de partidas.
+
+        Args:
+            path (str): Ruta del fichero de base de datos.
+            cache_size (int): Tamaño de la caché LRU de partidas calientes.
+        """
+        self.path = path
+        self.cache_size = max(0, int(cache_size))
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._cache: "OrderedDict[str, Tuple[int, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS games (
+                game_id TEXT PRIMARY KEY,
+                version INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                snapshot BLOB NOT NULL,
+                summary TEXT
+            )
+            """)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(games)")}
+        if "summary" not in columns:
+            conn.execute("ALTER TABLE games ADD COLUMN summary TEXT")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS games_status_activity "
+            "ON games (status, updated_at)"
+        )
+
+    def _connection(self):
+        """Obtiene la conexión SQLite del hilo actual.
+
+        Returns:
+            sqlite3.Connection: Conexión en modo autocommit.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=30.0, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _remember(self, game_id, version, game):
+        """Inserta una partida en la caché LRU.
+
+        Args:
+            game_id: Identificador único de la partida.
+            version (int): Versión de la partida.
+            game: Instancia de la partida.
+        """
+        if self.cache_size == 0:
+            return
+        with self._lock:
+            self._cache[game_id] = (version, game)
+            self._cache.move_to_end(game_id)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _cached(self, game_id):
+        """Obtiene la entrada de caché de una partida.
+
+        Args:
+            game_id: Identificador único de la partida.
+
+        Returns:
+            Tuple[int, Any]: Versión e instancia, o None si no está en caché.
+        """
+        with self._lock:
+            entry = self._cache.get(game_id)
+            if entry is not None:
+                self._cache.move_to_end(game_id)
+            return entry
+
+    def _forget(self, game_id):
+        """Descarta una partida de la caché LRU.
+
+        Args:
+            game_id: Identificador único de la partida.
+        """
+        with self._lock:
+            self._cache.pop(game_id, None)
+
+    def get(self, game_id):
+        return self.load(game_id)[0]
+
+    def load(self, game_id):
+        current = self.version(game_id)
+        if current is None:
+            self._forget(game_id)
+            return None, None
+
+        entry = self._cached(game_id)
+        if entry is not None and entry[0] == current:
+            return entry[1], current
+
+        row = (
+            self._connection()
+            .execute(
+                "SELECT version, snapshot FROM games WHERE game_id = ?", (game_id,)
+            )
+            .fetchone()
+        )
+        if row is None:
+            self._forget(game_id)
+            return None, None
+
+        game = deserialize_game(row[1])
+        self._remember(game_id, row[0], game)
+        return game, row[0]
+
+    def put(self, game_id, game, expected_version=None):
+        snapshot = serialize_game(game)
+        status = describe_game_status(game)
+        summary = json.dumps(describe_lobby(game))
+        conn = self._connection()
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT version FROM games WHERE game_id = ?", (game_id,)
+            ).fetchone()
+            current = row[0] if row else 0
+            if expected_version is not None and expected_version != current:
+                raise StaleGameError(game_id)
+
+            new_version = current + 1
+            conn.execute(
+                """
+                INSERT INTO games
+                    (game_id, version, status, updated_at, snapshot, summary)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(game_id) DO UPDATE SET
+                    version = excluded.version,
+                    status = excluded.status,
+                    updated_at = excluded.updated_at,
+                    snapshot = excluded.snapshot,
+                    summary = excluded.summary
+                """,
+                (game_id, new_version, status, time.time(), snapshot, summary),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            self._forget(game_id)
+            raise
+
+        self._remember(game_id, new_version, game)
+        return new_version
+
+    def invalidate(self, game_id):
+        self._forget(game_id)
+
+    def delete(self, game_id, expected_version=None):
+        if expected_version is None:
+            cursor = self._connection().execute(
+                "DELETE FROM games WHERE game_id = ?", (game_id,)
+            )
+        else:
+            cursor = self._connection().execute(
+                "DELETE FROM games WHERE game_id = ? AND version = ?",
+                (game_id, expected_version),
+            )
+        if cursor.rowcount:
+            self._forget(game_id)
+        return cursor.rowcount > 0
+
+    def version(self, game_id):
+        row = (
+            self._connection()
+            .execute("SELECT version FROM games WHERE game_id = ?", (game_id,))
+            .fetchone()
+        )
+        return row[0] if row else None
+
+    def ids(self):
+        rows = self._connection().execute("SELECT game_id FROM games").fetchall()
+        return [row[0] for row in rows]
+
+    def entries(self):
+        return (
+            self._connection()
+            .execute("SELECT game_id, version, status, updated_at FROM games")
+            .fetchall()
+        )
+
+    def lobby(self, status=None, offset=0, limit=None):
+        where, params = ("WHERE status = ?", [status]) if status else ("", [])
+        conn = self._connection()
+        total = conn.execute(f"SELECT COUNT(*) FROM games {where}", params).fetchone()[
+            0
+        ]
+        rows = conn.execute(
+            f"""
+            SELECT game_id, version, status, updated_at, summary FROM games {where}
+            ORDER BY updated_at DESC LIMIT ? OFFSET ?
+            """,
+            params + [-1 if limit is None else limit, offset],
+        ).fetchall()
+        return total, [
+            _lobby_entry(
+                game_id,
+                version,
+                row_status,
+                updated_at,
+                json.loads(summary) if summary else None,
+            )
+            for game_id, version, row_status, updated_at, summary in rows
+        ]
+
+    def snapshot_bytes(self):
+        """Obtiene el tamaño total de las instantáneas almacenadas.
+
+        Returns:
+            int: Bytes ocupados por las instantáneas comprimidas.
+        """
+        row = (
+            self._connection()
+            .execute("SELECT COALESCE(SUM(LENGTH(snapshot)), 0) FROM games")
+            .fetchone()
+        )
+        return row[0]
+
+    def cached_games(self):
+        """Obtiene el número de partidas en la caché LRU del proceso.
+
+        Returns:
+            int: Partidas calientes cargadas en memoria.
+        """
+        with self._lock:
+            return len(self._cache)
+
+    def clear(self):
+        self._connection().execute("DELETE FROM games")
+        with self._lock:
+            self._cache.clear()
+
+    def close(self):
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections = []
+            self._cache.clear()
+        self._local = threading.local()
+
+
+def create_store_from_env(environ=None):
+    """Crea el almacén de partidas configurado por variables de entorno.
+
+    Variables reconocidas:
+        SHXL_GAME_STORE: "memory" (por defecto) o "sqlite".
+        SHXL_SQLITE_PATH: Ruta de la base de datos SQLite.
+        SHXL_GAME_CACHE_SIZE: Tamaño de la caché LRU de partidas calientes.
+        SHXL_JOURNAL_DIR: Directorio del diario de instantáneas. Si se
+            indica, el almacén se envuelve en un JournaledGameStore que
+            recupera las partidas del diario al arrancar.
+        SHXL_JOURNAL_SYNC_INTERVAL: Segundos entre volcados a disco del diario.
+        SHXL_JOURNAL_COMPACT_EVERY: Entradas tras las que se compacta una
+            partida.
+        SHXL_JOURNAL_MAX_BYTES: Tamaño del diario de una partida a partir del
+            cual se compacta.
+
+    Args:
+        environ (dict, optional): Entorno a utilizar. Por defecto os.environ.
+
+    Returns:
+        GameStore: Almacén configurado.
+
+    Raises:
+        ValueError: Si el tipo de almacén no es válido.
+    """
+    environ = os.environ if environ is None else environ
+    kind = environ.get("SHXL_GAME_STORE", "memory").lower()
+
+    if kind == "memory":
+        store = InMemoryGameStore()
+    elif kind == "sqlite":
+        store = SQLiteGameStore(
+            path=environ.get("SHXL_SQLITE_PATH", DEFAULT_SQLITE_PATH),
+            cache_size=int(environ.get("SHXL_GAME_CACHE_SIZE", DEFAULT_CACHE_SIZE)),
+        )
+    else:
+        raise ValueError(f"Unknown game store: {kind}")
+
+    journal_dir = environ.get("SHXL_JOURNAL_DIR")
+    if not journal_dir:
+        return store
+
+    from .snapshot_journal import (
+        DEFAULT_COMPACT_EVERY,
+        DEFAULT_MAX_BYTES,
+        DEFAULT_SYNC_INTERVAL,
+        JournaledGameStore,
+        SnapshotJournal,
+    )
+
+    journal = SnapshotJournal(
+        journal_dir,
+        sync_interval=float(
+            environ.get("SHXL_JOURNAL_SYNC_INTERVAL", DEFAULT_SYNC_INTERVAL)
+        ),
+        compact_every=int(
+            environ.get("SHXL_JOURNAL_COMPACT_EVERY", DEFAULT_COMPACT_EVERY)
+        ),
+        max_bytes=int(environ.get("SHXL_JOURNAL_MAX_BYTES", DEFAULT_MAX_BYTES)),
+    )
+    return JournaledGameStore(store, journal)
+
+
+def iter_games(store):
+    """Itera sobre todas las partidas de un almacén.
+
+    Args:
+        store (GameStore): Almacén de partidas.
+
+    Yields:
+        Tuple[str, Any]: Pares (game_id, partida).
+    """
+    for game_id in store.ids():
+        game = store.get(game_id)
+        if game is not None:
+            yield game_id, game
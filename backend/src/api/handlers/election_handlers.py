@@ -0,0 +1,349 @@
+"""Manejadores de la fase de elección.
+
+Este módulo contiene la lógica de la nominación de canciller y de la votación.
+Los manejadores reciben el cuerpo de la acción ya decodificado y devuelven el
+cuerpo y el código de estado de la respuesta, de modo que los usan igual las
+rutas REST, las acciones en lote y el canal WebSocket (ver game_actions).
+"""
+
+from src.game.phases.election_utils import (
+    check_marked_for_execution,
+    nominate_chancellor_safe,
+    resolve_election,
+    run_full_election_cycle,
+)
+from src.game.phases.phase_machine import Phase
+
+from ..storage import games
+from ..utils.game_state_helpers import (
+    _get_current_phase_name,
+    _get_game_state_status,
+    _to_json_safe,
+)
+from .responses import (
+    bot_summary,
+    game_not_in_progress,
+    nomination_payload,
+    player_summary,
+    wrong_phase,
+)
+
+
+def nominate_chancellor_handler(game_id, data=None):
+    """Nomina canciller, o juega la elección completa si todos son bots.
+
+    Args:
+        game_id: Identificador único de la partida.
+        data: Cuerpo de la acción. Debe contener 'nomineeId' si el presidente
+            es humano.
+
+    Returns:
+        tuple: Cuerpo de la respuesta y código de estado HTTP. Incluye la
+            nominación y los votantes elegibles, o el resultado de la elección
+            automática.
+    """
+    if not data:
+        data = {}
+
+    game = games.get(game_id)
+    if not game:
+        return {"error": "Game not found"}, 404
+
+    if not hasattr(game.state, "president") or game.state.president is None:
+        return {"error": "No president assigned"}, 403
+
+    current_phase = _get_current_phase_name(game)
+    if current_phase != Phase.ELECTION:
+        return wrong_phase("Not in nomination phase", current_phase, "election")
+
+    current_president = game.state.president
+
+    try:
+        execution_result = check_marked_for_execution(game)
+        if execution_result["executed"]:
+            response_data = {
+                "message": f"Player {execution_result['player'].id} was executed before nomination",
+                "executionResult": {
+                    "executed": True,
+                    "playerId": execution_result["player"].id,
+                    "playerName": getattr(
+                        execution_result["player"],
+                        "name",
+                        f'Player {execution_result["player"].id}',
+                    ),
+                },
+            }
+
+            if execution_result["game_over"]:
+                response_data["gameOver"] = {
+                    "winner": execution_result["winner"],
+                    "reason": "Hitler was executed",
+                }
+                response_data["newPhase"] = "game_over"
+                return response_data, 200
+
+        all_players_are_bots = all(
+            getattr(p, "player_type", "human") == "ai"
+            for p in game.state.players
+            if getattr(p, "is_alive", True)
+        )
+
+        if all_players_are_bots:
+            full_result = run_full_election_cycle(game)
+
+            return (
+                {
+                    "message": "Full election completed automatically (all bots)",
+                    "fullElectionResult": _to_json_safe(full_result),
+                    "newPhase": full_result.get("next_phase", "election"),
+                    "gameOver": full_result.get("game_over", False),
+                    "winner": (
+                        full_result.get("winner")
+                        if full_result.get("game_over")
+                        else None
+                    ),
+                },
+                200,
+            )
+
+        if getattr(current_president, "player_type", "human") == "human":
+            nominee_id = data.get("nomineeId")
+            if nominee_id is None:
+                return {"error": "Missing nomineeId for human president"}, 400
+
+            nominee = None
+            for player in game.state.players:
+                if player.id == nominee_id:
+                    nominee = player
+                    break
+
+            if not nominee:
+                return {"error": "Nominee not found"}, 404
+
+            if hasattr(game.state, "get_eligible_chancellors"):
+                eligible_chancellors = game.state.get_eligible_chancellors()
+                if nominee not in eligible_chancellors:
+                    return (
+                        {"error": "Nominee is not eligible for chancellor"},
+                        403,
+                    )
+
+            game.state.chancellor_candidate = nominee
+            game.state.set_phase(Phase.VOTING)
+
+            return (
+                {
+                    "message": "Chancellor nominated by human president",
+                    **nomination_payload(
+                        game,
+                        player_summary(current_president, isHuman=True),
+                        nominee,
+                    ),
+                },
+                200,
+            )
+
+        else:
+            nomination_result = nominate_chancellor_safe(game)
+
+            if nomination_result["game_over"]:
+                return (
+                    {
+                        "message": "Game ended during nomination",
+                        "gameOver": True,
+                        "winner": nomination_result["winner"],
+                        "newPhase": "game_over",
+                    },
+                    200,
+                )
+
+            if nomination_result["chaos_triggered"]:
+                return (
+                    {
+                        "message": "No eligible chancellors - chaos policy enacted",
+                        "chaosTriggered": True,
+                        "newPhase": "election",
+                    },
+                    200,
+                )
+
+            if nomination_result["nominee"]:
+                game.state.set_phase(Phase.VOTING)
+
+                return (
+                    {
+                        "message": "Bot president nominated chancellor - ready for human voting",
+                        **nomination_payload(
+                            game,
+                            bot_summary(current_president),
+                            nomination_result["nominee"],
+                        ),
+                    },
+                    200,
+                )
+            else:
+                return {"error": "Bot nomination failed unexpectedly"}, 500
+
+    except Exception as e:
+        import traceback
+
+        traceback.print_exc()
+        return {"error": f"Failed to nominate chancellor: {str(e)}"}, 500
+
+
+def cast_vote_handler(game_id, data=None):
+    """Registra el voto de un jugador y resuelve la elección si es el último.
+
+    Args:
+        game_id: Identificador único de la partida.
+        data: Cuerpo de la acción. Debe contener 'playerId' y, para humanos,
+            'vote' ('ja' o 'nein').
+
+    Returns:
+        tuple: Cuerpo de la respuesta y código de estado HTTP. Incluye el voto
+            registrado y, si todos votaron, el resultado de la elección.
+    """
+    if not data:
+        data = {}
+
+    vote = data.get("vote", "").lower()
+    player_id = data.get("playerId")
+
+    if player_id is None:
+        return {"error": "Missing playerId"}, 400
+
+    game = games.get(game_id)
+    if not game:
+        return {"error": "Game not found"}, 404
+
+    current_game_state = _get_game_state_status(game)
+    current_phase = _get_current_phase_name(game)
+
+    if current_game_state != "in_progress":
+        return game_not_in_progress(
+            current_game_state,
+            current_phase,
+            debug={
+                "hasGameState": hasattr(game.state, "game_state"),
+                "gameStateValue": getattr(game.state, "game_state", "not_set"),
+                "hasPresident": hasattr(game.state, "president")
+                and game.state.president is not None,
+            },
+        )
+
+    if (
+        not hasattr(game.state, "chancellor_candidate")
+        or not game.state.chancellor_candidate
+    ):
+        return (
+            {
+                "error": "No nomination to vote on",
+                "currentPhase": current_phase,
+                "hasChancellorCandidate": hasattr(game.state, "chancellor_candidate"),
+                "chancellorCandidateValue": getattr(
+                    game.state, "chancellor_candidate", None
+                ),
+            },
+            403,
+        )
+
+    if current_phase != Phase.VOTING:
+        return wrong_phase("Not in voting phase", current_phase, "voting")
+
+    voting_player = None
+    for player in game.state.players:
+        if player.id == player_id:
+            voting_player = player
+            break
+
+    if not voting_player:
+        available_players = [
+            {"id": p.id, "name": getattr(p, "name", f"Player {p.id}")}
+            for p in game.state.players
+        ]
+        return (
+            {
+                "error": "Player not found",
+                "requestedPlayerId": player_id,
+                "availablePlayers": available_players,
+            },
+            404,
+        )
+
+    try:
+        if not hasattr(game.state, "api_votes"):
+            game.state.api_votes = {}
+
+        if player_id in game.state.api_votes:
+            return (
+                {
+                    "error": "Player has already voted",
+                    "playerId": player_id,
+                    "previousVote": (
+                        "ja" if game.state.api_votes[player_id] else "nein"
+                    ),
+                },
+                409,
+            )
+
+        if getattr(voting_player, "player_type", "human") == "ai":
+            ai_vote = voting_player.vote()
+            game.state.api_votes[player_id] = ai_vote
+            vote_display = "ja" if ai_vote else "nein"
+            message = f"AI {getattr(voting_player, 'name', f'Bot_{player_id}')} voted '{vote_display}'"
+        else:
+            if vote not in ["ja", "nein"]:
+                return {"error": "Vote must be 'ja' or 'nein'"}, 400
+
+            vote_value = vote == "ja"
+            game.state.api_votes[player_id] = vote_value
+            vote_display = vote
+            message = f"Human vote '{vote}' recorded"
+
+        eligible_voter_count = len(
+            [p for p in game.state.players if getattr(p, "is_alive", True)]
+        )
+        all_voted = len(game.state.api_votes) >= eligible_voter_count
+
+        response_data = {
+            "message": message,
+            "votingComplete": all_voted,
+            "playerVote": {
+                "playerId": player_id,
+                "playerName": getattr(voting_player, "name", f"Player {player_id}"),
+                "vote": vote_display,
+                "isAI": getattr(voting_player, "player_type", "human") == "ai",
+            },
+            "currentVoteCount": len(game.state.api_votes),
+            "totalVotersNeeded": eligible_voter_count,
+        }
+
+        if all_voted:
+            election_result = resolve_election(game, game.state.api_votes)
+
+            response_data["electionResult"] = {
+                "passed": election_result["passed"],
+                "jaVotes": election_result["ja_votes"],
+                "neinVotes": election_result["nein_votes"],
+                "totalVotes": election_result["total_votes"],
+            }
+
+            response_data["newPhase"] = election_result["next_phase"]
+
+            if election_result["game_over"]:
+                response_data["gameOver"] = {
+                    "winner": election_result["winner"],
+                    "reason": "Game ended",
+                }
+
+            game.state.api_votes = {}
+        else:
+            response_data["newPhase"] = "voting"
+
+        return response_data, 200
+
+    except Exception as e:
+        import traceback
+
+        traceback.print_exc()
+        return {"error": f"Failed to cast vote: {str(e)}"}, 500
@@ -6,25 +6,53 @@ Actúa como capa intermedia entre las rutas de la API y el modelo de datos
 del juego.
 """
 
-import uuid
+import os
 
-from flask import jsonify
 from src.game.game import SHXLGame
+from src.game.phases.phase_machine import Phase
 from src.players.player_factory import PlayerFactory
 
-from ..storage import games
-from ..utils.game_state_helpers import (
-    _get_board_info,
-    _get_current_phase_info,
-    _get_current_timestamp,
-    _get_game_config_info,
-    _get_game_state_status,
-    _get_government_info,
-    _get_last_action_info,
-    _get_nomination_info,
-    _get_players_info,
-    _get_trackers_info,
-)
+from ..metrics import get_metrics
+from ..storage import games, new_game_id
+from ..utils.state_serializer import serialize_game_state
+
+
+def bot_time_budget_from_env(environ=None):
+    """Presupuesto de tiempo por defecto de los bots de la API.
+
+    Variables de entorno:
+        SHXL_BOT_TIME_BUDGET: Segundos por decisión de cada bot. Sin ella,
+            las decisiones no se limitan.
+
+    Args:
+        environ (dict, optional): Entorno a leer. Por defecto os.environ.
+
+    Returns:
+        float: Segundos por decisión, o None para no limitar.
+    """
+    if environ is None:
+        environ = os.environ
+    value = environ.get("SHXL_BOT_TIME_BUDGET")
+    return float(value) if value else None
+
+
+def _parse_bot_time_budget(data, default=None):
+    """Lee el campo botTimeBudget de una petición.
+
+    Args:
+        data (dict): Cuerpo de la petición.
+        default (float, optional): Presupuesto si la petición no lo indica.
+
+    Returns:
+        tuple: Presupuesto en segundos (o None) y mensaje de error, que es
+            None si el valor es válido.
+    """
+    value = data.get("botTimeBudget", default)
+    if value is None:
+        return None, None
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+        return None, "botTimeBudget must be a positive number of seconds"
+    return float(value), None
 
 
 def create_new_game_handler(data):
@@ -33,12 +61,14 @@ def create_new_game_handler(data):
     Args:
         data: Diccionario con la configuración de la partida.
             Contiene parámetros opcionales como playerCount,
-            withCommunists, withAntiPolicies, withEmergencyPowers
-            y strategy.
+            withCommunists, withAntiPolicies, withEmergencyPowers,
+            strategy y botTimeBudget (segundos por decisión de cada bot;
+            por defecto, SHXL_BOT_TIME_BUDGET).
 
     Returns:
-        dict: Diccionario con el ID de la partida creada y
-            el estado inicial del juego.
+        tuple: Tupla con el cuerpo de la respuesta y el código de estado
+            HTTP (201). Incluye el ID de la partida creada y su estado
+            inicial.
     """
     if not data:
         data = {}
@@ -48,8 +78,11 @@ def create_new_game_handler(data):
     with_anti_policies = data.get("withAntiPolicies", False)
     with_emergency_powers = data.get("withEmergencyPowers", False)
     strategy = data.get("strategy", "role")
+    bot_time_budget, error = _parse_bot_time_budget(data, bot_time_budget_from_env())
+    if error:
+        return {"error": error}, 400
 
-    game_id = str(uuid.uuid4())[:8]
+    game_id = new_game_id()
     game = SHXLGame()
 
     game.player_count = player_count
@@ -57,6 +90,7 @@ def create_new_game_handler(data):
     game.with_anti_policies = with_anti_policies
     game.with_emergency_powers = with_emergency_powers
     game.ai_strategy = strategy
+    game.bot_time_budget = bot_time_budget
 
     game.state.player_factory = PlayerFactory()
     game.state.players = []
@@ -64,14 +98,13 @@ def create_new_game_handler(data):
     games[game_id] = game
 
     return (
-        jsonify(
-            {
-                "gameID": game_id,
-                "maxPlayers": player_count,
-                "state": "waiting_for_players",
-                "currentPlayers": 0,
-            }
-        ),
+        {
+            "gameID": game_id,
+            "maxPlayers": player_count,
+            "state": "waiting_for_players",
+            "currentPlayers": 0,
+            "botTimeBudget": bot_time_budget,
+        },
         201,
     )
 
@@ -85,26 +118,26 @@ def join_game_handler(game_id, data):
             Debe contener 'playerName'.
 
     Returns:
-        tuple: Tupla con respuesta JSON y código de estado HTTP.
+        tuple: Tupla con el cuerpo de la respuesta y el código de estado HTTP.
             En caso de éxito, incluye playerId, currentPlayers
             y maxPlayers.
     """
     if not data:
-        return jsonify({"error": "Missing request body"}), 400
+        return {"error": "Missing request body"}, 400
 
     player_name = data.get("playerName")
     if not player_name:
-        return jsonify({"error": "Missing playerName"}), 400
+        return {"error": "Missing playerName"}, 400
 
     game = games.get(game_id)
     if not game:
-        return jsonify({"error": "Game not found"}), 404
+        return {"error": "Game not found"}, 404
 
     if game.state.president is not None:
-        return jsonify({"error": "Game already in progress"}), 403
+        return {"error": "Game already in progress"}, 403
 
     if len(game.state.players) >= game.player_count:
-        return jsonify({"error": "Game is full"}), 403
+        return {"error": "Game is full"}, 403
 
     new_id = len(game.state.players)
     player = game.state.player_factory.create_player(
@@ -118,13 +151,11 @@ def join_game_handler(game_id, data):
     game.state.players.append(player)
 
     return (
-        jsonify(
-            {
-                "playerId": player.id,
-                "currentPlayers": len(game.state.players),
-                "maxPlayers": game.player_count,
-            }
-        ),
+        {
+            "playerId": player.id,
+            "currentPlayers": len(game.state.players),
+            "maxPlayers": game.player_count,
+        },
         200,
     )
 
@@ -138,32 +169,32 @@ def start_game_handler(game_id, data):
             Debe contener 'hostPlayerID'.
 
     Returns:
-        tuple: Tupla con respuesta JSON y código de estado HTTP.
+        tuple: Tupla con el cuerpo de la respuesta y el código de estado HTTP.
             En caso de éxito, incluye el estado completo del juego.
     """
     if not data:
-        return jsonify({"error": "Missing request body"}), 400
+        return {"error": "Missing request body"}, 400
 
     host_player_id = data.get("hostPlayerID")
     if host_player_id is None:
-        return jsonify({"error": "Missing hostPlayerID"}), 400
+        return {"error": "Missing hostPlayerID"}, 400
 
     game = games.get(game_id)
     if not game:
-        return jsonify({"error": "Game not found"}), 404
+        return {"error": "Game not found"}, 404
 
     if host_player_id != 0:
-        return jsonify({"error": "Only the host can start the game"}), 403
+        return {"error": "Only the host can start the game"}, 403
 
     if len(game.state.players) == 0:
-        return jsonify({"error": "No players in the game"}), 403
+        return {"error": "No players in the game"}, 403
 
     if hasattr(game.state, "game_state") and game.state.game_state == "in_progress":
-        return jsonify({"error": "Game already in progress"}), 403
+        return {"error": "Game already in progress"}, 403
 
     min_players = 5
     if len(game.state.players) < min_players:
-        return jsonify({"error": f"Need at least {min_players} players to start"}), 403
+        return {"error": f"Need at least {min_players} players to start"}, 403
 
     try:
         human_players_info = []
@@ -182,6 +213,8 @@ def start_game_handler(game_id, data):
             with_anti_policies=game.with_anti_policies,
             with_emergency_powers=game.with_emergency_powers,
             ai_strategy=game.ai_strategy,
+            bot_time_budget=getattr(game, "bot_time_budget", None),
+            role_beliefs=True,
         )
 
         for i, player_info in enumerate(human_players_info):
@@ -193,35 +226,35 @@ def start_game_handler(game_id, data):
 
         initial_president = game.state.president
         if not initial_president:
-            return jsonify({"error": "Failed to assign initial president"}), 500
+            return {"error": "Failed to assign initial president"}, 500
+
+        game.state.set_phase(Phase.ELECTION)
 
         return (
-            jsonify(
-                {
-                    "message": "Game started successfully",
-                    "gameState": "in_progress",
-                    "currentPlayers": len(game.state.players),
-                    "roles_assigned": True,
-                    "deck_ready": True,
-                    "playersPreserved": True,
-                    "initialPresident": {
-                        "id": initial_president.id,
-                        "name": getattr(
-                            initial_president, "name", f"Player {initial_president.id}"
-                        ),
-                        "isHuman": getattr(initial_president, "player_type", "human")
-                        == "human",
-                    },
-                    "playerTypes": [
-                        {
-                            "id": p.id,
-                            "name": getattr(p, "name", f"Player {p.id}"),
-                            "isHuman": getattr(p, "player_type", "human") == "human",
-                        }
-                        for p in game.state.players
-                    ],
-                }
-            ),
+            {
+                "message": "Game started successfully",
+                "gameState": "in_progress",
+                "currentPlayers": len(game.state.players),
+                "roles_assigned": True,
+                "deck_ready": True,
+                "playersPreserved": True,
+                "initialPresident": {
+                    "id": initial_president.id,
+                    "name": getattr(
+                        initial_president, "name", f"Player {initial_president.id}"
+                    ),
+                    "isHuman": getattr(initial_president, "player_type", "human")
+                    == "human",
+                },
+                "playerTypes": [
+                    {
+                        "id": p.id,
+                        "name": getattr(p, "name", f"Player {p.id}"),
+                        "isHuman": getattr(p, "player_type", "human") == "human",
+                    }
+                    for p in game.state.players
+                ],
+            },
             200,
         )
 
@@ -229,7 +262,7 @@ def start_game_handler(game_id, data):
         import traceback
 
         traceback.print_exc()
-        return jsonify({"error": f"Failed to start game: {str(e)}"}), 500
+        return {"error": f"Failed to start game: {str(e)}"}, 500
 
 
 def add_bots_handler(game_id, data):
@@ -238,10 +271,11 @@ def add_bots_handler(game_id, data):
     Args:
         game_id: Identificador único de la partida.
         data: Diccionario con la configuración de los bots.
-            Puede contener count, strategy y namePrefix.
+            Puede contener count, strategy, namePrefix y botTimeBudget
+            (segundos por decisión de los bots de la partida).
 
     Returns:
-        tuple: Tupla con respuesta JSON y código de estado HTTP.
+        tuple: Tupla con el cuerpo de la respuesta y el código de estado HTTP.
             En caso de éxito, incluye información de los bots añadidos.
     """
     if not data:
@@ -252,18 +286,24 @@ def add_bots_handler(game_id, data):
     name_prefix = data.get("namePrefix", "Bot")
 
     if bot_count < 1 or bot_count > 10:
-        return jsonify({"error": "Bot count must be between 1 and 10"}), 400
+        return {"error": "Bot count must be between 1 and 10"}, 400
 
     game = games.get(game_id)
     if not game:
-        return jsonify({"error": "Game not found"}), 404
+        return {"error": "Game not found"}, 404
+
+    bot_time_budget, error = _parse_bot_time_budget(
+        data, getattr(game, "bot_time_budget", None)
+    )
+    if error:
+        return {"error": error}, 400
 
     if game.state.president is not None:
-        return jsonify({"error": "Game already in progress"}), 403
+        return {"error": "Game already in progress"}, 403
 
     available_spots = game.player_count - len(game.state.players)
     if bot_count > available_spots:
-        return jsonify({"error": f"Only {available_spots} spots available"}), 403
+        return {"error": f"Only {available_spots} spots available"}, 403
 
     added_bots = []
     for _ in range(bot_count):
@@ -278,21 +318,23 @@ def add_bots_handler(game_id, data):
             strategy_type=strategy,
             player_type="ai",
         )
+        bot.time_budget = bot_time_budget
         game.state.players.append(bot)
 
         added_bots.append(
             {"playerId": bot.id, "playerName": bot_name, "strategy": strategy}
         )
 
+    game.bot_time_budget = bot_time_budget
+
     return (
-        jsonify(
-            {
-                "message": f"Added {bot_count} bots successfully",
-                "addedBots": added_bots,
-                "currentPlayers": len(game.state.players),
-                "maxPlayers": game.player_count,
-            }
-        ),
+        {
+            "message": f"Added {bot_count} bots successfully",
+            "addedBots": added_bots,
+            "currentPlayers": len(game.state.players),
+            "maxPlayers": game.player_count,
+            "botTimeBudget": bot_time_budget,
+        },
         200,
     )
 
@@ -306,29 +348,18 @@ def get_game_state_handler(game_id, requesting_player_id=None):
             Utilizado para filtrar información privada.
 
     Returns:
-        tuple: Tupla con respuesta JSON y código de estado HTTP.
+        tuple: Tupla con el cuerpo de la respuesta y el código de estado HTTP.
             En caso de éxito, incluye el estado completo del juego.
     """
     game = games.get(game_id)
     if not game:
-        return jsonify({"error": "Game not found"}), 404
+        return {"error": "Game not found"}, 404
 
     try:
-        game_state = {
-            "gameState": _get_game_state_status(game),
-            "currentPhase": _get_current_phase_info(game),
-            "players": _get_players_info(game, requesting_player_id),
-            "government": _get_government_info(game),
-            "nomination": _get_nomination_info(game),
-            "trackers": _get_trackers_info(game),
-            "board": _get_board_info(game),
-            "lastAction": _get_last_action_info(game),
-            "gameConfig": _get_game_config_info(game),
-            "gameId": game_id,
-            "timestamp": _get_current_timestamp(),
-        }
-
-        return jsonify(game_state), 200
+        with get_metrics().serialization_seconds.time():
+            game_state = serialize_game_state(game, game_id, requesting_player_id)
+
+        return game_state, 200
 
     except Exception as e:
-        return jsonify({"error": f"Failed to get game state: {str(e)}"}), 500
+        return {"error": f"Failed to get game state: {str(e)}"}, 500
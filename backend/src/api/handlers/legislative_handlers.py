@@ -0,0 +1,663 @@
+"""Manejadores de la fase legislativa.
+
+Este módulo contiene la lógica del robo y descarte del presidente, la
+promulgación del canciller y los poderes ejecutivos. Los manejadores devuelven
+el cuerpo y el código de estado de la respuesta (ver election_handlers).
+"""
+
+from src.game.phases.legislative_utils import (
+    check_veto_proposal,
+    draw_presidential_policies,
+    execute_presidential_power,
+    handle_chancellor_choice,
+    handle_presidential_choice,
+    handle_veto_decision,
+)
+from src.game.phases.phase_machine import Phase, SubPhase
+
+from ..storage import games
+from ..utils.game_state_helpers import _get_current_phase_name, _get_game_state_status
+from .responses import (
+    bot_summary,
+    game_not_in_progress,
+    player_summary,
+    power_game_over_payload,
+    session_end_payload,
+    wrong_phase,
+)
+
+
+def draw_policies_handler(game_id, data=None):
+    """Roba las políticas del presidente, o juega la sesión si es un bot.
+
+    Args:
+        game_id: Identificador único de la partida.
+        data: Cuerpo de la acción (no se utiliza).
+
+    Returns:
+        tuple: Cuerpo de la respuesta y código de estado HTTP. Incluye las
+            políticas robadas o el resultado de la sesión legislativa del bot.
+    """
+    game = games.get(game_id)
+    if not game:
+        return {"error": "Game not found"}, 404
+
+    current_game_state = _get_game_state_status(game)
+    current_phase = _get_current_phase_name(game)
+
+    if current_game_state != "in_progress":
+        return game_not_in_progress(current_game_state, current_phase)
+
+    if current_phase != Phase.LEGISLATIVE:
+        return wrong_phase("Not in legislative phase", current_phase, "legislative")
+
+    if not hasattr(game.state, "president") or not game.state.president:
+        return {"error": "No president assigned"}, 403
+
+    if not hasattr(game.state, "chancellor") or not game.state.chancellor:
+        return {"error": "No chancellor assigned"}, 403
+
+    current_sub_phase = getattr(game.state, "sub_phase", None)
+    if current_sub_phase != SubPhase.DRAW_POLICIES:
+        return (
+            {
+                "error": "President has already drawn policies",
+                "currentSubPhase": current_sub_phase,
+            },
+            403,
+        )
+
+    try:
+        draw_result = draw_presidential_policies(game)
+
+        game.state.presidential_policies = draw_result["policies"]
+        game.state.set_sub_phase(SubPhase.PRESIDENT_DISCARD)
+
+        president = game.state.president
+        president_is_human = getattr(president, "player_type", "human") == "human"
+
+        if president_is_human:
+            return (
+                {
+                    "message": "President drew 3 policies - awaiting discard choice",
+                    "drawResult": {
+                        "policyNames": draw_result["policy_names"],
+                        "deckRemaining": draw_result["deck_remaining"],
+                        "mustChoose": 2,
+                        "mustDiscard": 1,
+                    },
+                    "president": player_summary(
+                        president, isHuman=True, mustDiscard=True
+                    ),
+                    "gamePhase": "president_discard",
+                    "newPhase": "legislative",
+                    "subPhase": "president_discard",
+                    "requiresHumanInput": True,
+                    "availableActions": ["discard_policy"],
+                },
+                200,
+            )
+
+        else:
+            chosen, _ = game.presidential_policy_choice(draw_result["policies"])
+
+            policy_indices = []
+            for i, policy in enumerate(draw_result["policies"]):
+                if policy in chosen:
+                    policy_indices.append(i)
+
+            choice_result = handle_presidential_choice(game, policy_indices)
+
+            if not choice_result["success"]:
+                return (
+                    {
+                        "error": "Failed to process bot president choice",
+                        "details": choice_result,
+                    },
+                    500,
+                )
+
+            return (
+                {
+                    "message": "Bot president automatically drew and discarded policy",
+                    "drawResult": {
+                        "policyNames": draw_result["policy_names"],
+                        "deckRemaining": draw_result["deck_remaining"],
+                    },
+                    "presidentialChoice": {
+                        "chosenPolicies": choice_result["chosen_names"],
+                        "discardedPolicy": choice_result["discarded_name"],
+                        "automatic": True,
+                    },
+                    "president": bot_summary(president),
+                    "chancellor": player_summary(game.state.chancellor, mustEnact=True),
+                    "gamePhase": "chancellor_enact",
+                    "newPhase": "legislative",
+                    "subPhase": "chancellor_enact",
+                    "availableActions": (
+                        ["enact_policy"]
+                        if getattr(game.state.chancellor, "player_type", "human")
+                        == "human"
+                        else []
+                    ),
+                },
+                200,
+            )
+
+    except Exception as e:
+        import traceback
+
+        traceback.print_exc()
+        return {"error": f"Failed to draw policies: {str(e)}"}, 500
+
+
+def discard_policy_handler(game_id, data=None):
+    """Descarta una de las políticas robadas por el presidente humano.
+
+    Args:
+        game_id: Identificador único de la partida.
+        data: Cuerpo de la acción. Debe contener 'discardIndex'.
+
+    Returns:
+        tuple: Cuerpo de la respuesta y código de estado HTTP. Incluye las
+            políticas que pasan al canciller.
+    """
+    if not data:
+        data = {}
+
+    discard_index = data.get("discardIndex")
+
+    if discard_index is None:
+        return {"error": "Missing discardIndex (0, 1, or 2)"}, 400
+
+    if discard_index not in [0, 1, 2]:
+        return {"error": "discardIndex must be 0, 1, or 2"}, 400
+
+    game = games.get(game_id)
+    if not game:
+        return {"error": "Game not found"}, 404
+
+    if getattr(game.state, "sub_phase", None) != SubPhase.PRESIDENT_DISCARD:
+        return (
+            {
+                "error": "No presidential policies available to discard",
+                "suggestion": "Call /president/draw first",
+            },
+            403,
+        )
+
+    if len(game.state.presidential_policies) != 3:
+        return (
+            {
+                "error": "President must have exactly 3 policies to discard",
+                "currentPolicies": len(game.state.presidential_policies),
+            },
+            403,
+        )
+
+    try:
+        keep_indices = [i for i in range(3) if i != discard_index]
+
+        choice_result = handle_presidential_choice(game, keep_indices)
+
+        if not choice_result["success"]:
+            return (
+                {
+                    "error": "Failed to process presidential choice",
+                    "details": choice_result,
+                },
+                500,
+            )
+
+        return (
+            {
+                "message": "President discarded policy successfully",
+                "presidentialChoice": {
+                    "chosenPolicies": choice_result["chosen_names"],
+                    "discardedPolicy": choice_result["discarded_name"],
+                    "discardIndex": discard_index,
+                },
+                "chancellor": player_summary(
+                    game.state.chancellor,
+                    mustEnact=True,
+                    isHuman=getattr(game.state.chancellor, "player_type", "human")
+                    == "human",
+                ),
+                "gamePhase": "chancellor_enact",
+                "newPhase": "legislative",
+                "subPhase": "chancellor_enact",
+                "availableActions": (
+                    ["enact_policy"]
+                    if getattr(game.state.chancellor, "player_type", "human") == "human"
+                    else []
+                ),
+            },
+            200,
+        )
+
+    except Exception as e:
+        import traceback
+
+        traceback.print_exc()
+        return {"error": f"Failed to discard policy: {str(e)}"}, 500
+
+
+def _bot_veto_payload(game):
+    """Juega el veto de un gobierno de bots, si el canciller lo propone.
+
+    Un veto aceptado cuenta como un gobierno fallido (ver
+    handle_veto_decision), igual que en una partida jugada con SHXLGame.
+
+    Args:
+        game: Instancia de la partida.
+
+    Returns:
+        dict: Cuerpo de la respuesta si el presidente aceptó el veto, o None
+            si el canciller debe promulgar.
+    """
+    president = game.state.president
+    chancellor = game.state.chancellor
+    if getattr(president, "player_type", "human") == "human":
+        return None
+
+    if not check_veto_proposal(game)["chancellor_proposes"]:
+        return None
+
+    veto_result = handle_veto_decision(game, game.president_veto_accepted())
+    if not veto_result["veto_accepted"]:
+        return None
+
+    response_data = {
+        "message": "Bot government vetoed the agenda",
+        "veto": {
+            "chancellor": bot_summary(chancellor, f"Bot_{chancellor.id}"),
+            "president": bot_summary(president, f"Bot_{president.id}"),
+            "electionTracker": game.state.election_tracker,
+            "chaosEnacted": veto_result["chaos_triggered"],
+        },
+        "gameOver": veto_result["game_over"],
+        "winner": veto_result["winner"],
+        "newPhase": veto_result["next_phase"],
+    }
+    if veto_result["game_over"]:
+        response_data["gameOverReason"] = "Policy victory"
+    else:
+        response_data["subPhase"] = "nomination"
+        response_data["nextPresident"] = player_summary(game.state.president)
+    return response_data
+
+
+def enact_policy_handler(game_id, data=None):
+    """Promulga la política elegida por el canciller.
+
+    Si el presidente y el canciller son bots y hay veto disponible, el
+    gobierno puede vetar la agenda en lugar de promulgar.
+
+    Args:
+        game_id: Identificador único de la partida.
+        data: Cuerpo de la acción. Debe contener 'enactIndex' si el canciller
+            es humano.
+
+    Returns:
+        tuple: Cuerpo de la respuesta y código de estado HTTP. Incluye la
+            política promulgada y el poder ejecutivo o el fin de partida
+            resultante.
+    """
+    if not data:
+        data = {}
+
+    enact_index = data.get("enactIndex")
+
+    game = games.get(game_id)
+    if not game:
+        return {"error": "Game not found"}, 404
+
+    current_game_state = _get_game_state_status(game)
+    current_phase = _get_current_phase_name(game)
+
+    if current_game_state != "in_progress":
+        return game_not_in_progress(current_game_state, current_phase)
+
+    if current_phase != Phase.LEGISLATIVE:
+        return wrong_phase("Not in legislative phase", current_phase, "legislative")
+
+    if not hasattr(game.state, "chancellor") or not game.state.chancellor:
+        return {"error": "No chancellor assigned"}, 403
+
+    if (
+        getattr(game.state, "sub_phase", None) != SubPhase.CHANCELLOR_ENACT
+        or len(game.state.chancellor_policies) != 2
+    ):
+        return (
+            {
+                "error": "Chancellor must have exactly 2 policies available",
+                "suggestion": "President must draw and discard first",
+                "currentPolicies": len(
+                    getattr(game.state, "chancellor_policies", None) or []
+                ),
+            },
+            403,
+        )
+
+    try:
+        chancellor = game.state.chancellor
+        chancellor_is_human = getattr(chancellor, "player_type", "human") == "human"
+
+        if chancellor_is_human:
+            if enact_index is None:
+                return (
+                    {"error": "Missing enactIndex (0 or 1) for human chancellor"},
+                    400,
+                )
+
+            if enact_index not in [0, 1]:
+                return {"error": "enactIndex must be 0 or 1"}, 400
+
+            choice_result = handle_chancellor_choice(game, enact_index)
+
+            if not choice_result["success"]:
+                return (
+                    {
+                        "error": "Failed to process chancellor choice",
+                        "details": choice_result,
+                    },
+                    500,
+                )
+
+            response_data = {
+                "message": "Policy enacted successfully by human chancellor",
+                "chancellorChoice": {
+                    "enactedPolicy": choice_result["enacted_name"],
+                    "discardedPolicy": choice_result["discarded_name"],
+                    "enactIndex": enact_index,
+                    "isHuman": True,
+                },
+                "policyResult": {
+                    "enacted": choice_result["enacted_name"],
+                    "powerGranted": choice_result["power_granted"],
+                },
+                "chancellor": player_summary(chancellor, isHuman=True),
+                "gameOver": choice_result["game_over"],
+                "winner": (
+                    choice_result["winner"] if choice_result["game_over"] else None
+                ),
+            }
+
+        else:
+            veto_payload = _bot_veto_payload(game)
+            if veto_payload is not None:
+                return veto_payload, 200
+
+            enacted, _ = game.chancellor_policy_choice(game.state.chancellor_policies)
+            auto_enact_index = 0 if game.state.chancellor_policies[0] == enacted else 1
+
+            choice_result = handle_chancellor_choice(game, auto_enact_index)
+
+            if not choice_result["success"]:
+                return (
+                    {
+                        "error": "Failed to process bot chancellor choice",
+                        "details": choice_result,
+                    },
+                    500,
+                )
+
+            response_data = {
+                "message": "Bot chancellor automatically enacted policy",
+                "chancellorChoice": {
+                    "enactedPolicy": choice_result["enacted_name"],
+                    "discardedPolicy": choice_result["discarded_name"],
+                    "enactIndex": auto_enact_index,
+                    "automatic": True,
+                },
+                "policyResult": {
+                    "enacted": choice_result["enacted_name"],
+                    "powerGranted": choice_result["power_granted"],
+                },
+                "chancellor": bot_summary(chancellor, f"Bot_{chancellor.id}"),
+                "gameOver": choice_result["game_over"],
+                "winner": (
+                    choice_result["winner"] if choice_result["game_over"] else None
+                ),
+            }
+
+        if choice_result["game_over"]:
+            response_data["newPhase"] = "game_over"
+            response_data["gameOverReason"] = "Policy victory"
+            return response_data, 200
+
+        if choice_result["power_granted"]:
+            power_type = choice_result["power_granted"]
+            president = game.state.president
+            president_is_human = getattr(president, "player_type", "human") == "human"
+
+            if president_is_human:
+                response_data["newPhase"] = "executive_power"
+                response_data["executivePower"] = {
+                    "powerType": power_type,
+                    "president": player_summary(
+                        president, isHuman=True, mustExecutePower=True
+                    ),
+                    "requiresHumanInput": True,
+                    "instruction": f"President must execute {power_type} power",
+                }
+                response_data["availableActions"] = ["execute_power"]
+
+                game.state.pending_power_type = power_type
+                game.state.set_phase(Phase.EXECUTIVE_POWER)
+
+                return response_data, 200
+
+            else:
+                power_result = execute_presidential_power(
+                    game=game, power_type=power_type, target_player_id=None
+                )
+
+                if power_result.get("success", False):
+                    response_data["powerExecution"] = {
+                        "powerType": power_type,
+                        "executedBy": bot_summary(president, f"Bot_{president.id}"),
+                        "automatic": True,
+                        "result": power_result,
+                    }
+
+                    if power_result.get("game_over", False):
+                        response_data.update(power_game_over_payload(power_result))
+                        return response_data, 200
+
+                    response_data.update(session_end_payload(game))
+
+                else:
+                    response_data["powerExecutionError"] = power_result
+                    response_data["newPhase"] = "executive_power"
+                    response_data["executivePower"] = {
+                        "powerType": power_type,
+                        "president": bot_summary(
+                            president,
+                            f"Bot_{president.id}",
+                            error="Automatic execution failed - requires manual intervention",
+                        ),
+                    }
+                    game.state.pending_power_type = power_type
+                    game.state.set_phase(Phase.EXECUTIVE_POWER)
+
+        else:
+            response_data.update(session_end_payload(game))
+
+            if hasattr(game.state, "president") and game.state.president:
+                response_data["nextPresident"] = player_summary(game.state.president)
+
+        return response_data, 200
+
+    except Exception as e:
+        import traceback
+
+        traceback.print_exc()
+        return {"error": f"Failed to enact policy: {str(e)}"}, 500
+
+
+def execute_power_handler(game_id, data=None):
+    """Ejecuta el poder pendiente del presidente humano.
+
+    Args:
+        game_id: Identificador único de la partida.
+        data: Cuerpo de la acción. Debe contener 'powerType' y, si el poder lo
+            requiere, 'targetPlayerId'.
+
+    Returns:
+        tuple: Cuerpo de la respuesta y código de estado HTTP. Incluye el
+            resultado del poder y el fin de la sesión legislativa.
+    """
+    if not data:
+        data = {}
+
+    power_type = data.get("powerType")
+    target_player_id = data.get("targetPlayerId")
+
+    game = games.get(game_id)
+    if not game:
+        return {"error": "Game not found"}, 404
+
+    current_phase = _get_current_phase_name(game)
+    if current_phase != Phase.EXECUTIVE_POWER:
+        return wrong_phase("Not in executive power phase", current_phase)
+
+    if not hasattr(game.state, "president") or not game.state.president:
+        return {"error": "No president assigned"}, 403
+
+    president = game.state.president
+    president_is_human = getattr(president, "player_type", "human") == "human"
+
+    if not president_is_human:
+        return {"error": "Only human presidents can use this endpoint"}, 403
+
+    if not power_type:
+        return {"error": "Missing powerType"}, 400
+
+    expected_power = getattr(game.state, "pending_power_type", None)
+    if expected_power and power_type != expected_power:
+        return (
+            {
+                "error": "Power type mismatch",
+                "expected": expected_power,
+                "provided": power_type,
+            },
+            400,
+        )
+
+    if power_type not in [
+        "execution",
+        "investigation",
+        "special_election",
+        "policy_peek",
+    ]:
+        return {"error": f"Invalid powerType: {power_type}"}, 400
+
+    if (
+        power_type in ["execution", "investigation", "special_election"]
+        and target_player_id is None
+    ):
+        return {"error": f"Power {power_type} requires targetPlayerId"}, 400
+
+    try:
+        power_result = execute_presidential_power(
+            game=game, power_type=power_type, target_player_id=target_player_id
+        )
+
+        if power_result.get("success", False):
+            response_data = {
+                "message": f"Presidential power {power_type} executed successfully",
+                "powerExecution": {
+                    "powerType": power_type,
+                    "executedBy": player_summary(president, isHuman=True),
+                    "result": power_result,
+                },
+            }
+
+            if power_result.get("game_over", False):
+                response_data.update(power_game_over_payload(power_result))
+
+                if hasattr(game.state, "pending_power_type"):
+                    delattr(game.state, "pending_power_type")
+
+                return response_data, 200
+
+            response_data.update(session_end_payload(game))
+
+            if hasattr(game.state, "pending_power_type"):
+                delattr(game.state, "pending_power_type")
+
+            return response_data, 200
+
+        else:
+            return (
+                {
+                    "error": "Failed to execute presidential power",
+                    "details": power_result,
+                },
+                500,
+            )
+
+    except Exception as e:
+        import traceback
+
+        traceback.print_exc()
+        return {"error": f"Failed to execute power: {str(e)}"}, 500
+
+
+def executive_options_handler(game_id):
+    """Obtiene las opciones del poder presidencial pendiente.
+
+    Args:
+        game_id: Identificador único de la partida.
+
+    Returns:
+        tuple: Cuerpo de la respuesta y código de estado HTTP. Incluye el tipo
+            de poder y los objetivos disponibles.
+    """
+    game = games.get(game_id)
+    if not game:
+        return {"error": "Game not found"}, 404
+
+    current_phase = _get_current_phase_name(game)
+    if current_phase != Phase.EXECUTIVE_POWER:
+        return wrong_phase("Not in executive power phase", current_phase)
+
+    power_type = getattr(game.state, "pending_power_type", None)
+    if not power_type:
+        return {"error": "No pending power found"}, 404
+
+    president = game.state.president
+    available_targets = []
+
+    if power_type in ["execution", "investigation", "special_election"]:
+        available_targets = [
+            {
+                "id": p.id,
+                "name": getattr(p, "name", f"Player {p.id}"),
+                "isAlive": not getattr(p, "is_dead", False),
+            }
+            for p in game.state.players
+            if not getattr(p, "is_dead", False) and p != president
+        ]
+
+    elif power_type == "policy_peek":
+        available_targets = []
+
+    return (
+        {
+            "powerType": power_type,
+            "requiresTarget": power_type != "policy_peek",
+            "availableTargets": available_targets,
+            "president": player_summary(
+                president,
+                isHuman=getattr(president, "player_type", "human") == "human",
+            ),
+            "instruction": (
+                f"Choose target for {power_type} power"
+                if power_type != "policy_peek"
+                else "Execute policy peek power"
+            ),
+        },
+        200,
+    )
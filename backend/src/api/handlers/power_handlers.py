@@ -0,0 +1,82 @@
+"""Manejadores de poderes ejecutivos.
+
+Este módulo contiene la lógica de la ejecución de poderes presidenciales
+indicando el jugador que los usa (ver legislative_handlers).
+"""
+
+from src.game.phases.legislative_utils import execute_presidential_power
+from src.game.phases.phase_machine import Phase
+
+from ..storage import games
+from ..utils.game_state_helpers import _get_current_phase_name
+from .responses import (
+    player_summary,
+    power_game_over_payload,
+    session_end_payload,
+    wrong_phase,
+)
+
+
+def president_execute_power_handler(game_id, data=None):
+    """Ejecuta un poder presidencial en nombre del presidente indicado.
+
+    Args:
+        game_id: Identificador único de la partida.
+        data: Cuerpo de la acción. Debe contener 'powerType', 'playerId' y, si
+            el poder lo requiere, 'targetId'.
+
+    Returns:
+        tuple: Cuerpo de la respuesta y código de estado HTTP. Incluye el
+            resultado del poder.
+    """
+    if not data:
+        data = {}
+
+    power_type = data.get("powerType")
+    player_id = data.get("playerId")
+    target_id = data.get("targetId")
+
+    game = games.get(game_id)
+    if not game:
+        return {"error": "Game not found"}, 404
+
+    current_phase = _get_current_phase_name(game)
+    if current_phase != Phase.EXECUTIVE_POWER:
+        return wrong_phase("Not in executive power phase", current_phase)
+
+    if not game.state.president or game.state.president.id != player_id:
+        return {"error": "Only the president can execute powers"}, 403
+
+    try:
+        power_result = execute_presidential_power(
+            game=game, power_type=power_type, target_player_id=target_id
+        )
+
+        if not power_result.get("success", True):
+            return (
+                {
+                    "error": "Failed to execute power",
+                    "details": power_result.get("error"),
+                },
+                400,
+            )
+
+        response_data = {
+            "message": f"President executed power: {power_type}",
+            "powerResult": power_result,
+            "president": player_summary(game.state.president),
+        }
+
+        if power_result.get("game_over", False):
+            response_data.update(power_game_over_payload(power_result))
+            return response_data, 200
+
+        response_data.update(session_end_payload(game))
+
+        return response_data, 200
+
+    except Exception as e:
+        import traceback
+
+        traceback.print_exc()
+        return {"error": f"Failed to execute power: {str(e)}"}, 500
@@ -0,0 +1,150 @@
+"""Constructores de las respuestas comunes de los manejadores.
+
+Los manejadores de elección, legislativos y de poderes describen a los
+jugadores, los errores de fase y el paso a la siguiente fase con las mismas
+estructuras; este módulo las construye en un único sitio.
+"""
+
+from src.game.phases.legislative_utils import end_legislative_session
+
+from ..utils.game_state_helpers import _get_eligible_voters
+
+
+def player_summary(player, default_name=None, **fields):
+    """Resume un jugador para una respuesta.
+
+    Args:
+        player: Jugador a resumir.
+        default_name (str, optional): Nombre si el jugador no tiene uno. Por
+            defecto "Player <id>".
+        **fields: Campos adicionales del resumen.
+
+    Returns:
+        dict: Identificador, nombre y campos adicionales del jugador.
+    """
+    if default_name is None:
+        default_name = f"Player {player.id}"
+    return {"id": player.id, "name": getattr(player, "name", default_name), **fields}
+
+
+def bot_summary(player, default_name=None, **fields):
+    """Resume un bot para una respuesta, con su estrategia.
+
+    Args:
+        player: Bot a resumir.
+        default_name (str, optional): Nombre si el bot no tiene uno. Por
+            defecto "Bot <id>".
+        **fields: Campos adicionales del resumen.
+
+    Returns:
+        dict: Resumen del jugador marcado como bot.
+    """
+    if default_name is None:
+        default_name = f"Bot {player.id}"
+    return player_summary(
+        player,
+        default_name,
+        isBot=True,
+        strategy=getattr(player, "strategy_type", "unknown"),
+        **fields,
+    )
+
+
+def game_not_in_progress(game_state, phase, **fields):
+    """Respuesta de una acción sobre una partida que no está en curso.
+
+    Args:
+        game_state (str): Estado de la partida.
+        phase: Fase actual.
+        **fields: Campos adicionales de la respuesta.
+
+    Returns:
+        tuple: Cuerpo de la respuesta y código de estado HTTP (403).
+    """
+    return (
+        {
+            "error": "Game not in progress",
+            "currentGameState": game_state,
+            "currentPhase": phase,
+            **fields,
+        },
+        403,
+    )
+
+
+def wrong_phase(error, phase, expected_phase=None):
+    """Respuesta de una acción fuera de su fase.
+
+    Args:
+        error (str): Mensaje de error.
+        phase: Fase actual.
+        expected_phase (str, optional): Fase en la que se admite la acción.
+
+    Returns:
+        tuple: Cuerpo de la respuesta y código de estado HTTP (403).
+    """
+    response_data = {"error": error, "currentPhase": phase}
+    if expected_phase is not None:
+        response_data["expectedPhase"] = expected_phase
+    return response_data, 403
+
+
+def nomination_payload(game, president, nominee):
+    """Describe una nominación que pasa a votación.
+
+    Args:
+        game: Instancia de la partida.
+        president (dict): Resumen del presidente.
+        nominee: Candidato a canciller.
+
+    Returns:
+        dict: Nominación, nueva fase y votantes elegibles.
+    """
+    return {
+        "nomination": {
+            "president": president,
+            "chancellorCandidate": player_summary(nominee),
+        },
+        "newPhase": "voting",
+        "eligibleVoters": _get_eligible_voters(game),
+    }
+
+
+def session_end_payload(game):
+    """Termina la sesión legislativa y describe la siguiente elección.
+
+    Args:
+        game: Instancia de la partida.
+
+    Returns:
+        dict: Resultado del fin de sesión y nueva fase y subfase.
+    """
+    return {
+        "sessionEnd": end_legislative_session(game),
+        "newPhase": "election",
+        "subPhase": "nomination",
+    }
+
+
+def power_game_over_payload(power_result):
+    """Describe el fin de partida provocado por un poder ejecutivo.
+
+    Args:
+        power_result (dict): Resultado de execute_presidential_power.
+
+    Returns:
+        dict: Ganador, motivo y jugador ejecutado, si lo hay.
+    """
+    payload = {
+        "gameOver": True,
+        "newPhase": "game_over",
+        "winner": power_result.get("winner"),
+        "gameOverReason": (
+            "Hitler executed"
+            if power_result.get("hitler_executed")
+            else "Power execution ended game"
+        ),
+    }
+    if power_result.get("target_player"):
+        payload["executedPlayer"] = power_result["target_player"]
+    return payload
@@ -0,0 +1,452 @@
+"""Métricas de la API en formato de texto de Prometheus.
+
+Este módulo mide la latencia y el número de peticiones de cada ruta, el
+tiempo que el motor tarda en ejecutar cada acción de juego y el tiempo de
+serialización de cada estado enviado a los clientes. Además expone el número
+de partidas vivas por estado y por fase y su número de bots.
+
+Las métricas se acumulan en memoria por aplicación y se publican en
+GET /metrics. Las rutas se etiquetan con su plantilla (por ejemplo
+/games/<game_id>/vote) para que el número de series no crezca con el de
+partidas.
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+
+from flask import current_app, g, request
+
+from .game_store import describe_game_status
+from .storage import MUTATING_METHODS
+from .utils.game_state_helpers import _get_current_phase_name
+
+EXTENSION_KEY = "shxl_metrics"
+REQUEST_START_KEY = "shxl.request_start"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+UNMATCHED_ROUTE = "<unmatched>"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+ENGINE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+
+def _format_labels(names, values, extra=None):
+    """Formatea las etiquetas de una serie.
+
+    Args:
+        names (tuple): Nombres de las etiquetas.
+        values (tuple): Valores de las etiquetas.
+        extra (tuple, optional): Etiqueta adicional (nombre, valor).
+
+    Returns:
+        str: Etiquetas entre llaves, o cadena vacía si no hay ninguna.
+    """
+    pairs = list(zip(names, values))
+    if extra is not None:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    escaped = (
+        (name, str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n"))
+        for name, value in pairs
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+def _format_value(value):
+    """Formatea un valor numérico de una serie.
+
+    Args:
+        value (float): Valor de la serie.
+
+    Returns:
+        str: Representación en texto de Prometheus.
+    """
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class Counter:
+    """Contador monótono con etiquetas.
+
+    Attributes:
+        name (str): Nombre de la métrica.
+        help (str): Descripción de la métrica.
+        labels (tuple): Nombres de las etiquetas.
+    """
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *values, amount=1):
+        """Incrementa la serie de las etiquetas indicadas.
+
+        Args:
+            *values: Valores de las etiquetas.
+            amount (float): Incremento.
+        """
+        with self._lock:
+            self._values[values] = self._values.get(values, 0) + amount
+
+    def value(self, *values):
+        """Obtiene el valor de una serie.
+
+        Args:
+            *values: Valores de las etiquetas.
+
+        Returns:
+            float: Valor acumulado, 0 si la serie no existe.
+        """
+        with self._lock:
+            return self._values.get(values, 0)
+
+    def render(self):
+        """Representa el contador en formato de texto de Prometheus.
+
+        Returns:
+            list: Líneas de la métrica.
+        """
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for key, value in values:
+            labels = _format_labels(self.labels, key)
+            lines.append(f"{self.name}{labels} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """Histograma de cubetas fijas con etiquetas.
+
+    Attributes:
+        name (str): Nombre de la métrica.
+        help (str): Descripción de la métrica.
+        labels (tuple): Nombres de las etiquetas.
+        buckets (tuple): Límites superiores de las cubetas, en orden.
+    """
+
+    def __init__(self, name, help, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *values):
+        """Registra una observación.
+
+        Args:
+            value (float): Valor observado.
+            *values: Valores de las etiquetas.
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(values)
+            if series is None:
+                series = self._series[values] = [[0] * len(self.buckets), 0.0, 0]
+            if index < len(self.buckets):
+                series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, *values):
+        """Obtiene el número de observaciones de una serie.
+
+        Args:
+            *values: Valores de las etiquetas.
+
+        Returns:
+            int: Observaciones registradas, 0 si la serie no existe.
+        """
+        with self._lock:
+            series = self._series.get(values)
+            return series[2] if series is not None else 0
+
+    @contextmanager
+    def time(self, *values):
+        """Mide la duración de un bloque y la registra al salir.
+
+        Args:
+            *values: Valores de las etiquetas.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *values)
+
+    def render(self):
+        """Representa el histograma en formato de texto de Prometheus.
+
+        Returns:
+            list: Líneas de la métrica.
+        """
+        with self._lock:
+            series = sorted(
+                (key, (list(counts), total, count))
+                for key, (counts, total, count) in self._series.items()
+            )
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for key, (counts, total, count) in series:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labels, key, ("le", _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labels, key, ("le", "+Inf"))
+            lines.append(f"{self.name}_bucket{labels} {count}")
+            labels = _format_labels(self.labels, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+def _render_gauge(name, help, label, values):
+    """Representa un gauge con una etiqueta en formato de texto de Prometheus.
+
+    Args:
+        name (str): Nombre de la métrica.
+        help (str): Descripción de la métrica.
+        label (str): Nombre de la etiqueta.
+        values (dict): Valor de cada etiqueta.
+
+    Returns:
+        list: Líneas de la métrica.
+    """
+    lines = [f"# HELP {name} {help}", f"# TYPE {name} gauge"]
+    for key, value in sorted(values.items(), key=lambda item: str(item[0])):
+        lines.append(f"{name}{_format_labels((label,), (key,))} {value}")
+    return lines
+
+
+class ApiMetrics:
+    """Métricas acumuladas de una aplicación.
+
+    Attributes:
+        requests (Counter): Peticiones por ruta, método y código de estado.
+        request_seconds (Histogram): Latencia de las peticiones por ruta y
+            método, incluida la espera del cerrojo y la persistencia.
+        action_seconds (Histogram): Tiempo de la ruta de cada acción de juego,
+            sin la espera del cerrojo ni la persistencia.
+        serialization_seconds (Histogram): Tiempo de serialización de cada
+            estado de partida enviado a un cliente.
+    """
+
+    def __init__(self):
+        """Inicializa las métricas vacías."""
+        self.requests = Counter(
+            "shxl_http_requests_total",
+            "HTTP requests by route, method and status.",
+            ("route", "method", "status"),
+        )
+        self.request_seconds = Histogram(
+            "shxl_http_request_duration_seconds",
+            "HTTP request latency by route and method.",
+            ("route", "method"),
+        )
+        self.action_seconds = Histogram(
+            "shxl_game_action_duration_seconds",
+            "Time spent running each game action in the engine.",
+            ("action",),
+            buckets=ENGINE_BUCKETS,
+        )
+        self.serialization_seconds = Histogram(
+            "shxl_state_serialization_duration_seconds",
+            "Time spent serializing a game state for a client.",
+            buckets=ENGINE_BUCKETS,
+        )
+        self._games = {}
+        self._lock = threading.Lock()
+
+    def observe_request(self, route, method, status, seconds):
+        """Registra una petición terminada.
+
+        Args:
+            route (str): Plantilla de la ruta.
+            method (str): Método HTTP.
+            status (int): Código de estado de la respuesta.
+            seconds (float): Duración de la petición.
+        """
+        self.requests.inc(route, method, str(status))
+        self.request_seconds.observe(seconds, route, method)
+
+    def observe_game(self, game_id, game):
+        """Anota la fase y el número de bots de una partida.
+
+        Args:
+            game_id (str): Identificador único de la partida.
+            game: Instancia de la partida.
+        """
+        state = getattr(game, "state", None)
+        status = describe_game_status(game)
+        if status == "in_progress":
+            try:
+                phase = str(_get_current_phase_name(game))
+            except Exception:
+                phase = status
+        else:
+            phase = status
+        bots = sum(
+            1
+            for player in getattr(state, "players", [])
+            if getattr(player, "player_type", "human") == "ai"
+        )
+        with self._lock:
+            self._games[game_id] = (phase, bots)
+
+    def _game_gauges(self, store):
+        """Cuenta las partidas vivas por fase y por número de bots.
+
+        Solo se cuentan las partidas anotadas que siguen en el almacén; las
+        que desaparecieron se olvidan.
+
+        Args:
+            store (GameStore): Almacén de partidas.
+
+        Returns:
+            tuple: Partidas por fase y partidas por número de bots.
+        """
+        live = set(store.ids())
+        by_phase = {}
+        by_bots = {}
+        with self._lock:
+            for game_id in list(self._games):
+                if game_id not in live:
+                    del self._games[game_id]
+            for phase, bots in self._games.values():
+                by_phase[phase] = by_phase.get(phase, 0) + 1
+                by_bots[bots] = by_bots.get(bots, 0) + 1
+        return by_phase, by_bots
+
+    def render(self, store):
+        """Representa todas las métricas en formato de texto de Prometheus.
+
+        Args:
+            store (GameStore): Almacén de partidas vivas.
+
+        Returns:
+            str: Cuerpo de la respuesta de /metrics.
+        """
+        by_state = {}
+        for _, _, status, _ in store.entries():
+            by_state[status] = by_state.get(status, 0) + 1
+        by_phase, by_bots = self._game_gauges(store)
+
+        lines = []
+        lines += _render_gauge(
+            "shxl_live_games", "Live games by lifecycle state.", "state", by_state
+        )
+        lines += _render_gauge(
+            "shxl_live_games_by_phase",
+            "Live games by current phase.",
+            "phase",
+            by_phase,
+        )
+        lines += _render_gauge(
+            "shxl_live_games_by_bots", "Live games by number of bots.", "bots", by_bots
+        )
+        lines += self.requests.render()
+        lines += self.request_seconds.render()
+        lines += self.action_seconds.render()
+        lines += self.serialization_seconds.render()
+        return "\n".join(lines) + "\n"
+
+
+def get_metrics(flask_app=None):
+    """Obtiene las métricas de una aplicación.
+
+    Args:
+        flask_app (Flask, optional): Aplicación Flask. Por defecto la activa.
+
+    Returns:
+        ApiMetrics: Métricas registradas en la aplicación, o None si la
+            aplicación no las tiene.
+    """
+    flask_app = flask_app or current_app
+    return flask_app.extensions.get(EXTENSION_KEY)
+
+
+def _request_route():
+    """Obtiene la plantilla de la ruta de la petición actual.
+
+    Returns:
+        str: Plantilla de la ruta, o UNMATCHED_ROUTE si no hay ninguna.
+    """
+    rule = request.url_rule
+    return rule.rule if rule is not None else UNMATCHED_ROUTE
+
+
+def start_request_timer():
+    """Anota el inicio de la petición actual.
+
+    Se registra como primer manejador before_request, de modo que la
+    latencia incluye la espera del cerrojo de la partida.
+    """
+    request.environ.setdefault(REQUEST_START_KEY, time.perf_counter())
+
+
+def record_request_games(response):
+    """Anota la fase y los bots de las partidas que modificó la petición.
+
+    Se registra como manejador after_request tras persist_request_games para
+    ejecutarse antes que él, mientras las partidas usadas siguen anotadas.
+
+    Args:
+        response: Respuesta de Flask generada por la ruta.
+
+    Returns:
+        Response: La respuesta original.
+    """
+    metrics = get_metrics()
+    if metrics is None or request.method not in MUTATING_METHODS:
+        return response
+    if response.status_code >= 400:
+        return response
+    observe_games(g.get("loaded_games", {}))
+    return response
+
+
+def observe_games(loaded):
+    """Anota la fase y los bots de las partidas usadas en una escritura.
+
+    Args:
+        loaded (dict): Partidas anotadas, con su versión de carga, por id.
+    """
+    metrics = get_metrics()
+    if metrics is None:
+        return
+    for game_id, (game, _) in loaded.items():
+        metrics.observe_game(game_id, game)
+
+
+def record_request(response):
+    """Registra la latencia y el código de estado de la petición actual.
+
+    Se registra como primer manejador after_request para ejecutarse el
+    último, tras la persistencia de las partidas.
+
+    Args:
+        response: Respuesta de Flask.
+
+    Returns:
+        Response: La respuesta original.
+    """
+    metrics = get_metrics()
+    start = request.environ.pop(REQUEST_START_KEY, None)
+    if metrics is not None and start is not None:
+        metrics.observe_request(
+            _request_route(),
+            request.method,
+            response.status_code,
+            time.perf_counter() - start,
+        )
+    return response
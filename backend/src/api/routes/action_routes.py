@@ -0,0 +1,164 @@
+"""Rutas de acciones en lote.
+
+Este módulo define la ruta que aplica una lista ordenada de acciones de juego
+en una sola petición. Todas las acciones se ejecutan bajo el mismo cerrojo de
+la partida y se persisten juntas: si alguna falla, la partida queda como
+estaba antes del lote.
+"""
+
+from flask import Blueprint, jsonify, request
+
+from ..game_actions import ACTION_ROUTES, apply_action, next_step
+from ..game_store import StaleGameError, deserialize_game, serialize_game
+from ..storage import games
+
+action_bp = Blueprint("actions", __name__)
+
+MAX_BATCH_ACTIONS = 200
+
+
+def _parse_batch(data):
+    """Valida el cuerpo de una petición de acciones en lote.
+
+    Args:
+        data: Cuerpo JSON de la petición.
+
+    Returns:
+        tuple: Lista de acciones y mensaje de error (uno de los dos es None).
+    """
+    if not isinstance(data, dict) or not isinstance(data.get("actions"), list):
+        return None, "Request must be a JSON object with an actions list"
+
+    actions = data["actions"]
+    if not actions:
+        return None, "actions must not be empty"
+    if len(actions) > MAX_BATCH_ACTIONS:
+        return None, f"A batch accepts at most {MAX_BATCH_ACTIONS} actions"
+
+    for index, entry in enumerate(actions):
+        if not isinstance(entry, dict) or not isinstance(entry.get("action"), str):
+            return None, f"Action {index} must be a JSON object with an action"
+        if entry["action"] not in ACTION_ROUTES:
+            return None, f"Action {index} is unknown: {entry['action']}"
+
+    return actions, None
+
+
+@action_bp.route("/games/<game_id>/actions", methods=["POST"])
+def apply_actions(game_id):
+    """Aplica una lista ordenada de acciones de forma atómica.
+
+    Las acciones se ejecutan en orden sobre una copia de la partida a través
+    de las mismas rutas que la API REST. Si todas tienen éxito, la copia se
+    persiste una sola vez; ante la primera acción fallida se descarta y la
+    partida no cambia.
+
+    Args:
+        game_id (str): Identificador único de la partida.
+
+    Returns:
+        tuple: Una tupla con la respuesta JSON y el código de estado HTTP.
+            En caso de éxito (200):
+            - gameId (str): Identificador de la partida
+            - version (int): Versión de la partida tras aplicar el lote
+            - applied (int): Número de acciones aplicadas
+            - results (list): Resultado de cada acción (index, action,
+              status, result)
+            - nextStep (dict): Siguiente paso pendiente de la partida
+
+            Si una acción falla, se responde con su código de estado e
+            incluye error, failedIndex, version (sin cambios) y results
+            hasta la acción fallida.
+
+    Request JSON:
+        actions (list): Acciones a aplicar. Cada una es un objeto con
+            action (nominate, vote, draw, discard, enact o execute_power) y
+            los campos del cuerpo de la ruta correspondiente.
+        expectedVersion (int, optional): Versión de la partida sobre la que se
+            construyó el lote.
+
+    Note:
+        Respuestas de error:
+        - 400: Cuerpo inválido o acción desconocida.
+        - 404: La partida no existe.
+        - 409: La versión de la partida no coincide con expectedVersion o la
+               partida se modificó concurrentemente.
+    """
+    data = request.get_json(silent=True)
+    actions, error = _parse_batch(data)
+    if error is not None:
+        return jsonify({"error": error}), 400
+
+    game = games.get(game_id)
+    if not game:
+        return jsonify({"error": "Game not found"}), 404
+
+    version = games.version(game_id)
+    expected_version = data.get("expectedVersion")
+    if expected_version is not None and expected_version != version:
+        return (
+            jsonify(
+                {
+                    "error": "Game version mismatch",
+                    "expectedVersion": expected_version,
+                    "version": version,
+                }
+            ),
+            409,
+        )
+
+    try:
+        working = deserialize_game(serialize_game(game))
+        games.stage(game_id, working)
+
+        results = []
+        for index, entry in enumerate(actions):
+            body = {key: value for key, value in entry.items() if key != "action"}
+            status, result = apply_action(game_id, entry["action"], body)
+            results.append(
+                {
+                    "index": index,
+                    "action": entry["action"],
+                    "status": status,
+                    "result": result,
+                }
+            )
+            if status >= 400:
+                games.stage(game_id, game)
+                return (
+                    jsonify(
+                        {
+                            "error": f"Action {index} failed; batch was not applied",
+                            "failedIndex": index,
+                            "version": version,
+                            "results": results,
+                        }
+                    ),
+                    status,
+                )
+
+        step = next_step(working)
+        new_version = games.commit(game_id)
+    except StaleGameError:
+        return (
+            jsonify({"error": "Game was modified concurrently", "gameId": game_id}),
+            409,
+        )
+    except Exception as e:
+        import traceback
+
+        traceback.print_exc()
+        return jsonify({"error": f"Failed to apply actions: {str(e)}"}), 500
+
+    return (
+        jsonify(
+            {
+                "gameId": game_id,
+                "version": new_version,
+                "applied": len(results),
+                "results": results,
+                "nextStep": step,
+            }
+        ),
+        200,
+    )
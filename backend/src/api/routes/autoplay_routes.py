@@ -0,0 +1,169 @@
+"""Rutas de juego automático.
+
+Este módulo define las rutas que ponen en marcha, consultan y detienen el
+juego automático de una partida en el servidor, y la que encola los turnos de
+los bots de una partida mixta (ver autoplay).
+"""
+
+from flask import Blueprint, jsonify, request
+
+from ..autoplay import get_autoplay
+from ..game_store import describe_game_status
+from ..storage import games
+
+autoplay_bp = Blueprint("autoplay", __name__)
+
+
+@autoplay_bp.route("/games/<game_id>/autoplay", methods=["POST"])
+def start_autoplay(game_id):
+    """Pone en marcha el juego automático de una partida.
+
+    El servidor juega los pasos de los bots en segundo plano hasta el final
+    de la partida, hasta la ronda indicada o hasta que le toque a un humano.
+    El progreso se sigue con GET /games/<game_id>/autoplay o esperando
+    cambios de versión en /games/<game_id>/events.
+
+    Args:
+        game_id (str): Identificador único de la partida.
+
+    Returns:
+        tuple: Una tupla con la respuesta JSON y el código de estado HTTP.
+            En caso de éxito (202):
+            - message (str): Mensaje de confirmación
+            - autoplay (dict): Estado del trabajo de juego automático
+            - eventsUrl (str): Ruta de la consulta en espera de la partida
+
+    Request JSON:
+        untilRound (int, optional): Ronda en la que detenerse.
+        untilGameOver (bool, optional): Jugar hasta el final de la partida
+            (default: True si no se indica untilRound).
+
+    Note:
+        Respuestas de error:
+        - 400: untilRound no es un entero positivo.
+        - 404: La partida no existe.
+        - 409: La partida no está en curso o ya se está jugando sola.
+    """
+    data = request.get_json(silent=True) or {}
+    until_round = data.get("untilRound")
+    if until_round is not None and (
+        not isinstance(until_round, int)
+        or isinstance(until_round, bool)
+        or until_round < 1
+    ):
+        return jsonify({"error": "untilRound must be a positive integer"}), 400
+    until_game_over = bool(data.get("untilGameOver", until_round is None))
+
+    game = games.store.get(game_id)
+    if game is None:
+        return jsonify({"error": "Game not found"}), 404
+
+    status = describe_game_status(game)
+    if status != "in_progress":
+        return (
+            jsonify({"error": "Game is not in progress", "gameState": status}),
+            409,
+        )
+
+    job, created = get_autoplay().start(
+        game_id,
+        until_round=None if until_game_over else until_round,
+        until_game_over=until_game_over,
+    )
+    if not created:
+        return (
+            jsonify({"error": "Autoplay already running", "autoplay": job.to_dict()}),
+            409,
+        )
+
+    return (
+        jsonify(
+            {
+                "message": "Autoplay started",
+                "autoplay": job.to_dict(),
+                "eventsUrl": f"/games/{game_id}/events",
+            }
+        ),
+        202,
+    )
+
+
+@autoplay_bp.route("/games/<game_id>/bots/advance", methods=["POST"])
+def advance_bots(game_id):
+    """Encola los pasos de bot pendientes de una partida.
+
+    Los bots juegan en segundo plano hasta que le toque a un humano o termine
+    la partida. Si ya hay un trabajo activo para la partida, se reutiliza.
+
+    Args:
+        game_id (str): Identificador único de la partida.
+
+    Returns:
+        tuple: Una tupla con la respuesta JSON y el código de estado HTTP.
+            En caso de éxito (202):
+            - version (int): Versión actual de la partida
+            - eventsUrl (str): Ruta de la consulta en espera de la partida
+            - autoplay (dict): Estado del trabajo de los bots
+
+            Responde 404 si la partida no existe y 409 si no está en curso.
+    """
+    game = games.store.get(game_id)
+    if game is None:
+        return jsonify({"error": "Game not found"}), 404
+
+    status = describe_game_status(game)
+    if status != "in_progress":
+        return (
+            jsonify({"error": "Game is not in progress", "gameState": status}),
+            409,
+        )
+
+    job = get_autoplay().advance(game_id)
+    return (
+        jsonify(
+            {
+                "message": "Bot steps queued",
+                "version": games.version(game_id),
+                "eventsUrl": f"/games/{game_id}/events",
+                "autoplay": job.to_dict(),
+            }
+        ),
+        202,
+    )
+
+
+@autoplay_bp.route("/games/<game_id>/autoplay", methods=["GET"])
+def get_autoplay_status(game_id):
+    """Consulta el progreso del juego automático de una partida.
+
+    Args:
+        game_id (str): Identificador único de la partida.
+
+    Returns:
+        tuple: Una tupla con la respuesta JSON y el código de estado HTTP.
+            En caso de éxito (200) contiene el estado del trabajo: status,
+            stoppedReason, steps, lastEvent, version, gameState y
+            roundNumber. Responde 404 si la partida nunca se jugó sola.
+    """
+    job = get_autoplay().get(game_id)
+    if job is None:
+        return jsonify({"error": "No autoplay for this game"}), 404
+    return jsonify(job.to_dict()), 200
+
+
+@autoplay_bp.route("/games/<game_id>/autoplay", methods=["DELETE"])
+def stop_autoplay(game_id):
+    """Detiene el juego automático de una partida tras el paso en curso.
+
+    Args:
+        game_id (str): Identificador único de la partida.
+
+    Returns:
+        tuple: Una tupla con la respuesta JSON y el código de estado HTTP.
+            En caso de éxito (202) contiene el trabajo que se va a detener.
+            Responde 404 si la partida no se está jugando sola.
+    """
+    job = get_autoplay().cancel(game_id)
+    if job is None:
+        return jsonify({"error": "Autoplay is not running"}), 404
+    return jsonify({"message": "Autoplay stopping", "autoplay": job.to_dict()}), 202
@@ -4,28 +4,29 @@ Este módulo define las rutas de la API Flask para manejar la gestión
 del juego, incluyendo creación, unión, inicio y consulta de estado.
 """
 
-import uuid
-
 from flask import Blueprint, jsonify, request
-from src.game.game import SHXLGame
-from src.players.player_factory import PlayerFactory
 
-from ..storage import games
-from ..utils.game_state_helpers import (
-    _get_board_info,
-    _get_current_phase_info,
-    _get_current_timestamp,
-    _get_game_config_info,
-    _get_game_state_status,
-    _get_government_info,
-    _get_last_action_info,
-    _get_nomination_info,
-    _get_players_info,
-    _get_trackers_info,
+from ..handlers.game_handlers import (
+    add_bots_handler,
+    create_new_game_handler,
+    get_game_state_handler,
+    join_game_handler,
+    start_game_handler,
 )
+from ..storage import games
+from ..utils.state_serializer import json_response
 
 game_bp = Blueprint("game", __name__)
 
+DEFAULT_LOBBY_PAGE_SIZE = 20
+MAX_LOBBY_PAGE_SIZE = 100
+LOBBY_STATE_ALIASES = {
+    "waiting": "waiting_for_players",
+    "waiting_for_players": "waiting_for_players",
+    "in_progress": "in_progress",
+    "game_over": "game_over",
+}
+
 
 @game_bp.route("/newgame", methods=["POST"])
 def create_new_game():
@@ -50,37 +51,84 @@ def create_new_game():
         withEmergencyPowers (bool, optional): Incluir poderes de emergencia (default: False)
         strategy (str, optional): Estrategia de IA para jugadores bot (default: "role")
     """
-    data = request.json
-    player_count = data.get("playerCount", 10)
-    include_communists = data.get("withCommunists", False)
-    with_anti_policies = data.get("withAntiPolicies", False)
-    with_emergency_powers = data.get("withEmergencyPowers", False)
-    strategy = data.get("strategy", "role")
+    return json_response(*create_new_game_handler(request.get_json()))
+
 
-    game_id = str(uuid.uuid4())[:8]
-    game = SHXLGame()
+@game_bp.route("/games", methods=["GET"])
+def list_games():
+    """Lista las salas de juego a partir del índice del almacén.
+
+    El índice guarda un resumen de cada partida (configuración, ocupación,
+    estado y última actividad) que se actualiza en cada escritura, de modo que
+    el listado no carga ninguna partida completa.
+
+    Returns:
+        tuple: Una tupla con la respuesta JSON y el código de estado HTTP.
+            En caso de éxito (200):
+            - games (list): Salas de la página, de la actividad más reciente
+              a la más antigua (gameId, state, version, lastActivity,
+              maxPlayers, currentPlayers, withCommunists, withAntiPolicies,
+              withEmergencyPowers, strategy)
+            - total (int): Número de salas que cumplen el filtro
+            - offset (int): Posición de la primera sala de la página
+            - limit (int): Tamaño de la página
+            - nextOffset (int): Posición de la página siguiente o None
+
+    Query params:
+        state (str, optional): waiting (o waiting_for_players), in_progress
+            o game_over.
+        offset (int, optional): Salas a saltar (default: 0).
+        limit (int, optional): Tamaño de página, hasta MAX_LOBBY_PAGE_SIZE
+            (default: DEFAULT_LOBBY_PAGE_SIZE).
 
-    game.player_count = player_count
-    game.include_communists = include_communists
-    game.with_anti_policies = with_anti_policies
-    game.with_emergency_powers = with_emergency_powers
-    game.ai_strategy = strategy
+    Note:
+        Respuestas de error:
+        - 400: Estado desconocido o paginación inválida.
+    """
+    state = request.args.get("state")
+    if state is not None:
+        state = LOBBY_STATE_ALIASES.get(state)
+        if state is None:
+            return (
+                jsonify(
+                    {
+                        "error": f"Unknown state: {request.args['state']}",
+                        "availableStates": sorted(LOBBY_STATE_ALIASES),
+                    }
+                ),
+                400,
+            )
 
-    game.state.player_factory = PlayerFactory()
-    game.state.players = []
+    try:
+        offset = int(request.args.get("offset", 0))
+        limit = int(request.args.get("limit", DEFAULT_LOBBY_PAGE_SIZE))
+    except ValueError:
+        return jsonify({"error": "offset and limit must be integers"}), 400
+    if offset < 0 or not 1 <= limit <= MAX_LOBBY_PAGE_SIZE:
+        return (
+            jsonify(
+                {
+                    "error": "offset must be >= 0 and limit between 1 and "
+                    f"{MAX_LOBBY_PAGE_SIZE}"
+                }
+            ),
+            400,
+        )
 
-    games[game_id] = game
+    total, page = games.store.lobby(status=state, offset=offset, limit=limit)
+    next_offset = offset + len(page)
 
     return (
         jsonify(
             {
-                "gameID": game_id,
-                "maxPlayers": player_count,
-                "state": "waiting_for_players",
-                "currentPlayers": 0,
+                "games": page,
+                "total": total,
+                "offset": offset,
+                "limit": limit,
+                "nextOffset": next_offset if next_offset < total else None,
             }
         ),
-        201,
+        200,
     )
 
 
@@ -113,43 +161,7 @@ def join_game(game_id):
         403: Si la sala está llena o el juego ya comenzó
         404: Si la sala no existe
     """
-    data = request.get_json()
-    player_name = data.get("playerName")
-
-    if not player_name:
-        return jsonify({"error": "Missing playerName"}), 400
-
-    game = games.get(game_id)
-    if not game:
-        return jsonify({"error": "Game not found"}), 404
-
-    if game.state.president is not None:
-        return jsonify({"error": "Game already in progress"}), 403
-
-    if len(game.state.players) >= game.player_count:
-        return jsonify({"error": "Game is full"}), 403
-
-    new_id = len(game.state.players)
-    player = game.state.player_factory.create_player(
-        id=new_id,
-        name=player_name,
-        role=None,
-        state=game.state,
-        strategy_type="smart",
-        player_type="human",
-    )
-    game.state.players.append(player)
-
-    return (
-        jsonify(
-            {
-                "playerId": player.id,
-                "currentPlayers": len(game.state.players),
-                "maxPlayers": game.player_count,
-            }
-        ),
-        200,
-    )
+    return json_response(*join_game_handler(game_id, request.get_json()))
 
 
 @game_bp.route("/games/<game_id>/start", methods=["POST"])
@@ -188,96 +200,7 @@ def start_game(game_id):
         - 404: Juego con el game_id dado no existe.
         - 500: Falló al asignar presidente inicial u otros errores inesperados.
     """
-
-    data = request.get_json()
-    host_player_id = data.get("hostPlayerID")
-
-    if host_player_id is None:
-        return jsonify({"error": "Missing hostPlayerID"}), 400
-
-    game = games.get(game_id)
-    if not game:
-        return jsonify({"error": "Game not found"}), 404
-
-    if host_player_id != 0:
-        return jsonify({"error": "Only the host can start the game"}), 403
-
-    if len(game.state.players) == 0:
-        return jsonify({"error": "No players in the game"}), 403
-
-    if hasattr(game.state, "game_state") and game.state.game_state == "in_progress":
-        return jsonify({"error": "Game already in progress"}), 403
-
-    min_players = 5
-    if len(game.state.players) < min_players:
-        return jsonify({"error": f"Need at least {min_players} players to start"}), 403
-
-    try:
-
-        human_players_info = []
-        for player in game.state.players:
-            human_players_info.append(
-                {
-                    "id": player.id,
-                    "name": getattr(player, "name", f"Player {player.id}"),
-                    "player_type": getattr(player, "player_type", "human"),
-                }
-            )
-
-        game.setup_game(
-            player_count=len(human_players_info),
-            with_communists=game.include_communists,
-            with_anti_policies=game.with_anti_policies,
-            with_emergency_powers=game.with_emergency_powers,
-            ai_strategy=game.ai_strategy,
-        )
-
-        for i, player_info in enumerate(human_players_info):
-            if i < len(game.state.players):
-                game_player = game.state.players[i]
-                game_player.name = player_info["name"]
-                game_player.player_type = player_info["player_type"]
-                game_player.id = player_info["id"]
-
-        initial_president = game.state.president
-        if not initial_president:
-            return jsonify({"error": "Failed to assign initial president"}), 500
-
-        return (
-            jsonify(
-                {
-                    "message": "Game started successfully",
-                    "gameState": "in_progress",
-                    "currentPlayers": len(game.state.players),
-                    "roles_assigned": True,
-                    "deck_ready": True,
-                    "playersPreserved": True,
-                    "initialPresident": {
-                        "id": initial_president.id,
-                        "name": getattr(
-                            initial_president, "name", f"Player {initial_president.id}"
-                        ),
-                        "isHuman": getattr(initial_president, "player_type", "human")
-                        == "human",
-                    },
-                    "playerTypes": [
-                        {
-                            "id": p.id,
-                            "name": getattr(p, "name", f"Player {p.id}"),
-                            "isHuman": getattr(p, "player_type", "human") == "human",
-                        }
-                        for p in game.state.players
-                    ],
-                }
-            ),
-            200,
-        )
-
-    except Exception as e:
-        import traceback
-
-        traceback.print_exc()
-        return jsonify({"error": f"Failed to start game: {str(e)}"}), 500
+    return json_response(*start_game_handler(game_id, request.get_json()))
 
 
 @game_bp.route("/games/<game_id>/state", methods=["GET"])
@@ -310,31 +233,8 @@ def get_game_state(game_id):
             En caso de error (404):
             - error (str): Descripción del error
     """
-    game = games.get(game_id)
-    if not game:
-        return jsonify({"error": "Game not found"}), 404
-
     requesting_player_id = request.args.get("playerId", type=int)
-
-    try:
-        game_state = {
-            "gameState": _get_game_state_status(game),
-            "currentPhase": _get_current_phase_info(game),
-            "players": _get_players_info(game, requesting_player_id),
-            "government": _get_government_info(game),
-            "nomination": _get_nomination_info(game),
-            "trackers": _get_trackers_info(game),
-            "board": _get_board_info(game),
-            "lastAction": _get_last_action_info(game),
-            "gameConfig": _get_game_config_info(game),
-            "gameId": game_id,
-            "timestamp": _get_current_timestamp(),
-        }
-
-        return jsonify(game_state), 200
-
-    except Exception as e:
-        return jsonify({"error": f"Failed to get game state: {str(e)}"}), 500
+    return json_response(*get_game_state_handler(game_id, requesting_player_id))
 
 
 @game_bp.route("/games/<game_id>/add-bots", methods=["POST"])
@@ -369,53 +269,4 @@ def add_bots(game_id):
         - El número de bots no puede exceder los espacios disponibles.
         - Los nombres se generan como "{namePrefix}_{número}".
     """
-    data = request.get_json()
-    bot_count = data.get("count", 1)
-    strategy = data.get("strategy", "smart")
-    name_prefix = data.get("namePrefix", "Bot")
-
-    if bot_count < 1 or bot_count > 10:
-        return jsonify({"error": "Bot count must be between 1 and 10"}), 400
-
-    game = games.get(game_id)
-    if not game:
-        return jsonify({"error": "Game not found"}), 404
-
-    if game.state.president is not None:
-        return jsonify({"error": "Game already in progress"}), 403
-
-    available_spots = game.player_count - len(game.state.players)
-    if bot_count > available_spots:
-        return jsonify({"error": f"Only {available_spots} spots available"}), 403
-
-    added_bots = []
-
-    for _ in range(bot_count):
-        new_id = len(game.state.players)
-        bot_name = f"{name_prefix}_{new_id + 1}"
-
-        bot = game.state.player_factory.create_player(
-            id=new_id,
-            name=bot_name,
-            role=None,
-            state=game.state,
-            strategy_type=strategy,
-            player_type="ai",
-        )
-        game.state.players.append(bot)
-
-        added_bots.append(
-            {"playerId": bot.id, "playerName": bot_name, "strategy": strategy}
-        )
-
-    return (
-        jsonify(
-            {
-                "message": f"Added {bot_count} bots successfully",
-                "addedBots": added_bots,
-                "currentPlayers": len(game.state.players),
-                "maxPlayers": game.player_count,
-            }
-        ),
-        200,
-    )
+    return json_response(*add_bots_handler(game_id, request.get_json()))
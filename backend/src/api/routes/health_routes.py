@@ -4,7 +4,11 @@ Este módulo define las rutas de la API Flask para verificar el estado
 y disponibilidad del servidor de la API del juego Secret Hitler XL.
 """
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, Response, jsonify
+
+from ..game_reaper import GameReaper, get_reaper
+from ..metrics import CONTENT_TYPE, get_metrics
+from ..storage import get_store
 
 health_bp = Blueprint("health", __name__)
 
@@ -23,3 +27,34 @@ def health_check():
             - message (str): Mensaje descriptivo
     """
     return jsonify({"status": "OK", "message": "Server is running"}), 200
+
+
+@health_bp.route("/health/games", methods=["GET"])
+def games_health():
+    """Endpoint con métricas de partidas vivas y memoria del servidor.
+
+    Returns:
+        tuple: Una tupla con la respuesta JSON y el código de estado HTTP (200).
+            La respuesta contiene el número de partidas vivas por estado, las
+            partidas expulsadas por inactividad y la memoria residente del
+            proceso.
+    """
+    reaper = get_reaper()
+    if reaper is None or reaper.store is not get_store():
+        reaper = GameReaper(get_store(), interval=0)
+    return jsonify(reaper.metrics()), 200
+
+
+@health_bp.route("/metrics", methods=["GET"])
+def metrics():
+    """Endpoint de métricas en formato de texto de Prometheus.
+
+    Publica la latencia y el número de peticiones por ruta y código de
+    estado, el tiempo de cada acción de juego en el motor, el tiempo de
+    serialización de los estados y las partidas vivas por estado, por fase
+    y por número de bots.
+
+    Returns:
+        Response: Métricas en texto plano (200).
+    """
+    return Response(get_metrics().render(get_store()), 200, content_type=CONTENT_TYPE)
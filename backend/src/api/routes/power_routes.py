@@ -4,14 +4,10 @@ Este módulo define las rutas de la API Flask para manejar la ejecución
 de poderes presidenciales durante la fase ejecutiva del juego.
 """
 
-from flask import Blueprint, jsonify, request
-from src.game.phases.legislative_utils import (
-    end_legislative_session,
-    execute_presidential_power,
-)
+from flask import Blueprint, request
 
-from ..storage import games
-from ..utils.game_state_helpers import _get_current_phase_name
+from ..handlers.power_handlers import president_execute_power_handler
+from ..utils.state_serializer import json_response
 
 power_bp = Blueprint("power", __name__)
 
@@ -49,72 +45,6 @@ def execute_presidential_power_endpoint(game_id):
         información de fin de juego. De lo contrario, termina la sesión
         legislativa y transiciona el juego a la siguiente fase.
     """
-    data = request.get_json() or {}
-    power_type = data.get("powerType")
-    player_id = data.get("playerId")
-    target_id = data.get("targetId")
-
-    game = games.get(game_id)
-    if not game:
-        return jsonify({"error": "Game not found"}), 404
-
-    current_phase = _get_current_phase_name(game)
-    if current_phase != "executive_power":
-        return (
-            jsonify(
-                {
-                    "error": "Not in executive power phase",
-                    "currentPhase": current_phase,
-                }
-            ),
-            403,
-        )
-
-    if not game.state.president or game.state.president.id != player_id:
-        return jsonify({"error": "Only the president can execute powers"}), 403
-
-    try:
-        power_result = execute_presidential_power(
-            game=game, power_type=power_type, target_player_id=target_id
-        )
-
-        if not power_result.get("success", True):
-            return (
-                jsonify(
-                    {
-                        "error": "Failed to execute power",
-                        "details": power_result.get("error"),
-                    }
-                ),
-                400,
-            )
-
-        response_data = {
-            "message": f"President executed power: {power_type}",
-            "powerResult": power_result,
-            "president": {
-                "id": game.state.president.id,
-                "name": getattr(
-                    game.state.president, "name", f"Player {game.state.president.id}"
-                ),
-            },
-        }
-
-        if power_result.get("game_over", False):
-            response_data["gameOver"] = True
-            response_data["winner"] = power_result.get("winner")
-            response_data["newPhase"] = "game_over"
-            return jsonify(response_data), 200
-
-        session_end = end_legislative_session(game)
-        response_data["sessionEnd"] = session_end
-        response_data["newPhase"] = "election"
-        response_data["subPhase"] = "nomination"
-
-        return jsonify(response_data), 200
-
-    except Exception as e:
-        import traceback
-
-        traceback.print_exc()
-        return jsonify({"error": f"Failed to execute power: {str(e)}"}), 500
+    return json_response(
+        *president_execute_power_handler(game_id, request.get_json(silent=True))
+    )
@@ -0,0 +1,481 @@
+"""Despliegue particionado de la API en varios procesos.
+
+Con un único proceso, todas las partidas comparten el mismo intérprete (y su
+GIL). En el modo particionado cada partida pertenece a uno de N procesos
+trabajadores según un hash de su identificador; cada proceso guarda sus
+partidas en memoria y sirve su propia aplicación Flask. Un enrutador WSGI
+ligero reenvía cada petición al proceso dueño de la partida a través de una
+tubería de multiprocessing:
+
+- /games/<game_id>/... se envía al shard de la partida.
+- POST /newgame se reparte por turnos; el shard elegido genera un
+  identificador que le pertenece (ver storage.new_game_id).
+- GET /games consulta el índice de salas de todos los shards y mezcla los
+  resultados.
+- GET /health/games suma las métricas de partidas de todos los shards y
+  añade el detalle de cada uno.
+- GET /metrics reúne las métricas de Prometheus de todos los shards con la
+  etiqueta shard.
+- El resto de rutas se atienden en el shard 0.
+
+Ejemplo de ejecución con 4 procesos::
+
+    SHXL_SHARDS=4 python -m src.api.sharding
+"""
+
+import itertools
+import json
+import multiprocessing
+import os
+import re
+import threading
+from http import HTTPStatus
+from urllib.parse import urlencode
+
+from werkzeug.test import EnvironBuilder, run_wsgi_app
+from werkzeug.wrappers import Request
+
+from .metrics import CONTENT_TYPE
+from .routes.game_routes import MAX_LOBBY_PAGE_SIZE
+from .storage import configure_shard, shard_for
+
+DEFAULT_SHARDS = os.cpu_count() or 1
+SHARD_PATH = re.compile(r"^/games/(?P<game_id>[^/]+)")
+SHARD_UNAVAILABLE = (
+    503,
+    [("Content-Type", "application/json")],
+    b'{"error": "Game shard unavailable"}',
+)
+
+
+def _merge_health_value(key, merged, value):
+    """Combina un valor de /health/games de un shard con el acumulado.
+
+    Args:
+        key (str): Nombre de la métrica.
+        merged: Valor acumulado de los shards anteriores, o None.
+        value: Valor del shard.
+
+    Returns:
+        Valor combinado.
+    """
+    if merged is None or value is None:
+        return value if merged is None else merged
+    if key == "ttlSeconds":
+        return merged
+    if key in ("lastSweepAt", "lastSweepSeconds"):
+        return max(merged, value)
+    if isinstance(value, dict):
+        return {
+            name: merged.get(name, 0) + value.get(name, 0)
+            for name in {**merged, **value}
+        }
+    return merged + value
+
+
+def _label_sample(line, index):
+    """Añade la etiqueta shard a una muestra de Prometheus.
+
+    Args:
+        line (str): Muestra en formato de texto de Prometheus.
+        index (int): Índice del shard.
+
+    Returns:
+        str: Muestra con la etiqueta shard.
+    """
+    if "{" in line:
+        name, rest = line.split("{", 1)
+        return f'{name}{{shard="{index}",{rest}'
+    name, rest = line.split(" ", 1)
+    return f'{name}{{shard="{index}"}} {rest}'
+
+
+def _handle_request(app, message):
+    """Ejecuta en la aplicación Flask una petición reenviada por el enrutador.
+
+    Args:
+        app (Flask): Aplicación Flask del shard.
+        message (tuple): Método, ruta, query string, cabeceras y cuerpo.
+
+    Returns:
+        tuple: Código de estado, cabeceras y cuerpo de la respuesta.
+    """
+    method, path, query_string, headers, body = message
+    builder = EnvironBuilder(
+        path=path,
+        method=method,
+        query_string=query_string,
+        headers=headers,
+        data=body,
+    )
+    try:
+        environ = builder.get_environ()
+    finally:
+        builder.close()
+
+    app_iter, status, response_headers = run_wsgi_app(app, environ, buffered=True)
+    try:
+        content = b"".join(app_iter)
+    finally:
+        if hasattr(app_iter, "close"):
+            app_iter.close()
+    return int(status.split(" ", 1)[0]), list(response_headers.items()), content
+
+
+def serve_shard(index, count, connection):
+    """Bucle principal de un proceso trabajador.
+
+    Args:
+        index (int): Índice del shard de este proceso.
+        count (int): Número total de shards.
+        connection (Connection): Extremo del proceso en la tubería.
+    """
+    configure_shard(index, count)
+
+    from .app import create_app
+
+    app = create_app()
+    while True:
+        try:
+            message = connection.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+        try:
+            response = _handle_request(app, message)
+        except Exception:
+            import traceback
+
+            traceback.print_exc()
+            response = (
+                500,
+                [("Content-Type", "application/json")],
+                b'{"error": "Shard failed to handle the request"}',
+            )
+        connection.send(response)
+    connection.close()
+
+
+class _Shard:
+    """Proceso trabajador y su extremo de la tubería en el enrutador."""
+
+    def __init__(self, process, connection):
+        self.process = process
+        self.connection = connection
+        self.lock = threading.Lock()
+
+
+class ShardRouter:
+    """Aplicación WSGI que reparte las peticiones entre procesos trabajadores.
+
+    Cada shard atiende una petición a la vez; las peticiones de un mismo
+    shard se serializan en el enrutador y las de shards distintos se
+    ejecutan en paralelo en procesos distintos.
+
+    Attributes:
+        shard_count (int): Número de procesos trabajadores.
+        shards (list): Shards arrancados.
+    """
+
+    def __init__(self, shard_count=DEFAULT_SHARDS, start_method="spawn"):
+        """Inicializa el enrutador.
+
+        Args:
+            shard_count (int): Número de procesos trabajadores.
+            start_method (str): Método de arranque de multiprocessing.
+        """
+        if shard_count < 1:
+            raise ValueError("shard_count must be at least 1")
+        self.shard_count = shard_count
+        self.shards = []
+        self._context = multiprocessing.get_context(start_method)
+        self._next_new_game = itertools.count()
+
+    def start(self):
+        """Arranca los procesos trabajadores."""
+        if self.shards:
+            return
+        for index in range(self.shard_count):
+            parent, child = self._context.Pipe()
+            process = self._context.Process(
+                target=serve_shard,
+                args=(index, self.shard_count, child),
+                name=f"shxl-shard-{index}",
+                daemon=True,
+            )
+            process.start()
+            child.close()
+            self.shards.append(_Shard(process, parent))
+
+    def stop(self, timeout=5.0):
+        """Detiene los procesos trabajadores.
+
+        Args:
+            timeout (float): Segundos de espera por cada proceso.
+        """
+        for shard in self.shards:
+            with shard.lock:
+                try:
+                    shard.connection.send(None)
+                except OSError:
+                    pass
+                shard.connection.close()
+        for shard in self.shards:
+            shard.process.join(timeout)
+            if shard.process.is_alive():
+                shard.process.terminate()
+        self.shards = []
+
+    def shard_index(self, method, path):
+        """Elige el shard que debe atender una petición.
+
+        Args:
+            method (str): Método HTTP.
+            path (str): Ruta de la petición.
+
+        Returns:
+            int: Índice del shard.
+        """
+        match = SHARD_PATH.match(path)
+        if match:
+            return shard_for(match.group("game_id"), self.shard_count)
+        if method == "POST" and path == "/newgame":
+            return next(self._next_new_game) % self.shard_count
+        return 0
+
+    def forward(self, index, message):
+        """Envía una petición a un shard y espera su respuesta.
+
+        Args:
+            index (int): Índice del shard.
+            message (tuple): Método, ruta, query string, cabeceras y cuerpo.
+
+        Returns:
+            tuple: Código de estado, cabeceras y cuerpo de la respuesta.
+        """
+        shard = self.shards[index]
+        with shard.lock:
+            try:
+                shard.connection.send(message)
+                return shard.connection.recv()
+            except (EOFError, OSError):
+                return SHARD_UNAVAILABLE
+
+    def _shard_lobby(self, index, message, state, wanted):
+        """Obtiene las primeras salas del índice de un shard.
+
+        Args:
+            index (int): Índice del shard.
+            message (tuple): Petición original de listado.
+            state (str): Filtro de estado, o None.
+            wanted (int): Número de salas a obtener como mucho.
+
+        Returns:
+            tuple: Total de salas del shard y lista de salas obtenidas, o
+                None si el shard no respondió correctamente.
+        """
+        rooms = []
+        total = 0
+        while len(rooms) < wanted:
+            query = {
+                "offset": len(rooms),
+                "limit": min(MAX_LOBBY_PAGE_SIZE, wanted - len(rooms)),
+            }
+            if state is not None:
+                query["state"] = state
+            status, _, content = self.forward(
+                index, (message[0], message[1], urlencode(query)) + message[3:]
+            )
+            if status != 200:
+                return None
+            page = json.loads(content)
+            total = page["total"]
+            rooms.extend(page["games"])
+            if page["nextOffset"] is None:
+                break
+        return total, rooms
+
+    def list_games(self, request, message):
+        """Mezcla el índice de salas de todos los shards.
+
+        El shard 0 valida la petición; después se piden a cada shard sus
+        primeras offset + limit salas y se ordenan por última actividad.
+
+        Args:
+            request (Request): Petición de listado.
+            message (tuple): Petición reenviable a los shards.
+
+        Returns:
+            tuple: Código de estado, cabeceras y cuerpo de la respuesta.
+        """
+        response = self.forward(0, message)
+        if response[0] != 200 or self.shard_count == 1:
+            return response
+
+        first = json.loads(response[2])
+        offset, limit = first["offset"], first["limit"]
+        state = request.args.get("state")
+
+        total = 0
+        rooms = []
+        for index in range(self.shard_count):
+            result = self._shard_lobby(index, message, state, offset + limit)
+            if result is None:
+                return SHARD_UNAVAILABLE
+            total += result[0]
+            rooms.extend(result[1])
+
+        rooms.sort(key=lambda room: room["lastActivity"], reverse=True)
+        page = rooms[offset : offset + limit]
+        next_offset = offset + len(page)
+        content = json.dumps(
+            {
+                "games": page,
+                "total": total,
+                "offset": offset,
+                "limit": limit,
+                "nextOffset": next_offset if next_offset < total else None,
+            }
+        ).encode()
+        return 200, [("Content-Type", "application/json")], content
+
+    def _fan_out(self, message):
+        """Envía la misma petición a todos los shards.
+
+        Args:
+            message (tuple): Petición reenviable a los shards.
+
+        Returns:
+            list: Cuerpo de la respuesta de cada shard, o None si alguno no
+                respondió correctamente.
+        """
+        contents = []
+        for index in range(self.shard_count):
+            status, _, content = self.forward(index, message)
+            if status != 200:
+                return None
+            contents.append(content)
+        return contents
+
+    def games_health(self, message):
+        """Suma las métricas de partidas vivas de todos los shards.
+
+        Los contadores se suman; lastSweepAt y lastSweepSeconds toman el
+        valor más reciente y el más lento. La clave shards conserva las
+        métricas de cada shard.
+
+        Args:
+            message (tuple): Petición reenviable a los shards.
+
+        Returns:
+            tuple: Código de estado, cabeceras y cuerpo de la respuesta.
+        """
+        contents = self._fan_out(message)
+        if contents is None:
+            return SHARD_UNAVAILABLE
+
+        shards = [json.loads(content) for content in contents]
+        merged = {}
+        for shard in shards:
+            for key, value in shard.items():
+                merged[key] = _merge_health_value(key, merged.get(key), value)
+        merged["shards"] = [
+            dict(shard, shard=index) for index, shard in enumerate(shards)
+        ]
+        content = json.dumps(merged).encode()
+        return 200, [("Content-Type", "application/json")], content
+
+    def metrics(self, message):
+        """Reúne las métricas de Prometheus de todos los shards.
+
+        Cada muestra recibe la etiqueta shard con el índice de su proceso y
+        las muestras de una misma métrica se agrupan bajo una única cabecera
+        HELP/TYPE.
+
+        Args:
+            message (tuple): Petición reenviable a los shards.
+
+        Returns:
+            tuple: Código de estado, cabeceras y cuerpo de la respuesta.
+        """
+        contents = self._fan_out(message)
+        if contents is None:
+            return SHARD_UNAVAILABLE
+
+        families = {}
+        for index, content in enumerate(contents):
+            name = None
+            for line in content.decode().splitlines():
+                if line.startswith("# HELP "):
+                    name = line.split(" ", 3)[2]
+                    header = families.setdefault(name, ([], []))[0]
+                    if not header:
+                        header.append(line)
+                elif line.startswith("# TYPE "):
+                    header = families[name][0]
+                    if len(header) < 2:
+                        header.append(line)
+                elif line and name is not None:
+                    families[name][1].append(_label_sample(line, index))
+
+        lines = []
+        for header, samples in families.values():
+            lines += header + samples
+        content = ("\n".join(lines) + "\n").encode()
+        return 200, [("Content-Type", CONTENT_TYPE)], content
+
+    def __call__(self, environ, start_response):
+        """Atiende una petición WSGI reenviándola a su shard."""
+        request = Request(environ)
+        message = (
+            request.method,
+            request.path,
+            request.query_string.decode("latin-1"),
+            [
+                (name, value)
+                for name, value in request.headers.items()
+                if name.lower() != "content-length"
+            ],
+            request.get_data(),
+        )
+        if request.method == "GET" and request.path == "/games":
+            status, headers, content = self.list_games(request, message)
+        elif request.method == "GET" and request.path == "/health/games":
+            status, headers, content = self.games_health(message)
+        elif request.method == "GET" and request.path == "/metrics":
+            status, headers, content = self.metrics(message)
+        else:
+            status, headers, content = self.forward(
+                self.shard_index(request.method, request.path), message
+            )
+        start_response(f"{status} {HTTPStatus(status).phrase}", headers)
+        return [content]
+
+
+def create_router_from_env(environ=None):
+    """Crea el enrutador configurado por variables de entorno.
+
+    Variables reconocidas:
+        SHXL_SHARDS: Número de procesos trabajadores (por defecto, uno por
+            núcleo).
+
+    Args:
+        environ (dict, optional): Entorno a utilizar. Por defecto os.environ.
+
+    Returns:
+        ShardRouter: Enrutador configurado (sin arrancar).
+    """
+    environ = os.environ if environ is None else environ
+    return ShardRouter(int(environ.get("SHXL_SHARDS", DEFAULT_SHARDS)))
+
+
+if __name__ == "__main__":
+    from werkzeug.serving import run_simple
+
+    router = create_router_from_env()
+    router.start()
+    try:
+        run_simple("0.0.0.0", 5000, router, threaded=True)
+    finally:
+        router.stop()
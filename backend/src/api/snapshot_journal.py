@@ -0,0 +1,440 @@
+"""Diario de instantáneas de las partidas de la API.
+
+Con el almacén en memoria, el progreso de las partidas se pierde al reiniciar
+el proceso. Este módulo añade un diario de solo anexado por partida en el que
+cada escritura aceptada (unión, nominación, voto, descarte, promulgación,
+poder...) deja una entrada con la imagen completa de la partida tras la
+escritura, su versión y, a título informativo, la ruta y el cuerpo de la
+petición que la provocó.
+
+No es un registro de acciones que se vuelva a ejecutar: el motor del juego
+usa el generador aleatorio global del proceso, compartido por todas las
+partidas, por lo que repetir las acciones no reproduciría las mismas cartas
+ni las mismas decisiones de los bots. La recuperación se queda con la última
+imagen íntegra de cada partida (de la instantánea compacta o de la última
+entrada del diario que la sigue) y descarta una entrada truncada por una
+caída.
+
+Como cada entrada es una imagen completa, solo la última es necesaria para
+recuperar la partida. El diario de una partida se compacta en una
+instantánea y se vacía cada ``compact_every`` entradas o en cuanto ocupa más
+de ``max_bytes``, lo que acota el espacio en disco de cada partida a unas
+pocas imágenes.
+
+Las escrituras se vuelcan a disco (fsync) por lotes desde un hilo de fondo
+cada ``sync_interval`` segundos, de modo que la latencia de las peticiones no
+depende del disco.
+"""
+
+import glob
+import json
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+from flask import has_request_context, request
+
+from .game_store import GameStore, deserialize_game, serialize_game
+
+DEFAULT_SYNC_INTERVAL = 0.05
+DEFAULT_COMPACT_EVERY = 16
+DEFAULT_MAX_BYTES = 1 << 20
+MAX_OPEN_LOGS = 256
+
+JOURNAL_SUFFIX = ".journal"
+SNAPSHOT_SUFFIX = ".snap"
+
+# Cada entrada: longitud y CRC32 de la carga útil, seguidos de la carga
+# útil (cabecera JSON, salto de línea e instantánea de la partida).
+_FRAME = struct.Struct("<II")
+_SAFE_ID = re.compile(r"[^A-Za-z0-9_-]")
+
+
+def _encode_record(header, snapshot):
+    """Codifica una entrada del diario.
+
+    Args:
+        header (dict): Metadatos de la entrada.
+        snapshot (bytes): Instantánea de la partida.
+
+    Returns:
+        bytes: Entrada enmarcada.
+    """
+    payload = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    payload += b"\n" + snapshot
+    return _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def _read_records(path):
+    """Lee las entradas íntegras de un fichero del diario.
+
+    La lectura se detiene en la primera entrada incompleta o corrupta, que
+    corresponde a una escritura interrumpida por una caída.
+
+    Args:
+        path (str): Ruta del fichero.
+
+    Returns:
+        tuple: Lista de pares (cabecera, instantánea) y número de bytes
+            válidos al principio del fichero.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return [], 0
+
+    records = []
+    offset = 0
+    while offset + _FRAME.size <= len(data):
+        length, checksum = _FRAME.unpack_from(data, offset)
+        start = offset + _FRAME.size
+        payload = data[start : start + length]
+        if len(payload) < length or zlib.crc32(payload) != checksum:
+            break
+        header, _, snapshot = payload.partition(b"\n")
+        records.append((json.loads(header), snapshot))
+        offset = start + length
+    return records, offset
+
+
+def _fsync_file(f):
+    """Vuelca a disco un fichero abierto.
+
+    Args:
+        f: Fichero abierto en modo binario.
+    """
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def _request_action():
+    """Describe la petición que provocó la escritura actual.
+
+    Returns:
+        dict: Método, ruta y cuerpo JSON de la petición, o None si la
+            escritura no se hizo durante una petición.
+    """
+    if not has_request_context():
+        return None
+    return {
+        "method": request.method,
+        "path": request.path,
+        "body": request.get_json(silent=True),
+    }
+
+
+class SnapshotJournal:
+    """Diario de solo anexado de imágenes de partidas con compactación.
+
+    Attributes:
+        directory (str): Directorio de los ficheros del diario.
+        sync_interval (float): Segundos entre volcados a disco. Con 0 cada
+            entrada se vuelca antes de volver de append.
+        compact_every (int): Entradas tras las que se compacta una partida.
+        max_bytes (int): Tamaño del diario de una partida a partir del cual
+            se compacta.
+    """
+
+    def __init__(
+        self,
+        directory,
+        sync_interval=DEFAULT_SYNC_INTERVAL,
+        compact_every=DEFAULT_COMPACT_EVERY,
+        max_bytes=DEFAULT_MAX_BYTES,
+    ):
+        """Inicializa el diario y crea el directorio si no existe.
+
+        Args:
+            directory (str): Directorio de los ficheros del diario.
+            sync_interval (float): Segundos entre volcados a disco.
+            compact_every (int): Entradas tras las que se compacta.
+            max_bytes (int): Tamaño del diario a partir del cual se compacta.
+        """
+        self.directory = directory
+        self.sync_interval = sync_interval
+        self.compact_every = max(1, int(compact_every))
+        self.max_bytes = max(1, int(max_bytes))
+        os.makedirs(directory, exist_ok=True)
+
+        self._files: "OrderedDict[str, object]" = OrderedDict()
+        self._pending = {}
+        self._dirty = set()
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread = None
+        if sync_interval > 0:
+            self._thread = threading.Thread(
+                target=self._run, name="shxl-snapshot-journal", daemon=True
+            )
+            self._thread.start()
+
+    def path(self, game_id, suffix=JOURNAL_SUFFIX):
+        """Obtiene la ruta de un fichero del diario de una partida.
+
+        Args:
+            game_id: Identificador único de la partida.
+            suffix (str): JOURNAL_SUFFIX o SNAPSHOT_SUFFIX.
+
+        Returns:
+            str: Ruta del fichero.
+        """
+        return os.path.join(self.directory, _SAFE_ID.sub("_", str(game_id)) + suffix)
+
+    def _file(self, game_id):
+        """Obtiene el fichero abierto del diario de una partida.
+
+        Mantiene abiertos como mucho MAX_OPEN_LOGS ficheros; el menos usado
+        se vuelca y se cierra al superar el límite.
+
+        Args:
+            game_id: Identificador único de la partida.
+
+        Returns:
+            Fichero abierto en modo de anexado binario.
+        """
+        f = self._files.get(game_id)
+        if f is not None:
+            self._files.move_to_end(game_id)
+            return f
+
+        f = open(self.path(game_id), "ab")
+        self._files[game_id] = f
+        while len(self._files) > MAX_OPEN_LOGS:
+            old_id, old = self._files.popitem(last=False)
+            self._close(old_id, old)
+        return f
+
+    def _close(self, game_id, f):
+        """Vuelca y cierra el fichero del diario de una partida.
+
+        Args:
+            game_id: Identificador único de la partida.
+            f: Fichero abierto.
+        """
+        if game_id in self._dirty:
+            _fsync_file(f)
+            self._dirty.discard(game_id)
+        f.close()
+
+    def append(self, game_id, version, game, action=None):
+        """Añade al diario la imagen de una partida tras una escritura.
+
+        Si el diario de la partida alcanza compact_every entradas o
+        max_bytes, la imagen se escribe directamente como instantánea
+        compacta y el diario se vacía.
+
+        Args:
+            game_id: Identificador único de la partida.
+            version (int): Versión de la partida tras la escritura.
+            game: Instancia de la partida.
+            action (dict, optional): Petición que provocó la escritura.
+        """
+        header = {
+            "gameId": game_id,
+            "version": version,
+            "time": time.time(),
+            "action": action,
+        }
+        record = _encode_record(header, serialize_game(game))
+
+        with self._lock:
+            count, size = self._pending.get(game_id, (0, 0))
+            count, size = count + 1, size + len(record)
+            if count >= self.compact_every or size >= self.max_bytes:
+                self._write_snapshot(game_id, record)
+                return
+
+            f = self._file(game_id)
+            f.write(record)
+            self._pending[game_id] = (count, size)
+            if self.sync_interval > 0:
+                self._dirty.add(game_id)
+            else:
+                _fsync_file(f)
+
+    def _write_snapshot(self, game_id, record):
+        """Sustituye la instantánea de una partida y vacía su diario.
+
+        Args:
+            game_id: Identificador único de la partida.
+            record (bytes): Entrada con la imagen de la partida.
+        """
+        path = self.path(game_id, SNAPSHOT_SUFFIX)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(record)
+            _fsync_file(f)
+        os.replace(tmp_path, path)
+
+        f = self._files.pop(game_id, None)
+        if f is not None:
+            f.close()
+        self._dirty.discard(game_id)
+        self._pending[game_id] = (0, 0)
+        with open(self.path(game_id), "wb") as f:
+            _fsync_file(f)
+
+    def compact(self, game_id, version, game):
+        """Compacta el diario de una partida en una instantánea.
+
+        Args:
+            game_id: Identificador único de la partida.
+            version (int): Versión actual de la partida.
+            game: Instancia de la partida.
+        """
+        header = {"gameId": game_id, "version": version, "time": time.time()}
+        record = _encode_record(header, serialize_game(game))
+        with self._lock:
+            self._write_snapshot(game_id, record)
+
+    def remove(self, game_id):
+        """Elimina el diario y la instantánea de una partida.
+
+        Args:
+            game_id: Identificador único de la partida.
+        """
+        with self._lock:
+            f = self._files.pop(game_id, None)
+            if f is not None:
+                f.close()
+            self._dirty.discard(game_id)
+            self._pending.pop(game_id, None)
+            for suffix in (JOURNAL_SUFFIX, SNAPSHOT_SUFFIX):
+                try:
+                    os.remove(self.path(game_id, suffix))
+                except FileNotFoundError:
+                    pass
+
+    def clear(self):
+        """Elimina el diario de todas las partidas."""
+        with self._lock:
+            for f in self._files.values():
+                f.close()
+            self._files.clear()
+            self._dirty.clear()
+            self._pending.clear()
+            for suffix in (JOURNAL_SUFFIX, SNAPSHOT_SUFFIX):
+                for path in glob.glob(os.path.join(self.directory, "*" + suffix)):
+                    os.remove(path)
+
+    def flush(self):
+        """Vuelca a disco las entradas pendientes."""
+        with self._lock:
+            for game_id in list(self._dirty):
+                f = self._files.get(game_id)
+                if f is not None:
+                    _fsync_file(f)
+            self._dirty.clear()
+
+    def _run(self):
+        """Bucle del hilo de volcado por lotes."""
+        while not self._stop.wait(self.sync_interval):
+            try:
+                self.flush()
+            except Exception:
+                import traceback
+
+                traceback.print_exc()
+
+    def recover(self):
+        """Reconstruye la última imagen íntegra de cada partida registrada.
+
+        Returns:
+            dict: Pares game_id -> (versión, instantánea) de cada partida.
+        """
+        recovered = {}
+        paths = glob.glob(os.path.join(self.directory, "*" + SNAPSHOT_SUFFIX))
+        paths += glob.glob(os.path.join(self.directory, "*" + JOURNAL_SUFFIX))
+        for path in paths:
+            for header, snapshot in _read_records(path)[0]:
+                game_id = header["gameId"]
+                current = recovered.get(game_id)
+                if current is None or header["version"] >= current[0]:
+                    recovered[game_id] = (header["version"], snapshot)
+        return recovered
+
+    def close(self):
+        """Detiene el hilo de volcado y cierra los ficheros abiertos."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.sync_interval + 1)
+            self._thread = None
+        with self._lock:
+            for game_id, f in list(self._files.items()):
+                self._close(game_id, f)
+            self._files.clear()
+
+
+class JournaledGameStore(GameStore):
+    """Almacén que anota cada escritura en un SnapshotJournal.
+
+    Envuelve a otro almacén (normalmente InMemoryGameStore). Al crearse
+    recupera en él las partidas del diario.
+
+    Attributes:
+        inner (GameStore): Almacén envuelto.
+        journal (SnapshotJournal): Diario de instantáneas.
+        recovered (int): Partidas recuperadas al arrancar.
+    """
+
+    def __init__(self, inner, journal):
+        """Inicializa el almacén y recupera las partidas del diario.
+
+        Args:
+            inner (GameStore): Almacén envuelto.
+            journal (SnapshotJournal): Diario de instantáneas.
+        """
+        self.inner = inner
+        self.journal = journal
+        self.recovered = 0
+
+        for game_id, (_, snapshot) in self.journal.recover().items():
+            game = deserialize_game(snapshot)
+            version = self.inner.put(game_id, game)
+            self.journal.compact(game_id, version, game)
+            self.recovered += 1
+
+    def get(self, game_id):
+        return self.inner.get(game_id)
+
+    def load(self, game_id):
+        return self.inner.load(game_id)
+
+    def put(self, game_id, game, expected_version=None):
+        version = self.inner.put(game_id, game, expected_version=expected_version)
+        self.journal.append(game_id, version, game, action=_request_action())
+        return version
+
+    def delete(self, game_id, expected_version=None):
+        deleted = self.inner.delete(game_id, expected_version=expected_version)
+        if deleted:
+            self.journal.remove(game_id)
+        return deleted
+
+    def version(self, game_id):
+        return self.inner.version(game_id)
+
+    def ids(self):
+        return self.inner.ids()
+
+    def entries(self):
+        return self.inner.entries()
+
+    def lobby(self, status=None, offset=0, limit=None):
+        return self.inner.lobby(status=status, offset=offset, limit=limit)
+
+    def clear(self):
+        self.inner.clear()
+        self.journal.clear()
+
+    def invalidate(self, game_id):
+        self.inner.invalidate(game_id)
+
+    def close(self):
+        self.journal.close()
+        self.inner.close()
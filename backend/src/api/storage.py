@@ -2,11 +2,337 @@
 
 Este módulo proporciona almacenamiento centralizado para las instancias de juego,
 evitando importaciones circulares y manteniendo un registro global de partidas activas.
+El registro delega en un almacén intercambiable (ver game_store), de modo que las
+partidas pueden vivir solo en memoria o persistirse en SQLite.
 """
 
-from typing import Any, Dict
+import threading
+import uuid
+import weakref
+import zlib
+from collections.abc import MutableMapping
 
-games: Dict[str, Any] = {}
+from flask import g, has_app_context, has_request_context, jsonify, request
+
+from .game_store import GameStore, InMemoryGameStore, StaleGameError, iter_games
+
+MUTATING_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+REQUEST_LOCK_KEY = "shxl.game_lock"
+
+
+class GameRegistry(MutableMapping):
+    """Registro de partidas con interfaz de diccionario sobre un GameStore.
+
+    Las rutas acceden a las partidas como a un diccionario. Dentro de un
+    contexto de aplicación (una petición o una acción despachada), cada partida
+    cargada se anota junto con la versión sobre la que se leyó para poder
+    persistirla al terminar. Las partidas asignadas dentro de una petición
+    también se anotan, de modo que se guardan una sola vez al terminarla.
+    """
+
+    def __init__(self, store=None, archive=None):
+        """Inicializa el registro.
+
+        Args:
+            store (GameStore, optional): Almacén subyacente. Por defecto un
+                InMemoryGameStore.
+            archive (GameArchive, optional): Archivo en disco donde buscar
+                partidas terminadas que ya se expulsaron del almacén.
+        """
+        self.store: GameStore = store or InMemoryGameStore()
+        self.archive = archive
+
+    def _track(self, game_id, game, version):
+        """Anota una partida usada en la petición actual.
+
+        Args:
+            game_id: Identificador único de la partida.
+            game: Instancia de la partida.
+            version (int): Versión sobre la que se cargó la partida.
+        """
+        if game is not None and has_app_context():
+            loaded = g.setdefault("loaded_games", {})
+            loaded.setdefault(game_id, (game, version))
+
+    def get(self, game_id, default=None):
+        if has_app_context():
+            tracked = g.get("loaded_games", {}).get(game_id)
+            if tracked is not None:
+                return tracked[0]
+        game, version = self.store.load(game_id)
+        if game is None:
+            if self.archive is not None:
+                archived = self.archive.load(game_id)
+                if archived is not None:
+                    return archived
+            return default
+        self._track(game_id, game, version)
+        return game
+
+    def __getitem__(self, game_id):
+        game = self.get(game_id)
+        if game is None:
+            raise KeyError(game_id)
+        return game
+
+    def __setitem__(self, game_id, game):
+        # Dentro de una petición la partida solo se anota: persist_request_games
+        # la guarda una única vez al terminar.
+        if has_request_context():
+            self.stage(game_id, game)
+        else:
+            self.store.put(game_id, game)
+
+    def __delitem__(self, game_id):
+        staged = None
+        if has_app_context():
+            staged = g.setdefault("loaded_games", {}).pop(game_id, None)
+        if not self.store.delete(game_id) and staged is None:
+            raise KeyError(game_id)
+
+    def __contains__(self, game_id):
+        if has_app_context() and game_id in g.get("loaded_games", {}):
+            return True
+        return self.store.version(game_id) is not None
+
+    def __iter__(self):
+        return iter(self.store.ids())
+
+    def __len__(self):
+        return len(self.store.ids())
+
+    def clear(self):
+        self.store.clear()
+
+    def stage(self, game_id, game):
+        """Sustituye la partida que la petición actual persistirá al terminar.
+
+        Las siguientes lecturas de la partida dentro de la misma petición
+        devuelven la instancia indicada, que se guarda sobre la versión con la
+        que se cargó la original.
+
+        Args:
+            game_id: Identificador único de la partida.
+            game: Instancia que reemplaza a la cargada.
+        """
+        loaded = g.setdefault("loaded_games", {})
+        if game_id in loaded:
+            version = loaded[game_id][1]
+        else:
+            version = self.store.version(game_id)
+        loaded[game_id] = (game, version)
+
+    def commit(self, game_id):
+        """Persiste en el acto una partida usada en la petición actual.
+
+        La partida deja de estar anotada, de modo que persist_request_games no
+        vuelve a guardarla al terminar la petición.
+
+        Args:
+            game_id: Identificador único de la partida.
+
+        Returns:
+            int: Nueva versión de la partida.
+
+        Raises:
+            KeyError: Si la partida no se usó en la petición actual.
+            StaleGameError: Si otra instancia modificó la partida entretanto.
+        """
+        game, version = g.setdefault("loaded_games", {}).pop(game_id)
+        try:
+            return self.store.put(game_id, game, expected_version=version)
+        except StaleGameError:
+            self.store.invalidate(game_id)
+            raise
+
+    def version(self, game_id):
+        """Obtiene la versión actual de una partida.
+
+        Args:
+            game_id: Identificador único de la partida.
+
+        Returns:
+            int: Versión de la partida o None si no existe.
+        """
+        return self.store.version(game_id)
+
+
+games = GameRegistry()
+
+
+def configure_store(store, archive=None):
+    """Sustituye el almacén de partidas utilizado por la API.
+
+    Args:
+        store (GameStore): Nuevo almacén de partidas.
+        archive (GameArchive, optional): Archivo de partidas terminadas.
+    """
+    previous = games.store
+    games.store = store
+    games.archive = archive
+    if previous is not store:
+        previous.close()
+
+
+def get_store():
+    """Obtiene el almacén de partidas configurado.
+
+    Returns:
+        GameStore: Almacén de partidas activo.
+    """
+    return games.store
+
+
+_game_locks: "weakref.WeakValueDictionary[str, threading.RLock]" = (
+    weakref.WeakValueDictionary()
+)
+_game_locks_guard = threading.Lock()
+
+
+def game_lock(game_id):
+    """Obtiene el cerrojo que serializa el acceso a una partida.
+
+    El cerrojo es reentrante para que una petición que ya lo posee pueda
+    despachar acciones internas sobre la misma partida. Se libera de memoria
+    cuando nadie lo referencia.
+
+    Args:
+        game_id: Identificador único de la partida.
+
+    Returns:
+        threading.RLock: Cerrojo de la partida.
+    """
+    with _game_locks_guard:
+        lock = _game_locks.get(game_id)
+        if lock is None:
+            lock = threading.RLock()
+            _game_locks[game_id] = lock
+        return lock
+
+
+def acquire_request_game_lock():
+    """Bloquea la partida de la petición actual hasta que termine.
+
+    Se registra como manejador before_request; el motor del juego no es
+    seguro ante accesos concurrentes a una misma partida. El cerrojo se anota
+    en la propia petición y no en g, que comparten las peticiones internas
+    que una ruta despache dentro del mismo contexto de aplicación.
+    """
+    game_id = (request.view_args or {}).get("game_id")
+    if game_id is not None:
+        lock = game_lock(game_id)
+        lock.acquire()
+        request.environ[REQUEST_LOCK_KEY] = lock
+
+
+def release_request_game_lock(exc=None):
+    """Libera el cerrojo tomado por acquire_request_game_lock.
+
+    Se registra como manejador teardown_request.
+
+    Args:
+        exc: Excepción que terminó la petición, si la hubo.
+    """
+    lock = request.environ.pop(REQUEST_LOCK_KEY, None)
+    if lock is not None:
+        lock.release()
+
+
+def persist_request_games(response):
+    """Persiste las partidas modificadas durante una petición.
+
+    Se registra como manejador after_request. Las peticiones de escritura que
+    terminan con éxito guardan una nueva instantánea de cada partida usada;
+    si otra instancia de la API modificó la partida entretanto, se responde
+    con 409.
+
+    Args:
+        response: Respuesta de Flask generada por la ruta.
+
+    Returns:
+        Response: La respuesta original o un error 409 si hubo conflicto.
+    """
+    loaded = g.pop("loaded_games", None)
+    if not loaded or request.method not in MUTATING_METHODS:
+        return response
+
+    conflict = persist_games(loaded, failed=response.status_code >= 400)
+    if conflict is not None:
+        response = jsonify(
+            {"error": "Game was modified concurrently", "gameId": conflict}
+        )
+        response.status_code = 409
+    return response
+
+
+def persist_games(loaded, failed=False):
+    """Persiste las partidas anotadas durante una escritura.
+
+    Si la escritura falló, las partidas se descartan de la caché del almacén
+    para que la siguiente lectura vuelva a la última versión guardada.
+
+    Args:
+        loaded (dict): Partidas anotadas, con su versión de carga, por id.
+        failed (bool): Si la escritura terminó con error.
+
+    Returns:
+        str: Identificador de la partida modificada concurrentemente por otra
+            instancia, o None si todas se guardaron.
+    """
+    if failed:
+        for game_id in loaded:
+            games.store.invalidate(game_id)
+        return None
+
+    for game_id, (game, version) in loaded.items():
+        try:
+            games.store.put(game_id, game, expected_version=version)
+        except StaleGameError:
+            games.store.invalidate(game_id)
+            return game_id
+    return None
+
+
+_shard = None
+
+
+def shard_for(game_id, shard_count):
+    """Calcula el shard al que pertenece una partida.
+
+    Args:
+        game_id (str): Identificador único de la partida.
+        shard_count (int): Número total de shards.
+
+    Returns:
+        int: Índice del shard, entre 0 y shard_count - 1.
+    """
+    return zlib.crc32(game_id.encode("utf-8")) % shard_count
+
+
+def configure_shard(index, count):
+    """Indica qué shard de un despliegue particionado sirve este proceso.
+
+    Args:
+        index (int): Índice del shard de este proceso.
+        count (int): Número total de shards.
+    """
+    global _shard
+    _shard = (index, count)
+
+
+def new_game_id():
+    """Genera el identificador de una partida nueva.
+
+    En un despliegue particionado el identificador se elige de modo que la
+    partida pertenezca al shard de este proceso.
+
+    Returns:
+        str: Identificador de 8 caracteres.
+    """
+    while True:
+        game_id = str(uuid.uuid4())[:8]
+        if _shard is None or shard_for(game_id, _shard[1]) == _shard[0]:
+            return game_id
 
 
 def get_game(game_id):
@@ -47,7 +373,7 @@ def get_all_games():
     Returns:
         Dict[str, Any]: Diccionario con todos los juegos indexados por ID.
     """
-    return games
+    return dict(iter_games(games.store))
 
 
 def clear_all_games():
@@ -36,65 +36,17 @@ def _get_power_description(power_name):
 def _get_current_phase_name(game):
     """Obtiene el nombre de la fase actual del juego.
 
-    Esta función intenta determinar el nombre de la fase actual verificando
-    varias fuentes posibles en orden:
-    1. Si game.state tiene un atributo current_phase_name no vacío, se retorna.
-    2. Si game tiene un atributo current_phase no vacío, se usa su nombre de clase.
-    3. Si ninguno está disponible, se infiere usando _infer_phase_from_game_state.
+    El estado del juego mantiene la fase actual en state.phase (ver
+    phase_machine): se fija al crearlo y, en las instantáneas anteriores, al
+    restaurarlas, de modo que nunca hace falta inferirla.
 
     Args:
         game: Objeto del juego que contiene estado e información de fase.
 
     Returns:
-        str: Nombre de la fase actual.
+        Phase: Fase actual.
     """
-
-    if hasattr(game.state, "current_phase_name") and game.state.current_phase_name:
-        return game.state.current_phase_name
-
-    if hasattr(game, "current_phase") and game.current_phase:
-        backend_phase_name = game.current_phase.__class__.__name__.lower().replace(
-            "phase", ""
-        )
-        if hasattr(game.state, "current_phase_name"):
-            game.state.current_phase_name = backend_phase_name
-        return backend_phase_name
-
-    return _infer_phase_from_game_state(game)
-
-
-def _infer_phase_from_game_state(game):
-    """Infiere la fase actual del juego basándose en los atributos del estado.
-
-    Args:
-        game: Objeto que representa el juego actual, se espera que tenga un
-            atributo 'state' con varias propiedades que indican el progreso.
-
-    Returns:
-        str: String que representa la fase inferida del juego. Valores posibles:
-            - "game_over": El juego ha terminado.
-            - "voting": El juego está en fase de votación para candidato a canciller.
-            - "legislative": Presidente y canciller están establecidos, fase legislativa.
-            - "election": Solo el presidente está establecido, fase de elección.
-            - "setup": El juego está en configuración o ninguna otra fase coincide.
-    """
-    if hasattr(game.state, "game_over") and game.state.game_over:
-        return "game_over"
-    elif (
-        hasattr(game.state, "chancellor_candidate") and game.state.chancellor_candidate
-    ):
-        return "voting"
-    elif (
-        hasattr(game.state, "president")
-        and game.state.president
-        and hasattr(game.state, "chancellor")
-        and game.state.chancellor
-    ):
-        return "legislative"
-    elif hasattr(game.state, "president") and game.state.president:
-        return "election"
-    else:
-        return "setup"
+    return game.state.phase
 
 
 def _get_eligible_voters(game):
@@ -264,8 +216,9 @@ def _get_current_phase_info(game):
             - 'subPhase' (opcional): Sub-fase actual, si aplica ('voting', 'nomination', etc.).
 
     Note:
-        La función determina la sub-fase para fases 'election' y 'legislative'
-        basándose en la presencia y estado de atributos específicos en el estado del juego.
+        La sub-fase se toma de state.sub_phase. Para estados que no la
+        mantienen, se determina para fases 'election' y 'legislative' basándose
+        en la presencia y estado de atributos específicos en el estado del juego.
     """
 
     phase_name = getattr(game.state, "current_phase_name", "unknown")
@@ -278,7 +231,10 @@ def _get_current_phase_info(game):
         "canAdvance": True,
     }
 
-    if phase_name == "election":
+    sub_phase = getattr(game.state, "sub_phase", None)
+    if sub_phase is not None:
+        api_phase["subPhase"] = sub_phase
+    elif phase_name == "election":
         if (
             hasattr(game.state, "chancellor_candidate")
             and game.state.chancellor_candidate
@@ -376,6 +332,29 @@ def _safe_winner_string(winner):
         return str(winner)
 
 
+def _to_json_safe(value):
+    """Convierte un resultado del motor del juego a tipos serializables a JSON.
+
+    Los jugadores se sustituyen por un resumen con su ID y nombre; cualquier
+    otro objeto no serializable se convierte a string.
+
+    Args:
+        value: Valor a convertir (dict, lista, jugador o valor simple).
+
+    Returns:
+        Any: Valor equivalente compuesto solo de tipos JSON.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, dict):
+        return {str(key): _to_json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_to_json_safe(item) for item in value]
+    if hasattr(value, "id") and hasattr(value, "player_type"):
+        return {"id": value.id, "name": getattr(value, "name", f"Player {value.id}")}
+    return str(value)
+
+
 def _get_players_info(game, requesting_player_id=None):
     """Obtiene información de jugadores con visibilidad de rol apropiada.
 
@@ -0,0 +1,454 @@
+"""Serializador rápido del estado del juego para las respuestas de la API.
+
+Este módulo genera la misma estructura que las funciones de
+game_state_helpers, pero recorriendo el estado una sola vez: los jugadores se
+indexan al principio, las partes estáticas del tablero se cachean y cada
+sección se construye directamente con todas sus claves. La codificación JSON
+usa orjson cuando está instalado y json de la biblioteca estándar en caso
+contrario.
+"""
+
+import datetime
+import json
+from functools import lru_cache
+
+from flask import Response
+
+from .game_state_helpers import (
+    _get_phase_description,
+    _get_phase_display_name,
+    _get_power_description,
+)
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - depende del entorno
+    orjson = None
+
+JSON_MIMETYPE = "application/json"
+
+
+def dumps_json(payload):
+    """Codifica un objeto como JSON compacto en UTF-8.
+
+    Args:
+        payload: Objeto serializable a JSON.
+
+    Returns:
+        bytes: Documento JSON codificado.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode(
+        "utf-8"
+    )
+
+
+def json_response(payload, status=200):
+    """Construye una respuesta Flask a partir de un objeto JSON.
+
+    Args:
+        payload: Objeto serializable a JSON.
+        status (int): Código de estado HTTP.
+
+    Returns:
+        Response: Respuesta con el documento JSON.
+    """
+    return Response(dumps_json(payload), status=status, mimetype=JSON_MIMETYPE)
+
+
+def _player_ref(player):
+    """Construye la referencia {id, name} de un jugador.
+
+    Args:
+        player: Jugador a referenciar.
+
+    Returns:
+        dict: Referencia con id y nombre del jugador.
+    """
+    return {"id": player.id, "name": getattr(player, "name", f"Player {player.id}")}
+
+
+def _powers_info(powers, track):
+    """Construye la información de poderes de una pista.
+
+    Args:
+        powers (list): Poderes de cada posición de la pista.
+        track (int): Número de políticas promulgadas en la pista.
+
+    Returns:
+        list: Lista de diccionarios con posición, poder, estado y descripción.
+    """
+    return [
+        {
+            "position": position,
+            "power": power,
+            "isActive": track >= position,
+            "description": _get_power_description(power) if power else "No power",
+        }
+        for position, power in enumerate(powers, start=1)
+    ]
+
+
+@lru_cache(maxsize=256)
+def _board_powers(
+    fascist_powers, fascist_track, communist_powers, communist_track, with_communists
+):
+    """Obtiene la información de poderes del tablero, cacheada por estado de pistas.
+
+    El resultado se comparte entre respuestas y no debe modificarse.
+
+    Args:
+        fascist_powers (tuple): Poderes de la pista fascista.
+        fascist_track (int): Políticas fascistas promulgadas.
+        communist_powers (tuple): Poderes de la pista comunista.
+        communist_track (int): Políticas comunistas promulgadas.
+        with_communists (bool): Si se incluye la pista comunista.
+
+    Returns:
+        dict: Poderes fascistas y comunistas.
+    """
+    return {
+        "fascist": _powers_info(fascist_powers, fascist_track),
+        "communist": (
+            _powers_info(communist_powers, communist_track) if with_communists else []
+        ),
+    }
+
+
+def serialize_game_state(game, game_id, requesting_player_id=None):
+    """Serializa el estado completo de una partida en un único recorrido.
+
+    Produce la misma estructura que GET /games/<id>/state construía con las
+    funciones de game_state_helpers.
+
+    Args:
+        game: Instancia del juego.
+        game_id (str): Identificador único de la partida.
+        requesting_player_id (int, optional): ID del jugador que consulta.
+
+    Returns:
+        dict: Estado del juego listo para codificar como JSON.
+    """
+    state = game.state
+    timestamp = datetime.datetime.now().isoformat()
+
+    players = state.players
+    players_by_id = {}
+    for player in players:
+        players_by_id.setdefault(player.id, player)
+
+    game_over = getattr(state, "game_over", False)
+    president = getattr(state, "president", None)
+    chancellor = getattr(state, "chancellor", None)
+    candidate = getattr(state, "chancellor_candidate", None)
+    previous_government = getattr(state, "previous_government", None)
+
+    if game_over:
+        game_state = "game_over"
+    elif president:
+        game_state = "in_progress"
+    else:
+        game_state = "waiting_for_players"
+
+    # Fase actual
+    phase_name = getattr(state, "current_phase_name", "unknown")
+    current_phase = {
+        "name": phase_name,
+        "displayName": _get_phase_display_name(phase_name),
+        "description": _get_phase_description(game, phase_name),
+        "originalClass": f"{phase_name.title()}Phase",
+        "canAdvance": True,
+    }
+    sub_phase = getattr(state, "sub_phase", None)
+    if sub_phase is not None:
+        current_phase["subPhase"] = sub_phase
+    elif phase_name == "election":
+        current_phase["subPhase"] = "voting" if candidate else "nomination"
+    elif phase_name == "legislative":
+        if getattr(state, "chancellor_policies", None):
+            current_phase["subPhase"] = "chancellor_enact"
+        elif getattr(state, "president_policies", None):
+            current_phase["subPhase"] = "president_discard"
+        else:
+            current_phase["subPhase"] = "draw_policies"
+
+    # Gobierno anterior
+    previous_ids = ()
+    previous_info = None
+    term_limited = []
+    if previous_government:
+        prev_president_id = previous_government["president"]
+        prev_chancellor_id = previous_government["chancellor"]
+        previous_ids = (prev_president_id, prev_chancellor_id)
+        previous_info = {
+            "president": {
+                "id": prev_president_id,
+                "name": _name_by_id(players_by_id, prev_president_id),
+            },
+            "chancellor": {
+                "id": prev_chancellor_id,
+                "name": _name_by_id(players_by_id, prev_chancellor_id),
+            },
+        }
+
+        if (
+            isinstance(previous_government, dict)
+            and prev_president_id is not None
+            and prev_chancellor_id is not None
+        ):
+            prev_chancellor = players_by_id.get(prev_chancellor_id)
+            if prev_chancellor:
+                term_limited.append(
+                    {
+                        "id": prev_chancellor_id,
+                        "name": getattr(
+                            prev_chancellor, "name", f"Player {prev_chancellor_id}"
+                        ),
+                        "reason": "former_chancellor",
+                    }
+                )
+            if len(players) <= 5:
+                prev_president = players_by_id.get(prev_president_id)
+                if prev_president:
+                    term_limited.append(
+                        {
+                            "id": prev_president_id,
+                            "name": getattr(
+                                prev_president, "name", f"Player {prev_president_id}"
+                            ),
+                            "reason": "former_president_small_game",
+                        }
+                    )
+
+    # Jugadores
+    players_info = []
+    for player in players:
+        player_id = getattr(player, "id", -1)
+        player_type = getattr(player, "player_type", "human")
+        is_hitler = getattr(player, "is_hitler", False)
+        is_fascist = getattr(player, "is_fascist", False) and not is_hitler
+        is_communist = getattr(player, "is_communist", False)
+
+        if is_hitler or is_fascist:
+            party = "fascist"
+        elif is_communist:
+            party = "communist"
+        else:
+            party = "liberal"
+
+        players_info.append(
+            {
+                "id": player_id,
+                "name": getattr(player, "name", f"Player {getattr(player, 'id', '?')}"),
+                "position": player_id,
+                "isAlive": not getattr(player, "is_dead", False),
+                "isHuman": player_type == "human",
+                "isBot": player_type == "ai",
+                "specialStatus": (
+                    ["term_limited"] if player.id in previous_ids else []
+                ),
+                "role": {
+                    "isVisible": True,
+                    "party": party,
+                    "isLiberal": getattr(player, "is_liberal", False),
+                    "isFascist": is_fascist,
+                    "isHitler": is_hitler,
+                    "isCommunist": is_communist,
+                },
+            }
+        )
+
+    # Gobierno y nominación
+    candidate_info = _player_ref(candidate) if candidate else None
+    government = {
+        "president": _player_ref(president) if president else None,
+        "chancellor": _player_ref(chancellor) if chancellor else None,
+        "presidentCandidate": None,
+        "chancellorCandidate": candidate_info,
+        "previousGovernment": previous_info,
+        "termLimited": term_limited,
+    }
+
+    eligible_chancellors = []
+    if hasattr(state, "get_eligible_chancellors"):
+        try:
+            limited = {id(p) for p in getattr(state, "term_limited_players", [])}
+            eligible_chancellors = [
+                {
+                    "id": player.id,
+                    "name": getattr(player, "name", f"Player {player.id}"),
+                    "isTermLimited": id(player) in limited,
+                }
+                for player in state.get_eligible_chancellors()
+            ]
+        except Exception as e:
+            print(f"Warning: Could not get eligible chancellors: {e}")
+            eligible_chancellors = []
+
+    nomination = {
+        "chancellorCandidate": dict(candidate_info) if candidate_info else None,
+        "eligibleChancellors": eligible_chancellors,
+        "isVotingPhase": bool(candidate),
+    }
+
+    trackers = {
+        "electionTracker": getattr(state, "election_tracker", 0),
+        "roundNumber": getattr(state, "round_number", 1),
+    }
+    if hasattr(state, "enacted_policies"):
+        trackers["enactedPolicies"] = state.enacted_policies
+
+    # Tablero y última acción
+    board = getattr(state, "board", None)
+    if board:
+        policies = getattr(board, "policies", None)
+        discards = getattr(board, "discards", None)
+        liberal_count = getattr(board, "liberal_track", 0)
+        fascist_count = getattr(board, "fascist_track", 0)
+        communist_count = getattr(board, "communist_track", 0)
+        board_info = {
+            "liberalPolicies": liberal_count,
+            "fascistPolicies": fascist_count,
+            "communistPolicies": communist_count,
+            "policiesInDeck": len(policies) if policies else 0,
+            "policiesInDiscard": len(discards) if discards else 0,
+            "vetoAvailable": getattr(board, "veto_available", False),
+            "powers": _board_powers(
+                tuple(getattr(board, "fascist_powers", None) or ()),
+                fascist_count,
+                tuple(getattr(board, "communist_powers", None) or ()),
+                communist_count,
+                bool(getattr(game, "include_communists", False)),
+            ),
+        }
+        try:
+            last_action = _last_action(
+                state,
+                players_by_id,
+                liberal_count,
+                fascist_count,
+                communist_count,
+                timestamp,
+            )
+        except Exception as e:
+            print(f"Error getting last action: {e}")
+            last_action = {
+                "type": "error",
+                "player": None,
+                "description": "Could not determine last action",
+                "timestamp": timestamp,
+            }
+    else:
+        board_info = {
+            "liberalPolicies": 0,
+            "fascistPolicies": 0,
+            "communistPolicies": 0,
+            "policiesInDeck": 0,
+            "policiesInDiscard": 0,
+            "vetoAvailable": False,
+        }
+        last_action = {
+            "type": "initialization",
+            "player": None,
+            "description": "Game initializing",
+            "timestamp": timestamp,
+        }
+
+    return {
+        "gameState": game_state,
+        "currentPhase": current_phase,
+        "players": players_info,
+        "government": government,
+        "nomination": nomination,
+        "trackers": trackers,
+        "board": board_info,
+        "lastAction": last_action,
+        "gameConfig": {
+            "maxPlayers": getattr(game, "player_count", 10),
+            "withCommunists": getattr(game, "include_communists", False),
+            "withAntiPolicies": getattr(game, "with_anti_policies", False),
+            "withEmergencyPowers": getattr(game, "with_emergency_powers", False),
+            "aiStrategy": getattr(game, "ai_strategy", "smart"),
+        },
+        "gameId": game_id,
+        "timestamp": timestamp,
+    }
+
+
+def _name_by_id(players_by_id, player_id):
+    """Obtiene el nombre de un jugador a partir del índice por ID.
+
+    Args:
+        players_by_id (dict): Jugadores indexados por ID.
+        player_id: ID del jugador.
+
+    Returns:
+        str: Nombre del jugador o "Player {id}" si no existe.
+    """
+    player = players_by_id.get(player_id)
+    if player is None:
+        return f"Player {player_id}"
+    return getattr(player, "name", f"Player {player_id}")
+
+
+def _last_action(
+    state, players_by_id, liberal_count, fascist_count, communist_count, timestamp
+):
+    """Infiere la última acción significativa de la partida.
+
+    Args:
+        state: Estado del juego.
+        players_by_id (dict): Jugadores indexados por ID.
+        liberal_count (int): Políticas liberales promulgadas.
+        fascist_count (int): Políticas fascistas promulgadas.
+        communist_count (int): Políticas comunistas promulgadas.
+        timestamp (str): Marca de tiempo de la respuesta.
+
+    Returns:
+        dict: Tipo, jugador, descripción y marca de tiempo de la última acción.
+    """
+    total_policies = liberal_count + fascist_count + communist_count
+
+    if total_policies == 0:
+        president = getattr(state, "president", None)
+        return {
+            "type": "game_started",
+            "player": {
+                "id": president.id if president else 0,
+                "name": getattr(president, "name", "Unknown") if president else "Host",
+            },
+            "description": f"Game started - {len(state.players)} players",
+            "timestamp": timestamp,
+        }
+
+    last_chancellor = None
+    previous_government = getattr(state, "previous_government", None)
+    if previous_government:
+        chancellor_id = previous_government.get("chancellor")
+        if chancellor_id is not None:
+            last_chancellor = {
+                "id": chancellor_id,
+                "name": _name_by_id(players_by_id, chancellor_id),
+            }
+
+    chancellor = getattr(state, "chancellor", None)
+    if not last_chancellor and chancellor:
+        last_chancellor = _player_ref(chancellor)
+
+    if not last_chancellor:
+        last_chancellor = {"id": None, "name": "Unknown Chancellor"}
+
+    if fascist_count > 0:
+        last_policy_type = "fascist"
+    elif liberal_count > 0:
+        last_policy_type = "liberal"
+    else:
+        last_policy_type = "communist"
+
+    return {
+        "type": "policy_enacted",
+        "player": last_chancellor,
+        "description": f"Policy #{total_policies} enacted: {last_policy_type.title()}",
+        "timestamp": timestamp,
+    }
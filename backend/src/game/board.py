@@ -4,10 +4,10 @@ Este módulo contiene la implementación del tablero del juego, incluyendo
 los contadores de políticas, poderes y la lógica de victoria.
 """
 
-from random import shuffle
-
 from src.game.game_logger import GameLogger, LogLevel
 from src.game.powers.power_registry import PowerRegistry
+from src.game.rng import shuffle
+from src.policies.deck_odds import composition_key, draw_table
 
 VETO_POWER_THRESHOLD = 5
 
@@ -43,6 +43,8 @@ class GameBoard:
 
         self.policies = []
         self.discards = []
+        self._composition = None
+        self._composition_signature = None
 
         self.fascist_powers = self._setup_fascist_powers()
         self.communist_powers = self._setup_communist_powers()
@@ -172,6 +174,40 @@ class GameBoard:
 
         self.discards.extend(policies)
 
+    def public_deck_composition(self):
+        """Composición pública de las cartas por promulgar.
+
+        Cuenta las cartas del mazo y de los descartes: cualquier jugador la
+        conoce a partir del mazo inicial, las pistas y los poderes que añaden
+        cartas, pero no sabe cuáles están en cada montón. Se recalcula solo
+        cuando cambian los montones, de modo que consultarla es O(1).
+
+        Returns:
+            tuple: Cartas por tipo, en el orden de deck_odds.POLICY_TYPES.
+        """
+        signature = (
+            id(self.policies),
+            len(self.policies),
+            id(self.discards),
+            len(self.discards),
+        )
+        if getattr(self, "_composition_signature", None) != signature:
+            self._composition = composition_key(self.policies + self.discards)
+            self._composition_signature = signature
+        return self._composition
+
+    def draw_odds(self, count=3):
+        """Probabilidad de cada mano del próximo robo según la información pública.
+
+        Args:
+            count (int): Cartas robadas (3 para el presidente, 2 para el
+                canciller).
+
+        Returns:
+            dict: Tabla de deck_odds.draw_table para la composición pública.
+        """
+        return draw_table(self.public_deck_composition(), count)
+
     def enact_policy(self, policy, chaos=False, emergency=False, antipolicies=False):
         """Promulga una política en el marcador apropiado.
 
@@ -289,6 +325,7 @@ class GameBoard:
                 "president": self.state.president,
                 "chancellor": self.state.chancellor,
                 "round": self.state.round_number,
+                "chaos": chaos,
                 "liberal_track": self.state.board.liberal_track,
                 "fascist_track": self.state.board.fascist_track,
                 "communist_track": (
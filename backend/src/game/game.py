@@ -4,14 +4,16 @@ Este módulo contiene la implementación principal del juego Secret Hitler XL,
 gestionando el estado del juego, las fases y la lógica general del juego.
 """
 
-from random import randint
-
 from src.game.board import GameBoard
 from src.game.game_logger import GameLogger, LogLevel
 from src.game.game_state import EnhancedGameState
+from src.game.phases.phase_machine import Phase
 from src.game.phases.setup import SetupPhase
 from src.game.powers.abstract_power import PowerOwner
 from src.game.powers.power_registry import PowerRegistry
+from src.game.rng import randint
+from src.game.role_beliefs import RoleBeliefs
+from src.game.state_encoder import StateEncoder
 from src.players.player_factory import PlayerFactory
 from src.policies.policy_factory import PolicyFactory
 from src.roles.role_factory import RoleFactory
@@ -38,6 +40,7 @@ class SHXLGame:
         self.emergency_powers_in_play = False
         self.human_player_indices = []
         self.ai_strategy = "role"
+        self.bot_time_budget = None
         self.player_count = 0
         self.hitler_player = None
 
@@ -52,6 +55,8 @@ class SHXLGame:
         with_emergency_powers=False,
         human_player_indices=None,
         ai_strategy="role",
+        bot_time_budget=None,
+        role_beliefs=False,
     ):
         """Configura el juego con los parámetros dados.
 
@@ -62,6 +67,12 @@ class SHXLGame:
             with_emergency_powers (bool): Si incluir poderes de emergencia.
             human_player_indices (list): Lista de índices de jugadores controlados por humanos.
             ai_strategy (str): Estrategia a usar para jugadores IA.
+            bot_time_budget (float, optional): Segundos por decisión de cada
+                jugador IA (ver AIPlayer); por defecto, sin límite.
+            role_beliefs (bool): Si mantener creencias bayesianas sobre los
+                roles (ver RoleBeliefs). Sin ellas, las estrategias usan sus
+                reglas fijas; el filtro de partículas multiplica el coste de
+                cada partida, por lo que las simulaciones lo dejan apagado.
         """
         if with_anti_policies and not with_communists:
             with_anti_policies = False
@@ -72,6 +83,7 @@ class SHXLGame:
         self.emergency_powers_in_play = with_emergency_powers
         self.human_player_indices = human_player_indices or []
         self.ai_strategy = ai_strategy
+        self.bot_time_budget = bot_time_budget
 
         self.state = EnhancedGameState()
         self.state.government_history = []
@@ -86,6 +98,9 @@ class SHXLGame:
 
         self.assign_players()
         self.inform_players()
+        if role_beliefs:
+            self.state.beliefs = RoleBeliefs(self.state)
+        self.state.encoder = StateEncoder(self.state)
         self.choose_first_president()
         self.logger.log_game_setup(self)
 
@@ -110,25 +125,20 @@ class SHXLGame:
         Returns:
             str: El ganador del juego.
         """
-        if self.state.current_phase_name == "setup":
+        if self.state.phase == Phase.SETUP:
             from src.game.phases.election import ElectionPhase
 
             self.current_phase = ElectionPhase(self)
-            self.state.set_phase("election")
+            self.state.set_phase(Phase.ELECTION)
 
         while not self.state.game_over:
             next_phase = self.current_phase.execute()
             self.current_phase = next_phase
 
-            if isinstance(next_phase, type(self.current_phase)):
-                pass
-            else:
-                new_phase_name = next_phase.__class__.__name__.lower().replace(
-                    "phase", ""
-                )
-                self.state.set_phase(new_phase_name)
+            if self.state.phase != Phase.GAME_OVER:
+                self.state.set_phase(next_phase.phase)
 
-        self.state.set_phase("game_over")
+        self.state.set_phase(Phase.GAME_OVER)
         self.logger.log_game_end(self.state.winner, self.state.players, self)
         return self.state.winner
 
@@ -146,9 +156,12 @@ class SHXLGame:
             }
 
         phase_class = self.current_phase.__class__.__name__
-        phase_name = phase_class.lower().replace("phase", "")
 
-        return {"name": phase_name, "class": phase_class, "can_advance": True}
+        return {
+            "name": self.current_phase.phase,
+            "class": phase_class,
+            "can_advance": True,
+        }
 
     def assign_players(self):
         """Crea jugadores y asigna roles.
@@ -178,6 +191,9 @@ class SHXLGame:
         self.hitler_player = next(p for p in self.state.players if p.is_hitler)
 
         player_factory.update_player_strategies(self.state.players, self.ai_strategy)
+        for player in self.state.players:
+            if hasattr(player, "budget_stats"):
+                player.time_budget = self.bot_time_budget
 
     def inform_players(self):
         """Informa a los jugadores sobre sus roles y otros jugadores que deben conocer."""
@@ -297,6 +313,15 @@ class SHXLGame:
         else:
             self.state.election_tracker += 1
 
+        self.state.record_election(
+            {
+                player.id: vote
+                for player, vote in zip(
+                    self.state.active_players, self.state.last_votes
+                )
+            },
+            vote_passed,
+        )
         self.logger.log_election(
             self.state.president_candidate,
             self.state.chancellor_candidate,
@@ -381,10 +406,20 @@ class SHXLGame:
     def president_veto_accepted(self):
         """Pregunta al presidente si acepta el veto.
 
+        La decisión queda registrada en veto_history.
+
         Returns:
             bool: True si el veto es aceptado, False en caso contrario.
         """
-        return self.state.president.accept_veto()
+        accepted = self.state.president.accept_veto()
+        self.state.veto_history.append(
+            {
+                "president": getattr(self.state.president, "id", None),
+                "chancellor": getattr(self.state.chancellor, "id", None),
+                "accepted": bool(accepted),
+            }
+        )
+        return accepted
 
     def chancellor_policy_choice(self, policies):
         """Solicita al canciller que elija una política.
@@ -4,7 +4,16 @@ Este módulo contiene la implementación del estado mejorado del juego que
 soporta todas las características de Secret Hitler XL.
 """
 
-from random import randint
+import copy
+
+from src.game.game_logger import GameLogger, LogLevel
+from src.game.phases.phase_machine import (
+    Phase,
+    SubPhase,
+    resolve_phase_state,
+    validate_transition,
+)
+from src.game.rng import randint
 
 
 class EnhancedGameState:
@@ -12,14 +21,20 @@ class EnhancedGameState:
 
     Mantiene el estado completo del juego incluyendo jugadores, votaciones,
     políticas, poderes especiales y condiciones de fin del juego.
+
+    La fase y la sub-fase actuales (phase, sub_phase) son el único dato
+    autoritativo sobre el punto en que se encuentra la partida; solo cambian
+    mediante set_phase, que valida cada transición contra la tabla de
+    phase_machine.
     """
 
     def __init__(self):
         """Inicializa el estado del juego con valores por defecto."""
-        self.game_over = False
+        self.phase = Phase.SETUP
+        self.sub_phase = None
+        self._game_over = False
         self.winner = None
         self.round_number = 0
-        self.current_phase_name = "setup"
 
         self.players = []
         self.active_players = []
@@ -30,6 +45,8 @@ class EnhancedGameState:
         self.chancellor_candidate = None
         self.election_tracker = 0
         self.last_votes = []
+        self.election_history = []
+        self.veto_history = []
         self.term_limited_players = []
 
         self.special_election = False
@@ -59,6 +76,8 @@ class EnhancedGameState:
         self.month_counter = randint(1, 12)
         self.oktoberfest_active = False
         self.original_strategies = {}
+        self.beliefs = None
+        self.encoder = None
 
         self.month_names = {
             1: "January",
@@ -83,13 +102,104 @@ class EnhancedGameState:
         """
         return self.month_names.get(self.month_counter, f"Month {self.month_counter}")
 
-    def set_phase(self, phase_name):
+    def __setstate__(self, state):
+        """Restaura el estado desde una instantánea (pickle).
+
+        Las instantáneas anteriores a la máquina de fases guardaban la fase
+        como texto en current_phase_name; se convierten a phase/sub_phase. A
+        las instantáneas sin historial de votaciones o vetos se les añaden
+        historiales vacíos.
+
+        Args:
+            state (dict): Atributos de la instancia.
+        """
+        if "phase" not in state:
+            state = dict(state)
+            phase, sub_phase = resolve_phase_state(
+                state.pop("current_phase_name", None) or Phase.SETUP
+            )
+            state["phase"] = phase
+            state["sub_phase"] = sub_phase
+            state["_game_over"] = state.pop("game_over", False)
+        self.__dict__.update(state)
+        self.__dict__.setdefault("election_history", [])
+        self.__dict__.setdefault("veto_history", [])
+        self.__dict__.setdefault("beliefs", None)
+        self.__dict__.setdefault("encoder", None)
+
+    @property
+    def current_phase_name(self):
+        """Phase: Fase actual del juego (compatible con nombres de fase str)."""
+        return self.phase
+
+    @current_phase_name.setter
+    def current_phase_name(self, phase_name):
+        self.set_phase(phase_name)
+
+    @property
+    def game_over(self):
+        """bool: Si la partida ha terminado.
+
+        Marcar la partida como terminada la lleva a la fase game_over.
+        """
+        return self._game_over
+
+    @game_over.setter
+    def game_over(self, value):
+        self._game_over = value
+        if value:
+            self.set_phase(Phase.GAME_OVER)
+
+    def set_phase(self, phase, sub_phase=None):
         """Cambia la fase actual del juego.
 
         Args:
-            phase_name (str): Nombre de la nueva fase.
+            phase (Phase | str): Nueva fase.
+            sub_phase (SubPhase | str, optional): Nueva sub-fase. Por defecto la
+                sub-fase inicial de la fase.
+
+        Raises:
+            InvalidPhaseTransition: Si la transición no está permitida.
+        """
+        target = resolve_phase_state(phase, sub_phase)
+        validate_transition((self.phase, self.sub_phase), target)
+        self.phase, self.sub_phase = target
+
+    def set_sub_phase(self, sub_phase):
+        """Cambia la sub-fase dentro de la fase actual.
+
+        Args:
+            sub_phase (SubPhase | str): Nueva sub-fase.
+
+        Raises:
+            InvalidPhaseTransition: Si la transición no está permitida.
         """
-        self.current_phase_name = phase_name
+        self.set_phase(self.phase, SubPhase(sub_phase))
+
+    def fork(self, memo=None):
+        """Crea una copia independiente del estado para simular jugadas.
+
+        Copia en profundidad el estado, el tablero y los jugadores; las
+        políticas y los roles son inmutables y se comparten con el original.
+        El tablero de la copia usa un logger silencioso y la copia no mantiene
+        creencias sobre roles ni codificador de estado (beliefs y encoder son
+        None).
+
+        Args:
+            memo (dict, optional): Memo de copy.deepcopy con sustituciones
+                adicionales (por ejemplo, objetos que no deben copiarse).
+
+        Returns:
+            EnhancedGameState: Copia del estado.
+        """
+        memo = {} if memo is None else memo
+        if self.board is not None:
+            memo.setdefault(id(self.board.logger), GameLogger(LogLevel.NONE))
+        if getattr(self, "beliefs", None) is not None:
+            memo.setdefault(id(self.beliefs), None)
+        if getattr(self, "encoder", None) is not None:
+            memo.setdefault(id(self.encoder), None)
+        return copy.deepcopy(self, memo)
 
     def get_month_name(self, month_number):
         """Obtiene el nombre de un mes específico.
@@ -102,6 +212,23 @@ class EnhancedGameState:
         """
         return self.month_names.get(month_number, f"Month {month_number}")
 
+    def record_election(self, votes, passed):
+        """Registra una votación en election_history.
+
+        Args:
+            votes (dict): Votos por id de jugador {player_id: bool}.
+            passed (bool): Si el gobierno fue elegido.
+        """
+        self.election_history.append(
+            {
+                "president": getattr(self.president_candidate, "id", None),
+                "chancellor": getattr(self.chancellor_candidate, "id", None),
+                "votes": dict(votes),
+                "passed": passed,
+                "fascist_track": self.fascist_track,
+            }
+        )
+
     def reset_election_tracker(self):
         """Reinicia el contador de elecciones a 0."""
         self.election_tracker = 0
@@ -6,6 +6,8 @@ del juego como elección, legislativa, y fin de juego.
 
 from abc import ABC, abstractmethod
 
+from src.game.phases.phase_machine import Phase
+
 
 class GamePhase(ABC):
     """Clase base abstracta para las fases del juego.
@@ -16,8 +18,11 @@ class GamePhase(ABC):
 
     Attributes:
         game: Instancia principal del juego que contiene estado y métodos.
+        phase (Phase): Fase del estado del juego que representa la clase.
     """
 
+    phase: Phase
+
     def __init__(self, game):
         """Inicializa la fase del juego.
 
@@ -6,6 +6,7 @@ votación para candidatos a presidente y canciller en el juego.
 
 from src.game.phases.abstract_phase import GamePhase
 from src.game.phases.gameover import GameOverPhase
+from src.game.phases.phase_machine import Phase
 
 
 class ElectionPhase(GamePhase):
@@ -21,6 +22,8 @@ class ElectionPhase(GamePhase):
         game: La instancia principal del juego que contiene el estado y métodos.
     """
 
+    phase = Phase.ELECTION
+
     def execute(self):
         """Ejecuta la lógica de la fase electoral.
 
@@ -74,7 +77,6 @@ class ElectionPhase(GamePhase):
 
             self.game.state.president = self.game.state.president_candidate
             self.game.state.chancellor = self.game.state.chancellor_candidate
-            self.game.state.election_tracker = 0
             return LegislativePhase(self.game)
         else:
             self.game.state.president = self.game.state.president_candidate
@@ -4,6 +4,8 @@ Este módulo extrae funciones específicas de ElectionPhase para permitir
 control granular desde el API sin duplicar lógica electoral.
 """
 
+from src.game.phases.phase_machine import Phase
+
 
 def check_marked_for_execution(game):
     """Verifica y ejecuta jugadores marcados para ejecución.
@@ -133,6 +135,7 @@ def resolve_election(game, votes_dict):
     ja_votes = sum(1 for v in game.state.last_votes if v)
     total_votes = len(game.state.last_votes)
     vote_passed = ja_votes > total_votes // 2
+    game.state.record_election(votes_dict, vote_passed)
 
     result = {
         "passed": vote_passed,
@@ -191,6 +194,7 @@ def resolve_election(game, votes_dict):
         # Limpiar candidato y avanzar presidente
         game.state.chancellor_candidate = None
         advance_to_next_president(game)
+        game.state.set_phase(Phase.ELECTION)
 
     return result
 
@@ -221,11 +225,8 @@ def install_government(game):
     # Limpiar candidatos
     game.state.chancellor_candidate = None
 
-    # Reset election tracker
-    game.state.election_tracker = 0
-
     # Actualizar fase
-    game.state.current_phase_name = "legislative"
+    game.state.set_phase(Phase.LEGISLATIVE)
 
 
 def advance_to_next_president(game):
@@ -1,4 +1,5 @@
 from src.game.phases.abstract_phase import GamePhase
+from src.game.phases.phase_machine import Phase
 
 
 class GameOverPhase(GamePhase):
@@ -8,6 +9,8 @@ class GameOverPhase(GamePhase):
     Se encarga de finalizar el juego, revelar todos los roles y mantener el estado final.
     """
 
+    phase = Phase.GAME_OVER
+
     def execute(self):
         """Ejecuta la fase de fin del juego.
 
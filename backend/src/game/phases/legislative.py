@@ -8,6 +8,7 @@ y las acciones ejecutivas en el juego.
 from src.game.phases.abstract_phase import GamePhase
 from src.game.phases.election import ElectionPhase
 from src.game.phases.gameover import GameOverPhase
+from src.game.phases.phase_machine import Phase
 
 
 class LegislativePhase(GamePhase):
@@ -16,7 +17,10 @@ class LegislativePhase(GamePhase):
     La fase legislativa consiste en:
     1. El Presidente roba 3 políticas y descarta 1
     2. El Canciller recibe 2 políticas y puede proponer veto
-    3. El Presidente puede aceptar/rechazar el veto
+    3. El Presidente puede aceptar/rechazar el veto. Un veto aceptado cuenta
+       como un gobierno fallido: avanza el contador electoral (al llegar a 3
+       se promulga una política de caos) y la presidencia pasa al siguiente
+       jugador
     4. El Canciller promulga 1 política y descarta 1
     5. Ejecución de poder ejecutivo (si se otorga)
     6. Verificación de condiciones de victoria
@@ -26,6 +30,8 @@ class LegislativePhase(GamePhase):
         game: La instancia principal del juego que contiene el estado y métodos.
     """
 
+    phase = Phase.LEGISLATIVE
+
     def execute(self):
         """Ejecuta la lógica de la fase legislativa.
 
@@ -55,6 +61,19 @@ class LegislativePhase(GamePhase):
             if president_accepted:
                 self.game.state.board.discard(chosen)
                 self.game.state.election_tracker += 1
+
+                if self.game.state.election_tracker >= 3:
+                    self.game.logger.log(
+                        "\n> Three failed governments in a row. Enacting a chaos policy."
+                    )
+                    self.game.enact_chaos_policy()
+
+                    if self.game.check_policy_win():
+                        return GameOverPhase(self.game)
+
+                    self.game.state.term_limited_players = []
+
+                self.game.advance_turn()
                 return ElectionPhase(self.game)
 
         enacted, discarded = self.game.chancellor_policy_choice(chosen)
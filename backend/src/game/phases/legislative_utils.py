@@ -4,6 +4,8 @@ Este módulo extrae funciones específicas de LegislativePhase para permitir
 control granular desde el API sin duplicar lógica.
 """
 
+from src.game.phases.phase_machine import Phase, SubPhase
+
 
 def draw_presidential_policies(game):
     """Dibuja 3 políticas para decisión presidencial.
@@ -59,6 +61,7 @@ def handle_presidential_choice(game, policy_indices):
     game.state.chancellor_policies = chosen_policies
 
     game.state.presidential_policies = None
+    game.state.set_sub_phase(SubPhase.CHANCELLOR_ENACT)
 
     return {
         "chosen_policies": chosen_policies,
@@ -105,6 +108,10 @@ def check_veto_proposal(game):
 def handle_veto_decision(game, president_accepts_veto):
     """Maneja la decisión presidencial sobre veto.
 
+    Un veto aceptado cuenta como un gobierno fallido, igual que en
+    LegislativePhase: avanza el contador electoral (al llegar a 3 se promulga
+    una política de caos) y la presidencia pasa al siguiente jugador.
+
     Args:
         game: Instancia del juego.
         president_accepts_veto (bool): Si el presidente acepta el veto.
@@ -114,21 +121,47 @@ def handle_veto_decision(game, president_accepts_veto):
             - veto_accepted: Boolean indicando si el veto fue aceptado.
             - policies_discarded: Boolean indicando si las políticas fueron descartadas.
             - election_tracker_advanced: Boolean indicando si avanzó el contador electoral.
+            - chaos_triggered: Boolean indicando si se promulgó una política de caos.
+            - game_over: Boolean indicando si el juego terminó.
+            - winner: String con ganador o None.
             - next_phase: String con el nombre de la siguiente fase.
     """
     if president_accepts_veto:
-        if hasattr(game.state, "chancellor_policies"):
+        if getattr(game.state, "chancellor_policies", None):
             game.state.board.discard(game.state.chancellor_policies)
             game.state.chancellor_policies = None
 
-        game.state.election_tracker += 1
-
-        return {
+        result = {
             "veto_accepted": True,
             "policies_discarded": True,
             "election_tracker_advanced": True,
+            "chaos_triggered": False,
+            "game_over": False,
+            "winner": None,
             "next_phase": "election",
         }
+
+        game.state.election_tracker += 1
+
+        if game.state.election_tracker >= 3:
+            game.enact_chaos_policy()
+            result["chaos_triggered"] = True
+
+            if game.check_policy_win():
+                result["game_over"] = True
+                result["winner"] = getattr(game.state, "winner", "unknown")
+                result["next_phase"] = "game_over"
+                return result
+
+            game.state.term_limited_players = []
+
+        game.advance_turn()
+        game.state.president = game.state.president_candidate
+        game.state.chancellor = None
+        game.state.chancellor_candidate = None
+        game.state.set_phase(Phase.ELECTION)
+
+        return result
     else:
         return {
             "veto_accepted": False,
@@ -182,6 +215,7 @@ def handle_chancellor_choice(game, policy_index):
         getattr(game, "anti_policies_in_play", False),
     )
 
+    game.state.election_tracker = 0
     game.state.chancellor_policies = None
 
     game_over = False
@@ -426,20 +460,19 @@ def _execute_power_for_human(game, power_type, target_player_id):
             return {"success": False, "error": "Target player is already dead"}
 
         original_method = None
+        president = game.state.president
 
         if power_type == "execution":
-            original_method = game.state.president.kill
-            game.state.president.kill = lambda: target_player
+            original_method = president.kill
+            president.kill = lambda: target_player
 
         elif power_type == "investigation":
-            original_method = game.state.president.choose_player_to_investigate
-            game.state.president.choose_player_to_investigate = (
-                lambda eligible: target_player
-            )
+            original_method = president.choose_player_to_investigate
+            president.choose_player_to_investigate = lambda eligible: target_player
 
         elif power_type == "special_election":
-            original_method = game.state.president.choose_next_president
-            game.state.president.choose_next_president = lambda eligible: target_player
+            original_method = president.choose_next_president
+            president.choose_next_president = lambda eligible: target_player
 
         try:
             result = game.execute_power(power_type)
@@ -527,11 +560,11 @@ def _execute_power_for_human(game, power_type, target_player_id):
         finally:
             if original_method:
                 if power_type == "execution":
-                    game.state.president.kill = original_method
+                    president.kill = original_method
                 elif power_type == "investigation":
-                    game.state.president.choose_player_to_investigate = original_method
+                    president.choose_player_to_investigate = original_method
                 elif power_type == "special_election":
-                    game.state.president.choose_next_president = original_method
+                    president.choose_next_president = original_method
 
     elif power_type == "policy_peek":
         result = game.execute_power(power_type)
@@ -650,7 +683,7 @@ def end_legislative_session(game):
 
     game.state.chancellor = None
     game.state.chancellor_candidate = None
-    game.state.current_phase_name = "election"
+    game.state.set_phase(Phase.ELECTION)
 
     return {
         "term_limits_set": True,
@@ -712,6 +745,7 @@ def run_full_legislative_cycle(game):
         )
         game.state.board.discard(discarded)
         game.state.chancellor_policies = chosen
+        game.state.set_sub_phase(SubPhase.CHANCELLOR_ENACT)
 
         presidential_choice = {
             "chosen_names": [policy.type for policy in chosen],
@@ -719,6 +753,7 @@ def run_full_legislative_cycle(game):
             "automatic": True,
         }
     else:
+        game.state.set_sub_phase(SubPhase.PRESIDENT_DISCARD)
         return {
             "phase": "presidential_choice",
             "presidential_draw": {
@@ -739,7 +774,9 @@ def run_full_legislative_cycle(game):
                 return {
                     "phase": "veto_accepted",
                     "veto_result": veto_result,
-                    "next_phase": "election",
+                    "game_over": veto_result["game_over"],
+                    "winner": veto_result["winner"],
+                    "next_phase": veto_result["next_phase"],
                 }
         else:
             return {
@@ -761,6 +798,7 @@ def run_full_legislative_cycle(game):
             getattr(game, "emergency_powers_in_play", False),
             getattr(game, "anti_policies_in_play", False),
         )
+        game.state.election_tracker = 0
 
         chancellor_choice = {
             "enacted_name": enacted.type,
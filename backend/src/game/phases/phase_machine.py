@@ -0,0 +1,157 @@
+"""Máquina de estados de las fases del juego Secret Hitler XL.
+
+Este módulo define las fases y sub-fases del juego como enumeraciones y una
+tabla de transiciones precalculada. El estado del juego guarda la fase y la
+sub-fase actuales como único dato autoritativo, de modo que las rutas de la
+API comprueban la fase en tiempo constante en lugar de inferirla a partir de
+otros atributos del estado.
+"""
+
+from enum import StrEnum
+from typing import Dict, FrozenSet, Optional, Tuple
+
+
+class Phase(StrEnum):
+    """Fases del juego.
+
+    Los valores coinciden con los nombres de fase que expone la API.
+    """
+
+    SETUP = "setup"
+    ELECTION = "election"
+    VOTING = "voting"
+    LEGISLATIVE = "legislative"
+    EXECUTIVE_POWER = "executive_power"
+    GAME_OVER = "game_over"
+
+
+class SubPhase(StrEnum):
+    """Sub-fases del juego dentro de cada fase."""
+
+    NOMINATION = "nomination"
+    VOTING = "voting"
+    DRAW_POLICIES = "draw_policies"
+    PRESIDENT_DISCARD = "president_discard"
+    CHANCELLOR_ENACT = "chancellor_enact"
+    EXECUTE_POWER = "execute_power"
+
+
+PhaseState = Tuple[Phase, Optional[SubPhase]]
+
+
+class InvalidPhaseTransition(ValueError):
+    """Se intenta pasar a una fase no permitida desde la fase actual."""
+
+    def __init__(self, current, target):
+        """Inicializa el error.
+
+        Args:
+            current (PhaseState): Fase y sub-fase actuales.
+            target (PhaseState): Fase y sub-fase solicitadas.
+        """
+        super().__init__(
+            f"Invalid phase transition {_describe(current)} -> {_describe(target)}"
+        )
+        self.current = current
+        self.target = target
+
+
+DEFAULT_SUB_PHASES: Dict[Phase, Optional[SubPhase]] = {
+    Phase.SETUP: None,
+    Phase.ELECTION: SubPhase.NOMINATION,
+    Phase.VOTING: SubPhase.VOTING,
+    Phase.LEGISLATIVE: SubPhase.DRAW_POLICIES,
+    Phase.EXECUTIVE_POWER: SubPhase.EXECUTE_POWER,
+    Phase.GAME_OVER: None,
+}
+
+SETUP: PhaseState = (Phase.SETUP, None)
+NOMINATION: PhaseState = (Phase.ELECTION, SubPhase.NOMINATION)
+VOTING: PhaseState = (Phase.VOTING, SubPhase.VOTING)
+DRAW_POLICIES: PhaseState = (Phase.LEGISLATIVE, SubPhase.DRAW_POLICIES)
+PRESIDENT_DISCARD: PhaseState = (Phase.LEGISLATIVE, SubPhase.PRESIDENT_DISCARD)
+CHANCELLOR_ENACT: PhaseState = (Phase.LEGISLATIVE, SubPhase.CHANCELLOR_ENACT)
+EXECUTE_POWER: PhaseState = (Phase.EXECUTIVE_POWER, SubPhase.EXECUTE_POWER)
+GAME_OVER: PhaseState = (Phase.GAME_OVER, None)
+
+# Transiciones explícitas; cualquier estado puede además repetirse a sí mismo
+# y pasar a fin de juego.
+_EDGES: Dict[PhaseState, Tuple[PhaseState, ...]] = {
+    SETUP: (NOMINATION,),
+    # Nominación: la API pasa a votación; el ciclo automático de bots y el
+    # motor del juego resuelven la elección entera de una vez.
+    NOMINATION: (VOTING, DRAW_POLICIES),
+    VOTING: (NOMINATION, DRAW_POLICIES),
+    # Robo: presidente humano descarta; presidente bot descarta en el acto.
+    # El motor del juego ejecuta la sesión legislativa completa.
+    DRAW_POLICIES: (PRESIDENT_DISCARD, CHANCELLOR_ENACT, NOMINATION),
+    PRESIDENT_DISCARD: (CHANCELLOR_ENACT,),
+    CHANCELLOR_ENACT: (EXECUTE_POWER, NOMINATION),
+    EXECUTE_POWER: (NOMINATION,),
+    GAME_OVER: (),
+}
+
+TRANSITIONS: Dict[PhaseState, FrozenSet[PhaseState]] = {
+    state: frozenset(edges + (state, GAME_OVER)) for state, edges in _EDGES.items()
+}
+
+
+def _describe(phase_state):
+    """Representa una fase y sub-fase como texto.
+
+    Args:
+        phase_state (PhaseState): Fase y sub-fase.
+
+    Returns:
+        str: Texto "fase/sub-fase" o solo "fase".
+    """
+    phase, sub_phase = phase_state
+    return f"{phase}/{sub_phase}" if sub_phase else str(phase)
+
+
+def resolve_phase_state(phase, sub_phase=None):
+    """Normaliza una fase y sub-fase a sus enumeraciones.
+
+    Args:
+        phase (Phase | str): Fase destino.
+        sub_phase (SubPhase | str, optional): Sub-fase destino. Por defecto la
+            sub-fase inicial de la fase.
+
+    Returns:
+        PhaseState: Fase y sub-fase normalizadas.
+
+    Raises:
+        ValueError: Si la fase o la sub-fase no existen.
+    """
+    phase = Phase(phase)
+    if sub_phase is None:
+        return phase, DEFAULT_SUB_PHASES[phase]
+    return phase, SubPhase(sub_phase)
+
+
+def can_transition(current, target):
+    """Indica si una transición está permitida.
+
+    Args:
+        current (PhaseState): Fase y sub-fase actuales.
+        target (PhaseState): Fase y sub-fase destino.
+
+    Returns:
+        bool: True si la transición aparece en la tabla.
+    """
+    allowed = TRANSITIONS.get(current)
+    return allowed is not None and target in allowed
+
+
+def validate_transition(current, target):
+    """Comprueba una transición contra la tabla de transiciones.
+
+    Args:
+        current (PhaseState): Fase y sub-fase actuales.
+        target (PhaseState): Fase y sub-fase destino.
+
+    Raises:
+        InvalidPhaseTransition: Si la transición no está permitida.
+    """
+    if not can_transition(current, target):
+        raise InvalidPhaseTransition(current, target)
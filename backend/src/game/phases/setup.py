@@ -1,5 +1,6 @@
 from src.game.phases.abstract_phase import GamePhase
 from src.game.phases.election import ElectionPhase
+from src.game.phases.phase_machine import Phase
 
 
 class SetupPhase(GamePhase):
@@ -10,6 +11,8 @@ class SetupPhase(GamePhase):
     automáticamente a la fase de elección.
     """
 
+    phase = Phase.SETUP
+
     def execute(self):
         """Ejecuta la fase de configuración.
 
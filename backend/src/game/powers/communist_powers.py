@@ -76,8 +76,7 @@ class FiveYearPlan(Power):
         Returns:
             bool: True si la operación fue exitosa.
         """
-        from random import shuffle
-
+        from src.game.rng import shuffle
         from src.policies.policy import Communist, Liberal
 
         new_policies = [Communist(), Communist(), Liberal()]
@@ -4,8 +4,6 @@ Este módulo contiene la clase PowerRegistry que gestiona todos los poderes
 disponibles en el juego, incluyendo poderes fascistas, comunistas y de emergencia.
 """
 
-from random import choice
-
 from src.game.powers.abstract_power import (
     Bugging,
     Confession,
@@ -34,6 +32,7 @@ from src.game.powers.enabling_act_powers import (
     ChancellorPropaganda,
     VoteOfNoConfidence,
 )
+from src.game.rng import choice
 
 
 class PowerRegistry:
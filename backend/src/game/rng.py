@@ -0,0 +1,67 @@
+"""Generador aleatorio del motor de Secret Hitler XL.
+
+El motor y las estrategias obtienen sus números aleatorios a través de las
+funciones de este módulo, que delegan en el módulo random global salvo que el
+hilo actual haya instalado un generador propio con use_generator. Así una
+búsqueda MCTS puede jugar sus simulaciones con un random.Random exclusivo sin
+alterar el generador global ni interferir con las búsquedas de otros hilos.
+"""
+
+import random as _random
+import threading
+from contextlib import contextmanager
+
+_local = threading.local()
+
+
+def current_generator():
+    """Obtiene el generador activo en el hilo actual.
+
+    Returns:
+        random.Random: Generador instalado con use_generator o, si no hay
+            ninguno, el módulo random global.
+    """
+    return getattr(_local, "generator", None) or _random
+
+
+@contextmanager
+def use_generator(generator):
+    """Instala un generador para el hilo actual mientras dure el bloque.
+
+    Args:
+        generator (random.Random): Generador a utilizar.
+
+    Yields:
+        random.Random: El generador instalado.
+    """
+    previous = getattr(_local, "generator", None)
+    _local.generator = generator
+    try:
+        yield generator
+    finally:
+        _local.generator = previous
+
+
+def random():
+    """Devuelve un número aleatorio en [0, 1) del generador activo."""
+    return current_generator().random()
+
+
+def choice(seq):
+    """Elige un elemento aleatorio de una secuencia no vacía."""
+    return current_generator().choice(seq)
+
+
+def shuffle(seq):
+    """Baraja una lista en el sitio."""
+    current_generator().shuffle(seq)
+
+
+def randint(a, b):
+    """Devuelve un entero aleatorio en [a, b]."""
+    return current_generator().randint(a, b)
+
+
+def getrandbits(k):
+    """Devuelve un entero con k bits aleatorios."""
+    return current_generator().getrandbits(k)
@@ -0,0 +1,510 @@
+"""Creencias bayesianas sobre los roles ocultos de Secret Hitler XL.
+
+RoleBeliefs mantiene, para cada jugador que la consulta (observador), una
+nube de partículas: asignaciones completas de roles compatibles con lo que
+ese jugador sabe con certeza (su propio rol, los compañeros que conoce, las
+investigaciones y las afiliaciones reveladas). Cada partícula se pondera con
+la verosimilitud de la evidencia pública de la partida:
+
+- Votaciones: los fascistas y comunistas apoyan más a los gobiernos con
+  compañeros de partido; los liberales votan sin conocer a nadie.
+- Políticas promulgadas: cada miembro del gobierno aumenta la probabilidad
+  de que salga la política de su partido, partiendo de la composición del
+  mazo.
+- Vetos: un veto aceptado sugiere un gobierno del mismo partido y uno
+  rechazado, lo contrario.
+- Hechos públicos: un jugador ejecutado sin que termine la partida, o un
+  canciller elegido con 3 o más políticas fascistas, no es Hitler.
+
+La evidencia se lee de forma incremental de los historiales del estado
+(election_history, policy_history y veto_history), de modo que no hace
+falta instrumentar cada acción. Las marginales de cada observador se
+recalculan solo cuando cambia la evidencia o su conocimiento, y se consultan
+en O(1) mediante BeliefView.
+"""
+
+import itertools
+
+import numpy as np
+from src.game.rng import getrandbits
+
+ROLES = ("liberal", "fascist", "hitler", "communist")
+PARTIES = ("liberal", "fascist", "communist")
+ROLE_INDEX = {role: index for index, role in enumerate(ROLES)}
+PARTY_INDEX = {party: index for index, party in enumerate(PARTIES)}
+ROLE_PARTY = np.array([0, 1, 1, 2], dtype=np.int8)
+PARTY_ROLES = np.array(
+    [[party == role_party for role_party in ROLE_PARTY] for party in range(3)]
+)
+HITLER = ROLE_INDEX["hitler"]
+
+POLICY_PARTY = {
+    "liberal": 0,
+    "socialdemocratic": 0,
+    "fascist": 1,
+    "anticommunist": 1,
+    "communist": 2,
+    "antifascist": 2,
+}
+
+EVIDENCE_KINDS = ("vote", "policy", "veto")
+
+DEFAULT_PARTICLES = 256
+SAMPLING_ROUNDS = 20
+RESAMPLE_THRESHOLD = 0.3
+MOVE_STEPS = 16
+
+# Orden de preferencia de cada partido al descartar y promulgar políticas.
+PREFERENCES = ((0, 2, 1), (1, 2, 0), (2, 0, 1))
+LEGISLATIVE_NOISE = 0.1
+# Probabilidad de votar Ja por partido: (sin compañeros, con compañeros en
+# el gobierno). Los liberales no conocen a nadie.
+JA_TABLE = np.array([[0.6, 0.6], [0.73, 0.95], [0.57, 0.9]])
+LOG_VOTE = np.log(np.stack([1.0 - JA_TABLE, JA_TABLE], axis=-1))
+VETO_SAME_PARTY = 0.7
+
+
+class BeliefView:
+    """Probabilidades marginales de un observador sobre cada jugador.
+
+    Attributes:
+        roles (numpy.ndarray): Matriz jugadores x roles con P(rol).
+        parties (numpy.ndarray): Matriz jugadores x partidos con P(partido).
+    """
+
+    def __init__(self, index, roles):
+        """Inicializa la vista.
+
+        Args:
+            index (dict): Posición de cada id de jugador en las matrices.
+            roles (numpy.ndarray): Matriz jugadores x roles con P(rol).
+        """
+        self._index = index
+        self.roles = roles
+        self.parties = roles @ PARTY_ROLES.T
+
+    def role(self, player, role):
+        """Probabilidad de que un jugador tenga un rol.
+
+        Args:
+            player (Player | int): Jugador o id de jugador.
+            role (str): "liberal", "fascist", "hitler" o "communist".
+
+        Returns:
+            float: Probabilidad marginal.
+        """
+        index = self._index.get(getattr(player, "id", player))
+        if index is None:
+            return 0.0
+        return float(self.roles[index, ROLE_INDEX[role]])
+
+    def party(self, player, party):
+        """Probabilidad de que un jugador pertenezca a un partido.
+
+        Args:
+            player (Player | int): Jugador o id de jugador.
+            party (str): "liberal", "fascist" (incluye a Hitler) o "communist".
+
+        Returns:
+            float: Probabilidad marginal.
+        """
+        index = self._index.get(getattr(player, "id", player))
+        if index is None:
+            return 0.0
+        return float(self.parties[index, PARTY_INDEX[party]])
+
+    def uncertainty(self, player):
+        """Incertidumbre sobre el partido de un jugador.
+
+        Args:
+            player (Player | int): Jugador o id de jugador.
+
+        Returns:
+            float: 1 menos la probabilidad del partido más probable.
+        """
+        index = self._index.get(getattr(player, "id", player))
+        if index is None:
+            return 0.0
+        return float(1.0 - self.parties[index].max())
+
+
+class _ObserverFilter:
+    """Nube de partículas de un observador."""
+
+    def __init__(self, allowed, particles):
+        self.allowed = allowed
+        self.particles = particles
+        self.log_weights = np.zeros(len(particles))
+        self.applied = (0,) * len(EVIDENCE_KINDS)
+        self.view = None
+
+
+class RoleBeliefs:
+    """Motor de creencias sobre roles compartido por los bots de una partida.
+
+    Attributes:
+        state (EnhancedGameState): Estado de la partida observada.
+        particle_count (int): Partículas por observador.
+        player_ids (list): Ids de los jugadores, en orden de asiento.
+        pool (numpy.ndarray): Roles repartidos (composición pública).
+        evidence (dict): Evidencia pública procesada, como filas de índices
+            por tipo: "vote" (presidente, canciller, votante, voto), "policy"
+            (presidente, canciller, partido) y "veto" (presidente, canciller,
+            aceptado).
+    """
+
+    def __init__(self, state, particle_count=DEFAULT_PARTICLES, seed=None):
+        """Inicializa el motor para una partida ya repartida.
+
+        Args:
+            state (EnhancedGameState): Estado con jugadores y tablero.
+            particle_count (int): Partículas por observador.
+            seed (int, optional): Semilla del generador. Por defecto se toma
+                del generador activo del motor (ver src.game.rng), para que
+                las partidas con semilla sean reproducibles.
+        """
+        self.state = state
+        self.particle_count = particle_count
+        self.rng = np.random.default_rng(
+            getrandbits(32) if seed is None else seed
+        )
+        self.pool = np.array(
+            sorted(
+                ROLE_INDEX[player.role.role]
+                for player in state.players
+                if getattr(player.role, "role", None) in ROLE_INDEX
+            ),
+            dtype=np.int8,
+        )
+        self.player_ids = None
+        self.legislative_table = None
+
+    def _check_players(self):
+        """Prepara el motor la primera vez y si cambian los ids de los jugadores.
+
+        La tabla legislativa se calcula en la primera consulta. La API reasigna los
+        ids de los jugadores después del reparto; la evidencia se indexa por
+        posición y se vuelve a leer de los historiales.
+        """
+        player_ids = [player.id for player in self.state.players]
+        if player_ids == self.player_ids:
+            return
+        if self.legislative_table is None:
+            self.legislative_table = self._legislative_table(self.state.board)
+        self.player_ids = player_ids
+        self._index = {player_id: index for index, player_id in enumerate(player_ids)}
+        self.evidence = {kind: [] for kind in EVIDENCE_KINDS}
+        self._cleared_chancellors = set()
+        self._seen = {"election": 0, "policy": 0, "veto": 0}
+        self._filters = {}
+
+    def __getstate__(self):
+        """Excluye las partículas de las instantáneas; se reconstruyen al leer."""
+        state = dict(self.__dict__)
+        state["_filters"] = {}
+        return state
+
+    @staticmethod
+    def _legislative_table(board):
+        """Probabilidad de cada política según los partidos del gobierno.
+
+        Modela una sesión legislativa: se roban 3 cartas con la composición
+        del mazo inicial (mazo, descartes y políticas ya promulgadas), el
+        presidente descarta la que menos prefiere su partido y el canciller
+        promulga la que más prefiere el suyo. Se mezcla con la composición
+        del mazo para tolerar jugadas inesperadas.
+
+        Args:
+            board (GameBoard): Tablero con el mazo repartido.
+
+        Returns:
+            numpy.ndarray: Log-probabilidades [presidente, canciller, política].
+        """
+        counts = np.ones(len(PARTIES))
+        for party in PARTIES:
+            counts[PARTY_INDEX[party]] += getattr(board, f"{party}_track", 0)
+        for policy in list(getattr(board, "policies", [])) + list(
+            getattr(board, "discards", [])
+        ):
+            party = POLICY_PARTY.get(policy.type)
+            if party is not None:
+                counts[party] += 1
+        rates = counts / counts.sum()
+
+        table = np.zeros((len(PARTIES),) * 3)
+        for draw in itertools.product(range(len(PARTIES)), repeat=3):
+            probability = np.prod(rates[list(draw)])
+            for president, chancellor in np.ndindex(table.shape[:2]):
+                kept = sorted(draw, key=PREFERENCES[president].index)[:2]
+                enacted = min(kept, key=PREFERENCES[chancellor].index)
+                table[president, chancellor, enacted] += probability
+        return np.log((1 - LEGISLATIVE_NOISE) * table + LEGISLATIVE_NOISE * rates)
+
+    def view(self, observer):
+        """Devuelve las marginales de un observador.
+
+        Args:
+            observer (Player): Jugador cuyo conocimiento se usa.
+
+        Returns:
+            BeliefView: Probabilidades por jugador.
+        """
+        self._check_players()
+        self._sync()
+        allowed = self._constraints(observer)
+        observer_filter = self._filters.get(observer.id)
+        if observer_filter is None or not np.array_equal(
+            observer_filter.allowed, allowed
+        ):
+            observer_filter = _ObserverFilter(allowed, self._sample(allowed))
+            self._filters[observer.id] = observer_filter
+        applied = self._evidence_counts()
+        if observer_filter.applied != applied:
+            observer_filter.log_weights += self._log_likelihood(
+                observer_filter.particles, observer_filter.applied
+            )
+            observer_filter.applied = applied
+            observer_filter.view = None
+
+        if observer_filter.view is None:
+            weights = self._normalized(observer_filter.log_weights)
+            if 1.0 / np.sum(weights**2) < RESAMPLE_THRESHOLD * len(weights):
+                self._resample_move(observer_filter, weights)
+                weights = self._normalized(observer_filter.log_weights)
+            roles = np.stack(
+                [
+                    weights @ (observer_filter.particles == role)
+                    for role in range(len(ROLES))
+                ],
+                axis=1,
+            )
+            observer_filter.view = BeliefView(self._index, roles)
+        return observer_filter.view
+
+    def _sync(self):
+        """Incorpora la evidencia pública nueva de los historiales del estado."""
+        elections = getattr(self.state, "election_history", [])
+        for entry in elections[self._seen["election"] :]:
+            government = self._government(entry)
+            voters = [
+                (self._index[player_id], vote)
+                for player_id, vote in entry["votes"].items()
+                if player_id in self._index
+            ]
+            if government:
+                self.evidence["vote"].extend(
+                    (*government, voter, int(bool(vote))) for voter, vote in voters
+                )
+            if government and entry["passed"] and entry["fascist_track"] >= 3:
+                self._cleared_chancellors.add(government[1])
+        self._seen["election"] = len(elections)
+
+        policies = getattr(self.state, "policy_history", [])
+        for entry in policies[self._seen["policy"] :]:
+            president = getattr(entry["president"], "id", None)
+            chancellor = getattr(entry["chancellor"], "id", None)
+            government = self._government(
+                {"president": president, "chancellor": chancellor}
+            )
+            party = POLICY_PARTY.get(entry["policy"])
+            if government and party is not None and not entry.get("chaos"):
+                self.evidence["policy"].append((*government, party))
+        self._seen["policy"] = len(policies)
+
+        vetoes = getattr(self.state, "veto_history", [])
+        for entry in vetoes[self._seen["veto"] :]:
+            government = self._government(entry)
+            if government:
+                self.evidence["veto"].append((*government, int(entry["accepted"])))
+        self._seen["veto"] = len(vetoes)
+
+    def _government(self, entry):
+        """Posiciones del presidente y el canciller de una entrada de historial.
+
+        Args:
+            entry (dict): Entrada con ids en "president" y "chancellor".
+
+        Returns:
+            tuple or None: (presidente, canciller), o None si falta alguno.
+        """
+        president = self._index.get(entry.get("president"))
+        chancellor = self._index.get(entry.get("chancellor"))
+        if president is None or chancellor is None:
+            return None
+        return president, chancellor
+
+    def _constraints(self, observer):
+        """Roles posibles de cada jugador según lo que sabe el observador.
+
+        Args:
+            observer (Player): Jugador cuyo conocimiento se usa.
+
+        Returns:
+            numpy.ndarray: Matriz booleana jugadores x roles.
+        """
+        allowed = np.ones((len(self.player_ids), len(ROLES)), dtype=bool)
+
+        def restrict(player, roles):
+            index = self._index.get(getattr(player, "id", player))
+            if index is None:
+                return
+            narrowed = allowed[index] & roles
+            allowed[index] = narrowed if narrowed.any() else roles
+
+        not_hitler = np.arange(len(ROLES)) != HITLER
+        if not self.state.game_over:
+            for player in self.state.players:
+                if player.is_dead:
+                    restrict(player, not_hitler)
+            for index in self._cleared_chancellors:
+                restrict(self.player_ids[index], not_hitler)
+
+        affiliations = dict(getattr(self.state, "revealed_affiliations", {}))
+        affiliations.update(getattr(observer, "known_affiliations", None) or {})
+        affiliations.update(getattr(observer, "inspected_players", None) or {})
+        for player_id, party in affiliations.items():
+            if party in PARTY_INDEX:
+                restrict(player_id, PARTY_ROLES[PARTY_INDEX[party]])
+
+        for player_id in getattr(observer, "known_communists", None) or []:
+            restrict(player_id, np.arange(len(ROLES)) == ROLE_INDEX["communist"])
+        for fascist in getattr(observer, "fascists", None) or []:
+            restrict(fascist, np.arange(len(ROLES)) == ROLE_INDEX["fascist"])
+        hitler = getattr(observer, "hitler", None)
+        if hitler is not None:
+            restrict(hitler, np.arange(len(ROLES)) == HITLER)
+
+        own_index = self._index.get(observer.id)
+        if own_index is not None and observer.role is not None:
+            allowed[own_index] = np.arange(len(ROLES)) == ROLE_INDEX[observer.role.role]
+        return allowed
+
+    def _sample(self, allowed):
+        """Muestrea asignaciones de roles compatibles con las restricciones.
+
+        Los jugadores con un único rol posible se fijan y el resto de roles se
+        baraja entre los demás, descartando las asignaciones incompatibles.
+
+        Args:
+            allowed (numpy.ndarray): Matriz booleana jugadores x roles.
+
+        Returns:
+            numpy.ndarray: Partículas (partículas x jugadores).
+        """
+        count = self.particle_count
+        fixed = allowed.sum(axis=1) == 1
+        fixed_roles = allowed[fixed].argmax(axis=1)
+        pool = list(self.pool)
+        for role in fixed_roles:
+            if role in pool:
+                pool.remove(role)
+            else:
+                # Una radicalización cambia la composición real: se retira el
+                # rol más frecuente para mantener el número de jugadores.
+                pool.remove(max(set(pool), key=pool.count))
+        free = np.flatnonzero(~fixed)
+
+        accepted = []
+        needed = count
+        batch = np.tile(np.array(pool, dtype=np.int8), (count, 1))
+        for _ in range(SAMPLING_ROUNDS):
+            batch = self.rng.permuted(batch, axis=1)
+            valid = allowed[free, batch].all(axis=1)
+            accepted.append(batch[valid])
+            needed -= int(valid.sum())
+            if needed <= 0:
+                break
+        accepted = np.concatenate(accepted)
+        if len(accepted) == 0:
+            accepted = batch
+        elif len(accepted) < count:
+            accepted = accepted[self.rng.integers(len(accepted), size=count)]
+
+        particles = np.empty((count, len(self.player_ids)), dtype=np.int8)
+        particles[:, fixed] = fixed_roles
+        particles[:, free] = accepted[:count]
+        return particles
+
+    def _evidence_counts(self):
+        """Número de filas de evidencia de cada tipo."""
+        return tuple(len(self.evidence[kind]) for kind in EVIDENCE_KINDS)
+
+    def _log_likelihood(self, particles, start=None):
+        """Log-verosimilitud de la evidencia para cada partícula.
+
+        Args:
+            particles (numpy.ndarray): Partículas (partículas x jugadores).
+            start (tuple, optional): Filas de cada tipo ya incorporadas; solo
+                se evalúa la evidencia posterior. Por defecto, toda.
+
+        Returns:
+            numpy.ndarray: Log-verosimilitud por partícula.
+        """
+        start = start or (0,) * len(EVIDENCE_KINDS)
+        parties = ROLE_PARTY[particles]
+        total = np.zeros(len(particles))
+        rows = {
+            kind: np.array(self.evidence[kind][offset:], dtype=np.intp)
+            for kind, offset in zip(EVIDENCE_KINDS, start)
+        }
+
+        if len(rows["vote"]):
+            president, chancellor, voter, vote = rows["vote"].T
+            voter_parties = parties[:, voter]
+            teammate = (voter_parties == parties[:, president]) | (
+                voter_parties == parties[:, chancellor]
+            )
+            total += LOG_VOTE[voter_parties, teammate.astype(np.intp), vote].sum(axis=1)
+
+        if len(rows["policy"]):
+            president, chancellor, party = rows["policy"].T
+            total += self.legislative_table[
+                parties[:, president], parties[:, chancellor], party
+            ].sum(axis=1)
+
+        if len(rows["veto"]):
+            president, chancellor, accepted = rows["veto"].T
+            same = parties[:, president] == parties[:, chancellor]
+            total += np.where(
+                same == accepted.astype(bool),
+                np.log(VETO_SAME_PARTY),
+                np.log(1.0 - VETO_SAME_PARTY),
+            ).sum(axis=1)
+        return total
+
+    @staticmethod
+    def _normalized(log_weights):
+        """Convierte log-pesos en pesos normalizados."""
+        weights = np.exp(log_weights - log_weights.max())
+        return weights / weights.sum()
+
+    def _resample_move(self, observer_filter, weights):
+        """Remuestrea las partículas y las diversifica con pasos de Metropolis.
+
+        Cada paso propone intercambiar los roles de dos jugadores y lo acepta
+        según la verosimilitud de toda la evidencia, respetando las
+        restricciones del observador.
+
+        Args:
+            observer_filter (_ObserverFilter): Nube a remuestrear.
+            weights (numpy.ndarray): Pesos normalizados actuales.
+        """
+        count = len(weights)
+        rows = np.arange(count)
+        particles = observer_filter.particles[
+            self.rng.choice(count, size=count, p=weights)
+        ]
+        likelihood = self._log_likelihood(particles)
+        allowed = observer_filter.allowed
+        for _ in range(MOVE_STEPS):
+            first, second = self.rng.integers(len(self.player_ids), size=(2, count))
+            a, b = particles[rows, first], particles[rows, second]
+            proposal = particles.copy()
+            proposal[rows, first], proposal[rows, second] = b, a
+            valid = (a != b) & allowed[first, b] & allowed[second, a]
+            proposed = self._log_likelihood(proposal)
+            accept = valid & (np.log(self.rng.random(count)) < proposed - likelihood)
+            particles[accept] = proposal[accept]
+            likelihood[accept] = proposed[accept]
+        observer_filter.particles = particles
+        observer_filter.log_weights = np.zeros(count)
@@ -0,0 +1,366 @@
+"""Vista numérica de tamaño fijo del estado de Secret Hitler XL.
+
+StateEncoder mantiene, para cada jugador que la consulta (observador), un
+vector de NumPy de FEATURE_SIZE valores con lo que ese jugador ve de la
+partida, pensado para modelos aprendidos y análisis:
+
+- Cabecera (HEADER_FIELDS): tableros, contador de elecciones, jugadores
+  vivos, facción propia, veto y composición pública del mazo.
+- Asientos (SEAT_FIELDS): una fila por asiento hasta MAX_PLAYERS, empezando
+  por el del observador y en el orden de la mesa: vivo, limitado por
+  mandato, presidente, canciller, partido o Hitler conocidos con certeza y
+  resumen de su historial (votos a favor, gobiernos elegidos y políticas
+  promulgadas por sus gobiernos). Los asientos vacíos quedan a cero.
+
+Como RoleBeliefs, el codificador no instrumenta cada acción: los
+historiales (election_history y policy_history) se leen de forma
+incremental, y cada bloque de campos escalares se compara con una
+firma barata y solo se reescribe cuando cambia. Consultar el vector de un
+observador sin cambios en la partida es O(1); tras un evento solo se
+actualizan los campos afectados y se recompone el vector.
+"""
+
+import numpy as np
+from src.policies.deck_odds import POLICY_TYPES
+
+MAX_PLAYERS = 16
+FACTIONS = ("liberal", "fascist", "communist")
+
+HEADER_FIELDS = (
+    "liberal_track",
+    "fascist_track",
+    "communist_track",
+    "election_tracker",
+    "alive",
+    "players",
+    "faction_liberal",
+    "faction_fascist",
+    "faction_communist",
+    "is_hitler",
+    "veto_available",
+    "deck_liberal",
+    "deck_fascist",
+    "deck_communist",
+)
+SEAT_FIELDS = (
+    "alive",
+    "term_limited",
+    "president",
+    "chancellor",
+    "known_liberal",
+    "known_fascist",
+    "known_communist",
+    "known_hitler",
+    "ja_rate",
+    "governments",
+    "liberal_enacted",
+    "fascist_enacted",
+    "communist_enacted",
+)
+HEADER_SIZE = len(HEADER_FIELDS)
+SEAT_SIZE = len(SEAT_FIELDS)
+FEATURE_SIZE = HEADER_SIZE + MAX_PLAYERS * SEAT_SIZE
+
+HEADER = {name: index for index, name in enumerate(HEADER_FIELDS)}
+SEAT = {name: index for index, name in enumerate(SEAT_FIELDS)}
+KNOWN = slice(SEAT["known_liberal"], SEAT["known_hitler"] + 1)
+DECK_TYPES = tuple(POLICY_TYPES.index(f) for f in FACTIONS)
+POLICY_PARTY = {
+    "liberal": 0,
+    "socialdemocratic": 0,
+    "fascist": 1,
+    "anticommunist": 1,
+    "communist": 2,
+    "antifascist": 2,
+}
+_UNSET = object()
+
+
+class StateEncoder:
+    """Codificador incremental del estado por perspectiva de jugador.
+
+    Attributes:
+        state (EnhancedGameState): Estado de la partida.
+        version (int): Aumenta cada vez que cambia algún campo público.
+        header (numpy.ndarray): Cabecera pública (los campos de la facción
+            propia se rellenan por observador).
+        seats (numpy.ndarray): Filas públicas de los asientos, en el orden
+            de state.players.
+    """
+
+    def __init__(self, state):
+        """Inicializa el codificador para una partida ya repartida.
+
+        Args:
+            state (EnhancedGameState): Estado con jugadores y tablero.
+        """
+        self.state = state
+        self.player_ids = None
+        self.version = 0
+
+    def __getstate__(self):
+        """Excluye los vectores cacheados de las instantáneas."""
+        state = dict(self.__dict__)
+        state["_views"] = {}
+        return state
+
+    def features(self, observer):
+        """Devuelve el vector de un observador.
+
+        El vector se cachea mientras no cambien la partida ni lo que sabe el
+        observador, y es de solo lectura.
+
+        Args:
+            observer (Player): Jugador cuya perspectiva se codifica.
+
+        Returns:
+            numpy.ndarray: Vector de FEATURE_SIZE valores en [0, 1].
+        """
+        self._check_players()
+        self._sync()
+        knowledge = self._knowledge_signature(observer)
+        cached = self._views.get(observer.id)
+        if cached is not None and cached[:2] == (self.version, knowledge):
+            return cached[3]
+        if cached is not None and cached[1] == knowledge:
+            known = cached[2]
+        else:
+            known = self._known_roles(observer)
+
+        vector = np.zeros(FEATURE_SIZE, dtype=np.float32)
+        vector[:HEADER_SIZE] = self.header
+        role = observer.role
+        faction = getattr(role, "party_membership", None)
+        if faction in FACTIONS:
+            vector[HEADER["faction_liberal"] + FACTIONS.index(faction)] = 1
+        vector[HEADER["is_hitler"]] = getattr(role, "role", None) == "hitler"
+
+        count = len(self.player_ids)
+        seats = vector[HEADER_SIZE:].reshape(MAX_PLAYERS, SEAT_SIZE)
+        seats[:count] = self.seats
+        seats[:count, KNOWN] = known
+        index = self._index.get(observer.id)
+        if index:
+            seats[:count] = np.roll(seats[:count], -index, axis=0)
+
+        vector.flags.writeable = False
+        self._views[observer.id] = (self.version, knowledge, known, vector)
+        return vector
+
+    def _check_players(self):
+        """Prepara el codificador la primera vez y si cambian los ids.
+
+        La API reasigna los ids de los jugadores después del reparto; los
+        historiales se indexan por posición y se vuelven a leer.
+        """
+        player_ids = [player.id for player in self.state.players]
+        if player_ids == self.player_ids:
+            return
+        self.player_ids = player_ids
+        self._index = {player_id: index for index, player_id in enumerate(player_ids)}
+        count = len(player_ids)
+        self.header = np.zeros(HEADER_SIZE, dtype=np.float32)
+        self.header[HEADER["players"]] = count / MAX_PLAYERS
+        self.seats = np.zeros((count, SEAT_SIZE), dtype=np.float32)
+        self._votes = np.zeros((count, 2))
+        self._governments = np.zeros(count)
+        self._enacted = np.zeros((count, len(FACTIONS)))
+        self._totals = {"governments": 0, "policies": 0}
+        self._seen = {"election": 0, "policy": 0}
+        self._signatures = {}
+        self._views = {}
+        self.version += 1
+
+    def _sync(self):
+        """Actualiza los campos públicos que han cambiado desde la última vez."""
+        state = self.state
+        board = state.board
+        header = self.header
+        seats = self.seats
+
+        if self._changed(
+            "tracks",
+            (
+                board.liberal_track,
+                board.fascist_track,
+                board.communist_track,
+                board.veto_available,
+            ),
+        ):
+            header[HEADER["liberal_track"]] = (
+                board.liberal_track / board.liberal_track_size
+            )
+            header[HEADER["fascist_track"]] = (
+                board.fascist_track / board.fascist_track_size
+            )
+            header[HEADER["communist_track"]] = (
+                board.communist_track / board.communist_track_size
+                if board.communist_track_size
+                else 0.0
+            )
+            header[HEADER["veto_available"]] = board.veto_available
+
+        if self._changed("tracker", state.election_tracker):
+            header[HEADER["election_tracker"]] = state.election_tracker / 3
+
+        composition = board.public_deck_composition()
+        if self._changed("deck", composition):
+            cards = max(sum(composition), 1)
+            for offset, position in enumerate(DECK_TYPES):
+                header[HEADER["deck_liberal"] + offset] = composition[position] / cards
+
+        # Los jugadores solo salen de active_players al morir
+        if self._changed("alive", len(state.active_players)):
+            header[HEADER["alive"]] = len(state.active_players) / max(
+                len(self.player_ids), 1
+            )
+            seats[:, SEAT["alive"]] = [not player.is_dead for player in state.players]
+
+        term_limited = tuple(map(id, state.term_limited_players))
+        if self._changed("term_limited", term_limited):
+            seats[:, SEAT["term_limited"]] = 0
+            for player in state.term_limited_players:
+                self._set_seat(player, "term_limited")
+
+        if self._changed("government", (id(state.president), id(state.chancellor))):
+            seats[:, SEAT["president"]] = 0
+            seats[:, SEAT["chancellor"]] = 0
+            self._set_seat(state.president, "president")
+            self._set_seat(state.chancellor, "chancellor")
+
+        if self._sync_history():
+            self.version += 1
+
+    def _sync_history(self):
+        """Incorpora las entradas nuevas de los historiales.
+
+        Returns:
+            bool: Si había entradas nuevas.
+        """
+        elections = getattr(self.state, "election_history", [])
+        policies = getattr(self.state, "policy_history", [])
+        if (
+            len(elections) == self._seen["election"]
+            and len(policies) == self._seen["policy"]
+        ):
+            return False
+
+        for entry in elections[self._seen["election"] :]:
+            for player_id, vote in entry["votes"].items():
+                index = self._index.get(player_id)
+                if index is not None:
+                    self._votes[index, int(bool(vote))] += 1
+            if entry["passed"]:
+                self._totals["governments"] += 1
+                for role in ("president", "chancellor"):
+                    index = self._index.get(entry.get(role))
+                    if index is not None:
+                        self._governments[index] += 1
+        self._seen["election"] = len(elections)
+
+        for entry in policies[self._seen["policy"] :]:
+            party = POLICY_PARTY.get(entry["policy"])
+            if party is None or entry.get("chaos"):
+                continue
+            self._totals["policies"] += 1
+            for role in ("president", "chancellor"):
+                index = self._index.get(getattr(entry[role], "id", None))
+                if index is not None:
+                    self._enacted[index, party] += 1
+        self._seen["policy"] = len(policies)
+
+        seats = self.seats
+        cast = self._votes.sum(axis=1)
+        seats[:, SEAT["ja_rate"]] = np.divide(
+            self._votes[:, 1], cast, out=np.full(len(cast), 0.5), where=cast > 0
+        )
+        seats[:, SEAT["governments"]] = self._governments / max(
+            self._totals["governments"], 1
+        )
+        start = SEAT["liberal_enacted"]
+        seats[:, start : start + len(FACTIONS)] = self._enacted / max(
+            self._totals["policies"], 1
+        )
+        return True
+
+    def _changed(self, block, signature):
+        """Registra la firma de un bloque y dice si ha cambiado.
+
+        Args:
+            block (str): Nombre del bloque de campos.
+            signature: Valor barato que cambia cuando cambia el bloque.
+
+        Returns:
+            bool: Si la firma es distinta de la anterior.
+        """
+        if self._signatures.get(block, _UNSET) == signature:
+            return False
+        self._signatures[block] = signature
+        self.version += 1
+        return True
+
+    def _set_seat(self, player, field):
+        """Marca un campo en la fila de un jugador, si está en la partida."""
+        index = self._index.get(getattr(player, "id", None))
+        if index is not None:
+            self.seats[index, SEAT[field]] = 1
+
+    def _knowledge_signature(self, observer):
+        """Firma de lo que el observador sabe con certeza sobre los roles.
+
+        El conocimiento solo crece (investigaciones, afiliaciones reveladas,
+        compañeros conocidos) o cambia con el rol, así que basta con los
+        tamaños de cada fuente y la identidad del rol.
+        """
+        return (
+            id(observer.role),
+            len(getattr(observer, "fascists", None) or ()),
+            getattr(observer, "hitler", None) is not None,
+            len(getattr(observer, "known_communists", None) or ()),
+            len(getattr(observer, "inspected_players", None) or ()),
+            len(getattr(observer, "known_affiliations", None) or ()),
+            len(getattr(self.state, "revealed_affiliations", None) or ()),
+        )
+
+    def _known_roles(self, observer):
+        """Partido y Hitler conocidos con certeza por el observador.
+
+        Args:
+            observer (Player): Jugador cuyo conocimiento se usa.
+
+        Returns:
+            numpy.ndarray: Matriz jugadores x (partidos, Hitler).
+        """
+        known = np.zeros((len(self.player_ids), len(FACTIONS) + 1), dtype=np.float32)
+        hitler = len(FACTIONS)
+
+        def mark(player, party=None, is_hitler=False):
+            index = self._index.get(getattr(player, "id", player))
+            if index is None:
+                return
+            if party in FACTIONS:
+                known[index, :hitler] = 0
+                known[index, FACTIONS.index(party)] = 1
+            if is_hitler:
+                known[index, hitler] = 1
+
+        affiliations = dict(getattr(self.state, "revealed_affiliations", None) or {})
+        affiliations.update(getattr(observer, "known_affiliations", None) or {})
+        affiliations.update(getattr(observer, "inspected_players", None) or {})
+        for player_id, party in affiliations.items():
+            mark(player_id, party)
+        for player_id in getattr(observer, "known_communists", None) or []:
+            mark(player_id, "communist")
+        for fascist in getattr(observer, "fascists", None) or []:
+            mark(fascist, "fascist")
+        if getattr(observer, "hitler", None) is not None:
+            mark(observer.hitler, "fascist", is_hitler=True)
+
+        role = observer.role
+        if role is not None:
+            mark(
+                observer,
+                getattr(role, "party_membership", None),
+                getattr(role, "role", None) == "hitler",
+            )
+        return known
@@ -381,7 +381,7 @@ def main():
         "--strategy",
         type=str,
         default="role",
-        choices=["random", "role", "smart"],
+        choices=["random", "role", "smart", "mcts", "learned"],
         help="AI strategy type",
     )
 
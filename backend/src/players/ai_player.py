@@ -4,26 +4,51 @@ Este módulo define la clase AIPlayer que representa un jugador controlado
 por inteligencia artificial con estrategias automatizadas.
 """
 
-from random import choice
+import time
 
+from src.game.rng import choice
 from src.players.abstract_player import Player
 from src.players.strategies import (
     CommunistStrategy,
     FascistStrategy,
+    LearnedStrategy,
     LiberalStrategy,
+    MCTSStrategy,
     RandomStrategy,
     SmartStrategy,
 )
 
+# Parte del presupuesto que se da a las estrategias anytime, dejando margen
+# para que terminen la simulación en curso al llegar al límite.
+ANYTIME_SHARE = 0.8
+
+
+def _new_budget_stats():
+    """Contadores del presupuesto de tiempo de un jugador, a cero."""
+    return {"calls": 0, "overruns": 0, "fallbacks": 0, "max_elapsed": 0.0}
+
 
 class AIPlayer(Player):
     """Jugador controlado por IA que utiliza estrategias para tomar decisiones.
 
     Extiende la clase Player para proporcionar comportamiento automatizado
     basado en diferentes estrategias de juego.
+
+    Con un presupuesto de tiempo (time_budget), cada decisión de la
+    estrategia se cronometra. Solo las estrategias anytime quedan acotadas:
+    buscan hasta el límite y, si una llamada lo supera, se responde con la
+    estrategia del rol. Las demás no pueden interrumpirse, así que su exceso
+    se cuenta pero se mantiene su respuesta. budget_stats cuenta las
+    decisiones cronometradas, los excesos y las respuestas sustituidas.
+
+    Attributes:
+        strategy (PlayerStrategy): Estrategia que toma las decisiones.
+        time_budget (float): Segundos por decisión, o None para no limitar.
+        budget_stats (dict): Contadores "calls", "overruns" y "fallbacks", y
+            el mayor tiempo de una decisión ("max_elapsed").
     """
 
-    def __init__(self, id, name, role, state, strategy_type="role"):
+    def __init__(self, id, name, role, state, strategy_type="role", time_budget=None):
         """Inicializa un jugador IA.
 
         Args:
@@ -32,9 +57,14 @@ class AIPlayer(Player):
             role: Rol asignado al jugador.
             state: Estado actual del juego.
             strategy_type (str): Tipo de estrategia a utilizar.
+            time_budget (float, optional): Segundos por decisión de la
+                estrategia; por defecto, sin límite.
         """
         super().__init__(id, name, role, state)
         self.peeked_policies = None
+        self.time_budget = time_budget
+        self.budget_stats = _new_budget_stats()
+        self._fallback = None
 
         if isinstance(role, str):
             from src.roles.role import Communist, Fascist, Hitler, Liberal
@@ -57,13 +87,93 @@ class AIPlayer(Player):
             self.strategy = RandomStrategy(self)
         elif strategy_type == "smart":
             self.strategy = SmartStrategy(self)
+        elif strategy_type == "mcts":
+            self.strategy = MCTSStrategy(self)
+        elif strategy_type == "learned":
+            self.strategy = LearnedStrategy(self)
         else:
-            if self.is_fascist or self.is_hitler:
-                self.strategy = FascistStrategy(self)
-            elif self.is_communist:
-                self.strategy = CommunistStrategy(self)
-            else:
-                self.strategy = LiberalStrategy(self)
+            self.strategy = self._role_strategy_class()(self)
+
+    def __setstate__(self, state):
+        """Restaura el jugador desde una instantánea (pickle).
+
+        A las instantáneas anteriores al presupuesto de tiempo se les añade
+        un presupuesto vacío y contadores a cero.
+
+        Args:
+            state (dict): Atributos de la instancia.
+        """
+        self.__dict__.update(state)
+        self.__dict__.setdefault("time_budget", None)
+        self.__dict__.setdefault("budget_stats", _new_budget_stats())
+        self.__dict__.setdefault("_fallback", None)
+
+    def _role_strategy_class(self):
+        """Clase de la estrategia basada en el rol actual del jugador."""
+        if self.is_fascist or self.is_hitler:
+            return FascistStrategy
+        if self.is_communist:
+            return CommunistStrategy
+        return LiberalStrategy
+
+    def _decide(self, method, *args):
+        """Pide una decisión a la estrategia dentro del presupuesto de tiempo.
+
+        Sin presupuesto la llamada pasa directamente a la estrategia. Con
+        presupuesto, una estrategia anytime (con atributo time_budget, como
+        MCTSStrategy) busca como mucho ANYTIME_SHARE del presupuesto. Si aun
+        así la llamada lo supera, se cuenta el exceso y la respuesta se
+        sustituye por la de la estrategia del rol, de modo que una búsqueda
+        que no llegó a completarse no decide la jugada.
+
+        La latencia en el peor caso depende del tipo de estrategia:
+
+        - Anytime: ANYTIME_SHARE del presupuesto, más lo que tarde en cerrar
+          la simulación en curso, más la respuesta de la estrategia del rol
+          si se excede. La cota solo es tan buena como el respeto de la
+          estrategia a su time_budget.
+        - Cualquier otra: no está acotada. La llamada no puede interrumpirse;
+          su exceso se cuenta, pero se mantiene su respuesta en lugar de
+          sumar a la latencia la de la estrategia del rol.
+
+        Args:
+            method (str): Método de la estrategia.
+            *args: Argumentos de la llamada.
+
+        Returns:
+            La decisión de la estrategia o, si una estrategia anytime excedió
+            el presupuesto, la de la estrategia del rol.
+        """
+        strategy = self.strategy
+        budget = self.time_budget
+        if budget is None:
+            return getattr(strategy, method)(*args)
+
+        anytime = getattr(strategy, "time_budget", None)
+        search_budget = ANYTIME_SHARE * budget
+        start = time.perf_counter()
+        if anytime is not None:
+            strategy.time_budget = min(anytime, search_budget)
+        try:
+            result = getattr(strategy, method)(*args)
+        finally:
+            if anytime is not None:
+                strategy.time_budget = anytime
+        elapsed = time.perf_counter() - start
+
+        stats = self.budget_stats
+        stats["calls"] += 1
+        stats["max_elapsed"] = max(stats["max_elapsed"], elapsed)
+        if elapsed <= budget:
+            return result
+        stats["overruns"] += 1
+        fallback_class = self._role_strategy_class()
+        if anytime is None or type(strategy) is fallback_class:
+            return result
+        if self._fallback is None or self._fallback[0] is not self.role:
+            self._fallback = (self.role, fallback_class(self))
+        stats["fallbacks"] += 1
+        return getattr(self._fallback[1], method)(*args)
 
     def nominate_chancellor(self, eligible_players=None):
         """Nomina un canciller.
@@ -76,7 +186,7 @@ class AIPlayer(Player):
         """
         if eligible_players is None:
             eligible_players = self.state.get_eligible_chancellors()
-        return self.strategy.nominate_chancellor(eligible_players)
+        return self._decide("nominate_chancellor", eligible_players)
 
     def filter_policies(self, policies):
         """Filtra políticas como presidente.
@@ -87,7 +197,7 @@ class AIPlayer(Player):
         Returns:
             tuple: (políticas elegidas [2], política descartada [1]).
         """
-        return self.strategy.filter_policies(policies)
+        return self._decide("filter_policies", policies)
 
     def choose_policy(self, policies):
         """Elige qué política promulgar como canciller.
@@ -98,7 +208,7 @@ class AIPlayer(Player):
         Returns:
             tuple: (política elegida [1], política descartada [1]).
         """
-        return self.strategy.choose_policy(policies)
+        return self._decide("choose_policy", policies)
 
     def vote(self):
         """Vota sobre un gobierno.
@@ -106,8 +216,8 @@ class AIPlayer(Player):
         Returns:
             bool: True para Ja, False para Nein.
         """
-        return self.strategy.vote(
-            self.state.president_candidate, self.state.chancellor_candidate
+        return self._decide(
+            "vote", self.state.president_candidate, self.state.chancellor_candidate
         )
 
     def veto(self):
@@ -117,7 +227,7 @@ class AIPlayer(Player):
             bool: True para vetar, False en caso contrario.
         """
         policies = self.state.current_policies
-        return self.strategy.veto(policies)
+        return self._decide("veto", policies)
 
     def accept_veto(self):
         """Decide si aceptar el veto como presidente.
@@ -126,7 +236,7 @@ class AIPlayer(Player):
             bool: True para aceptar el veto, False en caso contrario.
         """
         policies = self.state.current_policies
-        return self.strategy.accept_veto(policies)
+        return self._decide("accept_veto", policies)
 
     def view_policies(self, policies):
         """Ve políticas durante el espionaje.
@@ -151,7 +261,7 @@ class AIPlayer(Player):
             Player: El jugador elegido para ejecutar.
         """
         eligible_players = [p for p in self.state.active_players if p != self]
-        return self.strategy.choose_player_to_kill(eligible_players)
+        return self._decide("choose_player_to_kill", eligible_players)
 
     def choose_player_to_mark(self):
         """Elige un jugador para marcar para ejecución.
@@ -160,7 +270,7 @@ class AIPlayer(Player):
             Player: El jugador elegido para marcar.
         """
         eligible_players = [p for p in self.state.active_players if p != self]
-        return self.strategy.choose_player_to_mark(eligible_players)
+        return self._decide("choose_player_to_mark", eligible_players)
 
     def inspect_player(self):
         """Elige un jugador para inspeccionar.
@@ -179,7 +289,7 @@ class AIPlayer(Player):
             if uninspected
             else [p for p in self.state.active_players if p != self]
         )
-        return self.strategy.choose_player_to_inspect(eligible_players)
+        return self._decide("choose_player_to_inspect", eligible_players)
 
     def choose_next(self):
         """Elige el próximo presidente en elección especial.
@@ -188,7 +298,7 @@ class AIPlayer(Player):
             Player: El jugador elegido como próximo presidente.
         """
         eligible_players = [p for p in self.state.active_players if p != self]
-        return self.strategy.choose_next_president(eligible_players)
+        return self._decide("choose_next_president", eligible_players)
 
     def choose_player_to_radicalize(self):
         """Elige un jugador para convertir al comunismo.
@@ -199,7 +309,7 @@ class AIPlayer(Player):
         eligible_players = [
             p for p in self.state.active_players if p != self and not p.is_hitler
         ]
-        return self.strategy.choose_player_to_radicalize(eligible_players)
+        return self._decide("choose_player_to_radicalize", eligible_players)
 
     def propaganda_decision(self, policy):
         """Decide si descartar la política superior.
@@ -289,7 +399,7 @@ class AIPlayer(Player):
             ):
                 return True
             return False
-        return self.strategy.pardon_player()
+        return self._decide("pardon_player")
 
     def choose_player_to_bug(self, eligible_players):
         """Elige un jugador para espiar su afiliación política.
@@ -300,7 +410,7 @@ class AIPlayer(Player):
         Returns:
             Player: El jugador elegido para espiar.
         """
-        return self.strategy.choose_player_to_bug(eligible_players)
+        return self._decide("choose_player_to_bug", eligible_players)
 
     def mark_for_execution(self, eligible_players=None):
         """Elige un jugador para marcar para ejecución.
@@ -313,7 +423,7 @@ class AIPlayer(Player):
         """
         if eligible_players is None:
             eligible_players = [p for p in self.state.active_players if p != self]
-        return self.strategy.choose_player_to_mark(eligible_players)
+        return self._decide("choose_player_to_mark", eligible_players)
 
     def chancellor_veto_proposal(self, policies):
         """Como canciller, decide si proponer un veto.
@@ -326,7 +436,7 @@ class AIPlayer(Player):
         """
         if not self.state.veto_available:
             return False
-        return self.strategy.chancellor_veto_proposal(policies)
+        return self._decide("chancellor_veto_proposal", policies)
 
     def vote_of_no_confidence(self):
         """Como canciller con poder de Ley Habilitante, decide si promulgar la política descartada.
@@ -334,7 +444,7 @@ class AIPlayer(Player):
         Returns:
             bool: True para promulgar política descartada, False para dejarla.
         """
-        return self.strategy.vote_of_no_confidence()
+        return self._decide("vote_of_no_confidence")
 
     def chancellor_propose_veto(self, policies):
         """El canciller propone un veto cuando está disponible.
@@ -347,7 +457,7 @@ class AIPlayer(Player):
         """
         if not self.state.veto_available:
             return False
-        return self.strategy.chancellor_veto_proposal(policies)
+        return self._decide("chancellor_veto_proposal", policies)
 
     def choose_player_to_mark_for_execution(self):
         """Elige un jugador para marcar para ejecución futura.
@@ -356,7 +466,7 @@ class AIPlayer(Player):
             Player: El jugador a marcar.
         """
         eligible_players = [p for p in self.state.active_players if p != self]
-        return self.strategy.choose_player_to_mark(eligible_players)
+        return self._decide("choose_player_to_mark", eligible_players)
 
     def choose_to_pardon(self):
         """Elige si perdonar al jugador marcado para ejecución.
@@ -364,7 +474,7 @@ class AIPlayer(Player):
         Returns:
             bool: True para perdonar, False en caso contrario.
         """
-        return self.strategy.pardon_player()
+        return self._decide("pardon_player")
 
     def no_confidence_decision(self):
         """Decide si promulgar la política descartada (Voto de No Confianza).
@@ -372,7 +482,7 @@ class AIPlayer(Player):
         Returns:
             bool: True para promulgar, False en caso contrario.
         """
-        return self.strategy.vote_of_no_confidence()
+        return self._decide("vote_of_no_confidence")
 
     def choose_player_to_investigate(self, eligible_players):
         """Elige un jugador para investigar su afiliación política.
@@ -383,7 +493,7 @@ class AIPlayer(Player):
         Returns:
             Player: El jugador a investigar.
         """
-        return self.strategy.choose_player_to_inspect(eligible_players)
+        return self._decide("choose_player_to_inspect", eligible_players)
 
     def choose_next_president(self, eligible_players):
         """Elige el próximo presidente para elección especial.
@@ -394,4 +504,4 @@ class AIPlayer(Player):
         Returns:
             Player: El jugador que será el próximo presidente.
         """
-        return self.strategy.choose_next_president(eligible_players)
+        return self._decide("choose_next_president", eligible_players)
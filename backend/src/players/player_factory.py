@@ -9,7 +9,9 @@ from src.players.human_player import HumanPlayer
 from src.players.strategies import (
     CommunistStrategy,
     FascistStrategy,
+    LearnedStrategy,
     LiberalStrategy,
+    MCTSStrategy,
     RandomStrategy,
     SmartStrategy,
 )
@@ -31,7 +33,8 @@ class PlayerFactory:
             name (str): Nombre del jugador.
             role: Rol del jugador.
             state: Estado del juego.
-            strategy_type (str): Tipo de estrategia a usar ("random", "role", "smart").
+            strategy_type (str): Tipo de estrategia a usar ("random", "role",
+                "smart", "mcts", "learned").
             player_type (str): Tipo de jugador a crear ("ai" o "human").
 
         Returns:
@@ -49,29 +52,38 @@ class PlayerFactory:
         return player
 
     @staticmethod
-    def apply_strategy_to_player(player, strategy_type="smart"):
+    def apply_strategy_to_player(player, strategy_type="smart", parameters=None):
         """Aplica la estrategia apropiada a un jugador según su rol.
 
         Args:
             player: El jugador al que aplicar la estrategia.
-            strategy_type (str): Tipo de estrategia a usar ("random", "role", "smart").
+            strategy_type (str): Tipo de estrategia a usar ("random", "role",
+                "smart", "mcts", "learned").
+            parameters (dict, optional): Parámetros ajustables de la
+                estrategia (ver PlayerStrategy.PARAMETERS).
         """
         if not hasattr(player, "strategy"):
             return
 
         if strategy_type == "random":
-            player.strategy = RandomStrategy(player)
+            player.strategy = RandomStrategy(player, parameters)
+
+        elif strategy_type == "mcts":
+            player.strategy = MCTSStrategy(player, parameters=parameters)
+
+        elif strategy_type == "learned":
+            player.strategy = LearnedStrategy(player, parameters)
 
         elif strategy_type == "role":
             if player.is_fascist or player.is_hitler:
-                player.strategy = FascistStrategy(player)
+                player.strategy = FascistStrategy(player, parameters)
             elif player.is_communist:
-                player.strategy = CommunistStrategy(player)
+                player.strategy = CommunistStrategy(player, parameters)
             else:
-                player.strategy = LiberalStrategy(player)
+                player.strategy = LiberalStrategy(player, parameters)
 
         else:
-            player.strategy = SmartStrategy(player)
+            player.strategy = SmartStrategy(player, parameters)
 
     @staticmethod
     def update_player_strategies(players, strategy_type="smart"):
@@ -1,7 +1,9 @@
 from src.players.strategies.base_strategy import PlayerStrategy
 from src.players.strategies.communist_strategy import CommunistStrategy
 from src.players.strategies.fascist_strategy import FascistStrategy
+from src.players.strategies.learned_strategy import LearnedStrategy
 from src.players.strategies.liberal_strategy import LiberalStrategy
+from src.players.strategies.mcts_strategy import MCTSStrategy
 from src.players.strategies.random_strategy import RandomStrategy
 from src.players.strategies.smart_strategy import SmartStrategy
 
@@ -12,4 +14,6 @@ __all__ = [
     "FascistStrategy",
     "SmartStrategy",
     "CommunistStrategy",
+    "MCTSStrategy",
+    "LearnedStrategy",
 ]
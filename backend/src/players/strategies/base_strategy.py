@@ -1,26 +1,48 @@
 """Módulo de estrategia base para jugadores de Secret Hitler XL.
 
 Este módulo define la clase abstracta base para todas las estrategias de jugadores,
-especificando los métodos que deben implementar las estrategias concretas.
+especificando los métodos que deben implementar las estrategias concretas, y
+funciones auxiliares para consultar las creencias sobre roles ocultos.
 """
 
 from abc import ABC, abstractmethod
 
+from src.game.rng import choice
+from src.game.role_beliefs import RoleBeliefs
+
+HITLER_RISK = 0.2
+TRUST_MARGIN = 0.8
+
 
 class PlayerStrategy(ABC):
     """Clase base abstracta para estrategias de jugadores.
 
     Define la interfaz común que deben implementar todas las estrategias
     de jugadores para la toma de decisiones en el juego.
+
+    Attributes:
+        PARAMETERS (dict): Parámetros ajustables de la estrategia (por
+            ejemplo, probabilidades de voto) con sus valores por defecto.
     """
 
-    def __init__(self, player):
+    PARAMETERS = {}
+
+    def __init__(self, player, parameters=None):
         """Inicializa la estrategia con una referencia al jugador.
 
         Args:
             player: El jugador que utilizará esta estrategia.
+            parameters (dict, optional): Valores que sustituyen a los de
+                PARAMETERS.
+
+        Raises:
+            ValueError: Si algún parámetro no existe en la estrategia.
         """
         self.player = player
+        unknown = set(parameters or {}) - set(self.PARAMETERS)
+        if unknown:
+            raise ValueError(f"Unknown strategy parameters: {sorted(unknown)}")
+        self.parameters = {**self.PARAMETERS, **(parameters or {})}
 
     @abstractmethod
     def nominate_chancellor(self, eligible_players):
@@ -164,3 +186,73 @@ class PlayerStrategy(ABC):
     @abstractmethod
     def social_democratic_removal_choice(self):
         """Choose which policy track to remove from (Social Democratic)"""
+
+
+def player_beliefs(player):
+    """Obtiene las creencias de un jugador sobre los roles ocultos.
+
+    Args:
+        player (Player): Jugador que observa la partida.
+
+    Returns:
+        BeliefView or None: Probabilidades por jugador, o None si la partida
+            no mantiene creencias (por ejemplo, en simulaciones).
+    """
+    engine = getattr(getattr(player, "state", None), "beliefs", None)
+    if not isinstance(engine, RoleBeliefs):
+        return None
+    return engine.view(player)
+
+
+def trusts_government(
+    player,
+    beliefs,
+    president,
+    chancellor,
+    hitler_risk=HITLER_RISK,
+    trust_margin=TRUST_MARGIN,
+):
+    """Decide si un gobierno parece seguro frente a los fascistas.
+
+    Rechaza al canciller que podría ser Hitler con 3 o más políticas
+    fascistas y a los gobiernos cuyo miembro más sospechoso lo es más que la
+    media de la mesa (con un margen de trust_margin).
+
+    Args:
+        player (Player): Jugador que vota.
+        beliefs (BeliefView): Creencias del jugador.
+        president (Player): Presidente propuesto.
+        chancellor (Player): Canciller propuesto.
+        hitler_risk (float): Probabilidad de ser Hitler a partir de la cual
+            se rechaza al canciller.
+        trust_margin (float): Fracción de la sospecha media que se tolera.
+
+    Returns:
+        bool: True para votar a favor del gobierno.
+    """
+    if (
+        player.state.fascist_track >= 3
+        and beliefs.role(chancellor, "hitler") > hitler_risk
+    ):
+        return False
+    others = [p for p in player.state.active_players if p.id != player.id]
+    average = sum(beliefs.party(p, "fascist") for p in others) / max(len(others), 1)
+    risk = max(
+        beliefs.party(president, "fascist"), beliefs.party(chancellor, "fascist")
+    )
+    return risk <= average * trust_margin
+
+
+def most_likely(players, probability):
+    """Elige el jugador con mayor probabilidad según las creencias.
+
+    Args:
+        players (list): Jugadores candidatos.
+        probability (callable): Probabilidad de cada jugador.
+
+    Returns:
+        Player: Jugador elegido; los empates se deciden al azar.
+    """
+    scores = [probability(p) for p in players]
+    best = max(scores)
+    return choice([p for p, score in zip(players, scores) if score >= best - 1e-9])
@@ -1,6 +1,13 @@
-from random import choice, random
-
-from src.players.strategies.base_strategy import PlayerStrategy
+from src.game.rng import choice, random
+from src.players.strategies.base_strategy import (
+    HITLER_RISK,
+    TRUST_MARGIN,
+    PlayerStrategy,
+    most_likely,
+    player_beliefs,
+    trusts_government,
+)
+from src.players.strategies.decision_tables import COMMUNIST_VETO, POLICY_ORDER
 
 
 class CommunistStrategy(PlayerStrategy):
@@ -9,6 +16,15 @@ class CommunistStrategy(PlayerStrategy):
     Implements decision logic for all game actions a communist player may take.
     """
 
+    # Tunable vote thresholds, used when no role beliefs are available
+    PARAMETERS = {
+        "hitler_risk": HITLER_RISK,
+        "trust_margin": TRUST_MARGIN,
+        "vote_late_unknown": 0.3,
+        "vote_near_win": 0.8,
+        "vote_default": 0.6,
+    }
+
     def nominate_chancellor(self, eligible_players):
         """Selects a chancellor nominee.
 
@@ -33,6 +49,11 @@ class CommunistStrategy(PlayerStrategy):
             and self.player.known_affiliations[p.id] == "fascist"
         ]
         non_fascists = [p for p in eligible_players if p not in known_fascists]
+        beliefs = player_beliefs(self.player)
+        if non_fascists and beliefs:
+            return most_likely(
+                non_fascists, lambda p: 1.0 - beliefs.party(p, "fascist")
+            )
         if non_fascists:
             return choice(non_fascists)
         return choice(eligible_players)
@@ -48,15 +69,9 @@ class CommunistStrategy(PlayerStrategy):
         Returns:
             tuple[list[Policy], Policy]: (The two kept policies, the discarded policy)
         """
-        sorted_policies = sorted(
-            policies,
-            key=lambda p: (
-                1 if p.type == "communist" else (0.5 if p.type == "liberal" else 0)
-            ),
-            reverse=True,
-        )
-        chosen = sorted_policies[:2]
-        discarded = sorted_policies[2]
+        order = POLICY_ORDER["communist"].lookup(policies)
+        chosen = [policies[i] for i in order[:2]]
+        discarded = policies[order[2]]
         return chosen, discarded
 
     def choose_policy(self, policies):
@@ -68,15 +83,9 @@ class CommunistStrategy(PlayerStrategy):
         Returns:
             tuple[Policy, Policy]: (Chosen policy to enact, discarded policy)
         """
-        sorted_policies = sorted(
-            policies,
-            key=lambda p: (
-                1 if p.type == "communist" else (0.5 if p.type == "liberal" else 0)
-            ),
-            reverse=True,
-        )
-        chosen = sorted_policies[0]
-        discarded = sorted_policies[1]
+        order = POLICY_ORDER["communist"].lookup(policies)
+        chosen = policies[order[0]]
+        discarded = policies[order[1]]
         return chosen, discarded
 
     def vote(self, president, chancellor):
@@ -101,16 +110,27 @@ class CommunistStrategy(PlayerStrategy):
         if chancellor_fascist:
             return False
 
+        beliefs = player_beliefs(self.player)
+        if beliefs:
+            return trusts_government(
+                self.player,
+                beliefs,
+                president,
+                chancellor,
+                self.parameters["hitler_risk"],
+                self.parameters["trust_margin"],
+            )
+
         if self.player.state.fascist_track >= 3:
             if chancellor.id not in self.player.known_affiliations:
-                return random() <= 0.3
+                return random() <= self.parameters["vote_late_unknown"]
 
         communist_track = self.player.state.board.communist_track
         communist_track_size = self.player.state.board.communist_track_size
         if communist_track >= communist_track_size - 2:
-            return random() <= 0.8
+            return random() <= self.parameters["vote_near_win"]
 
-        return random() <= 0.6
+        return random() <= self.parameters["vote_default"]
 
     def veto(self, policies):
         """Determines whether to propose a veto.
@@ -121,9 +141,7 @@ class CommunistStrategy(PlayerStrategy):
         Returns:
             bool: True to propose veto, False otherwise.
         """
-        communist_policies = [p for p in policies if p.type == "communist"]
-        fascist_policies = [p for p in policies if p.type == "fascist"]
-        return len(communist_policies) == 0 and len(fascist_policies) > 0
+        return COMMUNIST_VETO.lookup(policies)
 
     def accept_veto(self, policies):
         """Determines whether to accept a veto as president.
@@ -134,9 +152,7 @@ class CommunistStrategy(PlayerStrategy):
         Returns:
             bool: True to accept, False to reject.
         """
-        communist_policies = [p for p in policies if p.type == "communist"]
-        fascist_policies = [p for p in policies if p.type == "fascist"]
-        return not communist_policies and fascist_policies
+        return COMMUNIST_VETO.lookup(policies)
 
     def choose_player_to_kill(self, eligible_players):
         """Selects a player to execute.
@@ -183,6 +199,12 @@ class CommunistStrategy(PlayerStrategy):
             )
         ]
         non_friendly = [p for p in eligible_players if p not in known_friendly]
+        beliefs = player_beliefs(self.player)
+        if non_friendly and beliefs:
+            return most_likely(
+                non_friendly,
+                lambda p: beliefs.role(p, "hitler") + beliefs.party(p, "fascist"),
+            )
         if non_friendly:
             return choice(non_friendly)
         return choice(eligible_players)
@@ -205,6 +227,9 @@ class CommunistStrategy(PlayerStrategy):
         uninspected = [
             p for p in non_communists if p.id not in self.player.known_affiliations
         ]
+        beliefs = player_beliefs(self.player)
+        if uninspected and beliefs:
+            return most_likely(uninspected, beliefs.uncertainty)
         if uninspected:
             return choice(uninspected)
         non_liberal = [
@@ -239,6 +264,11 @@ class CommunistStrategy(PlayerStrategy):
             if p.id not in self.player.known_affiliations
             or self.player.known_affiliations[p.id] != "fascist"
         ]
+        beliefs = player_beliefs(self.player)
+        if non_fascists and beliefs:
+            return most_likely(
+                non_fascists, lambda p: 1.0 - beliefs.party(p, "fascist")
+            )
         if non_fascists:
             return choice(non_fascists)
         return choice(eligible_players)
@@ -282,6 +312,15 @@ class CommunistStrategy(PlayerStrategy):
         if known_hitler:
             ineligible.append(known_hitler)
         eligible_non_communists = [p for p in eligible_players if p not in ineligible]
+        beliefs = player_beliefs(self.player)
+        if eligible_non_communists and beliefs:
+            # Hitler cannot be converted and communists are already allies
+            return most_likely(
+                eligible_non_communists,
+                lambda p: 1.0
+                - beliefs.role(p, "hitler")
+                - beliefs.party(p, "communist"),
+            )
         if eligible_non_communists:
             return choice(eligible_non_communists)
         return choice(eligible_players)
@@ -400,9 +439,7 @@ class CommunistStrategy(PlayerStrategy):
         Returns:
             bool: True to propose veto, False otherwise.
         """
-        communist_policies = [p for p in policies if p.type == "communist"]
-        fascist_policies = [p for p in policies if p.type == "fascist"]
-        return len(communist_policies) == 0 and len(fascist_policies) > 0
+        return COMMUNIST_VETO.lookup(policies)
 
     def vote_of_no_confidence(self):
         """Decides whether to enact the discarded policy (Vote of No Confidence).
@@ -0,0 +1,250 @@
+"""Precompiled decision tables for the rule-based strategies.
+
+Policy decisions of the rule-based strategies only depend on the policy
+types in hand, so they are compiled once per process into tables keyed by
+the hand's types. A decision then costs one tuple build and one dict lookup
+instead of sorting the hand and rebuilding priority maps on every call.
+
+The veto tables are keyed on the hand alone. SmartStrategy's accept-veto
+rule also depends on the election tracker, so its table adds a first key:
+whether one more failed government would enact a policy by chaos.
+
+Tables cover every 2- and 3-card hand; other hands are computed with the
+same rule on first use and cached.
+"""
+
+from collections import Counter
+from itertools import product
+
+from src.policies.deck_odds import POLICY_TYPES
+
+HAND_SIZES = (2, 3)
+
+
+class HandTable(dict):
+    """Decision table keyed by the tuple of policy types in a hand."""
+
+    def __init__(self, rule, sizes=HAND_SIZES):
+        """Compile the table for every hand of the given sizes.
+
+        Args:
+            rule (callable): Decision for a tuple of policy types.
+            sizes (tuple): Hand sizes to precompute.
+        """
+        super().__init__()
+        self.rule = rule
+        for size in sizes:
+            for hand in product(POLICY_TYPES, repeat=size):
+                self[hand] = rule(hand)
+
+    def __missing__(self, hand):
+        value = self[hand] = self.rule(hand)
+        return value
+
+    def lookup(self, policies):
+        """Return the decision for a list of policies.
+
+        Args:
+            policies (list): Policies in hand.
+
+        Returns:
+            The value compiled for the hand's types.
+        """
+        return self[tuple(policy.type for policy in policies)]
+
+
+def priority_order(priority):
+    """Rule ordering a hand by descending priority.
+
+    Ties keep their position in the hand, as a stable sort would.
+
+    Args:
+        priority (dict): Priority of each policy type (0 if missing).
+
+    Returns:
+        callable: Rule returning the hand's indices, best first.
+    """
+
+    def rule(hand):
+        return tuple(
+            sorted(
+                range(len(hand)),
+                key=lambda index: priority.get(hand[index], 0),
+                reverse=True,
+            )
+        )
+
+    return rule
+
+
+def smart_filter_order(priority):
+    """Rule ordering a presidential hand the way SmartStrategy does.
+
+    A pair of the same type goes first if it is at least as valuable as the
+    remaining card and last otherwise; other hands are ordered by priority.
+
+    Args:
+        priority (dict): Priority of each policy type.
+
+    Returns:
+        callable: Rule returning the hand's indices, kept cards first.
+    """
+    by_priority = priority_order(priority)
+
+    def rule(hand):
+        pair = next((t for t, count in Counter(hand).items() if count == 2), None)
+        if pair is None:
+            return by_priority(hand)
+        solo = next(t for t in hand if t != pair)
+        pair_last = priority[pair] < priority.get(solo, 0)
+        return tuple(
+            sorted(
+                range(len(hand)),
+                key=lambda index: (hand[index] == pair) == pair_last,
+            )
+        )
+
+    return rule
+
+
+def first_of(preferences):
+    """Rule choosing the first card of the most preferred type.
+
+    Args:
+        preferences (tuple): Policy types, most preferred first.
+
+    Returns:
+        callable: Rule returning (chosen index, discarded index).
+    """
+
+    def rule(hand):
+        for policy_type in preferences:
+            if policy_type in hand:
+                chosen = hand.index(policy_type)
+                return chosen, next(i for i in range(len(hand)) if i != chosen)
+        return 0, 1
+
+    return rule
+
+
+def all_of(policy_type):
+    """Rule that holds when every card in hand has the given type."""
+    return lambda hand: all(t == policy_type for t in hand)
+
+
+def smart_accept_veto(policy_type, at_chaos, risks_chaos):
+    """Rule for SmartStrategy accepting its chancellor's veto.
+
+    The president accepts a veto of a hand made only of the type its role
+    vetoes. One failed government away from chaos, it accepts only such
+    hands, and only if its role is willing to risk chaos.
+
+    Args:
+        policy_type (str): Type the role vetoes, or None.
+        at_chaos (bool): Whether the election tracker is at CHAOS_TRACKER.
+        risks_chaos (bool): Whether the role accepts a veto that may
+            trigger chaos.
+
+    Returns:
+        callable: Rule returning True or False, or None to leave the
+            decision to the accept_veto probability.
+    """
+    bad_hand = all_of(policy_type) if policy_type else (lambda hand: False)
+
+    def rule(hand):
+        if at_chaos:
+            return risks_chaos and bad_hand(hand)
+        return True if bad_hand(hand) else None
+
+    return rule
+
+
+ROLE_PRIORITIES = {
+    "liberal": {"liberal": 1, "communist": 0.5},
+    "fascist": {"fascist": 1, "communist": 0.5},
+    "communist": {"communist": 1, "liberal": 0.5},
+}
+
+SMART_PRIORITIES = {
+    "fascist": {
+        "article48": 4,
+        "enablingact": 4,
+        "fascist": 3,
+        "communist": 2,
+        "anticommunist": 2,
+        "liberal": 1,
+        "socialdemocratic": 1,
+        "antifascist": 0,
+    },
+    "liberal": {
+        "article48": 4,
+        "enablingact": 4,
+        "liberal": 3,
+        "antifascist": 3,
+        "socialdemocratic": 3,
+        "communist": 2,
+        "anticommunist": 2,
+        "fascist": 1,
+    },
+    "communist": {
+        "article48": 4,
+        "enablingact": 4,
+        "communist": 3,
+        "antifascist": 3,
+        "fascist": 2,
+        "liberal": 1,
+        "socialdemocratic": 1,
+        "anticommunist": 0,
+    },
+}
+
+SMART_PREFERENCES = {
+    "fascist": ("fascist", "communist"),
+    "liberal": ("liberal",),
+    "communist": ("communist", "fascist"),
+    None: (),
+}
+
+# Hands each role vetoes outright; other hands fall back to a random veto.
+SMART_VETO_HANDS = {
+    "liberal": "fascist",
+    "fascist": "liberal",
+    "communist": "liberal",
+}
+
+# Election tracker value at which one more failed government means chaos
+CHAOS_TRACKER = 2
+
+POLICY_ORDER = {
+    role: HandTable(priority_order(priority))
+    for role, priority in ROLE_PRIORITIES.items()
+}
+
+SMART_FILTER_ORDER = {
+    role: HandTable(smart_filter_order(priority), sizes=(3,))
+    for role, priority in SMART_PRIORITIES.items()
+}
+
+SMART_CHOICE = {
+    role: HandTable(first_of(preferences))
+    for role, preferences in SMART_PREFERENCES.items()
+}
+
+SMART_VETO = {
+    role: HandTable(all_of(policy_type))
+    for role, policy_type in SMART_VETO_HANDS.items()
+}
+
+SMART_ACCEPT_VETO = {
+    role: {
+        at_chaos: HandTable(
+            smart_accept_veto(SMART_VETO_HANDS.get(role), at_chaos, role != "communist")
+        )
+        for at_chaos in (False, True)
+    }
+    for role in (*SMART_VETO_HANDS, None)
+}
+
+LIBERAL_VETO = HandTable(all_of("fascist"))
+FASCIST_VETO = HandTable(lambda hand: "fascist" not in hand)
+COMMUNIST_VETO = HandTable(lambda hand: "communist" not in hand and "fascist" in hand)
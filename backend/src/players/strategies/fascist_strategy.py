@@ -1,11 +1,22 @@
-from random import choice, random
-
-from src.players.strategies.base_strategy import PlayerStrategy
+from src.game.rng import choice, random
+from src.players.strategies.base_strategy import (
+    PlayerStrategy,
+    most_likely,
+    player_beliefs,
+)
+from src.players.strategies.decision_tables import FASCIST_VETO, POLICY_ORDER
 
 
 class FascistStrategy(PlayerStrategy):
     """Strategy for fascist players"""
 
+    # Tunable vote thresholds
+    PARAMETERS = {
+        "vote_liberal_government": 0.3,
+        "vote_power": 0.8,
+        "vote_default": 0.7,
+    }
+
     def nominate_chancellor(self, eligible_players):
         """Choose Hitler or another fascist if possible"""
         # If Hitler can be chancellor and enough fascist policies are enacted
@@ -26,40 +37,33 @@ class FascistStrategy(PlayerStrategy):
         if fascists:
             return choice(fascists)
 
-        # If no fascists are eligible, choose randomly
+        # If no fascists are eligible, avoid the likeliest liberals
+        beliefs = player_beliefs(self.player)
+        if beliefs:
+            return most_likely(
+                eligible_players, lambda p: 1.0 - beliefs.party(p, "liberal")
+            )
         return choice(eligible_players)
 
     def filter_policies(self, policies):
         """Keep fascist policies if possible"""
-        # Sort policies by preference: fascist > communist > liberal
-        sorted_policies = sorted(
-            policies,
-            key=lambda p: (
-                1 if p.type == "fascist" else (0.5 if p.type == "communist" else 0)
-            ),
-            reverse=True,
-        )
+        # Order by preference: fascist > communist > liberal
+        order = POLICY_ORDER["fascist"].lookup(policies)
 
         # Keep the two best policies
-        chosen = sorted_policies[:2]
-        discarded = sorted_policies[2]
+        chosen = [policies[i] for i in order[:2]]
+        discarded = policies[order[2]]
 
         return chosen, discarded
 
     def choose_policy(self, policies):
         """Enact fascist policy if possible"""
-        # Sort by preference: fascist > communist > liberal
-        sorted_policies = sorted(
-            policies,
-            key=lambda p: (
-                1 if p.type == "fascist" else (0.5 if p.type == "communist" else 0)
-            ),
-            reverse=True,
-        )
+        # Order by preference: fascist > communist > liberal
+        order = POLICY_ORDER["fascist"].lookup(policies)
 
         # Choose the best policy
-        chosen = sorted_policies[0]
-        discarded = sorted_policies[1]
+        chosen = policies[order[0]]
+        discarded = policies[order[1]]
 
         return chosen, discarded
 
@@ -80,27 +84,25 @@ class FascistStrategy(PlayerStrategy):
 
         # If both are known liberals, be more likely to vote no
         if chancellor_known_liberal and president_known_liberal:
-            return random() <= 0.3
+            return random() <= self.parameters["vote_liberal_government"]
 
         # If a fascist policy would result in a power that could help fascists, vote yes
         if (
             self.player.state.fascist_track == 2  # Next would be investigate
             or self.player.state.fascist_track == 4
         ):  # Next would be execution
-            return random() <= 0.8
+            return random() <= self.parameters["vote_power"]
 
         # Otherwise, vote randomly with a bias toward yes
-        return random() <= 0.7
+        return random() <= self.parameters["vote_default"]
 
     def veto(self, policies):
         """Veto if no fascist policies available"""
-        fascist_policies = [p for p in policies if p.type == "fascist"]
-        return not fascist_policies
+        return FASCIST_VETO.lookup(policies)
 
     def accept_veto(self, policies):
         """Accept veto if no fascist policies available"""
-        fascist_policies = [p for p in policies if p.type == "fascist"]
-        return not fascist_policies
+        return FASCIST_VETO.lookup(policies)
 
     def choose_player_to_kill(self, eligible_players):
         """Kill liberals or communists (not fascists)"""
@@ -140,6 +142,13 @@ class FascistStrategy(PlayerStrategy):
                 # Players who frequently vote against fascist governments might be liberals
                 unknown_players.append(p)
 
+        # Players the belief engine considers most likely liberal
+        beliefs = player_beliefs(self.player)
+        if beliefs:
+            suspected_liberals = [
+                p for p in unknown_players if beliefs.party(p, "liberal") >= 0.5
+            ]
+
         # Always prioritize known liberals for execution (they are the main enemy)
         if known_liberals:
             return choice(known_liberals)
@@ -174,6 +183,9 @@ class FascistStrategy(PlayerStrategy):
             if not p.is_fascist and p.id not in self.player.inspected_players
         ]
 
+        beliefs = player_beliefs(self.player)
+        if uninspected and beliefs:
+            return most_likely(uninspected, beliefs.uncertainty)
         if uninspected:
             return choice(uninspected)
 
@@ -199,6 +211,11 @@ class FascistStrategy(PlayerStrategy):
             or self.player.inspected_players[p.id] != "liberal"
         ]
 
+        beliefs = player_beliefs(self.player)
+        if unknown_players and beliefs:
+            return most_likely(
+                unknown_players, lambda p: 1.0 - beliefs.party(p, "liberal")
+            )
         if unknown_players:
             return choice(unknown_players)
 
@@ -224,6 +241,11 @@ class FascistStrategy(PlayerStrategy):
             p for p in eligible_players if not p.is_fascist and not p.is_hitler
         ]
 
+        beliefs = player_beliefs(self.player)
+        if non_fascist_non_hitler and beliefs:
+            return most_likely(
+                non_fascist_non_hitler, lambda p: beliefs.role(p, "liberal")
+            )
         if non_fascist_non_hitler:
             return choice(non_fascist_non_hitler)
 
@@ -243,6 +265,9 @@ class FascistStrategy(PlayerStrategy):
             if not p.is_fascist and p.id not in self.player.inspected_players
         ]
 
+        beliefs = player_beliefs(self.player)
+        if uninspected_non_fascists and beliefs:
+            return most_likely(uninspected_non_fascists, beliefs.uncertainty)
         if uninspected_non_fascists:
             return choice(uninspected_non_fascists)
 
@@ -297,8 +322,7 @@ class FascistStrategy(PlayerStrategy):
     def chancellor_veto_proposal(self, policies):
         """Decide whether to propose a veto as chancellor"""
         # Propose veto if no fascist policies available
-        fascist_policies = [p for p in policies if p.type == "fascist"]
-        return len(fascist_policies) == 0
+        return FASCIST_VETO.lookup(policies)
 
     def vote_of_no_confidence(self):
         """Decide whether to enact the discarded policy (Vote of No Confidence)"""
@@ -0,0 +1,444 @@
+"""Learned strategy that scores decisions with a small NumPy model.
+
+Every decision is encoded as a state vector, seen from the deciding player,
+and one feature row per legal action. A per-decision model (a linear scorer
+or a one-hidden-layer MLP) scores all rows at once and the best action is
+played, so inference costs a couple of small matrix products. Decisions
+without a trained model are delegated to the role strategy.
+
+Models are trained offline from simulated games with
+src.simulation.decision_data.
+"""
+
+import os
+from functools import lru_cache
+
+import numpy as np
+from src.game.rng import random
+from src.game.state_encoder import HEADER_SIZE
+from src.players.strategies.base_strategy import PlayerStrategy, player_beliefs
+from src.players.strategies.communist_strategy import CommunistStrategy
+from src.players.strategies.fascist_strategy import FascistStrategy
+from src.players.strategies.liberal_strategy import LiberalStrategy
+from src.policies.deck_odds import POLICY_TYPES
+
+MODEL_ENV = "SHXL_LEARNED_MODEL"
+FACTIONS = ("liberal", "fascist", "communist")
+
+STATE_SIZE = HEADER_SIZE
+PLAYER_SIZE = 6
+POLICY_SIZE = len(POLICY_TYPES)
+
+# Strategy method -> decision kind
+PLAYER_DECISIONS = {
+    "nominate_chancellor": "nominate",
+    "choose_player_to_kill": "kill",
+    "choose_player_to_inspect": "inspect",
+    "choose_next_president": "next_president",
+    "choose_player_to_mark": "mark",
+    "choose_player_to_radicalize": "radicalize",
+}
+DECISIONS = {
+    **PLAYER_DECISIONS,
+    "vote": "vote",
+    "filter_policies": "filter",
+    "choose_policy": "choose",
+    "veto": "veto",
+    "accept_veto": "accept_veto",
+}
+ACTION_SIZES = {
+    **{kind: PLAYER_SIZE for kind in PLAYER_DECISIONS.values()},
+    "vote": 1 + 2 * PLAYER_SIZE,
+    "filter": POLICY_SIZE,
+    "choose": POLICY_SIZE,
+    "veto": 1,
+    "accept_veto": 1,
+}
+POLICY_ONE_HOT = {
+    policy_type: np.eye(POLICY_SIZE, dtype=np.float32)[index]
+    for index, policy_type in enumerate(POLICY_TYPES)
+}
+ROLE_STRATEGIES = {
+    "liberal": LiberalStrategy,
+    "fascist": FascistStrategy,
+    "communist": CommunistStrategy,
+}
+
+
+def state_features(player):
+    """Encode the public game state and the player's own faction.
+
+    Reads the header of the state's incremental encoder when the game has
+    one; copies of the state (MCTS rollouts) fall back to reading the board.
+
+    Args:
+        player: Player that takes the decision.
+
+    Returns:
+        numpy.ndarray: Vector of STATE_SIZE floats, roughly in [0, 1].
+    """
+    state = player.state
+    encoder = getattr(state, "encoder", None)
+    if encoder is not None:
+        return encoder.features(player)[:STATE_SIZE]
+    board = state.board
+    composition = board.public_deck_composition()
+    cards = max(sum(composition), 1)
+    faction = player.role.party_membership
+    return np.array(
+        [
+            board.liberal_track / board.liberal_track_size,
+            board.fascist_track / board.fascist_track_size,
+            (
+                board.communist_track / board.communist_track_size
+                if board.communist_track_size
+                else 0.0
+            ),
+            state.election_tracker / 3,
+            len(state.active_players) / max(len(state.players), 1),
+            len(state.players) / 16,
+            *(float(faction == f) for f in FACTIONS),
+            float(player.is_hitler),
+            float(board.veto_available),
+            composition[0] / cards,
+            composition[1] / cards,
+            composition[2] / cards,
+        ],
+        dtype=np.float32,
+    )
+
+
+def player_features(observer, beliefs, target):
+    """Encode what the observer believes about another player.
+
+    Args:
+        observer: Player that takes the decision.
+        beliefs (BeliefView): Observer's beliefs, or None.
+        target: Player being described.
+
+    Returns:
+        list: PLAYER_SIZE floats.
+    """
+    state = observer.state
+    if beliefs:
+        parties = [beliefs.party(target, f) for f in FACTIONS]
+        hitler = beliefs.role(target, "hitler")
+    else:
+        parties = [1 / 3] * 3
+        hitler = 1 / max(len(state.active_players), 1)
+    return [
+        *parties,
+        hitler,
+        float(target in state.term_limited_players),
+        float(target is state.president),
+    ]
+
+
+def encode_decision(player, kind, args):
+    """Encode a decision as a state vector and one row per legal action.
+
+    Args:
+        player: Player that takes the decision.
+        kind (str): Decision kind (see DECISIONS).
+        args (tuple): Arguments of the strategy call.
+
+    Returns:
+        tuple: (state vector, action matrix, candidates). Candidates are the
+            players or policies of each row, or (True, False) for yes/no
+            decisions.
+    """
+    state = state_features(player)
+    if kind in PLAYER_DECISIONS.values():
+        beliefs = player_beliefs(player)
+        candidates = list(args[0])
+        rows = [player_features(player, beliefs, p) for p in candidates]
+    elif kind == "vote":
+        beliefs = player_beliefs(player)
+        president, chancellor = args
+        candidates = (True, False)
+        government = [1.0]
+        for member in (president, chancellor):
+            government += player_features(player, beliefs, member)
+        rows = [government, [0.0] * len(government)]
+    elif kind in ("filter", "choose"):
+        candidates = list(args[0])
+        rows = [POLICY_ONE_HOT[p.type] for p in candidates]
+    else:
+        candidates = (True, False)
+        rows = [[1.0], [0.0]]
+    actions = np.array(rows, dtype=np.float32).reshape(
+        len(candidates), ACTION_SIZES[kind]
+    )
+    return state, actions, candidates
+
+
+def decode_decision(kind, candidates, index):
+    """Turn the chosen row into the value a strategy call returns.
+
+    Args:
+        kind (str): Decision kind.
+        candidates (list): Candidates returned by encode_decision.
+        index (int): Chosen row.
+
+    Returns:
+        The strategy's answer. For "filter" the row is the discarded policy
+        and for "choose" the enacted one.
+    """
+    if kind == "filter":
+        kept = [p for i, p in enumerate(candidates) if i != index]
+        return kept, candidates[index]
+    if kind == "choose":
+        discarded = next(p for i, p in enumerate(candidates) if i != index)
+        return candidates[index], discarded
+    return candidates[index]
+
+
+def chosen_index(kind, candidates, result):
+    """Find the row of a strategy's answer (inverse of decode_decision).
+
+    Args:
+        kind (str): Decision kind.
+        candidates (list): Candidates returned by encode_decision.
+        result: Value returned by the strategy call.
+
+    Returns:
+        int: Chosen row, or None if the answer is not a candidate. Policies
+            of the same type are interchangeable, so the first one counts.
+    """
+    if candidates == (True, False):
+        return 0 if result else 1
+    if kind in ("filter", "choose"):
+        policy = result[1] if kind == "filter" else result[0]
+        if not any(c is policy for c in candidates):
+            return None
+        return next(i for i, c in enumerate(candidates) if c.type == policy.type)
+    return next((i for i, c in enumerate(candidates) if c is result), None)
+
+
+class DecisionModel:
+    """Scorers of the legal actions of each decision kind.
+
+    Attributes:
+        layers (dict): Weights of each kind: "v" (output weights) and, for
+            MLP scorers, "W" and "b" (hidden layer).
+    """
+
+    def __init__(self, layers):
+        """Initialize the model.
+
+        Args:
+            layers (dict): Weights of each decision kind.
+        """
+        self.layers = layers
+
+    def scores(self, kind, state, actions):
+        """Score every legal action of a decision.
+
+        Args:
+            kind (str): Decision kind.
+            state (numpy.ndarray): State vector.
+            actions (numpy.ndarray): One row per legal action.
+
+        Returns:
+            numpy.ndarray: One score per action (higher is better).
+        """
+        inputs = np.hstack(
+            [np.broadcast_to(state, (len(actions), len(state))), actions]
+        )
+        return forward(self.layers[kind], inputs)[0]
+
+    def save(self, path):
+        """Save the weights to a .npz file.
+
+        Args:
+            path (str): Destination file.
+        """
+        np.savez(
+            path,
+            **{
+                f"{kind}/{name}": array
+                for kind, weights in self.layers.items()
+                for name, array in weights.items()
+            },
+        )
+
+    @classmethod
+    def load(cls, path):
+        """Load a model saved with save.
+
+        Args:
+            path (str): Source .npz file.
+
+        Returns:
+            DecisionModel: The loaded model.
+        """
+        layers = {}
+        with np.load(path) as data:
+            for key in data.files:
+                kind, name = key.split("/")
+                layers.setdefault(kind, {})[name] = data[key]
+        return cls(layers)
+
+
+def forward(weights, inputs):
+    """Evaluate a scorer on a batch of input rows.
+
+    Args:
+        weights (dict): Scorer weights (see DecisionModel.layers).
+        inputs (numpy.ndarray): Input rows (state and action features).
+
+    Returns:
+        tuple: (scores, hidden activations or None for linear scorers).
+    """
+    if "W" not in weights:
+        return inputs @ weights["v"], None
+    hidden = np.tanh(inputs @ weights["W"] + weights["b"])
+    return hidden @ weights["v"], hidden
+
+
+@lru_cache(maxsize=None)
+def _load_model(path):
+    return DecisionModel.load(path)
+
+
+def default_model(environ=None):
+    """Model named by the SHXL_LEARNED_MODEL environment variable.
+
+    Args:
+        environ (dict, optional): Environment to read. Defaults to os.environ.
+
+    Returns:
+        DecisionModel: The model, loaded once per process, or None.
+    """
+    environ = os.environ if environ is None else environ
+    path = environ.get(MODEL_ENV)
+    return _load_model(path) if path else None
+
+
+class LearnedStrategy(PlayerStrategy):
+    """Strategy that plays the actions a trained model scores highest.
+
+    Learns nominations, votes, policy filtering and choice, vetoes and the
+    player-targeting powers. Every other call, and every decision kind the
+    model has no weights for, goes to the role strategy of the player's
+    current faction.
+
+    Attributes:
+        model (DecisionModel): Model that scores the decisions, or None to
+            play as the role strategy.
+    """
+
+    # Softmax temperature over action scores; 0 plays the best action
+    PARAMETERS = {"temperature": 0.0}
+
+    def __init__(self, player, parameters=None, model=None):
+        """Initialize the strategy.
+
+        Args:
+            player: Player that uses this strategy.
+            parameters (dict, optional): Overrides of PARAMETERS.
+            model (DecisionModel, optional): Model to play with. Defaults to
+                the one named by SHXL_LEARNED_MODEL.
+        """
+        super().__init__(player, parameters)
+        self.model = model if model is not None else default_model()
+        self._fallbacks = {}
+
+    def _fallback(self):
+        """Role strategy of the player's current faction."""
+        faction = self.player.role.party_membership
+        if faction not in self._fallbacks:
+            self._fallbacks[faction] = ROLE_STRATEGIES[faction](self.player)
+        return self._fallbacks[faction]
+
+    def _decide(self, method, *args):
+        """Answer a strategy call with the model, or with the fallback."""
+        kind = DECISIONS[method]
+        if self.model is None or kind not in self.model.layers:
+            return getattr(self._fallback(), method)(*args)
+        state, actions, candidates = encode_decision(self.player, kind, args)
+        if len(candidates) < 2:
+            return getattr(self._fallback(), method)(*args)
+        scores = self.model.scores(kind, state, actions)
+        return decode_decision(kind, candidates, self._pick(scores))
+
+    def _pick(self, scores):
+        """Best action, or a softmax sample when the temperature is positive."""
+        temperature = self.parameters["temperature"]
+        if temperature <= 0:
+            return int(np.argmax(scores))
+        weights = np.exp((scores - scores.max()) / temperature)
+        threshold = random() * weights.sum()
+        return min(int(np.searchsorted(np.cumsum(weights), threshold)), len(scores) - 1)
+
+    def nominate_chancellor(self, eligible_players):
+        """Nominate the chancellor the model scores highest"""
+        return self._decide("nominate_chancellor", eligible_players)
+
+    def filter_policies(self, policies):
+        """Discard the policy the model scores highest"""
+        return self._decide("filter_policies", policies)
+
+    def choose_policy(self, policies):
+        """Enact the policy the model scores highest"""
+        return self._decide("choose_policy", policies)
+
+    def vote(self, president, chancellor):
+        """Vote Ja if the model scores it above Nein"""
+        return self._decide("vote", president, chancellor)
+
+    def veto(self, policies):
+        """Propose a veto if the model scores it above enacting"""
+        return self._decide("veto", policies)
+
+    def accept_veto(self, policies):
+        """Accept a veto if the model scores it above rejecting"""
+        return self._decide("accept_veto", policies)
+
+    def choose_player_to_kill(self, eligible_players):
+        """Execute the player the model scores highest"""
+        return self._decide("choose_player_to_kill", eligible_players)
+
+    def choose_player_to_inspect(self, eligible_players):
+        """Investigate the player the model scores highest"""
+        return self._decide("choose_player_to_inspect", eligible_players)
+
+    def choose_next_president(self, eligible_players):
+        """Choose the special election president the model scores highest"""
+        return self._decide("choose_next_president", eligible_players)
+
+    def choose_player_to_mark(self, eligible_players):
+        """Mark the player the model scores highest"""
+        return self._decide("choose_player_to_mark", eligible_players)
+
+    def choose_player_to_radicalize(self, eligible_players):
+        """Radicalize the player the model scores highest"""
+        return self._decide("choose_player_to_radicalize", eligible_players)
+
+    def choose_player_to_bug(self, eligible_players):
+        """Delegate to the role strategy"""
+        return self._fallback().choose_player_to_bug(eligible_players)
+
+    def propaganda_decision(self, policy):
+        """Delegate to the role strategy"""
+        return self._fallback().propaganda_decision(policy)
+
+    def choose_revealer(self, eligible_players):
+        """Delegate to the role strategy"""
+        return self._fallback().choose_revealer(eligible_players)
+
+    def pardon_player(self):
+        """Delegate to the role strategy"""
+        return self._fallback().pardon_player()
+
+    def chancellor_veto_proposal(self, policies):
+        """Propose a veto as chancellor with the veto scorer"""
+        return self._decide("veto", policies)
+
+    def vote_of_no_confidence(self):
+        """Delegate to the role strategy"""
+        return self._fallback().vote_of_no_confidence()
+
+    def social_democratic_removal_choice(self):
+        """Delegate to the role strategy"""
+        return self._fallback().social_democratic_removal_choice()
@@ -1,11 +1,27 @@
-from random import choice, random
-
-from src.players.strategies.base_strategy import PlayerStrategy
+from src.game.rng import choice, random
+from src.players.strategies.base_strategy import (
+    HITLER_RISK,
+    TRUST_MARGIN,
+    PlayerStrategy,
+    most_likely,
+    player_beliefs,
+    trusts_government,
+)
+from src.players.strategies.decision_tables import LIBERAL_VETO, POLICY_ORDER
 
 
 class LiberalStrategy(PlayerStrategy):
     """Strategy for liberal players"""
 
+    # Tunable vote thresholds, used when no role beliefs are available
+    PARAMETERS = {
+        "hitler_risk": HITLER_RISK,
+        "trust_margin": TRUST_MARGIN,
+        "vote_late_unknown": 0.3,
+        "vote_late": 0.5,
+        "vote_early": 0.7,
+    }
+
     def nominate_chancellor(self, eligible_players):
         """Choose player that is not suspected to be fascist"""
         # Prioritize players we trust (known liberals)
@@ -29,6 +45,10 @@ class LiberalStrategy(PlayerStrategy):
 
         non_suspected = [p for p in eligible_players if p not in suspected_fascists]
 
+        beliefs = player_beliefs(self.player)
+        if non_suspected and beliefs:
+            return most_likely(non_suspected, lambda p: beliefs.party(p, "liberal"))
+
         if non_suspected:
             return choice(non_suspected)
 
@@ -36,35 +56,23 @@ class LiberalStrategy(PlayerStrategy):
 
     def filter_policies(self, policies):
         """Keep liberal policies if possible"""
-        # Sort policies by preference: liberal > communist > fascist
-        sorted_policies = sorted(
-            policies,
-            key=lambda p: (
-                1 if p.type == "liberal" else (0.5 if p.type == "communist" else 0)
-            ),
-            reverse=True,
-        )
+        # Order by preference: liberal > communist > fascist
+        order = POLICY_ORDER["liberal"].lookup(policies)
 
         # Keep the two best policies
-        chosen = sorted_policies[:2]
-        discarded = sorted_policies[2]
+        chosen = [policies[i] for i in order[:2]]
+        discarded = policies[order[2]]
 
         return chosen, discarded
 
     def choose_policy(self, policies):
         """Enact liberal policy if possible"""
-        # Sort by preference: liberal > communist > fascist
-        sorted_policies = sorted(
-            policies,
-            key=lambda p: (
-                1 if p.type == "liberal" else (0.5 if p.type == "communist" else 0)
-            ),
-            reverse=True,
-        )
+        # Order by preference: liberal > communist > fascist
+        order = POLICY_ORDER["liberal"].lookup(policies)
 
         # Choose the best policy
-        chosen = sorted_policies[0]
-        discarded = sorted_policies[1]
+        chosen = policies[order[0]]
+        discarded = policies[order[1]]
 
         return chosen, discarded
 
@@ -92,24 +100,35 @@ class LiberalStrategy(PlayerStrategy):
         if chancellor_suspected:
             return False
 
+        beliefs = player_beliefs(self.player)
+        if beliefs:
+            return trusts_government(
+                self.player,
+                beliefs,
+                president,
+                chancellor,
+                self.parameters["hitler_risk"],
+                self.parameters["trust_margin"],
+            )
+
         # If chancellor could be Hitler and 3+ fascist policies are enacted, be very cautious
         if self.player.state.fascist_track >= 3:
             # If chancellor is unknown and could be Hitler, more likely to vote no
             if chancellor.id not in self.player.inspected_players:
-                return random() <= 0.3
+                return random() <= self.parameters["vote_late_unknown"]
             # Otherwise be somewhat cautious
-            return random() <= 0.5
+            return random() <= self.parameters["vote_late"]
         else:
             # Early game, more willing to trust unknown players
-            return random() <= 0.7
+            return random() <= self.parameters["vote_early"]
 
     def veto(self, policies):
         """Veto if all policies are fascist"""
-        return all(p.type == "fascist" for p in policies)
+        return LIBERAL_VETO.lookup(policies)
 
     def accept_veto(self, policies):
         """Accept veto if all policies are fascist"""
-        return all(p.type == "fascist" for p in policies)
+        return LIBERAL_VETO.lookup(policies)
 
     def choose_player_to_kill(self, eligible_players):
         """Kill suspected fascists"""
@@ -124,6 +143,14 @@ class LiberalStrategy(PlayerStrategy):
         if confirmed_fascists:
             return choice(confirmed_fascists)
 
+        # Use role beliefs: Hitler first, then likely fascists
+        beliefs = player_beliefs(self.player)
+        if beliefs:
+            return most_likely(
+                eligible_players,
+                lambda p: beliefs.role(p, "hitler") + beliefs.party(p, "fascist"),
+            )
+
         # Track players involved in fascist policy enactments
         suspicious_players = []
         history = []
@@ -169,6 +196,11 @@ class LiberalStrategy(PlayerStrategy):
             p for p in eligible_players if p.id not in self.player.inspected_players
         ]
 
+        beliefs = player_beliefs(self.player)
+        if uninspected and beliefs:
+            # Inspect whoever we are least sure about
+            return most_likely(uninspected, beliefs.uncertainty)
+
         if uninspected:
             # If we have suspicious players, prioritize them
             suspicious_uninspected = []
@@ -205,6 +237,10 @@ class LiberalStrategy(PlayerStrategy):
             or self.player.inspected_players[p.id] != "fascist"
         ]
 
+        beliefs = player_beliefs(self.player)
+        if non_fascists and beliefs:
+            return most_likely(non_fascists, lambda p: beliefs.party(p, "liberal"))
+
         if non_fascists:
             return choice(non_fascists)
 
@@ -223,7 +259,11 @@ class LiberalStrategy(PlayerStrategy):
         if suspected_fascists:
             return choice(suspected_fascists)
 
-        # If no confirmed fascists, try someone suspicious but not confirmed
+        # If no confirmed fascists, try the most likely fascist
+        beliefs = player_beliefs(self.player)
+        if beliefs:
+            return most_likely(eligible_players, lambda p: beliefs.role(p, "fascist"))
+
         suspicious_players = []
 
         # In a real implementation, we'd have more sophisticated suspicion tracking
@@ -253,6 +293,10 @@ class LiberalStrategy(PlayerStrategy):
             p for p in eligible_players if p.id not in self.player.inspected_players
         ]
 
+        beliefs = player_beliefs(self.player)
+        if uninspected and beliefs:
+            return most_likely(uninspected, beliefs.uncertainty)
+
         if uninspected:
             return choice(uninspected)
 
@@ -282,7 +326,11 @@ class LiberalStrategy(PlayerStrategy):
         if trusted_liberals:
             return choice(trusted_liberals)
 
-        # Otherwise choose randomly
+        # Otherwise choose the most likely liberal
+        beliefs = player_beliefs(self.player)
+        if beliefs:
+            return most_likely(eligible_players, lambda p: beliefs.party(p, "liberal"))
+
         return choice(eligible_players)
 
     def pardon_player(self):
@@ -309,13 +357,18 @@ class LiberalStrategy(PlayerStrategy):
         ):
             return False
 
+        # Pardon unknowns unless they are probably fascist
+        beliefs = player_beliefs(self.player)
+        if beliefs:
+            return beliefs.party(marked_player, "fascist") < 0.5
+
         # Random decision for unknowns, slight bias toward pardoning
         return choice([True, True, False])
 
     def chancellor_veto_proposal(self, policies):
         """Decide whether to propose a veto as chancellor"""
         # Propose veto if all policies are fascist
-        return all(p.type == "fascist" for p in policies)
+        return LIBERAL_VETO.lookup(policies)
 
     def vote_of_no_confidence(self):
         """Decide whether to enact the discarded policy (Vote of No Confidence)"""
@@ -0,0 +1,667 @@
+"""Monte-Carlo search strategy for Secret Hitler XL bots.
+
+For each searched decision the strategy samples hidden-role assignments
+consistent with what its player knows, forks the game state, applies one
+candidate action in the fork and plays the rest of the game out with cheap
+rollout strategies. Candidate actions are chosen with UCB1 over the root of
+the search, and the search stops after a fixed number of rollouts or when
+the decision's time budget runs out, whichever comes first.
+
+Each search plays its rollouts with its own random.Random, installed through
+src.game.rng, so searches running on different threads never share or
+disturb the global generator and seeded games stay reproducible whatever the
+search budget.
+"""
+
+import copy
+import logging
+import random
+import time
+from collections import Counter
+from math import log, sqrt
+
+from src.game.rng import use_generator
+from src.players.strategies.base_strategy import PlayerStrategy
+from src.players.strategies.smart_strategy import SmartStrategy
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROLLOUTS = 32
+DEFAULT_TIME_BUDGET = 0.25
+DEFAULT_ROLLOUT_STRATEGY = "role"
+DEFAULT_EXPLORATION = 1.4
+MAX_ROLLOUT_PHASES = 120
+ROLE_SAMPLING_ATTEMPTS = 50
+
+ANTI_POLICY_TYPES = {"antifascist", "anticommunist", "socialdemocratic"}
+EMERGENCY_POLICY_TYPES = {"article48", "enablingact"}
+POWER_DECISIONS = {
+    "choose_player_to_kill": "execution",
+    "choose_next_president": "special_election",
+    "choose_player_to_mark": "marked_for_execution",
+    "choose_player_to_radicalize": "radicalization",
+}
+
+# Rule errors a determinized fork can run into: a sampled world may make a
+# scripted action illegal (InvalidPhaseTransition is a ValueError) or leave
+# no card or player to pick. These rollouts are counted as failed; any other
+# error is a bug and is logged as well.
+ROLLOUT_ERRORS = (ValueError, LookupError, StopIteration)
+
+
+class _ScriptedStrategy:
+    """Strategy that answers some calls with fixed decisions.
+
+    Each scripted method answers its first call with the scripted decision
+    and is then forgotten; every other call goes to the wrapped strategy.
+    Used to replay a candidate action at the start of a rollout.
+    """
+
+    def __init__(self, strategy, script):
+        """Initialize the scripted strategy.
+
+        Args:
+            strategy (PlayerStrategy): Strategy that answers unscripted calls.
+            script (dict): Callables keyed by strategy method name. Each one
+                receives the call arguments and returns the decision.
+        """
+        self.strategy = strategy
+        self.script = dict(script)
+
+    def __getattr__(self, name):
+        script = self.__dict__.get("script", {})
+        if name in script:
+            return script.pop(name)
+        return getattr(self.strategy, name)
+
+
+def _party(role):
+    """Return the faction a role plays for."""
+    return role.party_membership
+
+
+def _policy_kinds(state):
+    """Return the set of policy types present in the game."""
+    board = state.board
+    cards = list(board.policies) + list(board.discards)
+    kinds = {policy.type for policy in cards}
+    kinds.update(entry["policy"] for entry in getattr(state, "policy_history", []))
+    return kinds
+
+
+def _progress(board):
+    """Return each faction's progress towards a policy win, from 0 to 1."""
+    progress = {
+        "liberal": board.liberal_track / board.liberal_track_size,
+        "fascist": board.fascist_track / board.fascist_track_size,
+    }
+    if board.communist_track_size:
+        progress["communist"] = board.communist_track / board.communist_track_size
+    return progress
+
+
+class MCTSStrategy(PlayerStrategy):
+    """Monte-Carlo search strategy with determinized rollouts.
+
+    Searches nominations, presidential policy filtering, chancellor policy
+    choice, votes and the state-changing power targets (execution, special
+    election, marking and radicalization). Information-only powers, vetoes
+    and the remaining minor decisions are delegated to SmartStrategy, since
+    determinized rollouts cannot value the information they reveal.
+
+    Attributes:
+        rollouts (int): Maximum number of rollouts per decision.
+        time_budget (float): Maximum seconds spent searching each decision.
+        rollout_strategy (str): Strategy type played by every player inside
+            rollouts ("random", "role" or "smart").
+        exploration (float): UCB1 exploration constant.
+        fallback (PlayerStrategy): Strategy for decisions that are not
+            searched.
+        last_search (dict): Statistics of the most recent search.
+    """
+
+    def __init__(
+        self,
+        player,
+        rollouts=DEFAULT_ROLLOUTS,
+        time_budget=DEFAULT_TIME_BUDGET,
+        rollout_strategy=DEFAULT_ROLLOUT_STRATEGY,
+        exploration=DEFAULT_EXPLORATION,
+        seed=None,
+        parameters=None,
+    ):
+        """Initialize the strategy.
+
+        Args:
+            player: Player that uses this strategy.
+            rollouts (int): Maximum number of rollouts per decision.
+            time_budget (float): Maximum seconds per decision, or None for no
+                time limit.
+            rollout_strategy (str): Strategy type used inside rollouts.
+            exploration (float): UCB1 exploration constant.
+            seed (int, optional): Seed for role sampling and action selection.
+            parameters (dict, optional): Overrides of PARAMETERS.
+        """
+        super().__init__(player, parameters)
+        self.rollouts = rollouts
+        self.time_budget = time_budget
+        self.rollout_strategy = rollout_strategy
+        self.exploration = exploration
+        self.rng = random.Random(seed)
+        self.fallback = SmartStrategy(player)
+        self.last_search = None
+
+    # Determinization
+
+    def _fixed_roles(self, state):
+        """Collect the roles this player knows for certain.
+
+        Args:
+            state: Current game state.
+
+        Returns:
+            tuple: Roles known by player id, and party memberships known by
+                player id for players whose exact role is unknown.
+        """
+        player = self.player
+        roles = {player.id: player.role}
+        parties = {}
+
+        if player.hitler is not None:
+            roles[player.hitler.id] = player.hitler.role
+        for fascist in player.fascists or []:
+            roles[fascist.id] = fascist.role
+
+        by_id = {p.id: p for p in state.players}
+        for player_id in player.known_communists or []:
+            if player_id in by_id:
+                roles[player_id] = by_id[player_id].role
+
+        known = dict(getattr(state, "revealed_affiliations", None) or {})
+        known.update(player.known_affiliations or {})
+        known.update(player.inspected_players or {})
+        for player_id, party in known.items():
+            if player_id not in roles and isinstance(party, str):
+                parties[player_id] = party
+        return roles, parties
+
+    def sample_roles(self, state):
+        """Sample a role assignment consistent with this player's knowledge.
+
+        Known roles are kept; the remaining roles of the game are shuffled
+        over the other players until known party memberships are respected.
+
+        Args:
+            state: Current game state.
+
+        Returns:
+            dict: Role for every player id.
+        """
+        fixed, parties = self._fixed_roles(state)
+        unknown = [p.id for p in state.players if p.id not in fixed]
+        pool = Counter(p.role.role for p in state.players)
+        pool.subtract(Counter(role.role for role in fixed.values()))
+        prototypes = {p.role.role: p.role for p in state.players}
+        remaining = [prototypes[name] for name in pool.elements()]
+
+        for _ in range(ROLE_SAMPLING_ATTEMPTS):
+            self.rng.shuffle(remaining)
+            sample = dict(zip(unknown, remaining))
+            if all(
+                _party(sample[player_id]) == party
+                for player_id, party in parties.items()
+                if player_id in sample
+            ):
+                break
+
+        sample.update(fixed)
+        return sample
+
+    def _fork_game(self, roles):
+        """Fork the current game with the given hidden roles.
+
+        Every player in the fork, humans included, is played by a bot with
+        the rollout strategy, and the knowledge other players start with is
+        recomputed from the sampled roles.
+
+        Args:
+            roles (dict): Role for every player id.
+
+        Returns:
+            SHXLGame: Game built around the forked state.
+        """
+        from src.game.game import SHXLGame
+        from src.game.game_logger import GameLogger, LogLevel
+        from src.players.ai_player import AIPlayer
+        from src.players.player_factory import PlayerFactory
+
+        state = self.player.state
+        memo = {}
+        stand_ins = {}
+        for player in state.players:
+            strategy = getattr(player, "strategy", None)
+            if strategy is not None:
+                memo[id(strategy)] = None
+            stand_ins[player] = memo[id(player)] = AIPlayer.__new__(AIPlayer)
+
+        fork = state.fork(memo)
+        for player, stand_in in stand_ins.items():
+            attributes = {k: v for k, v in vars(player).items() if k != "strategy"}
+            vars(stand_in).update(copy.deepcopy(attributes, memo))
+
+        game = SHXLGame(GameLogger(LogLevel.NONE))
+        game.state = fork
+        game.player_count = len(fork.players)
+        game.communists_in_play = fork.board.with_communists
+        kinds = _policy_kinds(fork)
+        game.anti_policies_in_play = bool(kinds & ANTI_POLICY_TYPES)
+        game.emergency_powers_in_play = bool(kinds & EMERGENCY_POLICY_TYPES)
+
+        for player in fork.players:
+            player.role = roles[player.id]
+            player.player_type = "ai"
+            player.peeked_policies = getattr(player, "peeked_policies", None)
+            # The search itself is budgeted; rollout decisions are not
+            player.time_budget = None
+            if player.id != self.player.id:
+                player.hitler = None
+                player.fascists = None
+                player.known_communists = []
+                player.inspected_players = {}
+                player.known_affiliations = {}
+            player.strategy = None
+            PlayerFactory.apply_strategy_to_player(player, self.rollout_strategy)
+
+        game.hitler_player = next((p for p in fork.players if p.is_hitler), None)
+        if game.hitler_player is not None:
+            game.inform_players()
+        self._shuffle_unseen_policies(fork.board)
+        return game
+
+    def _shuffle_unseen_policies(self, board):
+        """Shuffle the deck and discard pile together, keeping their sizes.
+
+        The player has not seen the order of the deck nor the discarded
+        cards, so the fork redistributes them at random.
+
+        Args:
+            board: Board of the forked game.
+        """
+        cards = board.policies + board.discards
+        self.rng.shuffle(cards)
+        board.policies = cards[: len(board.policies)]
+        board.discards = cards[len(board.policies) :]
+
+    def _find(self, players, player_id):
+        """Return the player with the given id, if any."""
+        return next((p for p in players if p.id == player_id), None)
+
+    def _run_scripted(self, game, scripts, step):
+        """Run one step of a forked game with scripted player decisions.
+
+        Scripted decisions that the step did not use are dropped afterwards,
+        so the rest of the rollout is played by the rollout strategies.
+
+        Args:
+            game (SHXLGame): Forked game.
+            scripts (dict): Scripted decisions (see _ScriptedStrategy) keyed
+                by player id.
+            step (callable): Runs the step and returns its result.
+
+        Returns:
+            Any: Result of the step.
+        """
+        scripted = []
+        for player_id, script in scripts.items():
+            player = self._find(game.state.players, player_id)
+            player.strategy = _ScriptedStrategy(player.strategy, script)
+            scripted.append(player)
+        try:
+            return step()
+        finally:
+            for player in scripted:
+                player.strategy = player.strategy.strategy
+
+    # Rollouts
+
+    def _play_out(self, game, phase):
+        """Play a forked game until it ends or the rollout limit is reached.
+
+        Args:
+            game (SHXLGame): Forked game.
+            phase (GamePhase): Phase to execute first.
+        """
+        for _ in range(MAX_ROLLOUT_PHASES):
+            if game.state.game_over:
+                return
+            phase = phase.execute()
+
+    def _reward(self, game):
+        """Score a finished (or truncated) rollout for this player's faction.
+
+        Args:
+            game (SHXLGame): Forked game after the rollout.
+
+        Returns:
+            float: 1 for a win, 0 for a loss, or a value in between from the
+                policy tracks if the rollout was truncated.
+        """
+        party = _party(self.player.role)
+        winner = game.state.winner
+        if winner:
+            return 1.0 if party in winner.split("_and_") else 0.0
+
+        progress = _progress(game.state.board)
+        own = progress.pop(party, 0.0)
+        best_other = max(progress.values(), default=0.0)
+        return min(1.0, max(0.0, 0.5 + 0.5 * (own - best_other)))
+
+    def _search(self, decision, actions, simulate):
+        """Choose among candidate actions with UCB1 over determinized rollouts.
+
+        Args:
+            decision (str): Name of the decision, for the search statistics.
+            actions (list): Candidate actions (hashable).
+            simulate (callable): Receives an action and a forked game, applies
+                the action and plays the game out.
+
+        Returns:
+            Any: Action with the best mean reward, or None if no rollout
+                finished and the caller should fall back.
+        """
+        visits = dict.fromkeys(actions, 0)
+        totals = dict.fromkeys(actions, 0.0)
+        start = time.perf_counter()
+        deadline = None if self.time_budget is None else start + self.time_budget
+        state = self.player.state
+        played = failed = 0
+
+        with use_generator(random.Random(self.rng.getrandbits(64))):
+            for _ in range(self.rollouts):
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+                action = self._select(actions, visits, totals, played)
+                try:
+                    game = self._fork_game(self.sample_roles(state))
+                    simulate(action, game)
+                except ROLLOUT_ERRORS:
+                    failed += 1
+                    continue
+                except Exception:
+                    logger.exception(
+                        "MCTS rollout for %s (%r) raised an unexpected error",
+                        decision,
+                        action,
+                    )
+                    failed += 1
+                    continue
+                visits[action] += 1
+                totals[action] += self._reward(game)
+                played += 1
+
+        best = None
+        if played:
+            best = max(
+                (a for a in actions if visits[a]),
+                key=lambda a: (totals[a] / visits[a], visits[a]),
+            )
+        self.last_search = {
+            "decision": decision,
+            "rollouts": played,
+            "failed": failed,
+            "elapsed": time.perf_counter() - start,
+            "values": {
+                a: (totals[a] / visits[a] if visits[a] else None, visits[a])
+                for a in actions
+            },
+            "choice": best,
+        }
+        return best
+
+    def _select(self, actions, visits, totals, played):
+        """Pick the next action to simulate with UCB1."""
+        unvisited = [a for a in actions if not visits[a]]
+        if unvisited:
+            return self.rng.choice(unvisited)
+        log_played = log(played)
+        return max(
+            actions,
+            key=lambda a: totals[a] / visits[a]
+            + self.exploration * sqrt(log_played / visits[a]),
+        )
+
+    # Phase replays
+
+    def _replay_election(self, game, nominee_id, vote=None):
+        """Replay the current election in a fork with a fixed nomination.
+
+        Args:
+            game (SHXLGame): Forked game.
+            nominee_id (int): Id of the nominated chancellor.
+            vote (bool, optional): This player's vote, if it is fixed.
+        """
+        from src.game.phases.election import ElectionPhase
+
+        state = game.state
+        president = state.president_candidate or state.president
+        state.president_candidate = president
+        scripts = {
+            president.id: {
+                "nominate_chancellor": lambda eligible: self._find(eligible, nominee_id)
+                or self._find(state.players, nominee_id)
+            }
+        }
+        if vote is not None:
+            scripts.setdefault(self.player.id, {})["vote"] = lambda *args: vote
+        phase = ElectionPhase(game)
+        self._play_out(game, self._run_scripted(game, scripts, phase.execute))
+
+    def _replay_legislative(self, game, hand, keep, chancellor_script):
+        """Replay the current legislative session in a fork.
+
+        The president's hand is put back on top of the deck, the president
+        keeps the given cards, and the chancellor follows its script.
+
+        Args:
+            game (SHXLGame): Forked game.
+            hand (list): Three policies the president draws.
+            keep (list): Two policies the president passes on.
+            chancellor_script (dict): Scripted chancellor decisions.
+        """
+        from src.game.phases.legislative import LegislativePhase
+
+        state = game.state
+        discarded = next(p for p in hand if not any(p is k for k in keep))
+        state.board.policies[:0] = hand
+        scripts = {
+            state.president.id: {
+                "filter_policies": lambda policies: (list(keep), discarded)
+            }
+        }
+        if chancellor_script:
+            scripts.setdefault(state.chancellor.id, {}).update(chancellor_script)
+        phase = LegislativePhase(game)
+        self._play_out(game, self._run_scripted(game, scripts, phase.execute))
+
+    def _replay_power(self, game, power, target_id):
+        """Execute a presidential power in a fork and play the game out.
+
+        Args:
+            game (SHXLGame): Forked game.
+            power (str): Name of the power.
+            target_id (int): Id of the chosen target.
+        """
+        from src.game.phases.election import ElectionPhase
+        from src.game.phases.gameover import GameOverPhase
+
+        state = game.state
+        method = next(m for m, p in POWER_DECISIONS.items() if p == power)
+        scripts = {
+            self.player.id: {
+                method: lambda eligible=(): self._find(eligible, target_id)
+                or self._find(state.players, target_id)
+            }
+        }
+        target = self._run_scripted(game, scripts, lambda: game.execute_power(power))
+        if power == "execution" and target is not None and target.is_hitler:
+            state.winner = (
+                "liberal_and_communist" if game.communists_in_play else "liberal"
+            )
+            self._play_out(game, GameOverPhase(game))
+            return
+        game.advance_turn()
+        self._play_out(game, ElectionPhase(game))
+
+    # Searched decisions
+
+    def nominate_chancellor(self, eligible_players):
+        """Nominate the chancellor with the best simulated outcome."""
+        if len(eligible_players) == 1:
+            return eligible_players[0]
+        best = self._search(
+            "nominate",
+            [p.id for p in eligible_players],
+            lambda nominee_id, game: self._replay_election(game, nominee_id),
+        )
+        if best is None:
+            return self.fallback.nominate_chancellor(eligible_players)
+        return self._find(eligible_players, best)
+
+    def vote(self, president, chancellor):
+        """Vote ja or nein, whichever simulates better."""
+        if chancellor is None:
+            return self.fallback.vote(president, chancellor)
+        best = self._search(
+            "vote",
+            [True, False],
+            lambda vote, game: self._replay_election(game, chancellor.id, vote),
+        )
+        if best is None:
+            return self.fallback.vote(president, chancellor)
+        return best
+
+    def filter_policies(self, policies):
+        """Discard the policy type with the best simulated outcome."""
+        kinds = list(dict.fromkeys(policy.type for policy in policies))
+        if len(kinds) == 1:
+            return policies[1:], policies[0]
+
+        def split(kind):
+            discarded = next(p for p in policies if p.type == kind)
+            return [p for p in policies if p is not discarded], discarded
+
+        def simulate(kind, game):
+            keep, _ = split(kind)
+            self._replay_legislative(game, policies, keep, {"veto": lambda *a: False})
+
+        best = self._search("filter_policies", kinds, simulate)
+        if best is None:
+            return self.fallback.filter_policies(policies)
+        return split(best)
+
+    def choose_policy(self, policies):
+        """Enact the policy type with the best simulated outcome."""
+        kinds = list(dict.fromkeys(policy.type for policy in policies))
+        if len(kinds) == 1:
+            return policies[0], policies[1]
+
+        def split(kind):
+            chosen = next(p for p in policies if p.type == kind)
+            return chosen, next(p for p in policies if p is not chosen)
+
+        def simulate(kind, game):
+            board = game.state.board
+            filler = board.discards.pop() if board.discards else board.policies.pop()
+            self._replay_legislative(
+                game,
+                list(policies) + [filler],
+                list(policies),
+                {
+                    "veto": lambda *a: False,
+                    "choose_policy": lambda hand: split(kind),
+                },
+            )
+
+        best = self._search("choose_policy", kinds, simulate)
+        if best is None:
+            return self.fallback.choose_policy(policies)
+        return split(best)
+
+    def _choose_power_target(self, method, eligible_players):
+        """Choose the target of a state-changing presidential power."""
+        if len(eligible_players) == 1:
+            return eligible_players[0]
+        fallback = getattr(self.fallback, method)
+        president = getattr(self.player.state, "president", None)
+        if president is None or president.id != self.player.id:
+            return fallback(eligible_players)
+
+        power = POWER_DECISIONS[method]
+        best = self._search(
+            power,
+            [p.id for p in eligible_players],
+            lambda target_id, game: self._replay_power(game, power, target_id),
+        )
+        if best is None:
+            return fallback(eligible_players)
+        return self._find(eligible_players, best)
+
+    def choose_player_to_kill(self, eligible_players):
+        """Execute the player whose death simulates best."""
+        return self._choose_power_target("choose_player_to_kill", eligible_players)
+
+    def choose_next_president(self, eligible_players):
+        """Pick the special-election president that simulates best."""
+        return self._choose_power_target("choose_next_president", eligible_players)
+
+    def choose_player_to_mark(self, eligible_players):
+        """Mark for execution the player that simulates best."""
+        return self._choose_power_target("choose_player_to_mark", eligible_players)
+
+    def choose_player_to_radicalize(self, eligible_players):
+        """Radicalize the player that simulates best."""
+        return self._choose_power_target(
+            "choose_player_to_radicalize", eligible_players
+        )
+
+    # Delegated decisions
+
+    def veto(self, policies):
+        """Delegate to SmartStrategy."""
+        return self.fallback.veto(policies)
+
+    def accept_veto(self, policies):
+        """Delegate to SmartStrategy."""
+        return self.fallback.accept_veto(policies)
+
+    def choose_player_to_inspect(self, eligible_players):
+        """Delegate to SmartStrategy."""
+        return self.fallback.choose_player_to_inspect(eligible_players)
+
+    def choose_player_to_bug(self, eligible_players):
+        """Delegate to SmartStrategy."""
+        return self.fallback.choose_player_to_bug(eligible_players)
+
+    def propaganda_decision(self, policy):
+        """Delegate to SmartStrategy."""
+        return self.fallback.propaganda_decision(policy)
+
+    def choose_revealer(self, eligible_players):
+        """Delegate to SmartStrategy."""
+        return self.fallback.choose_revealer(eligible_players)
+
+    def pardon_player(self):
+        """Delegate to SmartStrategy."""
+        return self.fallback.pardon_player()
+
+    def chancellor_veto_proposal(self, policies):
+        """Delegate to SmartStrategy."""
+        return self.fallback.chancellor_veto_proposal(policies)
+
+    def vote_of_no_confidence(self):
+        """Delegate to SmartStrategy."""
+        return self.fallback.vote_of_no_confidence()
+
+    def social_democratic_removal_choice(self):
+        """Delegate to SmartStrategy."""
+        return self.fallback.social_democratic_removal_choice()
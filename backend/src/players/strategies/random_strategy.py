@@ -1,5 +1,4 @@
-from random import choice, random
-
+from src.game.rng import choice, random
 from src.players.strategies.base_strategy import PlayerStrategy
 
 
@@ -1,12 +1,40 @@
-from collections import Counter
-from random import choice, random
-
-from src.players.strategies.base_strategy import PlayerStrategy
+from src.game.rng import choice, random
+from src.players.strategies.base_strategy import (
+    HITLER_RISK,
+    TRUST_MARGIN,
+    PlayerStrategy,
+    most_likely,
+    player_beliefs,
+    trusts_government,
+)
+from src.players.strategies.decision_tables import (
+    CHAOS_TRACKER,
+    SMART_ACCEPT_VETO,
+    SMART_CHOICE,
+    SMART_FILTER_ORDER,
+    SMART_VETO,
+)
 
 
 class SmartStrategy(PlayerStrategy):
     """Advanced AI strategy with more sophisticated decision making"""
 
+    # Tunable vote, veto and pardon probabilities
+    PARAMETERS = {
+        "hitler_risk": HITLER_RISK,
+        "trust_margin": TRUST_MARGIN,
+        "fascist_vote": 0.7,
+        "liberal_vote_late": 0.4,
+        "liberal_vote": 0.6,
+        "communist_vote_fascist": 0.7,
+        "communist_vote_liberal": 0.3,
+        "communist_vote": 0.5,
+        "veto": 0.1,
+        "accept_veto": 0.2,
+        "pardon_fascist": 0.9,
+        "pardon_unknown": 0.2,
+    }
+
     def nominate_chancellor(self, eligible_players):
         """Choose chancellor based on game state and player knowledge"""
         # Get current game state data
@@ -58,6 +86,11 @@ class SmartStrategy(PlayerStrategy):
                 return choice(
                     known_liberals
                 )  # Avoid players who have enacted fascist policies
+            beliefs = player_beliefs(self.player)
+            if beliefs:
+                return most_likely(
+                    eligible_players, lambda p: beliefs.role(p, "liberal")
+                )
             suspicious_players = set()
             if hasattr(self.player.state, "policy_history"):
                 for policy_data in self.player.state.policy_history:
@@ -96,128 +129,44 @@ class SmartStrategy(PlayerStrategy):
 
             if eligible_players:
                 non_liberals = [p for p in eligible_players if p not in known_liberals]
+                beliefs = player_beliefs(self.player)
+                if non_liberals and beliefs:
+                    return most_likely(
+                        non_liberals, lambda p: beliefs.party(p, "communist")
+                    )
                 if non_liberals:
                     return choice(non_liberals)
 
         # Default to random choice if no better strategy is available
         return choice(eligible_players)
 
-    def filter_policies(self, policies):
-        """Sorts policies by priority based on role, handling duplicates intelligently."""
-
-        # Define priority map based on player role
+    def _role(self):
+        """Faction whose decision tables this player uses (None if unknown)."""
         if self.player.is_fascist or self.player.is_hitler:
-            priority = {
-                "article48": 4,
-                "enablingact": 4,
-                "fascist": 3,
-                "communist": 2,
-                "anticommunist": 2,
-                "liberal": 1,
-                "socialdemocratic": 1,
-                "antifascist": 0,
-            }
-        elif self.player.is_liberal:
-            priority = {
-                "article48": 4,
-                "enablingact": 4,
-                "liberal": 3,
-                "antifascist": 3,
-                "socialdemocratic": 3,
-                "communist": 2,
-                "anticommunist": 2,
-                "fascist": 1,
-            }
-        else:  # Communist
-            priority = {
-                "article48": 4,
-                "enablingact": 4,
-                "communist": 3,
-                "antifascist": 3,
-                "fascist": 2,
-                "liberal": 1,
-                "socialdemocratic": 1,
-                "anticommunist": 0,
-            }
-
-        # Count policy types and prepare for sorting
-        type_counts = Counter(p.type for p in policies)
-        decorated = [
-            {"policy": p, "type": p.type, "priority": priority.get(p.type, 0)}
-            for p in policies
-        ]
-
-        # Handle duplicate types specially
-        duplicate_type = next((t for t, c in type_counts.items() if c == 2), None)
-
-        if duplicate_type:
-            dup_priority = priority[duplicate_type]
-            solo_policy = next(d for d in decorated if d["type"] != duplicate_type)
-
-            # If duplicates are higher priority, put them first; otherwise, put them last
-            def sort_key(d):
-                return (
-                    d["type"] == duplicate_type
-                    if dup_priority < solo_policy["priority"]
-                    else d["type"] != duplicate_type
-                )
+            return "fascist"
+        if self.player.is_liberal:
+            return "liberal"
+        if self.player.is_communist:
+            return "communist"
+        return None
 
-            decorated.sort(key=sort_key)
-        else:
-            # Just sort by priority
-            decorated.sort(key=lambda d: d["priority"], reverse=True)
+    def filter_policies(self, policies):
+        """Sorts policies by priority based on role, handling duplicates intelligently."""
+        # Pairs go first or last depending on the remaining card (see
+        # decision_tables.smart_filter_order); unknown roles play as communists
+        order = SMART_FILTER_ORDER[self._role() or "communist"].lookup(policies)
 
         # Take the top 2 policies, discard the rest
-        sorted_policies = [d["policy"] for d in decorated]
-        chosen = sorted_policies[:2]
-        discarded = sorted_policies[2]
+        chosen = [policies[i] for i in order[:2]]
+        discarded = policies[order[2]]
         return chosen, discarded
 
     def choose_policy(self, policies):
         """Choose which policy to enact based on role"""
-        # Similar logic to filter_policies but for chancellor choice
-        if self.player.is_fascist or self.player.is_hitler:
-            # Fascists want fascist policies
-            fascist_policies = [p for p in policies if p.type == "fascist"]
-            if fascist_policies:
-                chosen = fascist_policies[0]
-                discarded = [p for p in policies if p != chosen][0]
-                return chosen, discarded
-
-            # If no fascist policies, prefer communist over liberal
-            communist_policies = [p for p in policies if p.type == "communist"]
-            if communist_policies:
-                chosen = communist_policies[0]
-                discarded = [p for p in policies if p != chosen][0]
-                return chosen, discarded
-
-        elif self.player.is_liberal:
-            # Liberals want liberal policies
-            liberal_policies = [p for p in policies if p.type == "liberal"]
-            if liberal_policies:
-                chosen = liberal_policies[0]
-                discarded = [p for p in policies if p != chosen][0]
-                return chosen, discarded
-
-        elif self.player.is_communist:
-            # Communists want communist policies
-            communist_policies = [p for p in policies if p.type == "communist"]
-            if communist_policies:
-                chosen = communist_policies[0]
-                discarded = [p for p in policies if p != chosen][0]
-                return chosen, discarded
-
-            # If no communist policies, prefer fascist to create chaos
-            fascist_policies = [p for p in policies if p.type == "fascist"]
-            if fascist_policies:
-                chosen = fascist_policies[0]
-                discarded = [p for p in policies if p != chosen][0]
-                return chosen, discarded
-
-        # Default if no preference found
-        chosen = policies[0]
-        discarded = policies[1]
-        return chosen, discarded
+        # Fascists prefer fascist then communist, liberals liberal, communists
+        # communist then fascist; otherwise enact the first policy
+        chosen, discarded = SMART_CHOICE[self._role()].lookup(policies)
+        return policies[chosen], policies[discarded]
 
     def vote(self, president, chancellor):
         """Vote on government based on role and game state"""
@@ -236,7 +185,7 @@ class SmartStrategy(PlayerStrategy):
                 return True
 
             # Be more cautious with unknown players
-            return random() <= 0.7
+            return random() <= self.parameters["fascist_vote"]
 
         # If player is liberal
         elif self.player.is_liberal:
@@ -254,13 +203,24 @@ class SmartStrategy(PlayerStrategy):
             ):
                 return False
 
+            beliefs = player_beliefs(self.player)
+            if beliefs:
+                return trusts_government(
+                    self.player,
+                    beliefs,
+                    president,
+                    chancellor,
+                    self.parameters["hitler_risk"],
+                    self.parameters["trust_margin"],
+                )
+
             # If we're at risk of fascist win, be more selective
             if fascist_policies >= 4:
                 # Only 40% chance to approve unknown governments
-                return random() <= 0.4
+                return random() <= self.parameters["liberal_vote_late"]
 
             # Default liberal voting - slightly more likely to approve government
-            return random() <= 0.6
+            return random() <= self.parameters["liberal_vote"]
 
         # If player is communist
         elif self.player.is_communist:
@@ -276,91 +236,54 @@ class SmartStrategy(PlayerStrategy):
                 chancellor.id in self.player.inspected_players
                 and self.player.inspected_players[chancellor.id] == "fascist"
             ):
-                return random() <= 0.7
+                return random() <= self.parameters["communist_vote_fascist"]
 
             # Vote against known liberals
             if (
                 chancellor.id in self.player.inspected_players
                 and self.player.inspected_players[chancellor.id] == "liberal"
             ):
-                return random() <= 0.3
+                return random() <= self.parameters["communist_vote_liberal"]
+
+            beliefs = player_beliefs(self.player)
+            if beliefs:
+                return trusts_government(
+                    self.player,
+                    beliefs,
+                    president,
+                    chancellor,
+                    self.parameters["hitler_risk"],
+                    self.parameters["trust_margin"],
+                )
 
             # Default communist voting
-            return random() <= 0.5
+            return random() <= self.parameters["communist_vote"]
 
         # Default fallback
         return random() >= 0.5
 
     def veto(self, policies):
         """Decide whether to propose veto based on role and policies"""
-        # Count policy types
-        liberal_policies = [p for p in policies if p.type == "liberal"]
-        fascist_policies = [p for p in policies if p.type == "fascist"]
-        communist_policies = [p for p in policies if p.type == "communist"]
-
-        # Liberals veto if both policies are fascist
-        if self.player.is_liberal and len(fascist_policies) == len(policies):
-            return True
-
-        # Fascists veto if both policies are liberal
-        if (self.player.is_fascist or self.player.is_hitler) and len(
-            liberal_policies
-        ) == len(policies):
-            return True
-
-        # Communists veto if no communist policies and all liberal
-        if (
-            self.player.is_communist
-            and not communist_policies
-            and len(liberal_policies) == len(policies)
-        ):
+        # Liberals veto all-fascist hands; fascists and communists all-liberal ones
+        role = self._role()
+        if role and SMART_VETO[role].lookup(policies):
             return True
 
         # By default, rarely veto
-        return random() <= 0.1
+        return random() <= self.parameters["veto"]
 
     def accept_veto(self, policies):
         """Decide whether to accept chancellor's veto"""
-        # Similar logic to veto, but from president's perspective
-        liberal_policies = [p for p in policies if p.type == "liberal"]
-        fascist_policies = [p for p in policies if p.type == "fascist"]
-        communist_policies = [p for p in policies if p.type == "communist"]
-
-        # Check election tracker
-        election_tracker = self.player.state.election_tracker
-
-        # If election tracker is at 2, accepting veto could trigger chaos
-        if election_tracker == 2:
-            # Only accept in truly bad situations
-            if self.player.is_liberal and len(fascist_policies) == len(policies):
-                return True
-
-            if (self.player.is_fascist or self.player.is_hitler) and len(
-                liberal_policies
-            ) == len(policies):
-                return True
-
-            # Otherwise don't risk chaos
-            return False
-
-        # Normal veto acceptance criteria
-        if self.player.is_liberal and len(fascist_policies) == len(policies):
-            return True
-
-        if (self.player.is_fascist or self.player.is_hitler) and len(
-            liberal_policies
-        ) == len(policies):
-            return True
-
-        if (
-            self.player.is_communist
-            and not communist_policies
-            and len(liberal_policies) == len(policies)
-        ):
-            return True
+        # Same hands as veto, from the president's side; one failed
+        # government from chaos only liberals and fascists accept, and only
+        # those hands (see decision_tables.smart_accept_veto)
+        at_chaos = self.player.state.election_tracker == CHAOS_TRACKER
+        accept = SMART_ACCEPT_VETO[self._role()][at_chaos].lookup(policies)
+        if accept is not None:
+            return accept
 
         # By default, rarely accept veto
-        return random() <= 0.2
+        return random() <= self.parameters["accept_veto"]
 
     def choose_player_to_kill(self, eligible_players):
         """Choose a player to execute based on role"""
@@ -374,6 +297,12 @@ class SmartStrategy(PlayerStrategy):
             ]
             if known_fascists:
                 return choice(known_fascists)  # Try to kill suspicious players
+            beliefs = player_beliefs(self.player)
+            if beliefs:
+                return most_likely(
+                    eligible_players,
+                    lambda p: beliefs.role(p, "hitler") + beliefs.party(p, "fascist"),
+                )
             suspicious_players = set()
             if hasattr(self.player.state, "policy_history"):
                 for policy_data in self.player.state.policy_history:
@@ -420,6 +349,13 @@ class SmartStrategy(PlayerStrategy):
             if known_liberals:
                 return choice(known_liberals)
 
+            beliefs = player_beliefs(self.player)
+            if beliefs:
+                return most_likely(
+                    eligible_players,
+                    lambda p: beliefs.role(p, "hitler") + beliefs.party(p, "fascist"),
+                )
+
         # Default to random
         return choice(eligible_players)
 
@@ -429,6 +365,9 @@ class SmartStrategy(PlayerStrategy):
         uninspected = [
             p for p in eligible_players if p.id not in self.player.inspected_players
         ]
+        beliefs = player_beliefs(self.player)
+        if uninspected and beliefs:
+            return most_likely(uninspected, beliefs.uncertainty)
         if uninspected:
             return choice(uninspected)
 
@@ -643,7 +582,7 @@ class SmartStrategy(PlayerStrategy):
         if (
             self.player.is_fascist or self.player.is_hitler
         ) and marked_player.is_fascist:
-            return random() <= 0.9  # 90% chance to pardon
+            return random() <= self.parameters["pardon_fascist"]
 
         # Liberal president will pardon known liberals
         if self.player.is_liberal and marked_player.id in self.player.inspected_players:
@@ -656,7 +595,7 @@ class SmartStrategy(PlayerStrategy):
                 return True
 
         # By default, random decision with bias toward not pardoning
-        return random() <= 0.2  # 20% chance to pardon unknown players
+        return random() <= self.parameters["pardon_unknown"]
 
     def social_democratic_removal_choice(self):
         """Choose policy track to remove from (Social Democratic)"""
@@ -0,0 +1,116 @@
+"""Probabilidades de robo del mazo de políticas para Secret Hitler XL.
+
+Este módulo calcula, con la distribución hipergeométrica multivariante, la
+probabilidad de cada mano al robar del mazo (3 cartas del presidente o 2 del
+canciller). Las tablas se indexan por la composición del mazo, una tupla con
+el número de cartas de cada tipo en el orden de POLICY_TYPES, y se memorizan
+una sola vez por proceso.
+"""
+
+from functools import lru_cache
+from math import comb
+
+POLICY_TYPES = (
+    "liberal",
+    "fascist",
+    "communist",
+    "antifascist",
+    "anticommunist",
+    "socialdemocratic",
+    "article48",
+    "enablingact",
+)
+TYPE_INDEX = {policy_type: index for index, policy_type in enumerate(POLICY_TYPES)}
+
+
+def composition_key(policies):
+    """Cuenta las cartas de cada tipo.
+
+    Args:
+        policies (iterable): Políticas o tipos de política.
+
+    Returns:
+        tuple: Número de cartas por tipo, en el orden de POLICY_TYPES.
+    """
+    counts = [0] * len(POLICY_TYPES)
+    for policy in policies:
+        index = TYPE_INDEX.get(getattr(policy, "type", policy))
+        if index is not None:
+            counts[index] += 1
+    return tuple(counts)
+
+
+@lru_cache(maxsize=None)
+def draw_table(composition, count=3):
+    """Probabilidad de cada mano al robar sin reposición.
+
+    El resultado se comparte entre llamadas y no debe modificarse.
+
+    Args:
+        composition (tuple): Cartas por tipo (ver composition_key).
+        count (int): Cartas robadas; se limita al tamaño del mazo.
+
+    Returns:
+        dict: Probabilidad de cada mano, indexada por cartas robadas de cada
+            tipo en el orden de POLICY_TYPES.
+    """
+    total = sum(composition)
+    count = min(count, total)
+    ways = comb(total, count)
+    table = {}
+
+    def expand(index, remaining, hand, combinations):
+        if index == len(composition):
+            if remaining == 0:
+                table[tuple(hand)] = combinations / ways
+            return
+        for drawn in range(min(remaining, composition[index]) + 1):
+            hand.append(drawn)
+            expand(
+                index + 1,
+                remaining - drawn,
+                hand,
+                combinations * comb(composition[index], drawn),
+            )
+            hand.pop()
+
+    expand(0, count, [], 1)
+    return table
+
+
+@lru_cache(maxsize=None)
+def hand_probability(composition, policy_type, count=3, at_least=1):
+    """Probabilidad de robar al menos un número de cartas de un tipo.
+
+    Args:
+        composition (tuple): Cartas por tipo (ver composition_key).
+        policy_type (str): Tipo de política.
+        count (int): Cartas robadas.
+        at_least (int): Mínimo de cartas del tipo en la mano.
+
+    Returns:
+        float: Probabilidad de la mano.
+    """
+    index = TYPE_INDEX[policy_type]
+    return sum(
+        probability
+        for hand, probability in draw_table(composition, count).items()
+        if hand[index] >= at_least
+    )
+
+
+def claim_probability(composition, claim):
+    """Probabilidad de que una mano declarada haya salido del mazo.
+
+    Sirve para juzgar si una declaración de un presidente o un canciller es
+    verosímil; una mano imposible tiene probabilidad 0.
+
+    Args:
+        composition (tuple): Cartas por tipo (ver composition_key).
+        claim (iterable): Políticas o tipos de política declarados.
+
+    Returns:
+        float: Probabilidad de robar exactamente esa mano.
+    """
+    hand = composition_key(claim)
+    return draw_table(composition, sum(hand)).get(hand, 0.0)
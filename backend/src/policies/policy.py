@@ -26,6 +26,20 @@ class Policy:
         """
         return self.type.title()
 
+    def __deepcopy__(self, memo):
+        """Devuelve la propia política al copiar en profundidad.
+
+        Las cartas no cambian tras crearse, de modo que las copias del estado
+        (ver EnhancedGameState.fork) pueden compartirlas.
+
+        Args:
+            memo (dict): Memo de copy.deepcopy.
+
+        Returns:
+            Policy: La misma política.
+        """
+        return self
+
 
 class Fascist(Policy):
     """Política fascista.
@@ -4,8 +4,7 @@ Este módulo proporciona funcionalidades para generar mazos de cartas de políti
 basados en la configuración del juego y número de jugadores.
 """
 
-from random import shuffle
-
+from src.game.rng import shuffle
 from src.policies.policy import (
     AntiCommunist,
     AntiFascist,
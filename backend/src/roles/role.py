@@ -24,6 +24,21 @@ class Role:
         """
         return self.role.title()
 
+    def __deepcopy__(self, memo):
+        """Devuelve el propio rol al copiar en profundidad.
+
+        Los roles no cambian tras crearse (una radicalización asigna un rol
+        nuevo al jugador), de modo que las copias del estado pueden
+        compartirlos.
+
+        Args:
+            memo (dict): Memo de copy.deepcopy.
+
+        Returns:
+            Role: El mismo rol.
+        """
+        return self
+
 
 class Liberal(Role):
     """Rol de jugador liberal.
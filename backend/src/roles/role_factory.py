@@ -4,8 +4,7 @@ Este módulo proporciona funcionalidades para generar distribuciones de roles
 basadas en el número de jugadores y configuración del juego.
 """
 
-from random import shuffle
-
+from src.game.rng import shuffle
 from src.roles.role import Communist, Fascist, Hitler, Liberal
 
 
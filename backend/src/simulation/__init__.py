@@ -0,0 +1 @@
+"""Herramientas de simulación y evaluación de estrategias para Secret Hitler XL."""
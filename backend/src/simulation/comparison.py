@@ -0,0 +1,70 @@
+"""Comparación emparejada de estrategias para Secret Hitler XL.
+
+Cuando dos estrategias juegan las mismas semillas (mismo reparto de roles,
+mismo mazo y mismo primer presidente), sus resultados partida a partida
+están correlacionados y la varianza de la diferencia es mucho menor que la
+de dos muestras independientes. Este módulo calcula esa diferencia
+emparejada con su error estándar y la compara con el de una comparación sin
+emparejar.
+"""
+
+import math
+
+Z_95 = 1.96
+
+
+def paired_difference(baseline, candidate):
+    """Diferencia media entre dos estrategias que jugaron las mismas semillas.
+
+    Args:
+        baseline (list): Resultado por partida de la estrategia de
+            referencia (por ejemplo, 1 si su facción ganó y 0 si no).
+        candidate (list): Resultado de la otra estrategia en las mismas
+            partidas y en el mismo orden.
+
+    Returns:
+        dict: Media de cada estrategia, diferencia media (candidata menos
+            referencia), varianza de las diferencias, error estándar
+            emparejado, intervalo de confianza del 95 %, error estándar sin
+            emparejar y reducción de varianza (cuántas veces menos partidas
+            necesita la comparación emparejada para la misma precisión).
+
+    Raises:
+        ValueError: Si las series no tienen la misma longitud o tienen
+            menos de dos partidas.
+    """
+    if len(baseline) != len(candidate):
+        raise ValueError("Paired series must have the same length")
+    n = len(baseline)
+    if n < 2:
+        raise ValueError("At least two paired games are needed")
+
+    differences = [c - b for b, c in zip(baseline, candidate)]
+    mean = sum(differences) / n
+    variance = _variance(differences, mean)
+    std_error = math.sqrt(variance / n)
+    unpaired_variance = _variance(baseline) + _variance(candidate)
+    if variance > 0:
+        reduction = unpaired_variance / variance
+    else:
+        reduction = math.inf if unpaired_variance > 0 else 1.0
+
+    return {
+        "games": n,
+        "baseline": sum(baseline) / n,
+        "candidate": sum(candidate) / n,
+        "difference": mean,
+        "variance": variance,
+        "std_error": std_error,
+        "low": mean - Z_95 * std_error,
+        "high": mean + Z_95 * std_error,
+        "unpaired_std_error": math.sqrt(unpaired_variance / n),
+        "variance_reduction": reduction,
+    }
+
+
+def _variance(values, mean=None):
+    """Varianza muestral (con n - 1)."""
+    if mean is None:
+        mean = sum(values) / len(values)
+    return sum((value - mean) ** 2 for value in values) / (len(values) - 1)
@@ -0,0 +1,374 @@
+"""Datos de decisiones y entrenamiento de la estrategia aprendida.
+
+Este módulo juega partidas simuladas con una estrategia maestra, registra
+cada decisión de los bots (vector de estado, acciones legales, acción
+elegida y si la facción del jugador acabó ganando) en arrays compactos de
+NumPy y entrena con ellos, solo con NumPy y en CPU, los modelos que usa
+LearnedStrategy.
+
+Cada tipo de decisión se guarda como:
+
+- states: matriz decisiones x STATE_SIZE.
+- actions: filas de todas las acciones legales, decisión tras decisión.
+- offsets: inicio de las acciones de cada decisión (más el total al final).
+- chosen: posición de la acción elegida dentro de su decisión.
+- won: si la facción del jugador ganó la partida.
+- faction: índice de la facción del jugador en FACTIONS.
+"""
+
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from src.game.game import SHXLGame
+from src.game.game_logger import GameLogger, LogLevel
+from src.players.strategies.learned_strategy import (
+    ACTION_SIZES,
+    DECISIONS,
+    FACTIONS,
+    STATE_SIZE,
+    DecisionModel,
+    chosen_index,
+    encode_decision,
+    forward,
+)
+from src.simulation.tournament import winning_factions
+
+FIELDS = ("states", "actions", "offsets", "chosen", "won", "faction")
+
+
+class DecisionRecorder:
+    """Envoltorio de una estrategia que registra sus decisiones.
+
+    Las llamadas de DECISIONS se codifican antes de responderlas; el resto
+    pasa directamente a la estrategia envuelta.
+    """
+
+    def __init__(self, player, strategy, log):
+        """Inicializa el registrador.
+
+        Args:
+            player: Jugador que decide.
+            strategy (PlayerStrategy): Estrategia maestra.
+            log (list): Lista donde se añaden las decisiones.
+        """
+        self.player = player
+        self.strategy = strategy
+        self.log = log
+
+    def __getattr__(self, name):
+        attribute = getattr(self.strategy, name)
+        kind = DECISIONS.get(name)
+        if kind is None:
+            return attribute
+
+        def record(*args):
+            state, actions, candidates = encode_decision(self.player, kind, args)
+            result = attribute(*args)
+            index = chosen_index(kind, candidates, result)
+            if len(candidates) > 1 and index is not None:
+                self.log.append((kind, self.player, state, actions, index))
+            return result
+
+        return record
+
+
+def record_game(
+    strategy_type="smart",
+    player_count=8,
+    with_communists=True,
+    with_anti_policies=False,
+    with_emergency_powers=False,
+    seed=None,
+):
+    """Juega una partida y devuelve las decisiones de todos los bots.
+
+    Es una función de módulo para poder ejecutarse en otros procesos.
+
+    Args:
+        strategy_type (str): Estrategia maestra de todos los bots.
+        player_count (int): Número de jugadores.
+        with_communists (bool): Si incluir la facción comunista.
+        with_anti_policies (bool): Si incluir anti-políticas.
+        with_emergency_powers (bool): Si incluir poderes de emergencia.
+        seed (int, optional): Semilla de la partida.
+
+    Returns:
+        dict: Arrays de cada tipo de decisión (ver el módulo).
+    """
+    if seed is not None:
+        random.seed(seed)
+    game = SHXLGame(GameLogger(LogLevel.NONE))
+    game.setup_game(
+        player_count,
+        with_communists=with_communists,
+        with_anti_policies=with_anti_policies,
+        with_emergency_powers=with_emergency_powers,
+        ai_strategy=strategy_type,
+    )
+    log = []
+    for player in game.state.players:
+        player.strategy = DecisionRecorder(player, player.strategy, log)
+    winners = winning_factions(game.start_game() or game.state.winner)
+
+    # Labels use each player's final faction (radicalization can change it)
+    decisions = {}
+    for kind, player, state, actions, index in log:
+        faction = player.role.party_membership
+        decisions.setdefault(kind, []).append(
+            (state, actions, index, faction in winners, FACTIONS.index(faction))
+        )
+    return {kind: _pack(kind, rows) for kind, rows in decisions.items()}
+
+
+def collect_decisions(
+    n_games,
+    strategy_type="smart",
+    player_count=8,
+    with_communists=True,
+    with_anti_policies=False,
+    with_emergency_powers=False,
+    seed=None,
+    parallel=True,
+    max_workers=None,
+):
+    """Registra las decisiones de varias partidas simuladas.
+
+    Args:
+        n_games (int): Número de partidas.
+        strategy_type (str): Estrategia maestra de todos los bots.
+        player_count (int): Número de jugadores.
+        with_communists (bool): Si incluir la facción comunista.
+        with_anti_policies (bool): Si incluir anti-políticas.
+        with_emergency_powers (bool): Si incluir poderes de emergencia.
+        seed (int, optional): Semilla de la que se derivan las partidas.
+        parallel (bool): Si ejecutar en paralelo.
+        max_workers (int, optional): Procesos; por defecto, los núcleos.
+
+    Returns:
+        dict: Arrays de cada tipo de decisión (ver el módulo).
+    """
+    rng = random.Random(seed)
+    jobs = [
+        (
+            strategy_type,
+            player_count,
+            with_communists,
+            with_anti_policies,
+            with_emergency_powers,
+            rng.getrandbits(32),
+        )
+        for _ in range(n_games)
+    ]
+    if parallel:
+        workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            games = list(executor.map(record_game, *zip(*jobs)))
+    else:
+        games = [record_game(*job) for job in jobs]
+    return merge_datasets(games)
+
+
+def merge_datasets(datasets):
+    """Concatena conjuntos de decisiones.
+
+    Args:
+        datasets (list): Conjuntos de decisiones.
+
+    Returns:
+        dict: Un único conjunto con todas las decisiones.
+    """
+    merged = {}
+    for kind in sorted({kind for dataset in datasets for kind in dataset}):
+        parts = [dataset[kind] for dataset in datasets if kind in dataset]
+        starts = np.cumsum([0] + [len(part["actions"]) for part in parts[:-1]])
+        merged[kind] = {
+            "states": np.concatenate([part["states"] for part in parts]),
+            "actions": np.concatenate([part["actions"] for part in parts]),
+            "offsets": np.concatenate(
+                [part["offsets"][:-1] + start for part, start in zip(parts, starts)]
+                + [np.array([sum(len(part["actions"]) for part in parts)], np.int32)]
+            ).astype(np.int32),
+            "chosen": np.concatenate([part["chosen"] for part in parts]),
+            "won": np.concatenate([part["won"] for part in parts]),
+            "faction": np.concatenate([part["faction"] for part in parts]),
+        }
+    return merged
+
+
+def save_dataset(path, dataset):
+    """Guarda un conjunto de decisiones en un .npz comprimido.
+
+    Args:
+        path (str): Fichero de destino.
+        dataset (dict): Conjunto de decisiones.
+    """
+    np.savez_compressed(
+        path,
+        **{
+            f"{kind}/{field}": arrays[field]
+            for kind, arrays in dataset.items()
+            for field in FIELDS
+        },
+    )
+
+
+def load_dataset(path):
+    """Carga un conjunto de decisiones guardado con save_dataset.
+
+    Args:
+        path (str): Fichero de origen.
+
+    Returns:
+        dict: Conjunto de decisiones.
+    """
+    dataset = {}
+    with np.load(path) as data:
+        for key in data.files:
+            kind, field = key.split("/")
+            dataset.setdefault(kind, {})[field] = data[key]
+    return dataset
+
+
+def train_model(
+    dataset,
+    hidden=16,
+    epochs=300,
+    learning_rate=0.05,
+    l2=1e-4,
+    winners_only=True,
+    seed=None,
+):
+    """Entrena un modelo que imita las decisiones del conjunto.
+
+    Cada tipo de decisión tiene su propio evaluador, entrenado con descenso
+    de gradiente (Adam) sobre la verosimilitud de la acción elegida bajo un
+    softmax de las puntuaciones de las acciones legales.
+
+    Args:
+        dataset (dict): Conjunto de decisiones.
+        hidden (int): Neuronas de la capa oculta; 0 para un evaluador lineal.
+        epochs (int): Pasadas por el conjunto completo.
+        learning_rate (float): Tasa de aprendizaje de Adam.
+        l2 (float): Regularización de los pesos.
+        winners_only (bool): Si imitar solo decisiones de jugadores cuya
+            facción ganó la partida.
+        seed (int, optional): Semilla de la inicialización.
+
+    Returns:
+        DecisionModel: Modelo con un evaluador por tipo de decisión.
+    """
+    rng = np.random.default_rng(seed)
+    layers = {}
+    for kind, arrays in dataset.items():
+        weights = arrays["won"].astype(np.float64)
+        if not winners_only:
+            weights = np.ones_like(weights)
+        if weights.sum() == 0:
+            continue
+        layers[kind] = _fit(arrays, weights, hidden, epochs, learning_rate, l2, rng)
+    return DecisionModel(layers)
+
+
+def decision_accuracy(model, dataset):
+    """Porcentaje de decisiones en las que el modelo elige la acción registrada.
+
+    Args:
+        model (DecisionModel): Modelo a evaluar.
+        dataset (dict): Conjunto de decisiones.
+
+    Returns:
+        dict: Acierto de cada tipo de decisión con modelo.
+    """
+    accuracy = {}
+    for kind, arrays in dataset.items():
+        if kind not in model.layers:
+            continue
+        inputs, starts, _ = _inputs(arrays)
+        scores = forward(model.layers[kind], inputs)[0]
+        best = _segment_argmax(scores, starts)
+        accuracy[kind] = float(np.mean(best == arrays["chosen"]))
+    return accuracy
+
+
+def _pack(kind, rows):
+    """Convierte las decisiones de una partida en arrays."""
+    states, actions, chosen, won, faction = zip(*rows)
+    offsets = np.cumsum([0] + [len(a) for a in actions]).astype(np.int32)
+    return {
+        "states": np.array(states, dtype=np.float32).reshape(-1, STATE_SIZE),
+        "actions": np.concatenate(actions).reshape(-1, ACTION_SIZES[kind]),
+        "offsets": offsets,
+        "chosen": np.array(chosen, dtype=np.int32),
+        "won": np.array(won, dtype=bool),
+        "faction": np.array(faction, dtype=np.int8),
+    }
+
+
+def _inputs(arrays):
+    """Filas de entrada (estado y acción) de todas las acciones legales."""
+    offsets = arrays["offsets"]
+    counts = np.diff(offsets)
+    segment = np.repeat(np.arange(len(counts)), counts)
+    inputs = np.hstack([arrays["states"][segment], arrays["actions"]])
+    return inputs.astype(np.float64), offsets[:-1], segment
+
+
+def _segment_argmax(scores, starts):
+    """Posición de la mejor acción de cada decisión (la primera si empatan)."""
+    best = np.maximum.reduceat(scores, starts)
+    ends = np.append(starts[1:], len(scores))
+    return np.array(
+        [
+            int(np.argmax(scores[start:end] >= top))
+            for start, end, top in zip(starts, ends, best)
+        ]
+    )
+
+
+def _fit(arrays, weights, hidden, epochs, learning_rate, l2, rng):
+    """Ajusta un evaluador con Adam sobre el softmax por decisión."""
+    inputs, starts, segment = _inputs(arrays)
+    targets = starts + arrays["chosen"]
+    total = weights.sum()
+    size = inputs.shape[1]
+    if hidden:
+        params = {
+            "W": rng.normal(0, 1 / np.sqrt(size), (size, hidden)),
+            "b": np.zeros(hidden),
+            "v": rng.normal(0, 1 / np.sqrt(hidden), hidden),
+        }
+    else:
+        params = {"v": np.zeros(size)}
+    moments = {name: (np.zeros_like(p), np.zeros_like(p)) for name, p in params.items()}
+
+    for step in range(1, epochs + 1):
+        scores, activations = forward(params, inputs)
+        exp = np.exp(scores - np.maximum.reduceat(scores, starts)[segment])
+        probabilities = exp / np.add.reduceat(exp, starts)[segment]
+        delta = probabilities * weights[segment]
+        delta[targets] -= weights
+        delta /= total
+
+        if hidden:
+            grad_hidden = np.outer(delta, params["v"]) * (1 - activations**2)
+            grads = {
+                "W": inputs.T @ grad_hidden + l2 * params["W"],
+                "b": grad_hidden.sum(axis=0),
+                "v": activations.T @ delta + l2 * params["v"],
+            }
+        else:
+            grads = {"v": inputs.T @ delta + l2 * params["v"]}
+
+        for name, grad in grads.items():
+            first, second = moments[name]
+            first *= 0.9
+            first += 0.1 * grad
+            second *= 0.999
+            second += 0.001 * grad**2
+            corrected = first / (1 - 0.9**step)
+            scale = np.sqrt(second / (1 - 0.999**step)) + 1e-8
+            params[name] -= learning_rate * corrected / scale
+
+    return {name: p.astype(np.float32) for name, p in params.items()}
@@ -0,0 +1,337 @@
+"""Torneos entre estrategias de bots para Secret Hitler XL.
+
+Este módulo enfrenta poblaciones mixtas de estrategias: en cada partida cada
+facción juega con una estrategia de su lista (por ejemplo, liberales con
+SmartStrategy contra fascistas con estrategias por rol). Mantiene una
+valoración TrueSkill por estrategia y facción, con su intervalo de confianza,
+y elige los emparejamientos según la incertidumbre de las valoraciones en vez
+de recorrer todas las combinaciones.
+"""
+
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from src.game.game import SHXLGame
+from src.game.game_logger import GameLogger, LogLevel
+from src.players.player_factory import PlayerFactory
+
+FACTIONS = ("liberal", "fascist", "communist")
+STRATEGY_TYPES = ("random", "role", "smart", "mcts", "learned")
+
+INITIAL_MU = 25.0
+INITIAL_SIGMA = INITIAL_MU / 3
+BETA = INITIAL_SIGMA / 2
+DYNAMICS = INITIAL_SIGMA / 100
+CONFIDENCE = 3
+
+
+def winning_factions(winner):
+    """Facciones ganadoras según el valor de state.winner.
+
+    Args:
+        winner (str): Ganador de la partida.
+
+    Returns:
+        set: Facciones que ganan la partida.
+    """
+    if winner in ("liberal_and_communist", "liberals_and_communists"):
+        return {"liberal", "communist"}
+    return {winner} if winner in FACTIONS else set()
+
+
+def play_match(
+    lineup,
+    player_count,
+    with_communists=True,
+    with_anti_policies=False,
+    with_emergency_powers=False,
+    seed=None,
+    parameters=None,
+):
+    """Juega una partida sentando en cada facción la estrategia indicada.
+
+    Es una función de módulo para poder ejecutarse en otros procesos.
+
+    Args:
+        lineup (dict): Estrategia de cada facción {facción: estrategia}.
+        player_count (int): Número de jugadores.
+        with_communists (bool): Si incluir la facción comunista.
+        with_anti_policies (bool): Si incluir anti-políticas.
+        with_emergency_powers (bool): Si incluir poderes de emergencia.
+        seed (int, optional): Semilla de la partida.
+        parameters (dict, optional): Parámetros de la estrategia de cada
+            facción {facción: parámetros}.
+
+    Returns:
+        str: Ganador de la partida (valor de state.winner).
+    """
+    if seed is not None:
+        random.seed(seed)
+    game = SHXLGame(GameLogger(LogLevel.NONE))
+    game.setup_game(
+        player_count,
+        with_communists=with_communists,
+        with_anti_policies=with_anti_policies,
+        with_emergency_powers=with_emergency_powers,
+        ai_strategy="role",
+    )
+    seat_lineup(game, lineup, parameters)
+    return game.start_game() or game.state.winner
+
+
+def seat_lineup(game, lineup, parameters=None):
+    """Asigna a cada bot la estrategia de su facción.
+
+    Args:
+        game (SHXLGame): Partida con los roles ya repartidos.
+        lineup (dict): Estrategia de cada facción {facción: estrategia}.
+        parameters (dict, optional): Parámetros de la estrategia de cada
+            facción {facción: parámetros}.
+    """
+    parameters = parameters or {}
+    for player in game.state.players:
+        faction = player.role.party_membership
+        PlayerFactory.apply_strategy_to_player(
+            player, lineup[faction], parameters.get(faction)
+        )
+
+
+class Rating:
+    """Valoración TrueSkill de una estrategia en una facción.
+
+    Attributes:
+        mu (float): Habilidad estimada.
+        sigma (float): Incertidumbre de la estimación.
+        games (int): Partidas jugadas.
+        wins (int): Partidas ganadas.
+    """
+
+    def __init__(self, mu=INITIAL_MU, sigma=INITIAL_SIGMA):
+        """Inicializa la valoración.
+
+        Args:
+            mu (float): Habilidad inicial.
+            sigma (float): Incertidumbre inicial.
+        """
+        self.mu = mu
+        self.sigma = sigma
+        self.games = 0
+        self.wins = 0
+
+    @property
+    def low(self):
+        """float: Cota inferior del intervalo (mu - 3 sigma)."""
+        return self.mu - CONFIDENCE * self.sigma
+
+    @property
+    def high(self):
+        """float: Cota superior del intervalo (mu + 3 sigma)."""
+        return self.mu + CONFIDENCE * self.sigma
+
+    def __repr__(self):
+        return f"Rating(mu={self.mu:.2f}, sigma={self.sigma:.2f})"
+
+
+class Tournament:
+    """Torneo entre estrategias con poblaciones mixtas por facción.
+
+    Attributes:
+        lineups (dict): Estrategias candidatas de cada facción.
+        ratings (dict): Valoración de cada (facción, estrategia).
+        matches (list): Partidas jugadas como (alineación, ganador).
+    """
+
+    def __init__(
+        self,
+        lineups,
+        player_count=8,
+        with_communists=True,
+        with_anti_policies=False,
+        with_emergency_powers=False,
+        seed=None,
+    ):
+        """Inicializa el torneo.
+
+        Args:
+            lineups (dict): Estrategias de cada facción, p. ej.
+                {"liberal": ["smart", "role"], "fascist": ["role"]}. Las
+                facciones sin lista juegan con "role".
+            player_count (int): Número de jugadores por partida.
+            with_communists (bool): Si incluir la facción comunista.
+            with_anti_policies (bool): Si incluir anti-políticas.
+            with_emergency_powers (bool): Si incluir poderes de emergencia.
+            seed (int, optional): Semilla del calendario de partidas.
+
+        Raises:
+            ValueError: Si una facción o estrategia no existe.
+        """
+        factions = FACTIONS if with_communists else FACTIONS[:2]
+        unknown = set(lineups) - set(factions)
+        if unknown:
+            raise ValueError(f"Unknown factions: {sorted(unknown)}")
+        self.lineups = {
+            faction: list(lineups.get(faction) or ["role"]) for faction in factions
+        }
+        for strategies in self.lineups.values():
+            for strategy in strategies:
+                if strategy not in STRATEGY_TYPES:
+                    raise ValueError(f"Unknown strategy: {strategy}")
+
+        self.player_count = player_count
+        self.with_communists = with_communists
+        self.with_anti_policies = with_anti_policies
+        self.with_emergency_powers = with_emergency_powers
+        self.rng = random.Random(seed)
+        self.ratings = {
+            (faction, strategy): Rating()
+            for faction, strategies in self.lineups.items()
+            for strategy in strategies
+        }
+        self.matches = []
+
+    def schedule(self, count):
+        """Elige las alineaciones de las próximas partidas.
+
+        Cada facción elige su estrategia con probabilidad proporcional a la
+        varianza de su valoración, de modo que las estrategias peor medidas
+        juegan más.
+
+        Args:
+            count (int): Número de partidas.
+
+        Returns:
+            list: Pares (alineación, semilla).
+        """
+        matches = []
+        for _ in range(count):
+            lineup = {}
+            for faction, strategies in self.lineups.items():
+                weights = [self.ratings[faction, s].sigma ** 2 for s in strategies]
+                lineup[faction] = self.rng.choices(strategies, weights)[0]
+            matches.append((lineup, self.rng.getrandbits(32)))
+        return matches
+
+    def record(self, lineup, winner):
+        """Actualiza las valoraciones con el resultado de una partida.
+
+        La partida se descompone en enfrentamientos entre cada facción
+        ganadora y cada facción perdedora; todos se calculan con las
+        valoraciones previas a la partida.
+
+        Args:
+            lineup (dict): Estrategia de cada facción.
+            winner (str): Ganador de la partida.
+        """
+        self.matches.append((dict(lineup), winner))
+        winners = winning_factions(winner)
+        entries = {
+            faction: self.ratings[faction, lineup[faction]] for faction in lineup
+        }
+        for faction, rating in entries.items():
+            rating.games += 1
+            rating.wins += faction in winners
+            rating.sigma = math.sqrt(rating.sigma**2 + DYNAMICS**2)
+
+        mu_delta = {faction: 0.0 for faction in entries}
+        variance_factor = {faction: 1.0 for faction in entries}
+        for winning in winners & set(entries):
+            for losing in set(entries) - winners:
+                won, lost = entries[winning], entries[losing]
+                c = math.sqrt(2 * BETA**2 + won.sigma**2 + lost.sigma**2)
+                t = (won.mu - lost.mu) / c
+                v = _pdf(t) / max(_cdf(t), 1e-12)
+                w = v * (v + t)
+                mu_delta[winning] += won.sigma**2 / c * v
+                mu_delta[losing] -= lost.sigma**2 / c * v
+                variance_factor[winning] *= max(1 - won.sigma**2 / c**2 * w, 1e-4)
+                variance_factor[losing] *= max(1 - lost.sigma**2 / c**2 * w, 1e-4)
+
+        for faction, rating in entries.items():
+            rating.mu += mu_delta[faction]
+            rating.sigma *= math.sqrt(variance_factor[faction])
+
+    def run(self, n_games, parallel=True, batch_size=None, max_workers=None):
+        """Juega partidas del torneo y actualiza las valoraciones.
+
+        Las partidas se juegan por lotes; en paralelo cada lote se reparte
+        entre todos los núcleos y el calendario del siguiente lote usa las
+        valoraciones actualizadas.
+
+        Args:
+            n_games (int): Número de partidas.
+            parallel (bool): Si ejecutar en paralelo.
+            batch_size (int, optional): Partidas por lote. Por defecto,
+                cuatro por proceso.
+            max_workers (int, optional): Procesos; por defecto, los núcleos.
+
+        Returns:
+            list: Clasificación (ver leaderboard).
+        """
+        workers = max_workers or os.cpu_count() or 1
+        batch_size = batch_size or (4 * workers if parallel else n_games)
+        settings = (
+            self.player_count,
+            self.with_communists,
+            self.with_anti_policies,
+            self.with_emergency_powers,
+        )
+        executor = ProcessPoolExecutor(max_workers=workers) if parallel else None
+        try:
+            remaining = n_games
+            while remaining > 0:
+                batch = self.schedule(min(batch_size, remaining))
+                remaining -= len(batch)
+                if executor:
+                    futures = [
+                        executor.submit(play_match, lineup, *settings, seed)
+                        for lineup, seed in batch
+                    ]
+                    winners = [future.result() for future in futures]
+                else:
+                    winners = [
+                        play_match(lineup, *settings, seed) for lineup, seed in batch
+                    ]
+                for (lineup, _), winner in zip(batch, winners):
+                    self.record(lineup, winner)
+        finally:
+            if executor:
+                executor.shutdown()
+        return self.leaderboard()
+
+    def leaderboard(self):
+        """Clasificación de las estrategias de cada facción.
+
+        Returns:
+            list: Diccionarios con facción, estrategia, mu, sigma, cotas del
+                intervalo, partidas, victorias y porcentaje de victorias,
+                ordenados por facción y por cota inferior.
+        """
+        rows = [
+            {
+                "faction": faction,
+                "strategy": strategy,
+                "mu": rating.mu,
+                "sigma": rating.sigma,
+                "low": rating.low,
+                "high": rating.high,
+                "games": rating.games,
+                "wins": rating.wins,
+                "win_rate": rating.wins / rating.games if rating.games else 0.0,
+            }
+            for (faction, strategy), rating in self.ratings.items()
+        ]
+        return sorted(
+            rows, key=lambda row: (FACTIONS.index(row["faction"]), -row["low"])
+        )
+
+
+def _pdf(x):
+    """Densidad de la normal estándar."""
+    return math.exp(-x * x / 2) / math.sqrt(2 * math.pi)
+
+
+def _cdf(x):
+    """Función de distribución de la normal estándar."""
+    return 0.5 * (1 + math.erf(x / math.sqrt(2)))
@@ -0,0 +1,280 @@
+"""Ajuste de parámetros de las estrategias de bots para Secret Hitler XL.
+
+Este módulo busca los valores de PlayerStrategy.PARAMETERS (probabilidades de
+voto, de veto, etc.) que maximizan el porcentaje de victorias de una facción.
+Cada candidato se evalúa con un lote de partidas en paralelo y todos los
+candidatos de un lote juegan con las mismas semillas (números aleatorios
+comunes): comparten reparto de roles, mazo y primer presidente, de modo que
+las diferencias entre ellos se deben a los parámetros y no al azar.
+"""
+
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from src.players.strategies import (
+    CommunistStrategy,
+    FascistStrategy,
+    LiberalStrategy,
+    SmartStrategy,
+)
+from src.simulation.tournament import FACTIONS, play_match, winning_factions
+
+ROLE_STRATEGIES = {
+    "liberal": LiberalStrategy,
+    "fascist": FascistStrategy,
+    "communist": CommunistStrategy,
+}
+TUNABLE_STRATEGIES = ("role", "smart")
+
+INITIAL_STEP = 0.25
+MIN_STEP = 0.02
+
+
+def tunable_parameters(strategy, faction):
+    """Parámetros ajustables de una estrategia y sus valores por defecto.
+
+    Args:
+        strategy (str): Tipo de estrategia ("role" o "smart").
+        faction (str): Facción que juega la estrategia.
+
+    Returns:
+        dict: Valor por defecto de cada parámetro.
+
+    Raises:
+        ValueError: Si la estrategia no es ajustable.
+    """
+    if strategy == "role":
+        return dict(ROLE_STRATEGIES[faction].PARAMETERS)
+    if strategy == "smart":
+        return dict(SmartStrategy.PARAMETERS)
+    raise ValueError(f"Strategy {strategy} has no tunable parameters")
+
+
+class ParameterTuner:
+    """Búsqueda de los parámetros de la estrategia de una facción.
+
+    Attributes:
+        faction (str): Facción cuyos parámetros se ajustan.
+        lineup (dict): Estrategia de cada facción en las partidas.
+        defaults (dict): Parámetros por defecto de la estrategia.
+        bounds (dict): Intervalo (mínimo, máximo) de cada parámetro.
+        history (list): Candidatos evaluados con su porcentaje de victorias.
+        best (tuple): Mejor candidato (parámetros, porcentaje de victorias).
+    """
+
+    def __init__(
+        self,
+        faction,
+        strategy="role",
+        opponents=None,
+        player_count=8,
+        with_communists=True,
+        with_anti_policies=False,
+        with_emergency_powers=False,
+        games=100,
+        bounds=None,
+        seed=None,
+    ):
+        """Inicializa la búsqueda.
+
+        Args:
+            faction (str): Facción cuyos parámetros se ajustan.
+            strategy (str): Estrategia ajustada ("role" o "smart").
+            opponents (dict, optional): Estrategia de las demás facciones;
+                por defecto, "role".
+            player_count (int): Número de jugadores por partida.
+            with_communists (bool): Si incluir la facción comunista.
+            with_anti_policies (bool): Si incluir anti-políticas.
+            with_emergency_powers (bool): Si incluir poderes de emergencia.
+            games (int): Partidas por candidato en cada evaluación.
+            bounds (dict, optional): Intervalos que sustituyen al de por
+                defecto, (0, 1).
+            seed (int, optional): Semilla de la búsqueda y de las partidas.
+
+        Raises:
+            ValueError: Si la facción, la estrategia o un parámetro no existe.
+        """
+        factions = FACTIONS if with_communists else FACTIONS[:2]
+        if faction not in factions:
+            raise ValueError(f"Unknown faction: {faction}")
+        self.faction = faction
+        self.defaults = tunable_parameters(strategy, faction)
+        self.bounds = {name: (0.0, 1.0) for name in self.defaults}
+        for name, interval in (bounds or {}).items():
+            if name not in self.bounds:
+                raise ValueError(f"Unknown strategy parameter: {name}")
+            self.bounds[name] = interval
+
+        self.lineup = {f: (opponents or {}).get(f, "role") for f in factions}
+        self.lineup[faction] = strategy
+        self.settings = (
+            player_count,
+            with_communists,
+            with_anti_policies,
+            with_emergency_powers,
+        )
+        self.games = games
+        self.rng = random.Random(seed)
+        self.history = []
+        self.best = (self._clip(self.defaults), None)
+
+    def evaluate(self, candidates, parallel=True, max_workers=None):
+        """Evalúa candidatos con las mismas partidas.
+
+        El mejor candidato del lote pasa a ser el mejor de la búsqueda.
+
+        Args:
+            candidates (list): Parámetros de cada candidato.
+            parallel (bool): Si ejecutar en paralelo.
+            max_workers (int, optional): Procesos; por defecto, los núcleos.
+
+        Returns:
+            list: Porcentaje de victorias de cada candidato.
+        """
+        executor = self._executor(parallel, max_workers)
+        try:
+            return self._evaluate(candidates, executor)
+        finally:
+            if executor:
+                executor.shutdown()
+
+    def random_search(self, iterations, population=8, parallel=True, max_workers=None):
+        """Busca parámetros muestreando candidatos uniformes en los intervalos.
+
+        Cada lote incluye al mejor candidato hasta el momento, que se vuelve
+        a evaluar con las semillas del lote para compararlo en igualdad.
+
+        Args:
+            iterations (int): Número de lotes.
+            population (int): Candidatos por lote, incluido el mejor.
+            parallel (bool): Si ejecutar en paralelo.
+            max_workers (int, optional): Procesos; por defecto, los núcleos.
+
+        Returns:
+            tuple: Mejores parámetros y su porcentaje de victorias.
+        """
+        executor = self._executor(parallel, max_workers)
+        try:
+            for _ in range(iterations):
+                candidates = [self.best[0]] + [
+                    {
+                        name: self.rng.uniform(low, high)
+                        for name, (low, high) in self.bounds.items()
+                    }
+                    for _ in range(population - 1)
+                ]
+                self._evaluate(candidates, executor)
+        finally:
+            if executor:
+                executor.shutdown()
+        return self.best
+
+    def evolve(self, generations, population=8, parallel=True, max_workers=None):
+        """Busca parámetros con una estrategia evolutiva de paso adaptativo.
+
+        Es una variante separable de CMA-ES: cada generación muestrea
+        alrededor de la media con una desviación por parámetro, y la media y
+        las desviaciones se recalculan con la mitad mejor de la generación,
+        ponderada por su posición.
+
+        Args:
+            generations (int): Número de generaciones.
+            population (int): Candidatos por generación, incluidos el mejor
+                hasta el momento y la media.
+            parallel (bool): Si ejecutar en paralelo.
+            max_workers (int, optional): Procesos; por defecto, los núcleos.
+
+        Returns:
+            tuple: Mejores parámetros y su porcentaje de victorias.
+        """
+        mean = self._clip(self.defaults)
+        step = {
+            name: INITIAL_STEP * (high - low)
+            for name, (low, high) in self.bounds.items()
+        }
+        executor = self._executor(parallel, max_workers)
+        try:
+            for _ in range(generations):
+                candidates = [self.best[0], mean] + [
+                    self._clip(
+                        {
+                            name: self.rng.gauss(value, step[name])
+                            for name, value in mean.items()
+                        }
+                    )
+                    for _ in range(max(population - 2, 1))
+                ]
+                rates = self._evaluate(candidates, executor)
+                ranked = sorted(
+                    range(len(candidates)), key=lambda i: rates[i], reverse=True
+                )
+                elite = ranked[: max(len(ranked) // 2, 1)]
+                weights = [
+                    math.log(len(elite) + 0.5) - math.log(rank + 1)
+                    for rank in range(len(elite))
+                ]
+                total = sum(weights)
+                weights = [weight / total for weight in weights]
+
+                new_mean = {}
+                for name, (low, high) in self.bounds.items():
+                    values = [candidates[i][name] for i in elite]
+                    new_mean[name] = sum(w * v for w, v in zip(weights, values))
+                    spread = sum(
+                        w * (v - mean[name]) ** 2 for w, v in zip(weights, values)
+                    )
+                    step[name] = max(math.sqrt(spread), MIN_STEP * (high - low))
+                mean = new_mean
+        finally:
+            if executor:
+                executor.shutdown()
+        return self.best
+
+    def _evaluate(self, candidates, executor):
+        """Juega las partidas de un lote y actualiza el mejor candidato.
+
+        Args:
+            candidates (list): Parámetros de cada candidato.
+            executor (ProcessPoolExecutor): Procesos, o None en secuencia.
+
+        Returns:
+            list: Porcentaje de victorias de cada candidato.
+        """
+        seeds = [self.rng.getrandbits(32) for _ in range(self.games)]
+        jobs = [
+            (self.lineup, *self.settings, seed, {self.faction: candidate})
+            for candidate in candidates
+            for seed in seeds
+        ]
+        if executor:
+            futures = [executor.submit(play_match, *job) for job in jobs]
+            winners = [future.result() for future in futures]
+        else:
+            winners = [play_match(*job) for job in jobs]
+
+        rates = []
+        for index, candidate in enumerate(candidates):
+            batch = winners[index * len(seeds) : (index + 1) * len(seeds)]
+            wins = sum(self.faction in winning_factions(winner) for winner in batch)
+            rates.append(wins / len(seeds))
+            self.history.append((dict(candidate), rates[-1]))
+
+        best = max(range(len(candidates)), key=lambda i: rates[i])
+        self.best = (dict(candidates[best]), rates[best])
+        return rates
+
+    def _clip(self, parameters):
+        """Limita cada parámetro a su intervalo."""
+        return {
+            name: min(max(value, self.bounds[name][0]), self.bounds[name][1])
+            for name, value in parameters.items()
+        }
+
+    @staticmethod
+    def _executor(parallel, max_workers):
+        """Crea el grupo de procesos, o None para ejecutar en secuencia."""
+        if not parallel:
+            return None
+        return ProcessPoolExecutor(max_workers=max_workers or os.cpu_count() or 1)
@@ -0,0 +1,610 @@
+"""Prueba de carga de la API del juego.
+
+Juega muchas partidas concurrentes de principio a fin a través de las rutas
+reales de la API y mide el rendimiento, la latencia por ruta (p50, p95 y p99)
+y la tasa de errores. Cada partida virtual:
+
+1. Crea la sala con POST /newgame, une a los humanos con /join y completa la
+   mesa con /add-bots antes de /start.
+2. Pide al servidor que juegue los turnos de los bots (POST /bots/advance) y
+   consulta el trabajo (GET /autoplay) hasta que le toque a un humano.
+3. Lee el estado (GET /state) y envía la acción del humano correspondiente a
+   la fase (nominate, vote, draw, discard, enact o execute), eligiendo al
+   azar entre las opciones válidas.
+
+Por defecto la API se ejecuta en el mismo proceso a través de su aplicación
+ASGI, sin red ni servicios externos. Con --url se ataca un servidor en marcha
+con un cliente HTTP/1.1 mínimo sobre asyncio. Con la misma semilla, número de
+partidas y concurrencia las ejecuciones son comparables entre sí.
+
+Ejemplo::
+
+    python benchmarks/load_test.py --games 1000 --concurrency 200 --humans 2
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import os
+import random
+import re
+import sys
+import time
+from contextlib import redirect_stderr, redirect_stdout
+from urllib.parse import urlsplit
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+GAME_PATH = re.compile(r"^/games/[^/?]+")
+ACTION_PATHS = {
+    "nominate": "/nominate",
+    "vote": "/vote",
+    "draw": "/president/draw",
+    "discard": "/president/discard",
+    "enact": "/chancellor/enact",
+    "execute_power": "/executive/execute",
+}
+MAX_GAME_STEPS = 2000
+AUTOPLAY_POLL_INTERVAL = 0.002
+
+
+class InProcessTransport:
+    """Envía peticiones a la aplicación ASGI de la API en el mismo proceso."""
+
+    def __init__(self, max_workers):
+        """Crea la aplicación Flask, con un almacén en memoria, y su ASGI.
+
+        Args:
+            max_workers (int): Hilos del motor del juego de la aplicación ASGI.
+        """
+        from src.api.app import create_app
+        from src.api.asgi import create_asgi_app
+        from src.api.game_store import InMemoryGameStore
+
+        self.flask_app = create_app(InMemoryGameStore())
+        self.app = create_asgi_app(self.flask_app, max_workers=max_workers)
+
+    async def request(self, method, path, body=None):
+        """Ejecuta una petición sobre la aplicación ASGI.
+
+        Args:
+            method (str): Método HTTP.
+            path (str): Ruta, con query string opcional.
+            body (dict, optional): Cuerpo JSON.
+
+        Returns:
+            tuple: Código de estado y cuerpo JSON (o None).
+        """
+        path, _, query = path.partition("?")
+        content = json.dumps(body).encode() if body is not None else b""
+        scope = {
+            "type": "http",
+            "method": method,
+            "path": path,
+            "query_string": query.encode(),
+            "headers": [(b"content-type", b"application/json")],
+            "http_version": "1.1",
+            "scheme": "http",
+            "root_path": "",
+        }
+        sent = False
+        response = {}
+
+        async def receive():
+            nonlocal sent
+            if sent:
+                return {"type": "http.disconnect"}
+            sent = True
+            return {"type": "http.request", "body": content, "more_body": False}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+            else:
+                response["body"] = message.get("body", b"")
+
+        await self.app(scope, receive, send)
+        return response["status"], _decode(response.get("body", b""))
+
+    async def close(self):
+        """Detiene los hilos del motor y de los bots."""
+        from src.api.autoplay import EXTENSION_KEY
+
+        self.app.executor.shutdown(wait=True)
+        self.flask_app.extensions[EXTENSION_KEY].shutdown()
+
+
+class HttpTransport:
+    """Cliente HTTP/1.1 mínimo con conexiones persistentes sobre asyncio."""
+
+    def __init__(self, url):
+        """Inicializa el cliente.
+
+        Args:
+            url (str): URL base del servidor (http://host:puerto).
+        """
+        parts = urlsplit(url)
+        if parts.scheme != "http":
+            raise ValueError("Only http:// URLs are supported")
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.prefix = parts.path.rstrip("/")
+        self._idle = []
+
+    async def _connection(self):
+        """Obtiene una conexión libre o abre una nueva."""
+        if self._idle:
+            return self._idle.pop()
+        return await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method, path, body=None):
+        """Envía una petición y lee la respuesta completa.
+
+        Args:
+            method (str): Método HTTP.
+            path (str): Ruta, con query string opcional.
+            body (dict, optional): Cuerpo JSON.
+
+        Returns:
+            tuple: Código de estado y cuerpo JSON (o None).
+        """
+        content = json.dumps(body).encode() if body is not None else b""
+        reader, writer = await self._connection()
+        try:
+            writer.write(
+                (
+                    f"{method} {self.prefix}{path} HTTP/1.1\r\n"
+                    f"Host: {self.host}:{self.port}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(content)}\r\n"
+                    "\r\n"
+                ).encode("latin-1")
+                + content
+            )
+            await writer.drain()
+
+            status_line = await reader.readline()
+            if not status_line:
+                raise ConnectionError("Server closed the connection")
+            status = int(status_line.split()[1])
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            if "content-length" in headers:
+                data = await reader.readexactly(int(headers["content-length"]))
+                keep_alive = headers.get("connection", "").lower() != "close"
+            else:
+                data = await reader.read()
+                keep_alive = False
+        except BaseException:
+            writer.close()
+            raise
+
+        if keep_alive:
+            self._idle.append((reader, writer))
+        else:
+            writer.close()
+        return status, _decode(data)
+
+    async def close(self):
+        """Cierra las conexiones abiertas."""
+        for _, writer in self._idle:
+            writer.close()
+        self._idle = []
+
+
+def _decode(data):
+    """Decodifica un cuerpo JSON.
+
+    Args:
+        data (bytes): Cuerpo de la respuesta.
+
+    Returns:
+        Any: Documento JSON, o None si el cuerpo no es JSON.
+    """
+    try:
+        return json.loads(data) if data else None
+    except ValueError:
+        return None
+
+
+def route_template(method, path):
+    """Obtiene la plantilla de ruta con la que se agrupan las latencias.
+
+    Args:
+        method (str): Método HTTP.
+        path (str): Ruta de la petición.
+
+    Returns:
+        str: Método y ruta sin query string ni identificador de partida.
+    """
+    return f"{method} {GAME_PATH.sub('/games/<game_id>', path.split('?')[0])}"
+
+
+def percentile(values, fraction):
+    """Calcula un percentil por el método del rango más cercano.
+
+    Args:
+        values (list): Valores ordenados.
+        fraction (float): Percentil entre 0 y 1.
+
+    Returns:
+        float: Valor del percentil, o 0.0 si no hay valores.
+    """
+    if not values:
+        return 0.0
+    index = max(0, min(len(values) - 1, int(round(fraction * len(values))) - 1))
+    return values[index]
+
+
+class LoadStats:
+    """Latencias y errores acumulados por ruta."""
+
+    def __init__(self):
+        self.latencies = {}
+        self.errors = {}
+        self.games_finished = 0
+        self.games_failed = []
+
+    def record(self, route, status, seconds, expected=()):
+        """Registra una petición.
+
+        Args:
+            route (str): Plantilla de la ruta.
+            status (int): Código de estado, 0 si la petición no llegó a
+                responderse.
+            seconds (float): Duración de la petición.
+            expected (tuple): Códigos de error que forman parte del flujo
+                normal de la ruta y no cuentan como errores.
+        """
+        self.latencies.setdefault(route, []).append(seconds)
+        if status == 0 or (status >= 400 and status not in expected):
+            self.errors[route] = self.errors.get(route, 0) + 1
+
+    def summary(self, elapsed):
+        """Resume la prueba.
+
+        Args:
+            elapsed (float): Duración total de la prueba en segundos.
+
+        Returns:
+            dict: Rendimiento global y latencias y errores por ruta.
+        """
+        routes = {}
+        total = 0
+        errors = 0
+        for route, values in sorted(self.latencies.items()):
+            values = sorted(values)
+            total += len(values)
+            errors += self.errors.get(route, 0)
+            routes[route] = {
+                "requests": len(values),
+                "errors": self.errors.get(route, 0),
+                "errorRate": self.errors.get(route, 0) / len(values),
+                "p50Ms": percentile(values, 0.50) * 1000,
+                "p95Ms": percentile(values, 0.95) * 1000,
+                "p99Ms": percentile(values, 0.99) * 1000,
+                "maxMs": values[-1] * 1000,
+            }
+        return {
+            "elapsedSeconds": elapsed,
+            "gamesFinished": self.games_finished,
+            "gamesFailed": len(self.games_failed),
+            "gamesPerSecond": self.games_finished / elapsed if elapsed else 0.0,
+            "requests": total,
+            "requestsPerSecond": total / elapsed if elapsed else 0.0,
+            "errors": errors,
+            "errorRate": errors / total if total else 0.0,
+            "routes": routes,
+        }
+
+
+class VirtualGame:
+    """Partida jugada por un cliente virtual a través de la API."""
+
+    def __init__(self, transport, stats, humans, bots, rng):
+        """Inicializa la partida virtual.
+
+        Args:
+            transport: Transporte de las peticiones.
+            stats (LoadStats): Estadísticas donde registrar las peticiones.
+            humans (int): Jugadores humanos simulados.
+            bots (int): Bots de la mesa.
+            rng (random.Random): Generador de las decisiones de los humanos.
+        """
+        self.transport = transport
+        self.stats = stats
+        self.humans = humans
+        self.bots = bots
+        self.rng = rng
+        self.game_id = None
+        self.election = None
+        self.voted = set()
+
+    async def call(self, method, path, body=None, expected=()):
+        """Envía una petición y registra su latencia.
+
+        Args:
+            method (str): Método HTTP.
+            path (str): Ruta de la petición.
+            body (dict, optional): Cuerpo JSON.
+            expected (tuple): Códigos de error esperados (ver LoadStats.record).
+
+        Returns:
+            tuple: Código de estado y cuerpo JSON.
+        """
+        start = time.perf_counter()
+        try:
+            status, payload = await self.transport.request(method, path, body)
+        except (OSError, ValueError, asyncio.IncompleteReadError) as e:
+            status, payload = 0, {"error": str(e)}
+        self.stats.record(
+            route_template(method, path),
+            status,
+            time.perf_counter() - start,
+            expected,
+        )
+        return status, payload
+
+    async def setup(self):
+        """Crea la sala, une a los humanos y completa la mesa con bots."""
+        status, payload = await self.call(
+            "POST", "/newgame", {"playerCount": self.humans + self.bots}
+        )
+        if status != 201:
+            raise RuntimeError(f"newgame failed: {status} {payload}")
+        self.game_id = payload["gameID"]
+        for i in range(self.humans):
+            await self.call(
+                "POST", f"/games/{self.game_id}/join", {"playerName": f"Human{i}"}
+            )
+        if self.bots:
+            await self.call(
+                "POST", f"/games/{self.game_id}/add-bots", {"count": self.bots}
+            )
+        status, payload = await self.call(
+            "POST", f"/games/{self.game_id}/start", {"hostPlayerID": 0}
+        )
+        if status != 200:
+            raise RuntimeError(f"start failed: {status} {payload}")
+
+    async def advance_bots(self):
+        """Hace que el servidor juegue los turnos de bot pendientes.
+
+        Returns:
+            bool: True si la partida sigue en curso.
+        """
+        # La API responde 409 cuando la partida ya terminó
+        status, _ = await self.call(
+            "POST", f"/games/{self.game_id}/bots/advance", expected=(409,)
+        )
+        if status == 409:
+            return False
+        while True:
+            status, job = await self.call("GET", f"/games/{self.game_id}/autoplay")
+            if status != 200:
+                raise RuntimeError(f"autoplay status failed: {status} {job}")
+            if job["status"] not in ("queued", "running"):
+                break
+            await asyncio.sleep(AUTOPLAY_POLL_INTERVAL)
+        if job["status"] == "failed":
+            raise RuntimeError(f"bot step failed: {job['error']}")
+        return job["gameState"] == "in_progress"
+
+    async def play_human_turn(self):
+        """Lee el estado y envía la acción del humano al que le toca.
+
+        Returns:
+            bool: True si la partida sigue en curso.
+        """
+        status, state = await self.call("GET", f"/games/{self.game_id}/state")
+        if status != 200:
+            raise RuntimeError(f"state failed: {status} {state}")
+        if state["gameState"] != "in_progress":
+            return False
+
+        game_path = f"/games/{self.game_id}"
+        phase = state["currentPhase"]["name"]
+        sub_phase = state["currentPhase"].get("subPhase")
+        president = (state["government"].get("president") or {}).get("id")
+        chancellor = (state["government"].get("chancellor") or {}).get("id")
+
+        if phase == "election":
+            eligible = state["nomination"]["eligibleChancellors"]
+            body = {"playerId": president, "nomineeId": self.rng.choice(eligible)["id"]}
+            await self.act(game_path + ACTION_PATHS["nominate"], body)
+        elif phase == "voting":
+            # Los bots votan antes que los humanos, y la ruta de voto espera
+            # el voto de todos los jugadores sentados a la mesa.
+            election = (president, tuple(state["trackers"].values()))
+            if election != self.election:
+                self.election = election
+                self.voted = set()
+            for player in state["players"]:
+                if player["isHuman"] and player["id"] not in self.voted:
+                    vote = self.rng.choice(["ja", "nein"])
+                    await self.act(
+                        game_path + ACTION_PATHS["vote"],
+                        {"playerId": player["id"], "vote": vote},
+                    )
+                    self.voted.add(player["id"])
+        elif phase == "legislative" and sub_phase == "president_discard":
+            body = {"playerId": president, "discardIndex": self.rng.randrange(3)}
+            await self.act(game_path + ACTION_PATHS["discard"], body)
+        elif phase == "legislative" and sub_phase == "chancellor_enact":
+            body = {"playerId": chancellor, "enactIndex": self.rng.randrange(2)}
+            await self.act(game_path + ACTION_PATHS["enact"], body)
+        elif phase == "legislative":
+            await self.act(game_path + ACTION_PATHS["draw"], {"playerId": president})
+        elif phase == "executive_power":
+            status, options = await self.call("GET", f"{game_path}/executive/options")
+            if status != 200:
+                raise RuntimeError(f"executive options failed: {status} {options}")
+            body = {"playerId": president, "powerType": options["powerType"]}
+            if options.get("availableTargets"):
+                target = self.rng.choice(options["availableTargets"])
+                body["targetPlayerId"] = target["id"]
+            await self.act(game_path + ACTION_PATHS["execute_power"], body)
+        else:
+            raise RuntimeError(f"unexpected phase: {phase}/{sub_phase}")
+        return True
+
+    async def act(self, path, body):
+        """Envía una acción de humano y falla si la API la rechaza.
+
+        Args:
+            path (str): Ruta de la acción.
+            body (dict): Cuerpo JSON de la acción.
+        """
+        status, payload = await self.call("POST", path, body)
+        if status >= 400:
+            raise RuntimeError(f"{path} failed: {status} {payload}")
+
+    async def play(self):
+        """Juega la partida hasta el final."""
+        await self.setup()
+        for _ in range(MAX_GAME_STEPS):
+            if not await self.advance_bots():
+                return
+            if not await self.play_human_turn():
+                return
+        raise RuntimeError("game did not finish")
+
+
+async def run_load_test(transport, games, concurrency, humans, bots, seed):
+    """Juega varias partidas concurrentes y mide la API.
+
+    Args:
+        transport: Transporte de las peticiones.
+        games (int): Número de partidas a jugar.
+        concurrency (int): Partidas jugándose a la vez como máximo.
+        humans (int): Humanos simulados por partida.
+        bots (int): Bots por partida.
+        seed (int): Semilla de las decisiones de los humanos.
+
+    Returns:
+        tuple: Resumen de la prueba (ver LoadStats.summary) y lista de
+            partidas fallidas (identificador y error).
+    """
+    stats = LoadStats()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def worker(index):
+        async with semaphore:
+            game = VirtualGame(
+                transport, stats, humans, bots, random.Random(seed * 100003 + index)
+            )
+            try:
+                await game.play()
+                stats.games_finished += 1
+            except Exception as e:
+                stats.games_failed.append((game.game_id, str(e)))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(index) for index in range(games)))
+    return stats.summary(time.perf_counter() - start), stats.games_failed
+
+
+def format_report(summary):
+    """Formatea el resumen como tabla de texto.
+
+    Args:
+        summary (dict): Resumen devuelto por run_load_test.
+
+    Returns:
+        str: Informe legible.
+    """
+    lines = [
+        f"Games finished: {summary['gamesFinished']} "
+        f"(failed: {summary['gamesFailed']}) in {summary['elapsedSeconds']:.2f}s "
+        f"-> {summary['gamesPerSecond']:.2f} games/s",
+        f"Requests: {summary['requests']} -> {summary['requestsPerSecond']:.1f} req/s, "
+        f"errors: {summary['errors']} ({summary['errorRate']:.2%})",
+        "",
+        f"{'route':<42} {'count':>8} {'err%':>7} {'p50 ms':>9} "
+        f"{'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}",
+    ]
+    for route, data in summary["routes"].items():
+        lines.append(
+            f"{route:<42} {data['requests']:>8} {data['errorRate']:>7.2%} "
+            f"{data['p50Ms']:>9.2f} {data['p95Ms']:>9.2f} {data['p99Ms']:>9.2f} "
+            f"{data['maxMs']:>9.2f}"
+        )
+    return "\n".join(lines)
+
+
+async def main_async(args):
+    """Prepara el transporte, ejecuta la prueba y lo cierra.
+
+    Args:
+        args (argparse.Namespace): Argumentos de la línea de órdenes.
+
+    Returns:
+        tuple: Resumen de la prueba y partidas fallidas.
+    """
+    if args.url:
+        transport = HttpTransport(args.url)
+    else:
+        transport = InProcessTransport(args.workers)
+    try:
+        return await run_load_test(
+            transport,
+            args.games,
+            args.concurrency,
+            args.humans,
+            args.players - args.humans,
+            args.seed,
+        )
+    finally:
+        await transport.close()
+
+
+def main():
+    """Ejecuta la prueba de carga e imprime el informe."""
+    parser = argparse.ArgumentParser(description="Load test the game API")
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--players", type=int, default=7)
+    parser.add_argument("--humans", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--url", help="Base URL of a running server (default: in-process ASGI app)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=32,
+        help="Engine threads of the in-process ASGI app",
+    )
+    parser.add_argument("--json", help="Write the summary as JSON to this path")
+    parser.add_argument(
+        "--verbose", action="store_true", help="Show the game engine output"
+    )
+    args = parser.parse_args()
+    if not 0 <= args.humans <= args.players:
+        parser.error("--humans must be between 0 and --players")
+
+    random.seed(args.seed)
+    if args.verbose:
+        summary, failed = asyncio.run(main_async(args))
+    else:
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            summary, failed = asyncio.run(main_async(args))
+
+    print(format_report(summary))
+    for game_id, error in failed[:10]:
+        print(f"failed game {game_id}: {error}", file=sys.stderr)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Benchmark de serialización del estado del juego.
+
+Compara la latencia de construir y codificar la respuesta de
+GET /games/<id>/state con las funciones de game_state_helpers y jsonify
+frente al serializador de state_serializer, en una partida de 16 jugadores.
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from flask import jsonify
+from src.api.app import create_app
+from src.api.storage import games
+from src.api.utils import game_state_helpers as helpers
+from src.api.utils import state_serializer
+
+
+def build_game(client, player_count):
+    """Crea una partida en curso con un humano y el resto bots.
+
+    Args:
+        client: Cliente de pruebas de Flask.
+        player_count (int): Número de jugadores.
+
+    Returns:
+        str: ID de la partida creada.
+    """
+    game_id = client.post(
+        "/newgame", json={"playerCount": player_count, "withCommunists": True}
+    ).get_json()["gameID"]
+    client.post(f"/games/{game_id}/join", json={"playerName": "Human"})
+    client.post(f"/games/{game_id}/add-bots", json={"count": player_count - 1})
+    client.post(f"/games/{game_id}/start", json={"hostPlayerID": 0})
+    client.post(f"/games/{game_id}/nominate", json={"nomineeId": 1})
+    return game_id
+
+
+def legacy_state(game, game_id):
+    """Construye y codifica el estado con el camino original basado en helpers.
+
+    Args:
+        game: Instancia del juego.
+        game_id (str): ID de la partida.
+
+    Returns:
+        bytes: Documento JSON.
+    """
+    payload = {
+        "gameState": helpers._get_game_state_status(game),
+        "currentPhase": helpers._get_current_phase_info(game),
+        "players": helpers._get_players_info(game, None),
+        "government": helpers._get_government_info(game),
+        "nomination": helpers._get_nomination_info(game),
+        "trackers": helpers._get_trackers_info(game),
+        "board": helpers._get_board_info(game),
+        "lastAction": helpers._get_last_action_info(game),
+        "gameConfig": helpers._get_game_config_info(game),
+        "gameId": game_id,
+        "timestamp": helpers._get_current_timestamp(),
+    }
+    return jsonify(payload).get_data()
+
+
+def fast_state(game, game_id):
+    """Construye y codifica el estado con el serializador rápido.
+
+    Args:
+        game: Instancia del juego.
+        game_id (str): ID de la partida.
+
+    Returns:
+        bytes: Documento JSON.
+    """
+    return state_serializer.dumps_json(
+        state_serializer.serialize_game_state(game, game_id)
+    )
+
+
+def measure(func, iterations):
+    """Mide la latencia de una función.
+
+    Args:
+        func: Función sin argumentos a medir.
+        iterations (int): Número de repeticiones.
+
+    Returns:
+        dict: Percentiles p50 y p99 en microsegundos.
+    """
+    for _ in range(min(100, iterations)):
+        func()
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+
+    samples.sort()
+    return {
+        "p50": samples[len(samples) // 2] * 1e6,
+        "p99": samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1e6,
+    }
+
+
+def main():
+    """Ejecuta el benchmark e imprime los resultados."""
+    parser = argparse.ArgumentParser(description="Benchmark game state serialization")
+    parser.add_argument("-n", "--iterations", type=int, default=5000)
+    parser.add_argument("-p", "--players", type=int, default=16)
+    args = parser.parse_args()
+
+    app = create_app()
+    client = app.test_client()
+    with redirect_stdout(io.StringIO()):
+        game_id = build_game(client, args.players)
+
+    with app.app_context():
+        game = games.get(game_id)
+        orjson_module = state_serializer.orjson
+
+        print(f"\nGame state serialization, {args.players} players")
+        print(f"{'path':<28}{'p50 (us)':>12}{'p99 (us)':>12}")
+
+        def report(name, func):
+            result = measure(func, args.iterations)
+            print(f"{name:<28}{result['p50']:>12.1f}{result['p99']:>12.1f}")
+
+        report("helpers + jsonify", lambda: legacy_state(game, game_id))
+
+        state_serializer.orjson = None
+        report("serializer + stdlib json", lambda: fast_state(game, game_id))
+
+        state_serializer.orjson = orjson_module
+        if orjson_module is not None:
+            report("serializer + orjson", lambda: fast_state(game, game_id))
+        else:
+            print(f"{'serializer + orjson':<28}{'orjson not installed':>24}")
+
+        report(
+            "GET /state (full request)", lambda: client.get(f"/games/{game_id}/state")
+        )
+
+
+if __name__ == "__main__":
+    main()
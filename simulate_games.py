@@ -6,6 +6,7 @@ para analizar estadísticas y balanceo del juego con diferentes configuraciones.
 
 import argparse
 import os
+import random
 import sys
 import time
 from collections import Counter
@@ -17,6 +18,20 @@ import matplotlib.pyplot as plt  # type: ignore[import-not-found]
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "backend"))
 
 from src.game.game import SHXLGame
+from src.simulation.comparison import paired_difference
+from src.simulation.decision_data import (
+    collect_decisions,
+    decision_accuracy,
+    save_dataset,
+    train_model,
+)
+from src.simulation.tournament import (
+    FACTIONS,
+    STRATEGY_TYPES,
+    Tournament,
+    winning_factions,
+)
+from src.simulation.tuning import TUNABLE_STRATEGIES, ParameterTuner
 
 
 def get_simulation_config():
@@ -188,6 +203,7 @@ class GameSimulator:
         self.victory_reasons = Counter()
         self.round_counts = []
         self.policy_counts = Counter()
+        self.budget_counts = Counter()
 
     def run_single_game(
         self,
@@ -196,6 +212,9 @@ class GameSimulator:
         with_anti_policies=False,
         with_emergency_powers=False,
         strategy_type="role",
+        seed=None,
+        time_budget=None,
+        role_beliefs=False,
     ):
         """Ejecuta una sola partida del juego y recopila estadísticas.
 
@@ -205,12 +224,20 @@ class GameSimulator:
             with_anti_policies (bool): Si incluir anti-políticas.
             with_emergency_powers (bool): Si incluir poderes de emergencia.
             strategy_type (str): Tipo de estrategia para jugadores IA.
+            seed (int, optional): Semilla de la partida; fija el reparto de
+                roles, el mazo y el primer presidente.
+            time_budget (float, optional): Segundos por decisión de cada bot.
+            role_beliefs (bool): Si los bots mantienen creencias sobre los
+                roles (mucho más lento).
 
         Returns:
             dict: Diccionario con estadísticas de la partida.
         """
         from src.game.game_logger import GameLogger, LogLevel
 
+        if seed is not None:
+            random.seed(seed)
+
         logger = GameLogger(LogLevel.NONE)  # Use no logging for simulations
         game = SHXLGame(logger)
         game.setup_game(
@@ -219,8 +246,16 @@ class GameSimulator:
             with_anti_policies=with_anti_policies,
             with_emergency_powers=with_emergency_powers,
             ai_strategy=strategy_type,
+            bot_time_budget=time_budget,
+            role_beliefs=role_beliefs,
         )
         winner = game.start_game()
+        budget = Counter()
+        for player in game.state.players:
+            stats = getattr(player, "budget_stats", {})
+            budget.update(
+                {k: stats.get(k, 0) for k in ("calls", "overruns", "fallbacks")}
+            )
 
         result = {
             "winner": winner,
@@ -228,6 +263,7 @@ class GameSimulator:
             "liberal": game.state.board.liberal_track,
             "fascist": game.state.board.fascist_track,
             "communist": game.state.board.communist_track if with_communists else 0,
+            "budget": dict(budget),
         }
 
         return result
@@ -249,6 +285,7 @@ class GameSimulator:
         self.policy_counts["liberal"] += result["liberal"]
         self.policy_counts["fascist"] += result["fascist"]
         self.policy_counts["communist"] += result["communist"]
+        self.budget_counts.update(result.get("budget", {}))
 
     def run_simulations(
         self,
@@ -259,6 +296,9 @@ class GameSimulator:
         with_emergency_powers=False,
         strategy_type="role",
         parallel=True,
+        seeds=None,
+        time_budget=None,
+        role_beliefs=False,
     ):
         """Ejecuta múltiples simulaciones del juego.
 
@@ -270,11 +310,20 @@ class GameSimulator:
             with_emergency_powers (bool): Si incluir poderes de emergencia.
             strategy_type (str): Tipo de estrategia para jugadores IA.
             parallel (bool): Si ejecutar en paralelo.
+            seeds (list, optional): Semilla de cada partida; si se indica,
+                se juega una partida por semilla y los resultados quedan en
+                el mismo orden.
+            time_budget (float, optional): Segundos por decisión de cada bot.
+            role_beliefs (bool): Si los bots mantienen creencias sobre los
+                roles (mucho más lento).
 
         Returns:
             dict: Diccionario con estadísticas agregadas de todas las partidas.
         """
         start = time.time()
+        if seeds is None:
+            seeds = [None] * n_games
+        n_games = len(seeds)
 
         if parallel:
             with ProcessPoolExecutor() as executor:
@@ -286,19 +335,25 @@ class GameSimulator:
                         with_anti_policies,
                         with_emergency_powers,
                         strategy_type,
+                        seed,
+                        time_budget,
+                        role_beliefs,
                     )
-                    for _ in range(n_games)
+                    for seed in seeds
                 ]
                 for future in futures:
                     self._process_result(future.result())
         else:
-            for _ in range(n_games):
+            for seed in seeds:
                 result = self.run_single_game(
                     player_count,
                     with_communists,
                     with_anti_policies,
                     with_emergency_powers,
                     strategy_type,
+                    seed,
+                    time_budget,
+                    role_beliefs,
                 )
                 self._process_result(result)
 
@@ -331,6 +386,7 @@ class GameSimulator:
             "avg_rounds": sum(self.round_counts) / len(self.round_counts),
             "policy_distribution": policy_distribution,
             "win_counts": dict(self.win_counts),
+            "budget": dict(self.budget_counts),
         }
 
     def print_detailed_results(self, stats):
@@ -374,6 +430,18 @@ class GameSimulator:
             bar = "█" * bar_length + "░" * (50 - bar_length)
             print(f"{policy_type.capitalize():>12}: {percentage:>6.2f}% {bar}")
 
+        budget = stats.get("budget", {})
+        if budget.get("calls"):
+            print("\n" + "-" * 40)
+            print("        DECISION TIME BUDGET")
+            print("-" * 40)
+            print(f"Timed decisions: {budget['calls']}")
+            print(
+                f"Budget overruns: {budget['overruns']} "
+                f"({budget['overruns'] / budget['calls']:.2%}), "
+                f"{budget['fallbacks']} answered by the role strategy"
+            )
+
         print("\n" + "=" * 60)
 
     def plot_results(self, stats):
@@ -510,13 +578,19 @@ class GameSimulator:
             print(f"\nNote: Could not generate graphs: {e}")
             print("This might be due to missing matplotlib or display issues.")
 
-    def compare_strategies(self, strategies, **kwargs):
+    def compare_strategies(self, strategies, paired=False, seed=None, **kwargs):
         """Compara múltiples estrategias ejecutando simulaciones para cada una.
 
         Args:
             strategies (list): Lista de estrategias a comparar.
+            paired (bool): Si jugar las mismas semillas con todas las
+                estrategias (ver compare_strategies_paired).
+            seed (int, optional): Semilla de la comparación emparejada.
             **kwargs: Argumentos adicionales para las simulaciones.
         """
+        if paired:
+            return self.compare_strategies_paired(strategies, seed=seed, **kwargs)
+
         results = {}
         for strategy in strategies:
             print(
@@ -527,6 +601,270 @@ class GameSimulator:
 
         self.plot_comparison(results)
 
+    def compare_strategies_paired(self, strategies, n_games=100, seed=None, **kwargs):
+        """Compara estrategias con números aleatorios comunes.
+
+        La partida i usa la misma semilla con todas las estrategias, así que
+        comparten reparto de roles, mazo y primer presidente. Cada estrategia
+        se compara con la primera partida a partida, lo que reduce la
+        varianza de la diferencia de porcentajes de victoria.
+
+        Args:
+            strategies (list): Estrategias a comparar; la primera es la
+                referencia.
+            n_games (int): Partidas por estrategia.
+            seed (int, optional): Semilla de la que se derivan las semillas
+                de las partidas.
+            **kwargs: Configuración de las simulaciones (player_count,
+                with_communists, with_anti_policies, with_emergency_powers,
+                parallel).
+
+        Returns:
+            dict: Diferencia emparejada de cada estrategia con la referencia
+                por facción (ver paired_difference).
+        """
+        rng = random.Random(seed)
+        seeds = [rng.getrandbits(32) for _ in range(n_games)]
+        outcomes = {}
+        for strategy in strategies:
+            print(f"\nRunning {n_games} paired games with {strategy} strategy...")
+            simulator = GameSimulator()
+            simulator.run_simulations(strategy_type=strategy, seeds=seeds, **kwargs)
+            outcomes[strategy] = [
+                winning_factions(result["winner"]) for result in simulator.results
+            ]
+
+        baseline = strategies[0]
+        factions = FACTIONS if kwargs.get("with_communists", True) else FACTIONS[:2]
+        comparison = {
+            strategy: {
+                faction: paired_difference(
+                    [int(faction in winners) for winners in outcomes[baseline]],
+                    [int(faction in winners) for winners in outcomes[strategy]],
+                )
+                for faction in factions
+            }
+            for strategy in strategies[1:]
+        }
+        self.print_paired_comparison(baseline, comparison)
+        return comparison
+
+    def print_paired_comparison(self, baseline, comparison):
+        """Imprime las diferencias emparejadas en CLI.
+
+        Args:
+            baseline (str): Estrategia de referencia.
+            comparison (dict): Resultado de compare_strategies_paired.
+        """
+        print("\n" + "=" * 80)
+        print(f"          PAIRED COMPARISON AGAINST {baseline.upper()} (95% CI)")
+        print("=" * 80)
+        print(
+            f"\n{'Strategy':>10} {'Faction':>10} {'Base %':>7} {'Win %':>7} "
+            f"{'Diff':>7} {'95% CI':>16} {'SE':>6} {'SE unp.':>7} {'Gain':>6}"
+        )
+        for strategy, factions in comparison.items():
+            for faction, stats in factions.items():
+                interval = f"[{stats['low'] * 100:+.1f}, {stats['high'] * 100:+.1f}]"
+                gain = stats["variance_reduction"]
+                gain = f"{gain:.1f}x" if gain != float("inf") else "inf"
+                print(
+                    f"{strategy:>10} {faction:>10} {stats['baseline'] * 100:>7.1f} "
+                    f"{stats['candidate'] * 100:>7.1f} "
+                    f"{stats['difference'] * 100:>+7.1f} {interval:>16} "
+                    f"{stats['std_error'] * 100:>6.2f} "
+                    f"{stats['unpaired_std_error'] * 100:>7.2f} {gain:>6}"
+                )
+        print(
+            "\nGain: how many times more games an unpaired comparison needs "
+            "for the same precision."
+        )
+        print("\n" + "=" * 80)
+
+    def run_tournament(self, lineups, n_games=100, parallel=True, seed=None, **kwargs):
+        """Ejecuta un torneo entre estrategias mezcladas por facción.
+
+        Args:
+            lineups (dict): Estrategias de cada facción.
+            n_games (int): Número de partidas.
+            parallel (bool): Si ejecutar en paralelo.
+            seed (int, optional): Semilla del calendario de partidas.
+            **kwargs: Configuración de las partidas (player_count,
+                with_communists, with_anti_policies, with_emergency_powers).
+
+        Returns:
+            list: Clasificación del torneo.
+        """
+        start = time.time()
+        tournament = Tournament(lineups, seed=seed, **kwargs)
+        leaderboard = tournament.run(n_games, parallel=parallel)
+        self.print_leaderboard(leaderboard, n_games, time.time() - start)
+        return leaderboard
+
+    def print_leaderboard(self, leaderboard, n_games, elapsed):
+        """Imprime la clasificación de un torneo en CLI.
+
+        Args:
+            leaderboard (list): Clasificación devuelta por Tournament.
+            n_games (int): Partidas jugadas.
+            elapsed (float): Tiempo transcurrido en segundos.
+        """
+        print("\n" + "=" * 80)
+        print("                    TOURNAMENT RATINGS (TrueSkill)")
+        print("=" * 80)
+        print(f"\nGames: {n_games} | Time: {elapsed:.2f}s")
+        print(
+            f"\n{'Faction':>10} {'Strategy':>10} {'Rating':>8} {'Sigma':>6} "
+            f"{'mu ± 3 sigma':>16} {'Games':>6} {'Win %':>7}"
+        )
+        for row in leaderboard:
+            interval = f"[{row['low']:.1f}, {row['high']:.1f}]"
+            print(
+                f"{row['faction']:>10} {row['strategy']:>10} {row['mu']:>8.2f} "
+                f"{row['sigma']:>6.2f} {interval:>16} {row['games']:>6} "
+                f"{row['win_rate'] * 100:>6.1f}%"
+            )
+        print("\n" + "=" * 80)
+
+    def run_tuning(
+        self,
+        faction,
+        player_counts,
+        strategy="role",
+        method="evolution",
+        iterations=10,
+        population=8,
+        games=100,
+        parallel=True,
+        seed=None,
+        **kwargs,
+    ):
+        """Ajusta los parámetros de la estrategia de una facción.
+
+        Args:
+            faction (str): Facción cuyos parámetros se ajustan.
+            player_counts (list): Números de jugadores; se ajusta cada uno.
+            strategy (str): Estrategia ajustada ("role" o "smart").
+            method (str): "evolution" o "random".
+            iterations (int): Generaciones o lotes de la búsqueda.
+            population (int): Candidatos por generación o lote.
+            games (int): Partidas por candidato en cada evaluación.
+            parallel (bool): Si ejecutar en paralelo.
+            seed (int, optional): Semilla de la búsqueda.
+            **kwargs: Configuración de las partidas (with_communists,
+                with_anti_policies, with_emergency_powers).
+
+        Returns:
+            dict: Mejores parámetros y porcentaje de victorias por número de
+                jugadores.
+        """
+        results = {}
+        for player_count in player_counts:
+            start = time.time()
+            tuner = ParameterTuner(
+                faction,
+                strategy,
+                player_count=player_count,
+                games=games,
+                seed=seed,
+                **kwargs,
+            )
+            search = tuner.evolve if method == "evolution" else tuner.random_search
+            results[player_count] = search(
+                iterations, population=population, parallel=parallel
+            )
+            self.print_tuning(
+                faction, player_count, tuner, results[player_count], start
+            )
+        return results
+
+    def train_learned_model(
+        self,
+        model_path,
+        n_games=100,
+        teacher="smart",
+        dataset_path=None,
+        hidden=16,
+        epochs=300,
+        winners_only=True,
+        parallel=True,
+        seed=None,
+        **kwargs,
+    ):
+        """Entrena el modelo de LearnedStrategy con partidas simuladas.
+
+        Args:
+            model_path (str): Fichero .npz donde guardar el modelo.
+            n_games (int): Partidas de las que registrar decisiones.
+            teacher (str): Estrategia maestra que juegan los bots.
+            dataset_path (str, optional): Fichero .npz donde guardar las
+                decisiones registradas.
+            hidden (int): Neuronas ocultas; 0 para un modelo lineal.
+            epochs (int): Pasadas de entrenamiento.
+            winners_only (bool): Si imitar solo decisiones ganadoras.
+            parallel (bool): Si simular en paralelo.
+            seed (int, optional): Semilla de las partidas y del modelo.
+            **kwargs: Configuración de las partidas (player_count,
+                with_communists, with_anti_policies, with_emergency_powers).
+
+        Returns:
+            DecisionModel: El modelo entrenado.
+        """
+        start = time.time()
+        dataset = collect_decisions(
+            n_games, teacher, seed=seed, parallel=parallel, **kwargs
+        )
+        collected = time.time() - start
+        if dataset_path:
+            save_dataset(dataset_path, dataset)
+        model = train_model(
+            dataset,
+            hidden=hidden,
+            epochs=epochs,
+            winners_only=winners_only,
+            seed=seed,
+        )
+        model.save(model_path)
+
+        print("\n" + "=" * 80)
+        print(f"          LEARNED MODEL ({teacher} teacher, {n_games} games)")
+        print("=" * 80)
+        print(
+            f"\nCollection: {collected:.2f}s | Training: "
+            f"{time.time() - start - collected:.2f}s | Saved to {model_path}"
+        )
+        print(f"\n{'Decision':>16} {'Samples':>8} {'Accuracy':>9}")
+        for kind, accuracy in decision_accuracy(model, dataset).items():
+            samples = len(dataset[kind]["chosen"])
+            print(f"{kind:>16} {samples:>8} {accuracy * 100:>8.1f}%")
+        print(f"\nPlay it with SHXL_LEARNED_MODEL={model_path} --strategy learned")
+        print("\n" + "=" * 80)
+        return model
+
+    def print_tuning(self, faction, player_count, tuner, best, start):
+        """Imprime los parámetros ajustados en CLI.
+
+        Args:
+            faction (str): Facción ajustada.
+            player_count (int): Número de jugadores.
+            tuner (ParameterTuner): Búsqueda realizada.
+            best (tuple): Mejores parámetros y su porcentaje de victorias.
+            start (float): Instante de inicio de la búsqueda.
+        """
+        parameters, win_rate = best
+        print("\n" + "=" * 80)
+        print(f"          TUNED {faction.upper()} PARAMETERS ({player_count} players)")
+        print("=" * 80)
+        print(
+            f"\nCandidates: {len(tuner.history)} | Games per candidate: "
+            f"{tuner.games} | Time: {time.time() - start:.2f}s"
+        )
+        print(f"Win rate of the best candidate: {win_rate * 100:.1f}%")
+        print(f"\n{'Parameter':>24} {'Default':>8} {'Tuned':>8}")
+        for name, value in parameters.items():
+            print(f"{name:>24} {tuner.defaults[name]:>8.2f} {value:>8.2f}")
+        print("\n" + "=" * 80)
+
 
 def main():
     """Función principal del simulador.
@@ -541,17 +879,81 @@ def main():
     parser.add_argument("--anti-policies", action="store_true")
     parser.add_argument("--emergency-powers", action="store_true")
     parser.add_argument(
-        "--strategy", default="role", choices=["smart", "role", "random"]
+        "--strategy",
+        default="role",
+        choices=["smart", "role", "random", "mcts", "learned"],
     )
     parser.add_argument("--sequential", action="store_true")
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        help=(
+            "Seconds per bot decision; anytime searches that overrun it "
+            "use the role strategy"
+        ),
+    )
+    parser.add_argument(
+        "--role-beliefs",
+        action="store_true",
+        help="Let bots track Bayesian role beliefs (much slower)",
+    )
     parser.add_argument(
         "--compare",
         nargs="+",
         help="Compare multiple strategies (e.g. --compare smart random)",
     )
+    parser.add_argument(
+        "--paired",
+        action="store_true",
+        help="Play the same seeds with every strategy in --compare",
+    )
     parser.add_argument(
         "--interactive", "-i", action="store_true", help="Use interactive setup"
     )
+    parser.add_argument(
+        "--tournament",
+        action="store_true",
+        help="Rate mixed strategies per faction (see --liberal/--fascist/--communist)",
+    )
+    for faction in ("liberal", "fascist", "communist"):
+        parser.add_argument(
+            f"--{faction}",
+            nargs="+",
+            choices=STRATEGY_TYPES,
+            default=["role", "smart"],
+            help=f"Strategies played by the {faction} faction in a tournament",
+        )
+    parser.add_argument(
+        "--tune",
+        choices=["liberal", "fascist", "communist"],
+        help="Tune the strategy parameters of a faction (-n games per candidate)",
+    )
+    parser.add_argument("--tune-strategy", default="role", choices=TUNABLE_STRATEGIES)
+    parser.add_argument(
+        "--tune-method", default="evolution", choices=["evolution", "random"]
+    )
+    parser.add_argument(
+        "--tune-players",
+        type=int,
+        nargs="+",
+        help="Player counts to tune separately (default: -p)",
+    )
+    parser.add_argument(
+        "--train-model",
+        metavar="PATH",
+        help="Train the learned strategy from -n games played by --strategy",
+    )
+    parser.add_argument(
+        "--dataset", metavar="PATH", help="Also save the recorded decisions"
+    )
+    parser.add_argument("--hidden", type=int, default=16)
+    parser.add_argument("--generations", type=int, default=10)
+    parser.add_argument("--population", type=int, default=8)
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Seed of the tournament schedule, tuning search or paired comparison",
+    )
 
     args = parser.parse_args()
 
@@ -589,16 +991,69 @@ def main():
 
         return
 
+    if args.tournament:
+        lineups = {"liberal": args.liberal, "fascist": args.fascist}
+        if not args.no_communists:
+            lineups["communist"] = args.communist
+        GameSimulator().run_tournament(
+            lineups,
+            n_games=args.num,
+            parallel=not args.sequential,
+            seed=args.seed,
+            player_count=args.players,
+            with_communists=not args.no_communists,
+            with_anti_policies=args.anti_policies,
+            with_emergency_powers=args.emergency_powers,
+        )
+        return
+
+    if args.tune:
+        GameSimulator().run_tuning(
+            args.tune,
+            args.tune_players or [args.players],
+            strategy=args.tune_strategy,
+            method=args.tune_method,
+            iterations=args.generations,
+            population=args.population,
+            games=args.num,
+            parallel=not args.sequential,
+            seed=args.seed,
+            with_communists=not args.no_communists,
+            with_anti_policies=args.anti_policies,
+            with_emergency_powers=args.emergency_powers,
+        )
+        return
+
+    if args.train_model:
+        GameSimulator().train_learned_model(
+            args.train_model,
+            n_games=args.num,
+            teacher=args.strategy,
+            dataset_path=args.dataset,
+            hidden=args.hidden,
+            parallel=not args.sequential,
+            seed=args.seed,
+            player_count=args.players,
+            with_communists=not args.no_communists,
+            with_anti_policies=args.anti_policies,
+            with_emergency_powers=args.emergency_powers,
+        )
+        return
+
     if args.compare:
         sim = GameSimulator()
         sim.compare_strategies(
             strategies=args.compare,
+            paired=args.paired,
+            seed=args.seed,
             n_games=args.num,
             player_count=args.players,
             with_communists=not args.no_communists,
             with_anti_policies=args.anti_policies,
             with_emergency_powers=args.emergency_powers,
             parallel=not args.sequential,
+            time_budget=args.time_budget,
+            role_beliefs=args.role_beliefs,
         )
         return
 
@@ -611,6 +1066,8 @@ def main():
         with_emergency_powers=args.emergency_powers,
         strategy_type=args.strategy,
         parallel=not args.sequential,
+        time_budget=args.time_budget,
+        role_beliefs=args.role_beliefs,
     )
 
     # The detailed results will be printed by plot_results method